@@ -25,6 +25,12 @@ endif ()
 find_package(PCRE2 REQUIRED COMPONENTS 8BIT)
 
 
+#-----------------------------------------------------------------------
+# Threading
+
+find_package(Threads REQUIRED)
+
+
 #-----------------------------------------------------------------------
 # Python
 
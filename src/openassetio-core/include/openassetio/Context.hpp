@@ -2,6 +2,7 @@
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <functional>
 #include <memory>
 
 #include <openassetio/export.h>
@@ -9,6 +10,7 @@
 #include <openassetio/typedefs.hpp>
 
 OPENASSETIO_FWD_DECLARE(managerApi, ManagerStateBase)
+OPENASSETIO_FWD_DECLARE(hostApi, Manager)
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
@@ -61,6 +63,12 @@ class OPENASSETIO_CORE_EXPORT Context final {
    * The opaque state token owned by the @ref manager, used to
    * correlate all API calls made using this context.
    *
+   * If this context was created by @fqref{hostApi.Manager.createChildContext}
+   * "createChildContext" with deferred manager state, then this will
+   * be null until the context is first used in a call to the manager,
+   * or until @ref resolveManagerState is called. Assigning to this
+   * member before then discards the deferred state.
+   *
    * @see @ref stable_resolution
    */
   managerApi::ManagerStateBasePtr managerState;
@@ -75,8 +83,86 @@ class OPENASSETIO_CORE_EXPORT Context final {
   [[nodiscard]] static ContextPtr make(trait::TraitsDataPtr locale = trait::TraitsData::make(),
                                        managerApi::ManagerStateBasePtr managerState = nullptr);
 
+  /// Defaulted destructor.
+  ~Context();
+
+  /**
+   * Copy construction.
+   *
+   * If the manager state of @p other is deferred, it is created first,
+   * then shared with the copy.
+   */
+  Context(const Context& other);
+  /// Copy assignment. See copy construction.
+  Context& operator=(const Context& other);
+  /// Defaulted move construction.
+  Context(Context&& other) noexcept;
+  /// Defaulted move assignment.
+  Context& operator=(Context&& other) noexcept;
+
+  /**
+   * Create the manager state of this context, if its creation was
+   * deferred, then return it.
+   *
+   * Hosts do not normally need to call this, since @fqref{hostApi.Manager}
+   * "Manager" does so before passing the context to the manager.
+   *
+   * This function is thread-safe, i.e. the manager state is created
+   * exactly once, even if multiple threads use the context
+   * concurrently. It is not safe to assign to @ref managerState
+   * concurrently with this call.
+   *
+   * @return The manager state, which may be null if the manager does
+   * not support stateful contexts.
+   */
+  const managerApi::ManagerStateBasePtr& resolveManagerState() const;
+
+  /**
+   * Create an immutable snapshot of this context.
+   *
+   * The snapshot holds a frozen copy of the locale (see
+   * @fqref{trait.TraitsData.freeze} "TraitsData.freeze"), and shares
+   * the manager state of this context, creating it first if deferred.
+   * Subsequent changes to this context do not affect the snapshot.
+   *
+   * Since it cannot change, a single snapshot can be passed to
+   * @fqref{hostApi.Manager} "Manager" methods from multiple threads
+   * concurrently, rather than each thread creating its own child
+   * context. Whether concurrent calls are supported remains up to
+   * the manager.
+   *
+   * Copying the locale is cheap, since the data is shared until the
+   * locale of this context is modified.
+   *
+   * @return A new, immutable context.
+   */
+  [[nodiscard]] ContextConstPtr snapshot() const;
+
+  /**
+   * Whether this context is an immutable snapshot, see @ref snapshot.
+   */
+  [[nodiscard]] bool isSnapshot() const;
+
  private:
+  friend class hostApi::Manager;
+
+  /// Factory for a deferred manager state.
+  using ManagerStateFactory = std::function<managerApi::ManagerStateBasePtr()>;
+
   Context(trait::TraitsDataPtr locale, managerApi::ManagerStateBasePtr managerState);
+
+  /**
+   * Defer creation of the manager state until first used, see @ref
+   * resolveManagerState.
+   */
+  void deferManagerState(ManagerStateFactory factory);
+
+  /// Whether the manager state is deferred and not yet created.
+  [[nodiscard]] bool hasDeferredManagerState() const;
+
+  class DeferredManagerState;
+  std::unique_ptr<DeferredManagerState> deferredManagerState_;
+  bool isSnapshot_ = false;
 };
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
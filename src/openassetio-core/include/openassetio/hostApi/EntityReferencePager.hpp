@@ -2,6 +2,10 @@
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <cstddef>
+#include <memory>
+#include <vector>
+
 #include <openassetio/EntityReference.hpp>
 #include <openassetio/typedefs.hpp>
 
@@ -30,7 +34,9 @@ OPENASSETIO_DECLARE_PTR(EntityReferencePager)
  * Due to the variance of backends, construction, `hasNext`, `get` and
  * `next` may all reasonably need to perform non-trivial, networked
  * operations, and thus performance characteristics should not be
- * assumed.
+ * assumed. To mitigate this, pages can be fetched in the background,
+ * ahead of the host, see @ref setPrefetchDepth, and the page size can
+ * be adapted to the observed latency, see @ref setAdaptivePageSize.
  *
  * Destruction of this object is a signal to the manager that the
  * connection query is finished. For this reason you should avoid
@@ -41,6 +47,28 @@ class OPENASSETIO_CORE_EXPORT EntityReferencePager final {
   OPENASSETIO_ALIAS_PTR(EntityReferencePager)
   using Page = EntityReferences;
 
+  /**
+   * Statistics of the pages fetched from the manager.
+   *
+   * @see statistics
+   */
+  struct Statistics {
+    /// Number of pages fetched from the manager.
+    std::size_t pageCount = 0;
+    /// Total number of entity references in the fetched pages.
+    std::size_t entityReferenceCount = 0;
+    /**
+     * Page size in effect when each page was fetched, or zero where
+     * the page size is not known.
+     */
+    std::vector<std::size_t> pageSizes;
+    /// Total time spent advancing to and fetching pages, in seconds.
+    double fetchSeconds = 0;
+  };
+
+  /// Default target time to advance to and fetch a page, in seconds.
+  static constexpr double kDefaultTargetPageSeconds = 0.1;
+
   /**
    * Constructs a new EntityReferencePager wrapping a @ref manager
    * plugin's implementation.
@@ -50,11 +78,13 @@ class OPENASSETIO_CORE_EXPORT EntityReferencePager final {
    *
    * @param pagerInterface Implementation of the underlying pager.
    * @param hostSession The API session.
+   * @param pageSize Page size given to the manager for the query, or
+   * zero if not known.
    * @return Newly created instance wrapped in a `std::shared_ptr`.
    */
   [[nodiscard]] static EntityReferencePager::Ptr make(
       managerApi::EntityReferencePagerInterfacePtr pagerInterface,
-      managerApi::HostSessionPtr hostSession);
+      managerApi::HostSessionPtr hostSession, std::size_t pageSize = 0);
 
   /**
    * Deleted copy constructor.
@@ -110,12 +140,118 @@ class OPENASSETIO_CORE_EXPORT EntityReferencePager final {
    */
   void next();
 
+  /**
+   * Set the number of pages to fetch in the background, ahead of the
+   * current page.
+   *
+   * By default, each call to @ref hasNext, @ref get and @ref next is
+   * passed straight through to the manager. When the prefetch depth is
+   * non-zero, a background worker instead advances through the
+   * manager's pages ahead of the host, buffering up to this many pages
+   * beyond the current page. This allows the host's processing of one
+   * page to overlap with the manager fetching the next.
+   *
+   * Pages are returned in order, and each page is only fetched once.
+   * If the manager raises an exception whilst prefetching, it is
+   * rethrown by the call that would have raised it had the pager not
+   * been prefetching, i.e. errors advancing the page are rethrown by
+   * @ref next, and errors querying a page are rethrown by @ref get or
+   * @ref hasNext. Prefetching then stops, and subsequent calls are
+   * passed straight through to the manager.
+   *
+   * The manager's pager is only ever called from one thread at a time,
+   * but may be called from a thread other than the calling thread. As
+   * such, the manager's pager must support being called from any
+   * thread. In particular, when the manager's pager is implemented in
+   * Python, the caller must not hold the Python GIL (the Python
+   * bindings release it automatically).
+   *
+   * On destruction, prefetching is cancelled. If a page is being
+   * fetched at that time, the manager's pager is closed once the fetch
+   * completes, rather than blocking destruction.
+   *
+   * @param prefetchDepth Maximum number of pages to buffer beyond the
+   * current page. Zero stops prefetching, though any pages already
+   * buffered are still returned.
+   */
+  void setPrefetchDepth(std::size_t prefetchDepth);
+
+  /**
+   * Get the number of pages to fetch in the background, ahead of the
+   * current page.
+   *
+   * @return Prefetch depth set by @ref setPrefetchDepth, zero by
+   * default.
+   */
+  [[nodiscard]] std::size_t prefetchDepth() const;
+
+  /**
+   * Adapt the page size to the observed latency of the manager.
+   *
+   * The page size of a relationship query is chosen up front by the
+   * host. Small pages mean many round-trips to the manager, whereas
+   * large pages mean long waits for each page and greater memory use.
+   * Once enabled, the time taken to advance to and fetch each page is
+   * measured, and the page size is doubled if a full page took less
+   * than half of @p targetPageSeconds, or halved if any page took
+   * longer than @p targetPageSeconds, within the given bounds.
+   *
+   * A new page size is given to the manager via @ref
+   * managerApi.EntityReferencePagerInterface.setPageSizeHint
+   * "setPageSizeHint" before advancing to the next page. Managers that
+   * do not support changing the page size of an ongoing query will
+   * continue to return pages of the original size.
+   *
+   * Typically, the query is made with a page size of @p minPageSize,
+   * so that the first page is returned quickly. If the page size of
+   * the query is outside of the bounds, it is clamped before advancing
+   * to the next page.
+   *
+   * @param minPageSize Smallest page size to request.
+   * @param maxPageSize Largest page size to request.
+   * @param targetPageSeconds Target time to advance to and fetch a
+   * page, in seconds.
+   *
+   * @throws errors.InputValidationException If @p minPageSize is zero
+   * or greater than @p maxPageSize, or @p targetPageSeconds is not
+   * positive.
+   */
+  void setAdaptivePageSize(std::size_t minPageSize, std::size_t maxPageSize,
+                           double targetPageSeconds = kDefaultTargetPageSeconds);
+
+  /**
+   * Get the page size most recently requested from the manager.
+   *
+   * @return Page size of the query, or the page size most recently
+   * chosen by @ref setAdaptivePageSize "adaptive page sizing", or zero
+   * if not known.
+   */
+  [[nodiscard]] std::size_t pageSize() const;
+
+  /**
+   * Get statistics of the pages fetched from the manager so far.
+   *
+   * Pages fetched in the background are included, see @ref
+   * setPrefetchDepth.
+   *
+   * @return Snapshot of the statistics.
+   */
+  [[nodiscard]] Statistics statistics() const;
+
  private:
   EntityReferencePager(managerApi::EntityReferencePagerInterfacePtr pagerInterface,
-                       managerApi::HostSessionPtr hostSession);
+                       managerApi::HostSessionPtr hostSession, std::size_t pageSize);
+
+  class PageSizer;
+  class Prefetcher;
 
   managerApi::EntityReferencePagerInterfacePtr pagerInterface_;
   managerApi::HostSessionPtr hostSession_;
+  /// Page statistics and size adaptation, shared with `prefetcher_`.
+  std::shared_ptr<PageSizer> pageSizer_;
+  std::size_t prefetchDepth_ = 0;
+  /// Background worker and page buffer, once prefetching is enabled.
+  std::shared_ptr<Prefetcher> prefetcher_;
 };
 static_assert(!std::is_default_constructible_v<EntityReferencePager>);
 static_assert(!std::is_copy_constructible_v<EntityReferencePager>);
@@ -0,0 +1,135 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <memory>
+#include <optional>
+#include <thread>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/hostApi/EntityReferencePager.hpp>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+OPENASSETIO_DECLARE_PTR(EntityReferencePagerStream)
+
+/**
+ * Merges the pages of many @ref EntityReferencePager "pagers" into a
+ * single stream, driving the pagers concurrently.
+ *
+ * Batch relationship queries, such as @ref Manager.getWithRelationship,
+ * provide one pager per input entity reference. Traversing each pager
+ * in turn means the total time is the sum of the round-trips to the
+ * manager for every page of every pager. This class instead traverses
+ * up to a configurable number of pagers at once, each on its own
+ * worker thread, and yields their pages as they arrive, tagged with
+ * the index of the pager they came from.
+ *
+ * Each pager is traversed from its current page until it has no more
+ * pages, and is released once exhausted. Empty pages are skipped.
+ * Pages from the same pager are always yielded in order. Pages from
+ * different pagers are yielded in order of arrival by default, or
+ * optionally in order of pager (i.e. all pages of the first pager,
+ * then all pages of the second pager, and so on).
+ *
+ * The number of pages buffered ahead of the host is bounded, so a
+ * slow host applies back-pressure to the workers.
+ *
+ * Each pager is only ever used from one thread at a time, but may be
+ * used from threads other than the calling thread. As such, the
+ * pagers' manager implementations must support being called from any
+ * thread. In particular, when implemented in Python, the caller must
+ * not hold the Python GIL whilst waiting on the stream (the Python
+ * bindings release it automatically).
+ *
+ * If a pager raises an exception, it is rethrown by @ref next at the
+ * point the failed page would have been yielded, after which the
+ * stream is finished.
+ *
+ * Destruction of the stream cancels any outstanding work. If a worker
+ * is mid-call to a pager at that time, the workers are left to finish
+ * their in-flight call and release their pagers in the background,
+ * rather than blocking destruction.
+ *
+ * None of the functions of this class should be considered
+ * thread-safe. Hosts should add their own synchronization around
+ * concurrent usage.
+ */
+class OPENASSETIO_CORE_EXPORT EntityReferencePagerStream final {
+ public:
+  OPENASSETIO_ALIAS_PTR(EntityReferencePagerStream)
+
+  /// List of pagers to stream.
+  using EntityReferencePagers = std::vector<EntityReferencePagerPtr>;
+
+  /// A page, and the index of the pager it came from.
+  struct Item {
+    /// Index of the pager in the list given to @ref make.
+    std::size_t sourceIndex;
+    /// Non-empty page of entity references.
+    EntityReferencePager::Page page;
+  };
+
+  /// Default maximum number of pagers to traverse concurrently.
+  static constexpr std::size_t kDefaultMaxConcurrency = 8;
+
+  /**
+   * Start streaming the pages of a list of pagers.
+   *
+   * @param pagers Pagers to stream. Null entries are permitted, and
+   * treated as having no pages, so that the list can be indexed in
+   * the same way as a batch of entity references for which some
+   * elements failed.
+   *
+   * @param maxConcurrency Maximum number of pagers to traverse at
+   * once.
+   *
+   * @param ordered Whether to yield pages in order of pager, rather
+   * than in order of arrival.
+   *
+   * @return Newly created instance wrapped in a `std::shared_ptr`.
+   *
+   * @throws errors.InputValidationException If @p maxConcurrency is
+   * zero.
+   */
+  [[nodiscard]] static EntityReferencePagerStreamPtr make(
+      EntityReferencePagers pagers, std::size_t maxConcurrency = kDefaultMaxConcurrency,
+      bool ordered = false);
+
+  EntityReferencePagerStream(const EntityReferencePagerStream&) = delete;
+  EntityReferencePagerStream& operator=(const EntityReferencePagerStream&) = delete;
+  EntityReferencePagerStream(EntityReferencePagerStream&&) noexcept = delete;
+  EntityReferencePagerStream& operator=(EntityReferencePagerStream&&) noexcept = delete;
+
+  /**
+   * Cancels any outstanding work.
+   */
+  ~EntityReferencePagerStream();
+
+  /**
+   * Get the next page, waiting for one to arrive if necessary.
+   *
+   * @return Next page and the index of its pager, or nullopt if all
+   * pagers are exhausted.
+   *
+   * @throws Exception from a pager, if fetching the next page failed.
+   */
+  std::optional<Item> next();
+
+ private:
+  class State;
+
+  EntityReferencePagerStream(EntityReferencePagers pagers, std::size_t maxConcurrency,
+                             bool ordered);
+
+  std::shared_ptr<State> state_;
+  std::vector<std::thread> workers_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -2,6 +2,7 @@
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <cstddef>
 #include <cstdint>
 #include <functional>
 #include <memory>
@@ -333,6 +334,9 @@ class OPENASSETIO_CORE_EXPORT Manager final {
    * Only applicable if the manager makes use of any caching, otherwise
    * it is a no-op.  In caching interfaces, this should cause any
    * retained data to be discarded to ensure future queries are fresh.
+   *
+   * Also clears the host-side persistence token cache, see @ref
+   * setPersistenceTokenCacheCapacity.
    */
   void flushCaches();
 
@@ -504,8 +508,20 @@ class OPENASSETIO_CORE_EXPORT Manager final {
    *  modified independently. Useful when performing multiple operations
    *  in parallel.
    *
-   *  @note The locale is deep-copied so that the child's locale can be
-   *  freely modified without affecting the parent.
+   *  @note The locale is copied so that the child's locale can be
+   *  freely modified without affecting the parent. The copy shares
+   *  the parent's data until either locale is modified.
+   *
+   *  Hosts that create many child contexts, for example one per graph
+   *  node evaluation, may not use most of them in a call to the
+   *  manager. In this case, @p deferManagerState can be used to avoid
+   *  the cost of creating the child's manager state (a call to the
+   *  manager) up front. The state is instead created when the context
+   *  is first passed to the manager, including by @ref
+   *  persistenceTokenForContext, or when a child of the child is
+   *  itself used. Until then, the child's @fqref{Context.managerState}
+   *  "managerState" is null, see @fqref{Context.resolveManagerState}
+   *  "resolveManagerState".
    *
    *  @warning Contexts should never be directly constructed, always
    *  use this method or @ref createContext to create a new one.
@@ -517,10 +533,13 @@ class OPENASSETIO_CORE_EXPORT Manager final {
    *  in order to parallelise actions that are part of the same logical
    *  group, but have different locales or access.
    *
+   *  @param deferManagerState Whether to defer creation of the child's
+   *  manager state until first used.
+   *
    *  @see @ref createContext
    *  @see @fqref{Context} "Context"
    */
-  ContextPtr createChildContext(const ContextPtr& parentContext);
+  ContextPtr createChildContext(const ContextPtr& parentContext, bool deferManagerState = false);
 
   /**
    *  Returns a serializable token that represents the supplied
@@ -587,6 +606,87 @@ class OPENASSETIO_CORE_EXPORT Manager final {
    */
   ContextPtr contextFromPersistenceToken(const Str& token);
 
+  /**
+   * Returns a persistence token for each of the supplied contexts.
+   *
+   * Equivalent to calling @ref persistenceTokenForContext for each
+   * context in turn, except that the manager is queried only once for
+   * each distinct manager state in the batch, whether or not the
+   * persistence token cache is enabled.
+   *
+   * @param contexts The contexts to derive persistence tokens for.
+   *
+   * @return A persistence token for each context, in the same order.
+   *
+   * @throws errors.InputValidationException If any context is null.
+   *
+   * @see @ref persistenceTokenForContext
+   * @see @ref setPersistenceTokenCacheCapacity
+   */
+  std::vector<Str> persistenceTokensForContexts(const std::vector<ContextPtr>& contexts);
+
+  /**
+   * Returns a context for each of the supplied persistence tokens.
+   *
+   * Equivalent to calling @ref contextFromPersistenceToken for each
+   * token in turn. If the persistence token cache is enabled, the
+   * manager is queried only once for each distinct token in the
+   * batch, and contexts restored from the same token share the same
+   * manager state. Otherwise, each token is restored individually.
+   *
+   * @param tokens Tokens previously returned from @ref
+   * persistenceTokenForContext or @ref persistenceTokensForContexts
+   * by this manager.
+   *
+   * @return A new context for each token, in the same order.
+   *
+   * @see @ref contextFromPersistenceToken
+   * @see @ref setPersistenceTokenCacheCapacity
+   */
+  std::vector<ContextPtr> contextsFromPersistenceTokens(const std::vector<Str>& tokens);
+
+  /**
+   * Set the maximum number of entries retained by the host-side
+   * persistence token cache.
+   *
+   * When enabled, persistence tokens are remembered against the
+   * identity of the manager state they were derived from, and manager
+   * states are remembered against the token they were restored from.
+   * Serializing the same context (or any context sharing its manager
+   * state) again, or restoring the same token again, is then served
+   * without a call to the manager. This is useful when, for example,
+   * a context is serialized per task of a farm submission, and each
+   * worker restores the tokens of many tasks.
+   *
+   * Contexts restored from the same token will share the same manager
+   * state instance. Only enable the cache if the manager allows this,
+   * and if the token for a given manager state does not change over
+   * its lifetime.
+   *
+   * Manager states restored from a token are retained by the cache
+   * until evicted, but states are otherwise not kept alive by the
+   * cache. The least recently used entries are evicted first.
+   *
+   * The cache is disabled by default, and is cleared by @ref
+   * flushCaches.
+   *
+   * This function is thread-safe.
+   *
+   * @param capacity The maximum number of tokens to remember in each
+   * direction. Zero disables the cache, discarding any entries.
+   */
+  void setPersistenceTokenCacheCapacity(std::size_t capacity);
+
+  /**
+   * Get the maximum number of entries retained by the persistence
+   * token cache.
+   *
+   * @return The capacity, or zero if the cache is disabled.
+   *
+   * @see @ref setPersistenceTokenCacheCapacity
+   */
+  [[nodiscard]] std::size_t persistenceTokenCacheCapacity() const;
+
   /**
    * @}
    */
@@ -3078,6 +3178,9 @@ class OPENASSETIO_CORE_EXPORT Manager final {
   managerApi::HostSessionPtr hostSession_;
 
   std::optional<openassetio::Str> entityReferencePrefix_;
+
+  class PersistenceTokenCache;
+  std::shared_ptr<PersistenceTokenCache> persistenceTokenCache_;
 };
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -3,6 +3,7 @@
 #pragma once
 
 #include <memory>
+#include <optional>
 #include <string_view>
 #include <unordered_map>
 #include <vector>
@@ -95,6 +96,14 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
    */
   static const Str kDefaultManagerConfigEnvVarName;
 
+  /**
+   * The name of the env var used to enable pooling of default
+   * managers.
+   *
+   * @see @ref setManagerPooling.
+   */
+  static const Str kManagerPoolingEnvVarName;
+
   /**
    * Construct an instance of this class.
    *
@@ -274,12 +283,56 @@ class OPENASSETIO_CORE_EXPORT ManagerFactory final {
    * @throws errors.ConfigurationException if there are errors occur
    * whilst loading the TOML file, or if it is missing the
    * `manager.identifier` field.
+   *
+   * @see @ref setManagerPooling to share initialized managers between
+   * callers.
    */
   [[nodiscard]] static ManagerPtr defaultManagerForInterface(
       std::string_view configPath, const HostInterfacePtr& hostInterface,
       const ManagerImplementationFactoryInterfacePtr& managerImplementationFactory,
       const log::LoggerInterfacePtr& logger);
 
+  /**
+   * Enable or disable process-wide pooling of the managers created by
+   * @ref defaultManagerForInterface.
+   *
+   * When pooling is enabled, a request for a default manager with the
+   * same identifier and settings, for a host with the same identifier,
+   * as a previously created manager that is still referenced elsewhere
+   * returns that same, already initialized, `Manager` instance, rather
+   * than instantiating and initializing a new one. This allows
+   * multiple libraries within a process to share a single manager.
+   *
+   * Pooled managers are held weakly, so a manager is destroyed once
+   * the last caller releases it, and the next request will create a
+   * new instance.
+   *
+   * A shared manager retains the host interface, implementation
+   * factory and logger supplied by the caller that created it.
+   * Callers that require an independent instance, e.g. so that they
+   * can modify its settings, should use @ref createManager and
+   * initialize the manager themselves.
+   *
+   * @envvar **OPENASSETIO_MANAGER_POOLING** *str* If set to a value
+   * other than `0`, enables pooling of default managers, unless
+   * overridden by this function.
+   *
+   * @param enabled Whether to enable pooling. If unset, reverts to
+   * the value of the @ref kManagerPoolingEnvVarName env var. Managers
+   * already in the pool are unaffected.
+   */
+  static void setManagerPooling(std::optional<bool> enabled);
+
+  /**
+   * Whether managers created by @ref defaultManagerForInterface are
+   * pooled.
+   *
+   * @return The value set by @ref setManagerPooling, if any,
+   * otherwise whether the @ref kManagerPoolingEnvVarName env var is
+   * set to a value other than `0`.
+   */
+  [[nodiscard]] static bool managerPooling();
+
  private:
   ManagerFactory(HostInterfacePtr hostInterface,
                  ManagerImplementationFactoryInterfacePtr managerImplementationFactory,
@@ -0,0 +1,210 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <deque>
+#include <functional>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/hostApi/PublishStream.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio/typedefs.hpp>
+
+OPENASSETIO_FWD_DECLARE(Context)
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+OPENASSETIO_DECLARE_PTR(PublishPipeline)
+
+/**
+ * Publishes entities via @ref Manager.preflight, a host-provided write
+ * step, then @ref Manager.register_, overlapping the three stages.
+ *
+ * Publishing a batch of entities typically involves preflighting the
+ * whole batch, writing the data for every entity, then registering
+ * the whole batch, each stage waiting for the previous to complete.
+ * This class instead streams entities through the stages in chunks,
+ * so that preflight of one chunk runs whilst the host writes the data
+ * for the previous chunk, whilst registration of the chunk before
+ * that completes.
+ *
+ * The host pushes each entity with its traits hint. Pushed entities
+ * are preflighted in chunks by a @ref PublishStream. As the preflight
+ * of each chunk completes, the host's write callback is called, in
+ * order, for each successfully preflighted entity, on the thread
+ * calling @ref push or @ref flush. The write callback should write
+ * the entity's data to the location given by the preflighted entity
+ * reference, and return the @fqref{trait.TraitsData} "TraitsData" to
+ * register, which is then pushed to a second @ref PublishStream for
+ * registration.
+ *
+ * Each stage has its own bound on the number of chunks awaiting the
+ * manager, so that both memory use and the number of concurrent
+ * manager calls are bounded. When a bound is reached, @ref push waits
+ * for the oldest chunk of that stage to complete.
+ *
+ * Every pushed entity is identified by its index in the order it was
+ * pushed, starting from zero. The final result of each entity is
+ * given to either the success callback, with the registered entity
+ * reference, or the error callback, with the error from whichever of
+ * preflight or register failed. If the write callback returns null,
+ * then the entity is not registered, and no further callbacks are
+ * made for it. This allows the host to skip an entity that failed to
+ * write, having reported its own error.
+ *
+ * As with @ref PublishStream, exceptions thrown by the manager or the
+ * host's callbacks are propagated from @ref push or @ref flush, after
+ * which the pipeline cannot be used further.
+ *
+ * Hosts must call @ref flush once all entities have been pushed.
+ * Destruction of the pipeline discards any outstanding work.
+ *
+ * None of the functions of this class should be considered
+ * thread-safe. Hosts should add their own synchronization around
+ * concurrent usage.
+ */
+class OPENASSETIO_CORE_EXPORT PublishPipeline final {
+ public:
+  OPENASSETIO_ALIAS_PTR(PublishPipeline)
+
+  /**
+   * Callback signature used to write the data of a preflighted
+   * entity. Given the index of the entity, and the entity reference
+   * returned by preflight. Returns the traits data to register, or
+   * null to skip registration of the entity.
+   */
+  using WriteCallback = std::function<trait::TraitsDataPtr(std::size_t, const EntityReference&)>;
+
+  /**
+   * Callback signature used for a successfully registered entity.
+   * Given the index of the entity, and the entity reference returned
+   * by register.
+   */
+  using SuccessCallback = Manager::RegisterSuccessCallback;
+
+  /**
+   * Callback signature used for an entity that failed to preflight or
+   * register. Given the index of the entity, and the error.
+   */
+  using ErrorCallback = Manager::BatchElementErrorCallback;
+
+  /**
+   * Start a pipeline.
+   *
+   * @param manager Manager to publish to.
+   *
+   * @param publishingAccess The intended usage of the published
+   * entities.
+   *
+   * @param context The calling context.
+   *
+   * @param writeCallback Callback called for each successfully
+   * preflighted entity.
+   *
+   * @param successCallback Callback called for each successfully
+   * registered entity.
+   *
+   * @param errorCallback Callback called for each entity that failed
+   * to preflight or register.
+   *
+   * @param chunkSize Number of entities to send to the manager per
+   * call, for each stage.
+   *
+   * @param maxPendingChunks Maximum number of chunks awaiting the
+   * manager, for each stage.
+   *
+   * @return Newly created instance wrapped in a `std::shared_ptr`.
+   *
+   * @throws errors.InputValidationException If @p chunkSize or @p
+   * maxPendingChunks is zero.
+   */
+  [[nodiscard]] static PublishPipelinePtr make(
+      ManagerPtr manager, access::PublishingAccess publishingAccess, ContextConstPtr context,
+      WriteCallback writeCallback, SuccessCallback successCallback, ErrorCallback errorCallback,
+      std::size_t chunkSize = PublishStream::kDefaultChunkSize,
+      std::size_t maxPendingChunks = PublishStream::kDefaultMaxPendingChunks);
+
+  PublishPipeline(const PublishPipeline&) = delete;
+  PublishPipeline& operator=(const PublishPipeline&) = delete;
+  PublishPipeline(PublishPipeline&&) noexcept = delete;
+  PublishPipeline& operator=(PublishPipeline&&) noexcept = delete;
+  ~PublishPipeline() = default;
+
+  /**
+   * Add an entity to the pipeline.
+   *
+   * The results of any completed chunks are passed on to the next
+   * stage, or given to the host's callbacks.
+   *
+   * @param entityReference Reference of the entity to publish.
+   *
+   * @param traitsHint Traits hint to preflight with.
+   *
+   * @throws errors.InputValidationException If @p traitsHint is null,
+   * or a previous chunk failed.
+   *
+   * @throws Exception from the manager, or the host's callbacks, if a
+   * chunk failed.
+   */
+  void push(EntityReference entityReference, trait::TraitsDataPtr traitsHint);
+
+  /**
+   * Preflight, write and register all remaining entities, waiting for
+   * all stages to complete.
+   *
+   * @throws errors.InputValidationException If a previous chunk
+   * failed.
+   *
+   * @throws Exception from the manager, or the host's callbacks, if a
+   * chunk failed.
+   */
+  void flush();
+
+  /**
+   * Number of entities pushed so far, i.e. the index that will be
+   * given to the next pushed entity.
+   */
+  [[nodiscard]] std::size_t pushedCount() const;
+
+  /**
+   * Number of entities whose publish is complete, i.e. that have been
+   * given to the success or error callback, or skipped by the write
+   * callback.
+   */
+  [[nodiscard]] std::size_t completedCount() const;
+
+ private:
+  PublishPipeline(ManagerPtr manager, access::PublishingAccess publishingAccess,
+                  ContextConstPtr context, WriteCallback writeCallback,
+                  SuccessCallback successCallback, ErrorCallback errorCallback,
+                  std::size_t chunkSize, std::size_t maxPendingChunks);
+
+  /// Write a preflighted entity and pass it on for registration.
+  void write(std::size_t index, EntityReference entityReference);
+
+  /// Pipeline index of an entity in the register stream.
+  [[nodiscard]] std::size_t pipelineIndex(std::size_t registerIndex) const;
+
+  /// Forget pipeline indices of entities that have been registered.
+  void trimRegisterIndices();
+
+  WriteCallback writeCallback_;
+  SuccessCallback successCallback_;
+  ErrorCallback errorCallback_;
+  /// Pipeline index of each entity in the register stream still
+  /// awaiting its result, starting from `registerIndexOffset_`.
+  std::deque<std::size_t> registerIndices_;
+  std::size_t registerIndexOffset_ = 0;
+  std::size_t completedCount_ = 0;
+  PublishStreamPtr registerStream_;
+  PublishStreamPtr preflightStream_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
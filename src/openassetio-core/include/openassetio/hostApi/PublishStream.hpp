@@ -0,0 +1,207 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <functional>
+#include <memory>
+#include <thread>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio/typedefs.hpp>
+
+OPENASSETIO_FWD_DECLARE(hostApi, Manager)
+OPENASSETIO_FWD_DECLARE(Context)
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+OPENASSETIO_DECLARE_PTR(PublishStream)
+
+/**
+ * Streams entities to @ref Manager.preflight or @ref Manager.register_
+ * in bounded chunks, as they are pushed by the host.
+ *
+ * Publishing a large number of entities, for example every frame of a
+ * long render, via a single batch call requires every entity reference
+ * and @fqref{trait.TraitsData} "TraitsData" to be held in memory
+ * up front, and nothing reaches the manager until they all have been
+ * gathered. This class instead accepts entities one at a time, and
+ * sends them to the manager in chunks of a configurable size on a
+ * background worker thread, whilst the host continues to push more.
+ *
+ * The number of chunks awaiting the manager is bounded. Once the limit
+ * is reached, @ref push waits for the oldest chunk to complete before
+ * accepting more, so a slow manager applies back-pressure to the host.
+ * Memory use is therefore bounded by the chunk size and the maximum
+ * number of pending chunks, regardless of the total number of
+ * entities published.
+ *
+ * Chunks are sent to the manager one at a time, in the order they were
+ * filled. Results are given to the host's callbacks on the thread
+ * calling @ref push or @ref flush, in chunk order, as each chunk
+ * completes. Each result is identified by the index of the entity in
+ * the order it was pushed, starting from zero.
+ *
+ * Since the manager is called from a worker thread, its implementation
+ * must support being called from any thread. In particular, when
+ * implemented in Python, the caller must not hold the Python GIL
+ * whilst pushing (the Python bindings release it automatically).
+ *
+ * If the manager throws an exception, rather than reporting a
+ * per-element error, then it is rethrown by @ref push or @ref flush
+ * at the point the failed chunk's results would have been given.
+ * Likewise for exceptions thrown by the host's callbacks. After
+ * either, the stream is finished, and any further call to @ref push
+ * or @ref flush throws an @fqref{errors.InputValidationException}
+ * "InputValidationException".
+ *
+ * Hosts must call @ref flush once all entities have been pushed.
+ * Destruction of the stream discards any entities not yet sent to the
+ * manager, and any results not yet given to the host. If the worker
+ * is mid-call to the manager at that time, it is left to finish in
+ * the background, rather than blocking destruction.
+ *
+ * None of the functions of this class should be considered
+ * thread-safe. Hosts should add their own synchronization around
+ * concurrent usage.
+ */
+class OPENASSETIO_CORE_EXPORT PublishStream final {
+ public:
+  OPENASSETIO_ALIAS_PTR(PublishStream)
+
+  /// Manager method to stream entities to.
+  enum class Operation {
+    /// Call @ref Manager.preflight, with traits hints.
+    kPreflight,
+    /// Call @ref Manager.register_, with entity traits data.
+    kRegister
+  };
+
+  /**
+   * Callback signature used for a successfully published entity.
+   * Given the index of the entity, and the entity reference returned
+   * by the manager.
+   */
+  using SuccessCallback = std::function<void(std::size_t, EntityReference)>;
+
+  /**
+   * Callback signature used for an entity that failed to publish.
+   * Given the index of the entity, and the error.
+   */
+  using ErrorCallback = std::function<void(std::size_t, errors::BatchElementError)>;
+
+  /// Default number of entities sent to the manager per call.
+  static constexpr std::size_t kDefaultChunkSize = 1000;
+
+  /// Default maximum number of chunks awaiting the manager.
+  static constexpr std::size_t kDefaultMaxPendingChunks = 2;
+
+  /**
+   * Start a stream.
+   *
+   * @param manager Manager to publish to.
+   *
+   * @param operation Manager method to call.
+   *
+   * @param publishingAccess The intended usage of the published
+   * entities.
+   *
+   * @param context The calling context.
+   *
+   * @param successCallback Callback called for each successfully
+   * published entity.
+   *
+   * @param errorCallback Callback called for each entity that failed
+   * to publish.
+   *
+   * @param chunkSize Number of entities to send to the manager per
+   * call.
+   *
+   * @param maxPendingChunks Maximum number of chunks sent to the
+   * manager whose results have not yet been given to the host.
+   *
+   * @return Newly created instance wrapped in a `std::shared_ptr`.
+   *
+   * @throws errors.InputValidationException If @p chunkSize or @p
+   * maxPendingChunks is zero.
+   */
+  [[nodiscard]] static PublishStreamPtr make(
+      ManagerPtr manager, Operation operation, access::PublishingAccess publishingAccess,
+      ContextConstPtr context, SuccessCallback successCallback, ErrorCallback errorCallback,
+      std::size_t chunkSize = kDefaultChunkSize,
+      std::size_t maxPendingChunks = kDefaultMaxPendingChunks);
+
+  PublishStream(const PublishStream&) = delete;
+  PublishStream& operator=(const PublishStream&) = delete;
+  PublishStream(PublishStream&&) noexcept = delete;
+  PublishStream& operator=(PublishStream&&) noexcept = delete;
+
+  /**
+   * Discards any outstanding work.
+   */
+  ~PublishStream();
+
+  /**
+   * Add an entity to the stream.
+   *
+   * If this fills a chunk, the chunk is sent to the manager, first
+   * waiting for the oldest pending chunk to complete if there are
+   * already the maximum number of pending chunks. The results of any
+   * completed chunks are then given to the host's callbacks.
+   *
+   * @param entityReference Reference of the entity to publish.
+   *
+   * @param traitsData Traits hint (for preflight) or entity data (for
+   * register) of the entity to publish.
+   *
+   * @throws errors.InputValidationException If @p traitsData is null,
+   * or a previous chunk failed.
+   *
+   * @throws Exception from the manager, or the host's callbacks, if a
+   * chunk failed.
+   */
+  void push(EntityReference entityReference, trait::TraitsDataPtr traitsData);
+
+  /**
+   * Send any partially filled chunk to the manager, and wait for all
+   * pending chunks to complete, giving their results to the host's
+   * callbacks.
+   *
+   * @throws Exception from the manager, or the host's callbacks, if a
+   * chunk failed.
+   *
+   * @throws errors.InputValidationException If a previous chunk
+   * failed.
+   */
+  void flush();
+
+  /**
+   * Number of entities pushed so far, i.e. the index that will be
+   * given to the next pushed entity.
+   */
+  [[nodiscard]] std::size_t pushedCount() const;
+
+  /**
+   * Number of entities whose results have been given to the host.
+   */
+  [[nodiscard]] std::size_t completedCount() const;
+
+ private:
+  class State;
+
+  PublishStream(ManagerPtr manager, Operation operation, access::PublishingAccess publishingAccess,
+                ContextConstPtr context, SuccessCallback successCallback,
+                ErrorCallback errorCallback, std::size_t chunkSize, std::size_t maxPendingChunks);
+
+  std::shared_ptr<State> state_;
+  std::thread worker_;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
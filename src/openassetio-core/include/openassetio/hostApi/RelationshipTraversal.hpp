@@ -0,0 +1,217 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstddef>
+#include <functional>
+#include <limits>
+#include <optional>
+#include <unordered_set>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
+#include <openassetio/hostApi/EntityReferencePagerStream.hpp>
+#include <openassetio/trait/collection.hpp>
+#include <openassetio/typedefs.hpp>
+
+OPENASSETIO_FWD_DECLARE(hostApi, Manager)
+OPENASSETIO_FWD_DECLARE(Context)
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+OPENASSETIO_DECLARE_PTR(RelationshipTraversal)
+
+/**
+ * Breadth-first traversal of the graph of entities formed by
+ * relationships, yielding the edges of the graph as they are found.
+ *
+ * Finding the closure of a relationship, for example every texture,
+ * cache and rig transitively used by a shot, means repeatedly querying
+ * @ref Manager.getWithRelationship for the entities found by the
+ * previous query. This class performs that traversal level by level.
+ * Each level, i.e. every entity first found by the previous level, is
+ * queried in a single batched call to the manager, and the resulting
+ * pagers are traversed concurrently via an @ref
+ * EntityReferencePagerStream.
+ *
+ * Each entity is queried at most once. An edge is yielded for every
+ * related entity returned by the manager, including those that were
+ * already found, so the edges describe the full graph between the
+ * entities visited, rather than just a spanning tree.
+ *
+ * The traversal can be bounded by depth, i.e. the number of hops from
+ * the root entities, and by a budget on the number of distinct
+ * entities found. The traversal stops as soon as the budget would be
+ * exceeded, which can be checked via @ref truncated.
+ *
+ * Edges from the same source entity are yielded in the order returned
+ * by the manager. Otherwise, edges within a level are yielded in order
+ * of arrival, and all edges of a level are yielded before any edge of
+ * the next level.
+ *
+ * Errors for individual entities are given to an error callback, if
+ * provided, in which case the traversal continues without that
+ * entity's relations. Otherwise, they are thrown from @ref next as a
+ * @fqref{errors.BatchElementException} "BatchElementException", after
+ * which the traversal is finished.
+ *
+ * None of the functions of this class should be considered
+ * thread-safe. Hosts should add their own synchronization around
+ * concurrent usage.
+ */
+class OPENASSETIO_CORE_EXPORT RelationshipTraversal final {
+ public:
+  OPENASSETIO_ALIAS_PTR(RelationshipTraversal)
+
+  /// A relationship between two entities.
+  struct Edge {
+    /// Entity that was queried.
+    EntityReference source;
+    /// Entity related to @ref source.
+    EntityReference target;
+    /// Number of hops from the roots to @ref target, starting at 1.
+    std::size_t depth;
+  };
+
+  /// Edges found by a single call to @ref next.
+  using Edges = std::vector<Edge>;
+
+  /**
+   * Callback signature used for an entity whose relationship query
+   * failed. Given the entity, its depth (where the roots have depth 0)
+   * and the error.
+   */
+  using ErrorCallback =
+      std::function<void(const EntityReference&, std::size_t, errors::BatchElementError)>;
+
+  /// Value of @p maxDepth or @p maxEntities for no limit.
+  static constexpr std::size_t kUnlimited = std::numeric_limits<std::size_t>::max();
+
+  /// Default number of entity references per page.
+  static constexpr std::size_t kDefaultPageSize = 100;
+
+  /**
+   * Start a traversal from a list of root entities.
+   *
+   * No query is made to the manager until the first call to @ref next.
+   *
+   * @param manager Manager to query.
+   *
+   * @param entityReferences Root entities. Duplicates are ignored.
+   *
+   * @param relationshipTraitsDatas Relationship to query at each hop.
+   * The first element is queried for the roots, the second for the
+   * entities found from the roots, and so on. If there are more hops
+   * than elements, the last element is used for the remaining hops, so
+   * a single element gives the closure of that relationship.
+   *
+   * @param relationsAccess The intended usage of the returned
+   * references.
+   *
+   * @param context The calling context.
+   *
+   * @param maxDepth Maximum number of hops from the roots.
+   *
+   * @param maxEntities Maximum number of distinct entities to find,
+   * not including the roots.
+   *
+   * @param pageSize The size of each page of data.
+   *
+   * @param maxConcurrency Maximum number of pagers to traverse at
+   * once, see @ref EntityReferencePagerStream.
+   *
+   * @param resultTraitSet A hint as to what traits the returned
+   * entities should have.
+   *
+   * @param errorCallback Callback that will be called for each entity
+   * whose relationship query fails, on the thread calling @ref next.
+   * If not set, such errors are thrown instead.
+   *
+   * @return Newly created instance wrapped in a `std::shared_ptr`.
+   *
+   * @throws errors.InputValidationException If @p
+   * relationshipTraitsDatas is empty or contains null elements, or if
+   * @p pageSize or @p maxConcurrency is zero.
+   */
+  [[nodiscard]] static RelationshipTraversalPtr make(
+      ManagerPtr manager, EntityReferences entityReferences,
+      trait::TraitsDatas relationshipTraitsDatas, access::RelationsAccess relationsAccess,
+      ContextConstPtr context, std::size_t maxDepth = kUnlimited,
+      std::size_t maxEntities = kUnlimited, std::size_t pageSize = kDefaultPageSize,
+      std::size_t maxConcurrency = EntityReferencePagerStream::kDefaultMaxConcurrency,
+      trait::TraitSet resultTraitSet = {}, ErrorCallback errorCallback = {});
+
+  /**
+   * Get the next edges, querying the manager if necessary.
+   *
+   * Edges are returned a page at a time, as they are found.
+   *
+   * @return Non-empty list of edges, or nullopt if the traversal is
+   * finished.
+   *
+   * @throws errors.BatchElementException If the query for an entity
+   * failed and no error callback was given.
+   *
+   * @throws Exception from the manager, if a query or fetching a page
+   * failed.
+   */
+  std::optional<Edges> next();
+
+  /**
+   * Whether the traversal stopped early because the entity budget was
+   * reached.
+   */
+  [[nodiscard]] bool truncated() const;
+
+  /**
+   * Number of distinct entities found so far, not including the roots.
+   */
+  [[nodiscard]] std::size_t entityCount() const;
+
+ private:
+  RelationshipTraversal(ManagerPtr manager, EntityReferences entityReferences,
+                        trait::TraitsDatas relationshipTraitsDatas,
+                        access::RelationsAccess relationsAccess, ContextConstPtr context,
+                        std::size_t maxDepth, std::size_t maxEntities, std::size_t pageSize,
+                        std::size_t maxConcurrency, trait::TraitSet resultTraitSet,
+                        ErrorCallback errorCallback);
+
+  /// Query the manager for the relations of the current frontier.
+  void startLevel();
+
+  /// Stop the traversal, discarding any outstanding work.
+  void finish();
+
+  ManagerPtr manager_;
+  trait::TraitsDatas relationshipTraitsDatas_;
+  access::RelationsAccess relationsAccess_;
+  ContextConstPtr context_;
+  std::size_t maxDepth_;
+  std::size_t maxEntities_;
+  std::size_t pageSize_;
+  std::size_t maxConcurrency_;
+  trait::TraitSet resultTraitSet_;
+  ErrorCallback errorCallback_;
+
+  /// Every entity found so far, including the roots.
+  std::unordered_set<EntityReference> visited_;
+  std::size_t entityCount_ = 0;
+  /// Entities to query at the next level.
+  EntityReferences frontier_;
+  /// Entities being queried at the current level.
+  EntityReferences sources_;
+  /// Pages of relations of `sources_`.
+  EntityReferencePagerStreamPtr stream_;
+  /// Depth of the entities found at the current level.
+  std::size_t depth_ = 0;
+  bool truncated_ = false;
+  bool finished_ = false;
+};
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -2,6 +2,7 @@
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <cstddef>
 #include <vector>
 
 #include <openassetio/export.h>
@@ -113,6 +114,24 @@ class OPENASSETIO_CORE_EXPORT EntityReferencePagerInterface {
    */
   virtual void next(const HostSessionPtr&) = 0;
 
+  /**
+   * Request a different page size for subsequent pages.
+   *
+   * Called by the host when adapting the page size to the observed
+   * latency of the manager, before advancing to the next page. The
+   * current page is unaffected. Managers that can change the page size
+   * of an ongoing query should apply it to pages after the current
+   * page.
+   *
+   * The default implementation ignores the hint, such that pages
+   * continue to be of the size given to the original query.
+   *
+   * @param pageSize Requested number of entity references per page.
+   * Always greater than zero.
+   * @param hostSession The API session.
+   */
+  virtual void setPageSizeHint(std::size_t pageSize, const HostSessionPtr& hostSession);
+
   /**
    * Close the paging query.
    *
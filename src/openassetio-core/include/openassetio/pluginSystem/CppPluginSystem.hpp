@@ -2,9 +2,11 @@
 // Copyright 2024-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <cstddef>
 #include <filesystem>
 #include <functional>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
 #include <string_view>
@@ -30,6 +32,19 @@ OPENASSETIO_DECLARE_PTR(CppPluginSystem)
  * The API broadly mirrors the @ref pluginSystem.PythonPluginSystem
  * "PythonPluginSystem".
  *
+ * @envvar **OPENASSETIO_CPP_PLUGIN_INDEX** *str* Path to a file in
+ * which to cache the results of C++ plugin discovery, such that
+ * subsequent scans need only load new or modified libraries. See
+ * @ref scan. The file will be created if it doesn't exist.
+ *
+ * @envvar **OPENASSETIO_CPP_PLUGIN_LAZY_LOAD** *int* If set to a
+ * non-zero value, enable lazy loading of C++ plugins by default. See
+ * @ref setLazyLoading.
+ *
+ * @envvar **OPENASSETIO_CPP_PLUGIN_SCAN_THREADS** *int* The default
+ * number of threads used to probe candidate C++ plugin libraries. See
+ * @ref setScanThreadCount.
+ *
  * @see @ref scan
  * @see @ref PluginFactory
  * @see @ref CppPluginSystemPlugin
@@ -40,6 +55,13 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystem {
   /// Pair of absolute path to plugin and shared_ptr to plugin instance.
   using PathAndPlugin = std::pair<std::filesystem::path, CppPluginSystemPluginPtr>;
 
+  /// Environment variable to read the discovery index path from.
+  static constexpr std::string_view kDiscoveryIndexEnvVar = "OPENASSETIO_CPP_PLUGIN_INDEX";
+  /// Environment variable to read the default lazy loading mode from.
+  static constexpr std::string_view kLazyLoadingEnvVar = "OPENASSETIO_CPP_PLUGIN_LAZY_LOAD";
+  /// Environment variable to read the default scan thread count from.
+  static constexpr std::string_view kScanThreadCountEnvVar = "OPENASSETIO_CPP_PLUGIN_SCAN_THREADS";
+
   /**
    * Constructs a new CppPluginSystem.
    *
@@ -94,6 +116,41 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystem {
    * or during the call to the provided @ref PluginFactory, and any such
    * exception will almost definitely terminate the process.
    *
+   * If a discovery index is configured (see @ref discoveryIndexPath),
+   * then the size, modification time and inode of each candidate
+   * library are compared against the index before loading it.
+   * Libraries that the index records as not exposing @p
+   * moduleHookName, as providing a plugin that failed validation, or
+   * as providing an identifier that has already been registered, are
+   * skipped without being loaded. Validation results are recorded
+   * against @p moduleHookName, so the same @p validationCallback
+   * should be used for every scan for a given hook. Libraries that
+   * are new, or have changed since they were indexed, are loaded as
+   * usual and the index updated. Entries for libraries that no longer
+   * exist in a scanned directory are removed.
+   *
+   * If @ref lazyLoading "lazy loading" is enabled, then libraries that
+   * the index records as providing a plugin are registered without
+   * being loaded, deferring loading until the plugin is requested via
+   * @ref plugin.
+   *
+   * If more than one @ref scanThreadCount "scan thread" is configured,
+   * then candidate libraries are probed (i.e. checked against the
+   * index, loaded and their identifier queried) concurrently. Probed
+   * plugins are then validated and registered serially, in the order
+   * described above, so precedence is unaffected. In this case, the
+   * logger, and any plugin's static initialisers, entry point and
+   * `identifier` method, must be thread safe. Validation callbacks are
+   * always called from the calling thread.
+   *
+   * A breakdown of the time taken by each phase of the scan is logged
+   * at @ref log.LoggerInterface.Severity.kDebug "debug" severity.
+   *
+   * The index may be shared between processes, and between plugin
+   * systems scanning for different hooks. Updates are written
+   * atomically, but concurrent updates may be lost, in which case the
+   * affected libraries will simply be indexed again on a later scan.
+   *
    * @param paths A list of paths to search, delimited by operating
    * system specific path separator (i.e. `:` for POSIX, `;` for
    * Windows). Leave blank to search paths given by the environment
@@ -113,6 +170,109 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystem {
   void scan(std::string_view paths, std::string_view pathsEnvVar, std::string_view moduleHookName,
             const ValidationCallback& validationCallback);
 
+  /**
+   * Discard any existing discovery index, then @ref scan.
+   *
+   * This loads every candidate library, repopulating the index from
+   * scratch. Note that entries for other hooks, or libraries in other
+   * directories, are also discarded, and will be re-indexed by
+   * subsequent scans.
+   *
+   * Typically, stale entries are detected and replaced automatically,
+   * so this is only required if the index has been corrupted, or a
+   * library was modified without changing its size, modification time
+   * or inode.
+   *
+   * @see scan
+   */
+  void rebuildDiscoveryIndex(std::string_view paths, std::string_view pathsEnvVar,
+                             std::string_view moduleHookName,
+                             const ValidationCallback& validationCallback);
+
+  /**
+   * Set the path of the file used to cache the results of plugin
+   * discovery.
+   *
+   * @param indexPath Path to the index file. An empty path reverts
+   * to using the path given by the @ref kDiscoveryIndexEnvVar
+   * environment variable.
+   */
+  void setDiscoveryIndexPath(std::filesystem::path indexPath);
+
+  /**
+   * Get the path of the file used to cache the results of plugin
+   * discovery.
+   *
+   * @return The path set by @ref setDiscoveryIndexPath, or if unset,
+   * the value of the @ref kDiscoveryIndexEnvVar environment variable.
+   * If neither are set, returns an empty path, and no index is used.
+   */
+  [[nodiscard]] std::filesystem::path discoveryIndexPath() const;
+
+  /**
+   * Set whether loading of indexed plugins is deferred until they are
+   * requested.
+   *
+   * When enabled, @ref scan registers plugins found in the discovery
+   * index (see @ref discoveryIndexPath) by identifier and path alone.
+   * The library is only loaded, its static initialisers run, and the
+   * plugin constructed, on the first call to @ref plugin for that
+   * identifier. This reduces startup time and memory usage when only
+   * a few of the available plugins are used.
+   *
+   * Libraries that are not yet indexed, or have changed since they
+   * were indexed, must still be loaded during @ref scan in order to
+   * discover their identifier.
+   *
+   * Plugins that the index records as failing validation are
+   * skipped, as when loading eagerly, so do not take precedence over
+   * a valid plugin with the same identifier later in the search path.
+   * Deferred plugins are validated again when loaded, so an identifier
+   * may still be listed by @ref identifiers whose plugin fails
+   * validation in @ref plugin, if the validation callback has changed
+   * since the library was indexed.
+   *
+   * @param lazyLoading Whether to defer loading.
+   */
+  void setLazyLoading(bool lazyLoading);
+
+  /**
+   * Get whether loading of indexed plugins is deferred until they are
+   * requested.
+   *
+   * @return The mode set by @ref setLazyLoading, or if unset, whether
+   * the @ref kLazyLoadingEnvVar environment variable is set to a
+   * non-zero value.
+   */
+  [[nodiscard]] bool lazyLoading() const;
+
+  /**
+   * Set the number of threads used to probe candidate libraries during
+   * @ref scan.
+   *
+   * Probing a library involves querying the file system and loading
+   * it, which is latency bound on network file systems, so benefits
+   * from concurrency even beyond the number of CPU cores. Note that
+   * some platforms' dynamic loaders serialise parts of library
+   * loading.
+   *
+   * @param threadCount Number of threads, including the calling
+   * thread. A value of 1 probes serially, and 0 uses the number of
+   * hardware threads.
+   */
+  void setScanThreadCount(std::size_t threadCount);
+
+  /**
+   * Get the number of threads used to probe candidate libraries during
+   * @ref scan.
+   *
+   * @return The count set by @ref setScanThreadCount, or if unset,
+   * the value of the @ref kScanThreadCountEnvVar environment variable.
+   * If neither are set (or the environment variable is malformed),
+   * returns 1.
+   */
+  [[nodiscard]] std::size_t scanThreadCount() const;
+
   /**
    * Returns the identifiers known to the plugin system.
    *
@@ -125,24 +285,49 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystem {
    *
    * @param identifier Identifier to look up.
    *
+   * If the plugin's loading was deferred (see @ref setLazyLoading),
+   * then its library is loaded and the plugin constructed and
+   * validated. This method is safe to call concurrently.
+   *
    * @return A pair of plugin path and instance.
    *
    * @exception errors.InputValidationException Raised if no plugin
-   * provides the specified identifier.
+   * provides the specified identifier, or if a deferred plugin could
+   * not be loaded or failed validation.
    */
   const PathAndPlugin& plugin(const openassetio::Identifier& identifier) const;
 
  private:
+  /// On-disk cache of plugin discovery results.
+  class DiscoveryIndex;
   /// Mapping of plugin identifier to file path and instance.
   using PluginMap = std::unordered_map<openassetio::Identifier, PathAndPlugin>;
   /// Optional pair of plugin identifier and instance.
   using MaybeIdentifierAndPlugin =
       std::optional<std::pair<openassetio::Identifier, CppPluginSystemPluginPtr>>;
-  /// Attempt to load a plugin at a given path, returning nullopt on
-  /// failure.
-  MaybeIdentifierAndPlugin maybeLoadPlugin(const std::filesystem::path& filePath,
-                                           std::string_view moduleHookName,
-                                           const ValidationCallback& validationCallback);
+  /// Result of probing a candidate plugin library.
+  struct ProbeResult;
+  /// Check whether a file provides a plugin, loading it if required.
+  /// Safe to call concurrently, provided @ref plugins_ is not modified.
+  ProbeResult probePlugin(const std::filesystem::path& filePath, std::string_view moduleHookName,
+                          DiscoveryIndex* discoveryIndex) const;
+  /// Validate a probed plugin and check it is not already registered,
+  /// returning nullopt on failure, or a null plugin if loading is
+  /// deferred.
+  MaybeIdentifierAndPlugin acceptProbedPlugin(ProbeResult probeResult,
+                                              std::string_view moduleHookName,
+                                              const ValidationCallback& validationCallback,
+                                              DiscoveryIndex* discoveryIndex);
+
+  /// Load a plugin whose loading was deferred by @ref scan.
+  void loadDeferredPlugin(const openassetio::Identifier& identifier,
+                          PathAndPlugin& pathAndPlugin) const;
+
+  /// Arguments to @ref scan required to load a deferred plugin.
+  struct DeferredLoad {
+    Str moduleHookName;
+    ValidationCallback validationCallback;
+  };
 
   /// Private constructor. See @ref make.
   explicit CppPluginSystem(log::LoggerInterfacePtr logger);
@@ -150,8 +335,19 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystem {
   /// Logger for logging progress, warnings and errors.
   log::LoggerInterfacePtr logger_;
   /// Map of discovered plugin identifiers to their file path and
-  /// instance.
-  PluginMap plugins_;
+  /// instance. Instances of deferred plugins are null until loaded by
+  /// @ref plugin, hence mutable.
+  mutable PluginMap plugins_;
+  /// Map of deferred plugin identifiers to how to load them.
+  mutable std::unordered_map<openassetio::Identifier, DeferredLoad> deferredLoads_;
+  /// Guard loading of deferred plugins.
+  mutable std::mutex deferredLoadsMutex_;
+  /// Explicitly set discovery index path, overriding the environment.
+  std::filesystem::path discoveryIndexPath_;
+  /// Explicitly set lazy loading mode, overriding the environment.
+  std::optional<bool> lazyLoading_;
+  /// Explicitly set scan thread count, overriding the environment.
+  std::optional<std::size_t> scanThreadCount_;
 };
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -3,6 +3,7 @@
 #pragma once
 
 #include <filesystem>
+#include <mutex>
 #include <optional>
 #include <unordered_map>
 #include <utility>
@@ -110,6 +111,14 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystemManagerImplementationFactory
   CppPluginSystemManagerImplementationFactory(openassetio::Str paths,
                                               log::LoggerInterfacePtr logger);
 
+  /**
+   * Get the underlying plugin system, scanning for plugins first if
+   * this has not yet been done.
+   *
+   * Safe to call from multiple threads concurrently.
+   */
+  const CppPluginSystemPtr& scannedPluginSystem();
+
   /// Search paths provided on construction.
   openassetio::Str paths_;
 
@@ -121,6 +130,8 @@ class OPENASSETIO_CORE_EXPORT CppPluginSystemManagerImplementationFactory
    * are considered.
    */
   CppPluginSystemPtr pluginSystem_;
+  /// Guard for lazy construction of @ref pluginSystem_.
+  std::mutex pluginSystemMutex_;
 };
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -2,9 +2,12 @@
 // Copyright 2024-2025 The Foundry Visionmongers Ltd
 #pragma once
 
+#include <optional>
+#include <string_view>
 #include <vector>
 
 #include <openassetio/export.h>
+#include <openassetio/errors/BatchElementError.hpp>
 #include <openassetio/hostApi/ManagerImplementationFactoryInterface.hpp>
 #include <openassetio/typedefs.hpp>
 
@@ -35,6 +38,30 @@ OPENASSETIO_DECLARE_PTR(HybridPluginSystemManagerImplementationFactory)
  * If multiple plugins support the same capability, then priority is
  * given to the plugin corresponding to the earliest in the list of
  * provided child factories.
+ *
+ * Child factories are queried one after another, in priority order,
+ * on the calling thread. They can optionally be queried concurrently,
+ * see @ref setConcurrentScan.
+ *
+ * @envvar **OPENASSETIO_HYBRID_ENTITY_REFERENCE_ROUTING** *int* If set
+ * to a non-zero value, enable per-element routing of batches by entity
+ * reference by default. See @ref setEntityReferenceRouting.
+ *
+ * @envvar **OPENASSETIO_HYBRID_FALLBACK_ERROR_CODES** *str* A comma
+ * separated list of @ref errors.BatchElementError.ErrorCode
+ * "BatchElementError.ErrorCode" names, e.g.
+ * `kInvalidTraitSet,kEntityResolutionError`, for which failed elements
+ * are retried by the next capable child by default. See @ref
+ * setFallbackErrorCodes.
+ *
+ * @envvar **OPENASSETIO_HYBRID_CONCURRENT_INITIALIZATION** *int* If
+ * set to a non-zero value, initialize the children of composed
+ * interfaces concurrently by default. See @ref
+ * setConcurrentInitialization.
+ *
+ * @envvar **OPENASSETIO_HYBRID_CONCURRENT_SCAN** *int* If set to a
+ * non-zero value, query child factories concurrently by default. See
+ * @ref setConcurrentScan.
  */
 class OPENASSETIO_CORE_EXPORT HybridPluginSystemManagerImplementationFactory
     : public hostApi::ManagerImplementationFactoryInterface {
@@ -44,6 +71,28 @@ class OPENASSETIO_CORE_EXPORT HybridPluginSystemManagerImplementationFactory
 
   OPENASSETIO_ALIAS_PTR(HybridPluginSystemManagerImplementationFactory)
 
+  /// Environment variable to read the default entity reference routing
+  /// mode from.
+  static constexpr std::string_view kEntityReferenceRoutingEnvVar =
+      "OPENASSETIO_HYBRID_ENTITY_REFERENCE_ROUTING";
+
+  /// Environment variable to read the default fallback error codes
+  /// from.
+  static constexpr std::string_view kFallbackErrorCodesEnvVar =
+      "OPENASSETIO_HYBRID_FALLBACK_ERROR_CODES";
+
+  /// Environment variable to read the default concurrent
+  /// initialization mode from.
+  static constexpr std::string_view kConcurrentInitializationEnvVar =
+      "OPENASSETIO_HYBRID_CONCURRENT_INITIALIZATION";
+
+  /// Environment variable to read the default concurrent scan mode
+  /// from.
+  static constexpr std::string_view kConcurrentScanEnvVar = "OPENASSETIO_HYBRID_CONCURRENT_SCAN";
+
+  /// List of batch element error codes.
+  using ErrorCodes = std::vector<errors::BatchElementError::ErrorCode>;
+
   /**
    * Construct a new instance.
    *
@@ -88,6 +137,157 @@ class OPENASSETIO_CORE_EXPORT HybridPluginSystemManagerImplementationFactory
    */
   managerApi::ManagerInterfacePtr instantiate(const Identifier& identifier) override;
 
+  /**
+   * Set whether composed interfaces created by subsequent calls to
+   * @ref instantiate route batches per element, by entity reference.
+   *
+   * By default, an API call taking a batch of entity references is
+   * dispatched in its entirety to the first child that has the
+   * required capability. When entity reference routing is enabled, the
+   * batch is instead partitioned, with each element routed to the
+   * first capable child that claims its entity reference. A child
+   * claims an entity reference if it matches the child's @ref
+   * constants.kInfoKey_EntityReferencesMatchPrefix
+   * "entity reference prefix", if the child advertises one in its
+   * @ref managerApi.ManagerInterface.info "info", or otherwise if
+   * the child's @ref managerApi.ManagerInterface.isEntityReferenceString
+   * "isEntityReferenceString" returns true. A child that does neither
+   * claims all entity references. Elements that no child claims are
+   * routed to the first capable child.
+   *
+   * Each sub-batch is dispatched to its child concurrently, and the
+   * indices given to the success and error callbacks are mapped back
+   * to those of the original batch. Results are buffered until all
+   * sub-batches have completed, and callbacks are then invoked on the
+   * calling thread, grouped by sub-batch.
+   *
+   * When children advertise different entity reference prefixes, the
+   * composed interface's `info` omits the prefix, and its
+   * `isEntityReferenceString` returns true if any child claims the
+   * string.
+   *
+   * @param entityReferenceRouting Whether to route by entity
+   * reference.
+   */
+  void setEntityReferenceRouting(bool entityReferenceRouting);
+
+  /**
+   * Get whether batches are routed per element, by entity reference.
+   *
+   * @return The mode set by @ref setEntityReferenceRouting, or if
+   * unset, whether the @ref kEntityReferenceRoutingEnvVar environment
+   * variable is set to a non-zero value.
+   */
+  [[nodiscard]] bool entityReferenceRouting() const;
+
+  /**
+   * Set the batch element error codes for which composed interfaces
+   * created by subsequent calls to @ref instantiate fall back to the
+   * next capable child.
+   *
+   * By default, a batch element error from a child is passed straight
+   * to the host. When fallback error codes are set, elements that
+   * fail with one of these codes are instead collected and retried,
+   * as a reduced batch, by the next child that has the required
+   * capability. This repeats until no elements fail with a fallback
+   * error code or there are no more capable children, in which case
+   * the errors from the last child attempted are passed to the host.
+   *
+   * For example, falling back on `kInvalidTraitSet` allows a fast
+   * child (e.g. a C++ plugin) to handle the common cases, whilst a
+   * slower child (e.g. a Python plugin) handles only the remainder.
+   *
+   * Fallback applies to all API methods that report per-element
+   * errors, and is compatible with @ref setEntityReferenceRouting, in
+   * which case elements fall back from the child they were routed to.
+   *
+   * @param errorCodes Error codes to fall back on. An empty list
+   * disables fallback.
+   */
+  void setFallbackErrorCodes(ErrorCodes errorCodes);
+
+  /**
+   * Get the batch element error codes for which failed elements fall
+   * back to the next capable child.
+   *
+   * @return The error codes set by @ref setFallbackErrorCodes, or if
+   * unset, those parsed from the @ref kFallbackErrorCodesEnvVar
+   * environment variable. Unrecognised names in the environment
+   * variable are logged and ignored.
+   */
+  [[nodiscard]] ErrorCodes fallbackErrorCodes() const;
+
+  /**
+   * Set whether composed interfaces created by subsequent calls to
+   * @ref instantiate initialize their children concurrently.
+   *
+   * By default, children are initialized one after another, in
+   * priority order, and then probed for their capabilities. When
+   * concurrent initialization is enabled, each child is initialized
+   * and then probed for all of its capabilities on its own thread, so
+   * that, e.g., one child opening a database connection overlaps with
+   * another warming a cache.
+   *
+   * This is opt-in, since children must then support being
+   * initialized concurrently with one another, which may not be the
+   * case if they share state.
+   *
+   * All children are initialized, even if some fail. If several
+   * children fail, the exception from the highest priority child is
+   * rethrown once all children have finished, regardless of the order
+   * in which they failed, and the errors from the other children are
+   * logged.
+   *
+   * @param concurrentInitialization Whether to initialize children
+   * concurrently.
+   */
+  void setConcurrentInitialization(bool concurrentInitialization);
+
+  /**
+   * Get whether children of composed interfaces are initialized
+   * concurrently.
+   *
+   * @return The mode set by @ref setConcurrentInitialization, or if
+   * unset, whether the @ref kConcurrentInitializationEnvVar
+   * environment variable is set to a non-zero value.
+   */
+  [[nodiscard]] bool concurrentInitialization() const;
+
+  /**
+   * Set whether child factories are queried concurrently by
+   * subsequent calls to @ref identifiers and @ref instantiate.
+   *
+   * By default, child factories are queried one after another, in
+   * priority order, on the calling thread. Factories typically scan for
+   * plugins lazily on first query, which can be slow. When concurrent
+   * scanning is enabled, each child factory is queried on its own
+   * thread, so that, e.g., a C++ plugin scan overlaps with a Python
+   * plugin scan, rather than one waiting on the other.
+   *
+   * This is opt-in, since child factories must then support being
+   * called from any thread, and concurrently with one another. In
+   * particular, when a child factory is implemented in Python, the
+   * caller must not hold the Python GIL (the Python bindings release
+   * it automatically).
+   *
+   * All child factories are queried, even if some fail. If several
+   * fail, the exception from the highest priority factory is rethrown
+   * once all have finished.
+   *
+   * @param concurrentScan Whether to query child factories
+   * concurrently.
+   */
+  void setConcurrentScan(bool concurrentScan);
+
+  /**
+   * Get whether child factories are queried concurrently.
+   *
+   * @return The mode set by @ref setConcurrentScan, or if unset,
+   * whether the @ref kConcurrentScanEnvVar environment variable is set
+   * to a non-zero value.
+   */
+  [[nodiscard]] bool concurrentScan() const;
+
  private:
   /// Private constructor. See @ref make.
   explicit HybridPluginSystemManagerImplementationFactory(
@@ -95,6 +295,15 @@ class OPENASSETIO_CORE_EXPORT HybridPluginSystemManagerImplementationFactory
 
   /// Child factories to compose.
   ManagerImplementationFactoryInterfaces factories_;
+  /// Explicitly set routing mode, overriding the environment.
+  std::optional<bool> entityReferenceRouting_;
+  /// Explicitly set fallback error codes, overriding the environment.
+  std::optional<ErrorCodes> fallbackErrorCodes_;
+  /// Explicitly set concurrent initialization mode, overriding the
+  /// environment.
+  std::optional<bool> concurrentInitialization_;
+  /// Explicitly set concurrent scan mode, overriding the environment.
+  std::optional<bool> concurrentScan_;
 };
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
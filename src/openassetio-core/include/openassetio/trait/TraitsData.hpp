@@ -80,6 +80,9 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
   /**
    * Construct such that this instance is a deep copy of the other.
    *
+   * The underlying data is shared until either instance is modified,
+   * so copies that are only read are cheap.
+   *
    * @param other The instance to copy.
    */
   [[nodiscard]] static TraitsDataPtr make(const TraitsDataConstPtr& other);
@@ -115,6 +118,9 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    * If this instance already has this trait, it is a no-op.
    *
    * @param traitId ID of the trait to add.
+   *
+   * @throws errors.InputValidationException If this instance is
+   * frozen, see @ref freeze.
    */
   void addTrait(const trait::TraitId& traitId);
 
@@ -125,6 +131,9 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    * are skipped.
    *
    * @param traitSet A trait set with the traits to add.
+   *
+   * @throws errors.InputValidationException If this instance is
+   * frozen, see @ref freeze.
    */
   void addTraits(const trait::TraitSet& traitSet);
 
@@ -152,6 +161,9 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    * @param traitId ID of trait to update.
    * @param propertyKey Key of property to set.
    * @param propertyValue Value to set.
+   *
+   * @throws errors.InputValidationException If this instance is
+   * frozen, see @ref freeze.
    */
   void setTraitProperty(const trait::TraitId& traitId, const trait::property::Key& propertyKey,
                         trait::property::Value propertyValue);
@@ -180,13 +192,40 @@ class OPENASSETIO_CORE_EXPORT TraitsData final {
    */
   bool operator!=(const TraitsData& other) const;
 
+  /**
+   * Make this instance immutable.
+   *
+   * Any subsequent attempt to modify this instance will throw. Since a
+   * frozen instance can no longer change, it can be safely read from
+   * multiple threads concurrently.
+   *
+   * Freezing is irreversible, but copies of a frozen instance are not
+   * themselves frozen.
+   *
+   * This function is not thread-safe, and so should be called before
+   * sharing the instance with other threads.
+   */
+  void freeze();
+
+  /**
+   * Whether this instance is immutable, see @ref freeze.
+   */
+  [[nodiscard]] bool isFrozen() const;
+
  private:
   TraitsData();
   explicit TraitsData(const trait::TraitSet& traitSet);
   TraitsData(const TraitsData& other);
 
+  /**
+   * Ensure this instance is not frozen, and that no other instance
+   * shares our data, before modifying it.
+   */
+  void detach();
+
   class Impl;
-  std::unique_ptr<Impl> impl_;
+  std::shared_ptr<Impl> impl_;
+  bool frozen_ = false;
 };
 }  // namespace trait
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -0,0 +1,147 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <optional>
+#include <string_view>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace utils {
+/**
+ * Process-wide recording of the time taken by the stages of
+ * OpenAssetIO startup.
+ *
+ * When enabled, plugin scanning (including loading of individual
+ * plugin libraries and modules), composition of hybrid plugins,
+ * default manager creation and manager initialization are timed, and
+ * recorded as a list of @ref Event "events". This allows the cause of
+ * a slow application launch to be attributed to a specific stage or
+ * plugin, and startup regressions to be tracked across releases.
+ *
+ * Events can be queried via @ref events, or serialised to JSON via
+ * @ref toJson, or written to a file on process exit via the @ref
+ * kStartupProfileEnvVarName env var.
+ *
+ * Profiling is disabled by default. When disabled, the overhead of an
+ * instrumented stage is a single atomic load.
+ */
+class OPENASSETIO_CORE_EXPORT StartupProfile final {
+ public:
+  /**
+   * The name of the env var used to enable startup profiling.
+   *
+   * @envvar **OPENASSETIO_STARTUP_PROFILE** *str* If set to a value
+   * other than `0`, enables startup profiling, unless overridden by
+   * @ref setEnabled. If the value is other than `1`, it is treated as
+   * a file path, and a JSON report (see @ref toJson) is written to it
+   * on process exit.
+   */
+  static const Str kStartupProfileEnvVarName;
+
+  /// A single timed stage of startup.
+  struct Event {
+    /// Name of the stage, e.g. `CppPluginSystem.scan`.
+    Str name;
+    /// Stage-specific detail, e.g. a search path or identifier.
+    Str detail;
+    /// Seconds from the library being loaded to the stage starting.
+    double start;
+    /// Seconds taken by the stage.
+    double duration;
+    /// Number of enclosing stages on the same thread.
+    std::size_t depth;
+    /// Sequential index of the thread, in order of first event.
+    std::size_t thread;
+  };
+  /// List of events, in order of completion.
+  using Events = std::vector<Event>;
+
+  /**
+   * RAII timer for a stage of startup.
+   *
+   * The stage is recorded as an event when the scope is ended, either
+   * explicitly via @ref end or on destruction, if profiling was
+   * enabled when the scope was constructed.
+   */
+  class OPENASSETIO_CORE_EXPORT Scope final {
+   public:
+    /**
+     * Start timing a stage.
+     *
+     * @param name Name of the stage.
+     *
+     * @param detail Stage-specific detail.
+     */
+    explicit Scope(std::string_view name, std::string_view detail = {});
+    /// Ends the scope, if not already ended.
+    ~Scope();
+
+    Scope(const Scope&) = delete;
+    Scope(Scope&&) = delete;
+    Scope& operator=(const Scope&) = delete;
+    Scope& operator=(Scope&&) = delete;
+
+    /**
+     * Stop timing and record the event. Subsequent calls have no
+     * effect.
+     */
+    void end();
+
+   private:
+    std::optional<Event> event_;
+    std::chrono::steady_clock::time_point startTime_;
+  };
+
+  StartupProfile() = delete;
+
+  /**
+   * Enable or disable startup profiling.
+   *
+   * Events already recorded are retained.
+   *
+   * @param enabled Whether to enable profiling. If unset, reverts to
+   * the value of the @ref kStartupProfileEnvVarName env var.
+   */
+  static void setEnabled(std::optional<bool> enabled);
+
+  /**
+   * Whether startup profiling is enabled.
+   *
+   * @return The value set by @ref setEnabled, if any, otherwise
+   * whether the @ref kStartupProfileEnvVarName env var is set to a
+   * value other than `0`.
+   */
+  [[nodiscard]] static bool enabled();
+
+  /**
+   * Get the events recorded so far.
+   *
+   * @return Recorded events, in order of completion.
+   */
+  [[nodiscard]] static Events events();
+
+  /**
+   * Serialise the events recorded so far as JSON.
+   *
+   * The result is an object with a single `events` key, whose value is
+   * a list of objects with a key for each field of @ref Event.
+   *
+   * @return JSON document.
+   */
+  [[nodiscard]] static Str toJson();
+
+  /**
+   * Discard all recorded events.
+   */
+  static void reset();
+};
+}  // namespace utils
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -1,14 +1,54 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2022-2025 The Foundry Visionmongers Ltd
+#include <atomic>
 #include <memory>
+#include <mutex>
 #include <utility>
 
 #include <openassetio/export.h>
 #include <openassetio/Context.hpp>
+#include <openassetio/managerApi/ManagerStateBase.hpp>
 #include <openassetio/trait/TraitsData.hpp>
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
+
+/**
+ * Manager state whose creation is deferred until first use.
+ */
+class Context::DeferredManagerState {
+ public:
+  explicit DeferredManagerState(ManagerStateFactory factory) : factory_{std::move(factory)} {}
+
+  /**
+   * Create the manager state, if not already done, assigning it to
+   * the given context's managerState.
+   */
+  void resolve(Context& context) {
+    if (resolved_.load(std::memory_order_acquire)) {
+      return;
+    }
+    const std::lock_guard lock{mutex_};
+    if (resolved_.load(std::memory_order_relaxed)) {
+      return;
+    }
+    // A host-assigned state takes precedence.
+    if (!context.managerState) {
+      context.managerState = factory_();
+    }
+    // Release anything captured, e.g. the parent context.
+    factory_ = nullptr;
+    resolved_.store(true, std::memory_order_release);
+  }
+
+  [[nodiscard]] bool resolved() const { return resolved_.load(std::memory_order_acquire); }
+
+ private:
+  std::mutex mutex_;
+  std::atomic<bool> resolved_ = false;
+  ManagerStateFactory factory_;
+};
+
 ContextPtr Context::make(trait::TraitsDataPtr locale,
                          managerApi::ManagerStateBasePtr managerState) {
   return std::shared_ptr<Context>(new Context(std::move(locale), std::move(managerState)));
@@ -16,5 +56,56 @@ ContextPtr Context::make(trait::TraitsDataPtr locale,
 
 Context::Context(trait::TraitsDataPtr locale_, managerApi::ManagerStateBasePtr managerState_)
     : locale{std::move(locale_)}, managerState{std::move(managerState_)} {}
+
+Context::~Context() = default;
+
+Context::Context(const Context& other)
+    : locale{other.locale},
+      managerState{other.resolveManagerState()},
+      isSnapshot_{other.isSnapshot_} {}
+
+Context& Context::operator=(const Context& other) {
+  if (this != &other) {
+    locale = other.locale;
+    managerState = other.resolveManagerState();
+    deferredManagerState_.reset();
+    isSnapshot_ = other.isSnapshot_;
+  }
+  return *this;
+}
+
+Context::Context(Context&& other) noexcept = default;
+
+Context& Context::operator=(Context&& other) noexcept = default;
+
+const managerApi::ManagerStateBasePtr& Context::resolveManagerState() const {
+  if (deferredManagerState_) {
+    // Contexts are only ever constructed non-const, so it is safe to
+    // cast away constness to lazily fill in the state.
+    deferredManagerState_->resolve(const_cast<Context&>(*this));  // NOLINT(*-const-cast)
+  }
+  return managerState;
+}
+
+ContextConstPtr Context::snapshot() const {
+  trait::TraitsDataPtr frozenLocale;
+  if (locale) {
+    frozenLocale = trait::TraitsData::make(locale);
+    frozenLocale->freeze();
+  }
+  ContextPtr context = make(std::move(frozenLocale), resolveManagerState());
+  context->isSnapshot_ = true;
+  return context;
+}
+
+bool Context::isSnapshot() const { return isSnapshot_; }
+
+void Context::deferManagerState(ManagerStateFactory factory) {
+  deferredManagerState_ = std::make_unique<DeferredManagerState>(std::move(factory));
+}
+
+bool Context::hasDeferredManagerState() const {
+  return deferredManagerState_ && !deferredManagerState_->resolved();
+}
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
@@ -1,9 +1,19 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
 #include <exception>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <thread>
 #include <utility>
 
 #include <openassetio/export.h>
+#include <openassetio/errors/exceptions.hpp>
 #include <openassetio/hostApi/EntityReferencePager.hpp>
 #include <openassetio/log/LoggerInterface.hpp>  // NOLINT(*-include-cleaner): needed for logger()
 #include <openassetio/managerApi/EntityReferencePagerInterface.hpp>
@@ -13,36 +23,482 @@ namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace hostApi {
 
+namespace {
+/**
+ * Close the manager's pager, logging rather than propagating any
+ * exception, since this is called during destruction.
+ */
+void closePagerInterface(const managerApi::EntityReferencePagerInterfacePtr& pagerInterface,
+                         const managerApi::HostSessionPtr& hostSession) {
+  try {
+    pagerInterface->close(hostSession);
+  } catch (const std::exception& ex) {
+    hostSession->logger()->error(ex.what());
+  } catch (...) {
+    hostSession->logger()->error(
+        "Unknown non-exception object caught during destruction of EntityReferencePager");
+  }
+}
+
+using Clock = std::chrono::steady_clock;
+using Seconds = std::chrono::duration<double>;
+}  // namespace
+
+/**
+ * Calls through to the manager's pager that advance to and fetch
+ * pages, recording statistics and adapting the page size.
+ *
+ * Calls to the manager's pager are made without the lock held, so that
+ * statistics can be queried whilst a page is being fetched in the
+ * background.
+ */
+class EntityReferencePager::PageSizer {
+ public:
+  explicit PageSizer(const std::size_t pageSize) : pageSize_{pageSize} {}
+
+  /// See EntityReferencePager::setAdaptivePageSize.
+  void setAdaptive(const std::size_t minPageSize, const std::size_t maxPageSize,
+                   const double targetPageSeconds) {
+    const std::lock_guard lock{mutex_};
+    minPageSize_ = minPageSize;
+    maxPageSize_ = maxPageSize;
+    targetPageSeconds_ = targetPageSeconds;
+    adaptive_ = true;
+    const std::size_t current = pendingPageSize_.value_or(pageSize_);
+    const std::size_t clamped =
+        current == 0 ? minPageSize : std::clamp(current, minPageSize, maxPageSize);
+    requestPageSize(clamped);
+  }
+
+  /// See EntityReferencePager::pageSize.
+  std::size_t pageSize() const {
+    const std::lock_guard lock{mutex_};
+    return pendingPageSize_.value_or(pageSize_);
+  }
+
+  /// See EntityReferencePager::statistics.
+  Statistics statistics() const {
+    const std::lock_guard lock{mutex_};
+    return statistics_;
+  }
+
+  /**
+   * Advance the manager's pager, first giving it the latest page size
+   * if it has changed.
+   */
+  void advance(const managerApi::EntityReferencePagerInterfacePtr& pagerInterface,
+               const managerApi::HostSessionPtr& hostSession) {
+    std::unique_lock lock{mutex_};
+    const std::optional<std::size_t> newPageSize = pendingPageSize_;
+    lock.unlock();
+    if (newPageSize) {
+      pagerInterface->setPageSizeHint(*newPageSize, hostSession);
+      lock.lock();
+      pageSize_ = *newPageSize;
+      if (pendingPageSize_ == newPageSize) {
+        pendingPageSize_.reset();
+      }
+      lock.unlock();
+    }
+
+    const Clock::time_point start = Clock::now();
+    pagerInterface->next(hostSession);
+    const Seconds duration = Clock::now() - start;
+
+    lock.lock();
+    advanceSeconds_ += duration.count();
+    fetched_ = false;
+  }
+
+  /**
+   * Fetch the current page from the manager's pager.
+   *
+   * Only the first fetch of each page is recorded, since subsequent
+   * fetches of the same page do not reflect the cost of paging.
+   */
+  Page fetch(const managerApi::EntityReferencePagerInterfacePtr& pagerInterface,
+             const managerApi::HostSessionPtr& hostSession) {
+    const Clock::time_point start = Clock::now();
+    Page page = pagerInterface->get(hostSession);
+    const Seconds duration = Clock::now() - start;
+
+    const std::lock_guard lock{mutex_};
+    if (!fetched_) {
+      fetched_ = true;
+      record(page.size(), advanceSeconds_ + duration.count());
+      advanceSeconds_ = 0;
+    }
+    return page;
+  }
+
+ private:
+  /// Record a fetched page, adapting the page size if enabled.
+  void record(const std::size_t pageLength, const double pageSeconds) {
+    ++statistics_.pageCount;
+    statistics_.entityReferenceCount += pageLength;
+    statistics_.pageSizes.push_back(pageSize_);
+    statistics_.fetchSeconds += pageSeconds;
+
+    if (!adaptive_ || pageSize_ == 0) {
+      return;
+    }
+    // Note that the page size of the query may be outside of the
+    // bounds, so the result is always clamped.
+    if (pageSeconds > targetPageSeconds_) {
+      requestPageSize(std::clamp(pageSize_ / 2, minPageSize_, maxPageSize_));
+    } else if (pageLength >= pageSize_ && pageSeconds < targetPageSeconds_ / 2) {
+      // Only grow on full pages, since a partial page is the last.
+      const std::size_t grown = pageSize_ > maxPageSize_ / 2 ? maxPageSize_ : pageSize_ * 2;
+      requestPageSize(std::clamp(grown, minPageSize_, maxPageSize_));
+    }
+  }
+
+  /// Request a page size, to be given to the manager on next advance.
+  void requestPageSize(const std::size_t pageSize) {
+    if (pageSize == pageSize_) {
+      pendingPageSize_.reset();
+    } else {
+      pendingPageSize_ = pageSize;
+    }
+  }
+
+  mutable std::mutex mutex_;
+  Statistics statistics_;
+  /// Page size in effect for the manager's current page.
+  std::size_t pageSize_;
+  /// Page size to give to the manager before next advancing.
+  std::optional<std::size_t> pendingPageSize_;
+  /// Time spent advancing to the current page, yet to be recorded.
+  double advanceSeconds_ = 0;
+  /// Whether the current page has been recorded.
+  bool fetched_ = false;
+  bool adaptive_ = false;
+  std::size_t minPageSize_ = 0;
+  std::size_t maxPageSize_ = 0;
+  double targetPageSeconds_ = 0;
+};
+
+/**
+ * Background worker that advances through the manager's pages ahead of
+ * the host, and the buffer of pages it has fetched.
+ *
+ * The front of the buffer is the host's current page, and the back is
+ * the page the manager's pager is positioned at. When the worker is
+ * not running and the buffer is empty, the manager's pager is
+ * positioned at the host's current page, and calls are passed straight
+ * through to it.
+ *
+ * The worker shares ownership of this object, so that closing the
+ * manager's pager can be deferred to the worker if it is mid-fetch
+ * when the EntityReferencePager is destroyed.
+ */
+class EntityReferencePager::Prefetcher {
+ public:
+  /// A fetched page, and whether there is another page after it.
+  struct Prefetched {
+    Page page;
+    bool hasNext;
+  };
+
+  Prefetcher(managerApi::EntityReferencePagerInterfacePtr pagerInterface,
+             managerApi::HostSessionPtr hostSession, std::shared_ptr<PageSizer> pageSizer)
+      : pagerInterface_{std::move(pagerInterface)},
+        hostSession_{std::move(hostSession)},
+        pageSizer_{std::move(pageSizer)} {}
+
+  Prefetcher(const Prefetcher&) = delete;
+  Prefetcher(Prefetcher&&) = delete;
+  Prefetcher& operator=(const Prefetcher&) = delete;
+  Prefetcher& operator=(Prefetcher&&) = delete;
+  ~Prefetcher() = default;
+
+  /**
+   * Set the prefetch depth, and start the worker if it is not already
+   * running.
+   *
+   * The worker is not restarted once the pages are exhausted, or after
+   * an error.
+   */
+  static void start(const std::shared_ptr<Prefetcher>& self, const std::size_t depth) {
+    std::unique_lock lock{self->mutex_};
+    self->depth_ = depth;
+    if (self->running_ || self->ended_) {
+      self->cond_.notify_all();
+      return;
+    }
+    lock.unlock();
+    // Reap a worker previously stopped via `stop`.
+    if (self->worker_.joinable()) {
+      self->worker_.join();
+    }
+    lock.lock();
+    self->running_ = true;
+    self->stopRequested_ = false;
+    // If pages are buffered, the manager's pager is positioned at the
+    // last of them, so must be advanced before fetching the next.
+    const bool advanceFirst = !self->pages_.empty();
+    self->worker_ = std::thread{[self, advanceFirst] { self->run(advanceFirst); }};
+  }
+
+  /**
+   * Stop the worker, waiting for any in-flight fetch to complete.
+   * Buffered pages are retained.
+   */
+  void stop() {
+    {
+      const std::lock_guard lock{mutex_};
+      stopRequested_ = true;
+    }
+    cond_.notify_all();
+    if (worker_.joinable()) {
+      worker_.join();
+    }
+  }
+
+  /**
+   * Stop the worker on destruction of the EntityReferencePager.
+   *
+   * @return `true` if the worker is mid-fetch, in which case it is
+   * detached and will close the manager's pager itself once the fetch
+   * completes. This avoids blocking destruction, e.g. whilst the
+   * calling thread holds a lock (such as the Python GIL) required by
+   * the manager's pager. Otherwise `false`, and the caller must close
+   * the manager's pager.
+   */
+  bool cancel() {
+    std::unique_lock lock{mutex_};
+    stopRequested_ = true;
+    cond_.notify_all();
+    if (inFlight_) {
+      closeOnExit_ = true;
+      worker_.detach();
+      return true;
+    }
+    lock.unlock();
+    if (worker_.joinable()) {
+      worker_.join();
+    }
+    return false;
+  }
+
+  /**
+   * Get the host's current page, waiting for it to be fetched if
+   * necessary.
+   *
+   * @return Current page, or nullptr if calls should be passed through
+   * to the manager's pager.
+   *
+   * @throws Exception from the manager's pager, if fetching the current
+   * page failed.
+   */
+  const Prefetched* current() {
+    std::unique_lock lock{mutex_};
+    cond_.wait(lock, [&] { return !pages_.empty() || !running_; });
+    if (!pages_.empty()) {
+      // Note that references to deque elements are not invalidated by
+      // the worker pushing to the back.
+      return &pages_.front();
+    }
+    if (error_ && !errorOnAdvance_) {
+      std::rethrow_exception(std::exchange(error_, nullptr));
+    }
+    return nullptr;
+  }
+
+  /**
+   * Advance the host's current page, waiting for the next page to be
+   * fetched if necessary.
+   *
+   * @return Whether the caller must advance the manager's pager.
+   *
+   * @throws Exception from the manager's pager, if advancing to the
+   * next page failed.
+   */
+  bool next() {
+    std::unique_lock lock{mutex_};
+    cond_.wait(lock, [&] { return pages_.size() > 1 || !running_; });
+    if (pages_.empty()) {
+      // Either pass-through, or the host is skipping a page that
+      // failed to fetch, so would not have seen the error.
+      error_ = nullptr;
+      return true;
+    }
+    pages_.pop_front();
+    if (running_) {
+      lock.unlock();
+      cond_.notify_all();
+      return false;
+    }
+    if (!pages_.empty()) {
+      return false;
+    }
+    if (error_ && errorOnAdvance_) {
+      std::rethrow_exception(std::exchange(error_, nullptr));
+    }
+    // If fetching the next page failed, then the manager's pager has
+    // already been advanced to it.
+    return error_ == nullptr;
+  }
+
+ private:
+  /// Worker thread body.
+  void run(bool advance) {
+    std::unique_lock lock{mutex_};
+    while (true) {
+      cond_.wait(lock, [&] { return stopRequested_ || pages_.size() <= depth_; });
+      if (stopRequested_) {
+        break;
+      }
+      inFlight_ = true;
+      lock.unlock();
+
+      Prefetched prefetched{};
+      std::exception_ptr error;
+      bool errorOnAdvance = advance;
+      try {
+        if (advance) {
+          pageSizer_->advance(pagerInterface_, hostSession_);
+        }
+        errorOnAdvance = false;
+        prefetched.page = pageSizer_->fetch(pagerInterface_, hostSession_);
+        prefetched.hasNext = pagerInterface_->hasNext(hostSession_);
+      } catch (...) {
+        error = std::current_exception();
+      }
+
+      lock.lock();
+      inFlight_ = false;
+      if (error) {
+        error_ = std::move(error);
+        errorOnAdvance_ = errorOnAdvance;
+        ended_ = true;
+        break;
+      }
+      pages_.push_back(std::move(prefetched));
+      cond_.notify_all();
+      if (!pages_.back().hasNext) {
+        ended_ = true;
+        break;
+      }
+      advance = true;
+    }
+    running_ = false;
+    const bool closeOnExit = closeOnExit_;
+    lock.unlock();
+    cond_.notify_all();
+
+    if (closeOnExit) {
+      closePagerInterface(pagerInterface_, hostSession_);
+    }
+  }
+
+  managerApi::EntityReferencePagerInterfacePtr pagerInterface_;
+  managerApi::HostSessionPtr hostSession_;
+  std::shared_ptr<PageSizer> pageSizer_;
+  std::thread worker_;
+
+  std::mutex mutex_;
+  std::condition_variable cond_;
+  /// Host's current page, followed by pages fetched ahead of it.
+  std::deque<Prefetched> pages_;
+  std::size_t depth_ = 0;
+  /// Error from the manager's pager, to be rethrown to the host.
+  std::exception_ptr error_;
+  /// Whether `error_` came from advancing, rather than fetching, a page.
+  bool errorOnAdvance_ = false;
+  bool running_ = false;
+  bool stopRequested_ = false;
+  /// Whether the pages are exhausted or an error occurred.
+  bool ended_ = false;
+  /// Whether the worker is currently calling the manager's pager.
+  bool inFlight_ = false;
+  /// Whether the worker should close the manager's pager on exit.
+  bool closeOnExit_ = false;
+};
+
 EntityReferencePager::Ptr EntityReferencePager::make(
     managerApi::EntityReferencePagerInterfacePtr pagerInterface,
-    managerApi::HostSessionPtr hostSession) {
+    managerApi::HostSessionPtr hostSession, const std::size_t pageSize) {
   return EntityReferencePager::Ptr{
-      new EntityReferencePager{std::move(pagerInterface), std::move(hostSession)}};
+      new EntityReferencePager{std::move(pagerInterface), std::move(hostSession), pageSize}};
 }
 
 EntityReferencePager::EntityReferencePager(
     managerApi::EntityReferencePagerInterfacePtr pagerInterface,
-    managerApi::HostSessionPtr hostSession)
-    : pagerInterface_(std::move(pagerInterface)), hostSession_(std::move(hostSession)) {}
+    managerApi::HostSessionPtr hostSession, const std::size_t pageSize)
+    : pagerInterface_(std::move(pagerInterface)),
+      hostSession_(std::move(hostSession)),
+      pageSizer_{std::make_shared<PageSizer>(pageSize)} {}
 
 EntityReferencePager::~EntityReferencePager() {
-  try {
-    pagerInterface_->close(hostSession_);
-  } catch (const std::exception& ex) {
-    hostSession_->logger()->error(ex.what());
-  } catch (...) {
-    hostSession_->logger()->error(
-        "Unknown non-exception object caught during destruction of EntityReferencePager");
+  if (prefetcher_ && prefetcher_->cancel()) {
+    // Closing is deferred to the worker.
+    return;
   }
+  closePagerInterface(pagerInterface_, hostSession_);
 }
 
-bool EntityReferencePager::hasNext() { return pagerInterface_->hasNext(hostSession_); }
+bool EntityReferencePager::hasNext() {
+  if (prefetcher_) {
+    if (const Prefetcher::Prefetched* current = prefetcher_->current()) {
+      return current->hasNext;
+    }
+  }
+  return pagerInterface_->hasNext(hostSession_);
+}
 
 EntityReferencePager::Page EntityReferencePager::get() {
-  return pagerInterface_->get(hostSession_);
+  if (prefetcher_) {
+    if (const Prefetcher::Prefetched* current = prefetcher_->current()) {
+      return current->page;
+    }
+  }
+  return pageSizer_->fetch(pagerInterface_, hostSession_);
+}
+
+void EntityReferencePager::next() {
+  if (prefetcher_ && !prefetcher_->next()) {
+    return;
+  }
+  pageSizer_->advance(pagerInterface_, hostSession_);
+}
+
+void EntityReferencePager::setPrefetchDepth(const std::size_t prefetchDepth) {
+  prefetchDepth_ = prefetchDepth;
+  if (prefetchDepth == 0) {
+    if (prefetcher_) {
+      prefetcher_->stop();
+    }
+    return;
+  }
+  if (!prefetcher_) {
+    prefetcher_ = std::make_shared<Prefetcher>(pagerInterface_, hostSession_, pageSizer_);
+  }
+  Prefetcher::start(prefetcher_, prefetchDepth);
 }
 
-void EntityReferencePager::next() { pagerInterface_->next(hostSession_); }
+std::size_t EntityReferencePager::prefetchDepth() const { return prefetchDepth_; }
+
+void EntityReferencePager::setAdaptivePageSize(const std::size_t minPageSize,
+                                               const std::size_t maxPageSize,
+                                               const double targetPageSeconds) {
+  if (minPageSize == 0) {
+    throw errors::InputValidationException{"minPageSize must be greater than zero."};
+  }
+  if (minPageSize > maxPageSize) {
+    throw errors::InputValidationException{"minPageSize must not be greater than maxPageSize."};
+  }
+  if (!(targetPageSeconds > 0)) {
+    throw errors::InputValidationException{"targetPageSeconds must be greater than zero."};
+  }
+  pageSizer_->setAdaptive(minPageSize, maxPageSize, targetPageSeconds);
+}
+
+std::size_t EntityReferencePager::pageSize() const { return pageSizer_->pageSize(); }
+
+EntityReferencePager::Statistics EntityReferencePager::statistics() const {
+  return pageSizer_->statistics();
+}
 
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -0,0 +1,275 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/errors/exceptions.hpp>
+#include <openassetio/hostApi/EntityReferencePager.hpp>
+#include <openassetio/hostApi/EntityReferencePagerStream.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+namespace {
+/**
+ * Maximum number of pages from a single pager that may be buffered
+ * awaiting the host, before its worker waits.
+ */
+constexpr std::size_t kMaxBufferedPagesPerPager = 4;
+}  // namespace
+
+/**
+ * State shared between the stream and its workers.
+ *
+ * Workers share ownership, so that they can outlive the stream if it
+ * is destroyed whilst they are mid-call to a pager.
+ *
+ * Every call to a pager (including its release, which closes it) is
+ * made outside the lock, but is preceded by a check of `cancelled`
+ * and an increment of `inFlight` under the lock. Once cancelled, the
+ * stream can therefore tell whether joining the workers could block
+ * on a pager.
+ */
+class EntityReferencePagerStream::State {
+ public:
+  /// A fetched page or error awaiting the host.
+  struct Pending {
+    std::size_t sourceIndex;
+    EntityReferencePager::Page page;
+    std::exception_ptr error;
+  };
+
+  State(EntityReferencePagers pagers, const std::size_t maxConcurrency, const bool ordered)
+      : pagers_{std::move(pagers)},
+        maxConcurrency_{maxConcurrency},
+        ordered_{ordered},
+        bufferedCounts_(pagers_.size()),
+        finished_(pagers_.size()) {}
+
+  /// Worker thread body: claim and traverse pagers until none remain.
+  void run() {
+    std::unique_lock lock{mutex_};
+    while (true) {
+      // When ordered, limit how far workers may run ahead of the host,
+      // to bound the number of pages buffered.
+      workerCond_.wait(lock, [&] {
+        return cancelled_ || nextPagerIdx_ == pagers_.size() || !ordered_ ||
+               nextPagerIdx_ < nextSourceIdx_ + maxConcurrency_;
+      });
+      if (cancelled_ || nextPagerIdx_ == pagers_.size()) {
+        return;
+      }
+      const std::size_t sourceIdx = nextPagerIdx_++;
+      traverse(sourceIdx, lock);
+      finished_[sourceIdx] = true;
+      ++finishedCount_;
+      consumerCond_.notify_all();
+    }
+  }
+
+  /// Get the next page for the host. See EntityReferencePagerStream::next.
+  std::optional<Item> next() {
+    std::unique_lock lock{mutex_};
+    while (!done_) {
+      const auto pendingIter = ordered_
+                                   ? std::find_if(begin(ready_), end(ready_),
+                                                  [&](const Pending& pending) {
+                                                    return pending.sourceIndex == nextSourceIdx_;
+                                                  })
+                                   : begin(ready_);
+
+      if (pendingIter != end(ready_)) {
+        Pending pending = std::move(*pendingIter);
+        ready_.erase(pendingIter);
+        --bufferedCounts_[pending.sourceIndex];
+        workerCond_.notify_all();
+        if (pending.error) {
+          done_ = true;
+          cancel();
+          std::rethrow_exception(pending.error);
+        }
+        return Item{pending.sourceIndex, std::move(pending.page)};
+      }
+
+      if (ordered_ && nextSourceIdx_ < pagers_.size() && finished_[nextSourceIdx_]) {
+        ++nextSourceIdx_;
+        workerCond_.notify_all();
+        continue;
+      }
+      if (finishedCount_ == pagers_.size()) {
+        done_ = true;
+        break;
+      }
+      consumerCond_.wait(lock);
+    }
+    return std::nullopt;
+  }
+
+  /**
+   * Cancel outstanding work. Must be called with the lock held.
+   */
+  void cancel() {
+    cancelled_ = true;
+    workerCond_.notify_all();
+  }
+
+  /**
+   * Cancel outstanding work, on destruction of the stream.
+   *
+   * @return Whether any worker is mid-call to a pager.
+   */
+  bool cancelOnDestruction() {
+    const std::lock_guard lock{mutex_};
+    cancel();
+    return inFlight_ > 0;
+  }
+
+ private:
+  /**
+   * Traverse a pager from its current page, buffering each non-empty
+   * page, until it is exhausted, fails, or the stream is cancelled.
+   * Must be called with the lock held.
+   */
+  void traverse(const std::size_t sourceIdx, std::unique_lock<std::mutex>& lock) {
+    const EntityReferencePagerPtr& pager = pagers_[sourceIdx];
+    bool started = false;
+    while (pager && !cancelled_) {
+      ++inFlight_;
+      lock.unlock();
+
+      Pending pending{sourceIdx, {}, nullptr};
+      bool exhausted = false;
+      try {
+        if (started) {
+          exhausted = !pager->hasNext();
+          if (!exhausted) {
+            pager->next();
+          }
+        }
+        if (!exhausted) {
+          started = true;
+          pending.page = pager->get();
+        }
+      } catch (...) {
+        pending.error = std::current_exception();
+      }
+
+      lock.lock();
+      --inFlight_;
+      if (exhausted) {
+        break;
+      }
+      if (pending.page.empty() && !pending.error) {
+        continue;
+      }
+      workerCond_.wait(lock, [&] {
+        return cancelled_ || bufferedCounts_[sourceIdx] < kMaxBufferedPagesPerPager;
+      });
+      if (cancelled_) {
+        return;
+      }
+      const bool failed = pending.error != nullptr;
+      ++bufferedCounts_[sourceIdx];
+      ready_.push_back(std::move(pending));
+      consumerCond_.notify_all();
+      if (failed) {
+        break;
+      }
+    }
+
+    // Release the exhausted pager, which closes it, unless the host
+    // retains a reference. If cancelled, the pager is instead released
+    // along with this state.
+    if (!pager || cancelled_) {
+      return;
+    }
+    EntityReferencePagerPtr finishedPager = std::move(pagers_[sourceIdx]);
+    ++inFlight_;
+    lock.unlock();
+    finishedPager.reset();
+    lock.lock();
+    --inFlight_;
+  }
+
+  EntityReferencePagers pagers_;
+  const std::size_t maxConcurrency_;
+  const bool ordered_;
+
+  std::mutex mutex_;
+  /// Notified when a page is buffered or a pager is finished.
+  std::condition_variable consumerCond_;
+  /// Notified when the host takes a page, or on cancellation.
+  std::condition_variable workerCond_;
+
+  /// Pages and errors awaiting the host, in order of arrival.
+  std::deque<Pending> ready_;
+  /// Number of entries in `ready_` per pager.
+  std::vector<std::size_t> bufferedCounts_;
+  /// Whether each pager has been fully traversed.
+  std::vector<bool> finished_;
+  std::size_t finishedCount_ = 0;
+  /// Index of the next pager for a worker to claim.
+  std::size_t nextPagerIdx_ = 0;
+  /// When ordered, index of the pager whose pages are being yielded.
+  std::size_t nextSourceIdx_ = 0;
+  /// Number of workers currently calling a pager.
+  std::size_t inFlight_ = 0;
+  bool cancelled_ = false;
+  /// Whether the host has been given every page (or an error).
+  bool done_ = false;
+};
+
+EntityReferencePagerStreamPtr EntityReferencePagerStream::make(EntityReferencePagers pagers,
+                                                               const std::size_t maxConcurrency,
+                                                               const bool ordered) {
+  if (maxConcurrency == 0) {
+    throw errors::InputValidationException{
+        "EntityReferencePagerStream: maxConcurrency must be greater than zero"};
+  }
+  return EntityReferencePagerStreamPtr{
+      new EntityReferencePagerStream{std::move(pagers), maxConcurrency, ordered}};
+}
+
+EntityReferencePagerStream::EntityReferencePagerStream(EntityReferencePagers pagers,
+                                                       const std::size_t maxConcurrency,
+                                                       const bool ordered) {
+  const std::size_t workerCount = std::min(maxConcurrency, pagers.size());
+  state_ = std::make_shared<State>(std::move(pagers), maxConcurrency, ordered);
+  workers_.reserve(workerCount);
+  for (std::size_t workerIdx = 0; workerIdx < workerCount; ++workerIdx) {
+    workers_.emplace_back([state = state_] { state->run(); });
+  }
+}
+
+EntityReferencePagerStream::~EntityReferencePagerStream() {
+  if (state_->cancelOnDestruction()) {
+    // Joining could block on a pager call, e.g. one waiting on a lock
+    // held by the calling thread, so leave workers to finish their
+    // in-flight calls in the background.
+    for (std::thread& worker : workers_) {
+      worker.detach();
+    }
+    return;
+  }
+  for (std::thread& worker : workers_) {
+    worker.join();
+  }
+}
+
+std::optional<EntityReferencePagerStream::Item> EntityReferencePagerStream::next() {
+  return state_->next();
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -2,9 +2,12 @@
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #include <array>
 #include <cstddef>
+#include <list>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
+#include <unordered_map>
 #include <utility>
 #include <variant>
 #include <vector>
@@ -24,14 +27,26 @@
 #include <openassetio/log/LoggerInterface.hpp>
 #include <openassetio/managerApi/HostSession.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
+#include <openassetio/managerApi/ManagerStateBase.hpp>
 #include <openassetio/trait/TraitsData.hpp>
 #include <openassetio/trait/collection.hpp>
 #include <openassetio/typedefs.hpp>
+#include <openassetio/utils/profiling.hpp>
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace {
 
+/**
+ * Create the manager state of a context, if deferred by
+ * Manager::createChildContext, before it is passed to the manager.
+ */
+void resolveDeferredManagerState(const ContextConstPtr &context) {
+  if (context) {
+    context->resolveManagerState();
+  }
+}
+
 /**
  * Validate the supplied ManagerInterface supports all required
  * capabilities, or throw a ConfigurationException.
@@ -103,9 +118,138 @@ ManagerPtr Manager::make(managerApi::ManagerInterfacePtr managerInterface,
       new Manager(std::move(managerInterface), std::move(hostSession)));
 }
 
+/**
+ * Thread-safe, size-bounded memo of persistence tokens by manager state
+ * identity, and of manager states by persistence token.
+ *
+ * Each direction evicts its least recently used entries once it
+ * reaches capacity.
+ */
+class Manager::PersistenceTokenCache {
+ public:
+  void setCapacity(const std::size_t capacity) {
+    const std::lock_guard lock{mutex_};
+    capacity_ = capacity;
+    tokensByState_.shrink(capacity);
+    statesByToken_.shrink(capacity);
+  }
+
+  [[nodiscard]] std::size_t capacity() const {
+    const std::lock_guard lock{mutex_};
+    return capacity_;
+  }
+
+  void clear() {
+    const std::lock_guard lock{mutex_};
+    tokensByState_.shrink(0);
+    statesByToken_.shrink(0);
+  }
+
+  /// Get the token previously derived from, or restored to, a state.
+  std::optional<Str> token(const managerApi::ManagerStateBasePtr &state) {
+    const std::lock_guard lock{mutex_};
+    const TokenEntry *entry = tokensByState_.find(state.get());
+    if (entry == nullptr) {
+      return std::nullopt;
+    }
+    // If the state we recorded has been destroyed, then this is a
+    // new state that happens to occupy the same address.
+    if (entry->state.expired()) {
+      tokensByState_.erase(state.get());
+      return std::nullopt;
+    }
+    return entry->token;
+  }
+
+  /// Get the state previously restored from a token.
+  managerApi::ManagerStateBasePtr state(const Str &token) {
+    const std::lock_guard lock{mutex_};
+    const managerApi::ManagerStateBasePtr *state = statesByToken_.find(token);
+    return state != nullptr ? *state : nullptr;
+  }
+
+  /// Record the token derived from a state.
+  void addToken(const managerApi::ManagerStateBasePtr &state, const Str &token) {
+    const std::lock_guard lock{mutex_};
+    tokensByState_.insert(state.get(), TokenEntry{state, token}, capacity_);
+  }
+
+  /// Record the state restored from a token.
+  void addState(const Str &token, const managerApi::ManagerStateBasePtr &state) {
+    if (!state) {
+      return;
+    }
+    const std::lock_guard lock{mutex_};
+    statesByToken_.insert(token, state, capacity_);
+    tokensByState_.insert(state.get(), TokenEntry{state, token}, capacity_);
+  }
+
+ private:
+  /// Map that evicts its least recently used entries.
+  template <class Key, class Value>
+  class LruMap {
+   public:
+    /// Find a value, marking it as most recently used.
+    Value *find(const Key &key) {
+      const auto indexIter = index_.find(key);
+      if (indexIter == index_.end()) {
+        return nullptr;
+      }
+      entries_.splice(entries_.begin(), entries_, indexIter->second);
+      return &indexIter->second->second;
+    }
+
+    void insert(const Key &key, Value value, const std::size_t capacity) {
+      if (capacity == 0) {
+        return;
+      }
+      if (Value *existing = find(key)) {
+        *existing = std::move(value);
+        return;
+      }
+      shrink(capacity - 1);
+      entries_.emplace_front(key, std::move(value));
+      index_.emplace(key, entries_.begin());
+    }
+
+    void erase(const Key &key) {
+      const auto indexIter = index_.find(key);
+      if (indexIter != index_.end()) {
+        entries_.erase(indexIter->second);
+        index_.erase(indexIter);
+      }
+    }
+
+    /// Evict least recently used entries until within capacity.
+    void shrink(const std::size_t capacity) {
+      while (index_.size() > capacity) {
+        index_.erase(entries_.back().first);
+        entries_.pop_back();
+      }
+    }
+
+   private:
+    using Entries = std::list<std::pair<Key, Value>>;
+    Entries entries_;
+    std::unordered_map<Key, typename Entries::iterator> index_;
+  };
+
+  struct TokenEntry {
+    std::weak_ptr<managerApi::ManagerStateBase> state;
+    Str token;
+  };
+
+  mutable std::mutex mutex_;
+  std::size_t capacity_ = 0;
+  LruMap<const managerApi::ManagerStateBase *, TokenEntry> tokensByState_;
+  LruMap<Str, managerApi::ManagerStateBasePtr> statesByToken_;
+};
+
 Manager::Manager(managerApi::ManagerInterfacePtr managerInterface,
                  managerApi::HostSessionPtr hostSession)
-    : managerInterface_{std::move(managerInterface)}, hostSession_{std::move(hostSession)} {}
+    : managerInterface_{std::move(managerInterface)},
+      hostSession_{std::move(hostSession)},
+      persistenceTokenCache_{std::make_shared<PersistenceTokenCache>()} {}
 
 Identifier Manager::identifier() const { return managerInterface_->identifier(); }
 
@@ -125,7 +269,13 @@ StrMap Manager::updateTerminology(StrMap terms) {
 InfoDictionary Manager::settings() { return managerInterface_->settings(hostSession_); }
 
 void Manager::initialize(InfoDictionary managerSettings) {
-  managerInterface_->initialize(std::move(managerSettings), hostSession_);
+  const utils::StartupProfile::Scope profileScope{
+      "Manager.initialize",
+      utils::StartupProfile::enabled() ? managerInterface_->identifier() : Str{}};
+  {
+    const utils::StartupProfile::Scope interfaceProfileScope{"ManagerInterface.initialize"};
+    managerInterface_->initialize(std::move(managerSettings), hostSession_);
+  }
 
   // Verify the manager has required capabilities. This must only be
   // done after initialization, to ensure we can support proxy interface
@@ -133,15 +283,20 @@ void Manager::initialize(InfoDictionary managerSettings) {
   // implementation
   verifyRequiredCapabilities(managerInterface_);
 
+  const utils::StartupProfile::Scope infoProfileScope{"ManagerInterface.info"};
   entityReferencePrefix_ =
       entityReferencePrefixFromInfo(hostSession_->logger(), managerInterface_->info());
 }
 
-void Manager::flushCaches() { managerInterface_->flushCaches(hostSession_); }
+void Manager::flushCaches() {
+  persistenceTokenCache_->clear();
+  managerInterface_->flushCaches(hostSession_);
+}
 
 trait::TraitsDatas Manager::managementPolicy(const trait::TraitSets &traitSets,
                                              const access::PolicyAccess policyAccess,
                                              const ContextConstPtr &context) {
+  resolveDeferredManagerState(context);
   return managerInterface_->managementPolicy(traitSets, policyAccess, context, hostSession_);
 }
 
@@ -154,32 +309,133 @@ ContextPtr Manager::createContext() {
   return context;
 }
 
-ContextPtr Manager::createChildContext(const ContextPtr &parentContext) {
+ContextPtr Manager::createChildContext(const ContextPtr &parentContext,
+                                       const bool deferManagerState) {
   // Copy-construct the locale so changes made to the child context
-  // don't affect the parent (and vice versa).
+  // don't affect the parent (and vice versa). The copy is cheap, since
+  // the data is shared until modified.
   ContextPtr context = Context::make(trait::TraitsData::make(parentContext->locale));
-  if (parentContext->managerState) {
-    context->managerState =
-        managerInterface_->createChildState(parentContext->managerState, hostSession_);
+
+  if (!deferManagerState) {
+    if (const managerApi::ManagerStateBasePtr &parentState =
+            parentContext->resolveManagerState()) {
+      context->managerState = managerInterface_->createChildState(parentState, hostSession_);
+    }
+    return context;
+  }
+
+  if (parentContext->hasDeferredManagerState()) {
+    // Parent state is itself deferred, so must be resolved first, but
+    // only once the child is used.
+    context->deferManagerState([managerInterface = managerInterface_, hostSession = hostSession_,
+                                parentContext] {
+      const managerApi::ManagerStateBasePtr &parentState = parentContext->resolveManagerState();
+      return parentState ? managerInterface->createChildState(parentState, hostSession)
+                         : managerApi::ManagerStateBasePtr{};
+    });
+  } else if (parentContext->managerState) {
+    context->deferManagerState([managerInterface = managerInterface_, hostSession = hostSession_,
+                                parentState = parentContext->managerState] {
+      return managerInterface->createChildState(parentState, hostSession);
+    });
   }
   return context;
 }
 
 Str Manager::persistenceTokenForContext(const ContextPtr &context) {
-  if (context->managerState) {
-    return managerInterface_->persistenceTokenForState(context->managerState, hostSession_);
+  const managerApi::ManagerStateBasePtr &state = context->resolveManagerState();
+  if (!state) {
+    return "";
   }
-  return "";
+  if (std::optional<Str> token = persistenceTokenCache_->token(state)) {
+    return std::move(*token);
+  }
+  Str token = managerInterface_->persistenceTokenForState(state, hostSession_);
+  persistenceTokenCache_->addToken(state, token);
+  return token;
 }
 
 ContextPtr Manager::contextFromPersistenceToken(const Str &token) {
   ContextPtr context = Context::make();
   if (!token.empty()) {
-    context->managerState = managerInterface_->stateFromPersistenceToken(token, hostSession_);
+    managerApi::ManagerStateBasePtr state = persistenceTokenCache_->state(token);
+    if (!state) {
+      state = managerInterface_->stateFromPersistenceToken(token, hostSession_);
+      persistenceTokenCache_->addState(token, state);
+    }
+    context->managerState = std::move(state);
   }
   return context;
 }
 
+std::vector<Str> Manager::persistenceTokensForContexts(const std::vector<ContextPtr> &contexts) {
+  for (std::size_t idx = 0; idx < contexts.size(); ++idx) {
+    if (!contexts[idx]) {
+      throw errors::InputValidationException{fmt::format("Context at index {} is null.", idx)};
+    }
+  }
+  // Serialize each distinct manager state once, regardless of whether
+  // the persistence token cache is enabled.
+  std::unordered_map<const managerApi::ManagerStateBase *, std::size_t> tokenIndices;
+  std::vector<Str> tokens;
+  tokens.reserve(contexts.size());
+  for (const ContextPtr &context : contexts) {
+    const managerApi::ManagerStateBasePtr &state = context->resolveManagerState();
+    if (!state) {
+      tokens.emplace_back();
+      continue;
+    }
+    const auto [iter, inserted] = tokenIndices.try_emplace(state.get(), tokens.size());
+    if (!inserted) {
+      tokens.push_back(tokens[iter->second]);
+      continue;
+    }
+    tokens.push_back(persistenceTokenForContext(context));
+  }
+  return tokens;
+}
+
+std::vector<ContextPtr> Manager::contextsFromPersistenceTokens(const std::vector<Str> &tokens) {
+  std::vector<ContextPtr> contexts;
+  contexts.reserve(tokens.size());
+  // With the persistence token cache disabled, each context must have
+  // its own manager state, as if restored individually.
+  if (persistenceTokenCache_->capacity() == 0) {
+    for (const Str &token : tokens) {
+      contexts.push_back(contextFromPersistenceToken(token));
+    }
+    return contexts;
+  }
+  // Otherwise, restore each distinct token in the batch once, even if
+  // there are more distinct tokens than the cache can retain.
+  std::unordered_map<Str, managerApi::ManagerStateBasePtr> states;
+  for (const Str &token : tokens) {
+    if (token.empty()) {
+      contexts.push_back(Context::make());
+      continue;
+    }
+    const auto iter = states.find(token);
+    if (iter == states.end()) {
+      ContextPtr context = contextFromPersistenceToken(token);
+      states.emplace(token, context->managerState);
+      contexts.push_back(std::move(context));
+      continue;
+    }
+    ContextPtr context = Context::make();
+    context->managerState = iter->second;
+    contexts.push_back(std::move(context));
+  }
+  return contexts;
+}
+
+void Manager::setPersistenceTokenCacheCapacity(const std::size_t capacity) {
+  persistenceTokenCache_->setCapacity(capacity);
+}
+
+std::size_t Manager::persistenceTokenCacheCapacity() const {
+  return persistenceTokenCache_->capacity();
+}
+
 bool Manager::isEntityReferenceString(const Str &someString) {
   if (!entityReferencePrefix_) {
     return managerInterface_->isEntityReferenceString(someString, hostSession_);
@@ -209,6 +465,7 @@ void Manager::entityExists(const EntityReferences &entityReferences,
                            const ContextConstPtr &context,
                            const ExistsSuccessCallback &successCallback,
                            const BatchElementErrorCallback &errorCallback) {
+  resolveDeferredManagerState(context);
   managerInterface_->entityExists(entityReferences, context, hostSession_, successCallback,
                                   errorCallback);
 }
@@ -218,6 +475,7 @@ void Manager::entityTraits(const EntityReferences &entityReferences,
                            const ContextConstPtr &context,
                            const EntityTraitsSuccessCallback &successCallback,
                            const BatchElementErrorCallback &errorCallback) {
+  resolveDeferredManagerState(context);
   managerInterface_->entityTraits(entityReferences, entityTraitsAccess, context, hostSession_,
                                   successCallback, errorCallback);
 }
@@ -226,6 +484,7 @@ void Manager::resolve(const EntityReferences &entityReferences, const trait::Tra
                       const access::ResolveAccess resolveAccess, const ContextConstPtr &context,
                       const ResolveSuccessCallback &successCallback,
                       const BatchElementErrorCallback &errorCallback) {
+  resolveDeferredManagerState(context);
   managerInterface_->resolve(entityReferences, traitSet, resolveAccess, context, hostSession_,
                              successCallback, errorCallback);
 }
@@ -235,6 +494,7 @@ void Manager::defaultEntityReference(const trait::TraitSets &traitSets,
                                      const ContextConstPtr &context,
                                      const DefaultEntityReferenceSuccessCallback &successCallback,
                                      const BatchElementErrorCallback &errorCallback) {
+  resolveDeferredManagerState(context);
   managerInterface_->defaultEntityReference(traitSets, defaultEntityAccess, context, hostSession_,
                                             successCallback, errorCallback);
 }
@@ -257,11 +517,13 @@ void Manager::getWithRelationship(const EntityReferences &entityReferences,
    * This callback does the converting construction and forwards through.
    */
   const auto convertingPagerSuccessCallback =
-      [&hostSession = this->hostSession_, &successCallback](
+      [&hostSession = this->hostSession_, &successCallback, pageSize](
           std::size_t idx, managerApi::EntityReferencePagerInterfacePtr pagerInterface) {
-        auto pager = hostApi::EntityReferencePager::make(std::move(pagerInterface), hostSession);
+        auto pager =
+            hostApi::EntityReferencePager::make(std::move(pagerInterface), hostSession, pageSize);
         successCallback(idx, std::move(pager));
       };
+  resolveDeferredManagerState(context);
   managerInterface_->getWithRelationship(entityReferences, relationshipTraitsData, resultTraitSet,
                                          pageSize, relationsAccess, context, hostSession_,
                                          convertingPagerSuccessCallback, errorCallback);
@@ -284,11 +546,13 @@ void Manager::getWithRelationships(
    * This callback does the converting construction and forwards through.
    */
   const auto convertingPagerSuccessCallback =
-      [&hostSession = this->hostSession_, &successCallback](
+      [&hostSession = this->hostSession_, &successCallback, pageSize](
           std::size_t idx, managerApi::EntityReferencePagerInterfacePtr pagerInterface) {
-        auto pager = hostApi::EntityReferencePager::make(std::move(pagerInterface), hostSession);
+        auto pager =
+            hostApi::EntityReferencePager::make(std::move(pagerInterface), hostSession, pageSize);
         successCallback(idx, std::move(pager));
       };
+  resolveDeferredManagerState(context);
   managerInterface_->getWithRelationships(entityReference, relationshipTraitsDatas, resultTraitSet,
                                           pageSize, relationsAccess, context, hostSession_,
                                           convertingPagerSuccessCallback, errorCallback);
@@ -308,6 +572,7 @@ void Manager::preflight(const EntityReferences &entityReferences,
     message += " traits hints.";
     throw errors::InputValidationException{message};
   }
+  resolveDeferredManagerState(context);
   managerInterface_->preflight(entityReferences, traitsHints, publishingAccess, context,
                                hostSession_, successCallback, errorCallback);
 }
@@ -326,6 +591,7 @@ void Manager::register_(const EntityReferences &entityReferences,
     message += " traits datas.";
     throw errors::InputValidationException{message};
   }
+  resolveDeferredManagerState(context);
   managerInterface_->register_(entityReferences, entityTraitsDatas, publishingAccess, context,
                                hostSession_, successCallback, errorCallback);
 }
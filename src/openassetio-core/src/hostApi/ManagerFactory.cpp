@@ -2,11 +2,19 @@
 // Copyright 2022-2025 The Foundry Visionmongers Ltd
 #include <openassetio/hostApi/ManagerFactory.hpp>
 
+#include <algorithm>
 #include <cstdlib>
+#include <memory>
+#include <mutex>
+#include <optional>
 #include <string_view>
 #include <utility>
+#include <vector>
+
+#include <fmt/core.h>
 
 #include <openassetio/export.h>
+#include <openassetio/InfoDictionary.hpp>
 #include <openassetio/hostApi/HostInterface.hpp>
 #include <openassetio/hostApi/Manager.hpp>
 #include <openassetio/hostApi/ManagerImplementationFactoryInterface.hpp>
@@ -16,12 +24,63 @@
 #include <openassetio/managerApi/ManagerInterface.hpp>
 #include <openassetio/private/hostApi/factory.hpp>
 #include <openassetio/typedefs.hpp>
+#include <openassetio/utils/profiling.hpp>
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace hostApi {
 
 const Str ManagerFactory::kDefaultManagerConfigEnvVarName{factory::kDefaultConfigEnvVarName};
+const Str ManagerFactory::kManagerPoolingEnvVarName{"OPENASSETIO_MANAGER_POOLING"};
+
+namespace {
+/// A manager shared between callers of defaultManagerForInterface.
+struct PooledManager {
+  Identifier identifier;
+  InfoDictionary settings;
+  Identifier hostIdentifier;
+  /// Held weakly, so the manager is destroyed with its last user.
+  std::weak_ptr<Manager> manager;
+};
+
+/// Process-wide pool of default managers.
+struct ManagerPool {
+  std::mutex mutex;
+  std::vector<PooledManager> managers;
+  std::optional<bool> enabled;
+};
+
+ManagerPool& managerPool() {
+  static ManagerPool pool;
+  return pool;
+}
+
+/**
+ * Find a live pooled manager matching the given key, removing any
+ * expired entries along the way.
+ *
+ * The pool's mutex must be held by the caller.
+ */
+ManagerPtr findPooledManager(ManagerPool& pool, const Identifier& identifier,
+                             const InfoDictionary& settings, const Identifier& hostIdentifier) {
+  ManagerPtr found;
+  pool.managers.erase(std::remove_if(pool.managers.begin(), pool.managers.end(),
+                                     [&](const PooledManager& pooled) {
+                                       ManagerPtr manager = pooled.manager.lock();
+                                       if (!manager) {
+                                         return true;
+                                       }
+                                       if (!found && pooled.identifier == identifier &&
+                                           pooled.hostIdentifier == hostIdentifier &&
+                                           pooled.settings == settings) {
+                                         found = std::move(manager);
+                                       }
+                                       return false;
+                                     }),
+                      pool.managers.end());
+  return found;
+}
+}  // namespace
 
 ManagerFactoryPtr ManagerFactory::make(
     HostInterfacePtr hostInterface,
@@ -77,18 +136,71 @@ ManagerPtr ManagerFactory::defaultManagerForInterface(
     const std::string_view configPath, const HostInterfacePtr& hostInterface,
     const ManagerImplementationFactoryInterfacePtr& managerImplementationFactory,
     const log::LoggerInterfacePtr& logger) {
+  const utils::StartupProfile::Scope profileScope{"ManagerFactory.defaultManagerForInterface",
+                                                  configPath};
   const auto& [identifier, settings] =
       factory::identifierAndSettingsFromConfigFile(logger, configPath, "manager");
 
+  const bool pooling = managerPooling();
+  Identifier hostIdentifier;
+
+  if (pooling) {
+    hostIdentifier = hostInterface->identifier();
+    ManagerPool& pool = managerPool();
+    const std::lock_guard lock{pool.mutex};
+    if (ManagerPtr pooledManager =
+            findPooledManager(pool, Identifier(identifier), settings, hostIdentifier)) {
+      logger->debug(fmt::format("Reusing pooled manager '{}'", identifier));
+      return pooledManager;
+    }
+  }
+
   const managerApi::HostSessionPtr hostSession =
       managerApi::HostSession::make(managerApi::Host::make(hostInterface), logger);
 
-  const ManagerPtr manager = Manager::make(
+  ManagerPtr manager = Manager::make(
       managerImplementationFactory->instantiate(Identifier(identifier)), hostSession);
 
+  // Initialized without holding the pool's lock, since this may be
+  // slow, and could itself request a default manager.
   manager->initialize(settings);
+
+  if (pooling) {
+    ManagerPool& pool = managerPool();
+    const std::lock_guard lock{pool.mutex};
+    // Another thread may have pooled an equivalent manager whilst we
+    // were initializing ours, in which case prefer theirs, so that all
+    // callers share a single instance.
+    if (ManagerPtr pooledManager =
+            findPooledManager(pool, Identifier(identifier), settings, hostIdentifier)) {
+      logger->debug(fmt::format("Reusing pooled manager '{}'", identifier));
+      return pooledManager;
+    }
+    pool.managers.push_back(
+        PooledManager{Identifier(identifier), settings, std::move(hostIdentifier), manager});
+    logger->debug(fmt::format("Added manager '{}' to pool", identifier));
+  }
+
   return manager;
 }
+
+void ManagerFactory::setManagerPooling(const std::optional<bool> enabled) {
+  ManagerPool& pool = managerPool();
+  const std::lock_guard lock{pool.mutex};
+  pool.enabled = enabled;
+}
+
+bool ManagerFactory::managerPooling() {
+  {
+    ManagerPool& pool = managerPool();
+    const std::lock_guard lock{pool.mutex};
+    if (pool.enabled) {
+      return *pool.enabled;
+    }
+  }
+  const char* pooling = std::getenv(kManagerPoolingEnvVarName.c_str());
+  return pooling != nullptr && *pooling != '\0' && std::string_view{pooling} != "0";
+}
 }  // namespace hostApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
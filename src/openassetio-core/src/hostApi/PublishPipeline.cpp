@@ -0,0 +1,112 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <utility>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
+#include <openassetio/errors/exceptions.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/hostApi/PublishPipeline.hpp>
+#include <openassetio/hostApi/PublishStream.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+PublishPipelinePtr PublishPipeline::make(ManagerPtr manager,
+                                         const access::PublishingAccess publishingAccess,
+                                         ContextConstPtr context, WriteCallback writeCallback,
+                                         SuccessCallback successCallback,
+                                         ErrorCallback errorCallback, const std::size_t chunkSize,
+                                         const std::size_t maxPendingChunks) {
+  if (chunkSize == 0) {
+    throw errors::InputValidationException{"PublishPipeline: chunkSize must be greater than zero"};
+  }
+  if (maxPendingChunks == 0) {
+    throw errors::InputValidationException{
+        "PublishPipeline: maxPendingChunks must be greater than zero"};
+  }
+  return PublishPipelinePtr{new PublishPipeline{
+      std::move(manager), publishingAccess, std::move(context), std::move(writeCallback),
+      std::move(successCallback), std::move(errorCallback), chunkSize, maxPendingChunks}};
+}
+
+PublishPipeline::PublishPipeline(ManagerPtr manager,
+                                 const access::PublishingAccess publishingAccess,
+                                 ContextConstPtr context, WriteCallback writeCallback,
+                                 SuccessCallback successCallback, ErrorCallback errorCallback,
+                                 const std::size_t chunkSize, const std::size_t maxPendingChunks)
+    : writeCallback_{std::move(writeCallback)},
+      successCallback_{std::move(successCallback)},
+      errorCallback_{std::move(errorCallback)} {
+  // The streams' callbacks are only called from within their `push`
+  // and `flush`, i.e. from within ours, so can safely capture `this`.
+  registerStream_ = PublishStream::make(
+      manager, PublishStream::Operation::kRegister, publishingAccess, context,
+      [this](const std::size_t index, EntityReference entityReference) {
+        ++completedCount_;
+        successCallback_(pipelineIndex(index), std::move(entityReference));
+      },
+      [this](const std::size_t index, errors::BatchElementError error) {
+        ++completedCount_;
+        errorCallback_(pipelineIndex(index), std::move(error));
+      },
+      chunkSize, maxPendingChunks);
+
+  preflightStream_ = PublishStream::make(
+      std::move(manager), PublishStream::Operation::kPreflight, publishingAccess,
+      std::move(context),
+      [this](const std::size_t index, EntityReference entityReference) {
+        write(index, std::move(entityReference));
+      },
+      [this](const std::size_t index, errors::BatchElementError error) {
+        ++completedCount_;
+        errorCallback_(index, std::move(error));
+      },
+      chunkSize, maxPendingChunks);
+}
+
+void PublishPipeline::push(EntityReference entityReference, trait::TraitsDataPtr traitsHint) {
+  preflightStream_->push(std::move(entityReference), std::move(traitsHint));
+  trimRegisterIndices();
+}
+
+void PublishPipeline::flush() {
+  preflightStream_->flush();
+  registerStream_->flush();
+  trimRegisterIndices();
+}
+
+std::size_t PublishPipeline::pushedCount() const { return preflightStream_->pushedCount(); }
+
+std::size_t PublishPipeline::completedCount() const { return completedCount_; }
+
+void PublishPipeline::write(const std::size_t index, EntityReference entityReference) {
+  trait::TraitsDataPtr traitsData = writeCallback_(index, entityReference);
+  if (!traitsData) {
+    ++completedCount_;
+    return;
+  }
+  registerIndices_.push_back(index);
+  registerStream_->push(std::move(entityReference), std::move(traitsData));
+}
+
+std::size_t PublishPipeline::pipelineIndex(const std::size_t registerIndex) const {
+  // Indices given by the stream are already bounds checked.
+  return registerIndices_[registerIndex - registerIndexOffset_];
+}
+
+void PublishPipeline::trimRegisterIndices() {
+  const std::size_t registeredCount = registerStream_->completedCount();
+  while (registerIndexOffset_ < registeredCount && !registerIndices_.empty()) {
+    registerIndices_.pop_front();
+    ++registerIndexOffset_;
+  }
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
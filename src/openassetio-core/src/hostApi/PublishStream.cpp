@@ -0,0 +1,346 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <fmt/format.h>
+
+#include <openassetio/export.h>
+#include <openassetio/Context.hpp>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
+#include <openassetio/errors/exceptions.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/hostApi/PublishStream.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio/trait/collection.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+/**
+ * State shared between the stream and its worker.
+ *
+ * The worker shares ownership, so that it can outlive the stream if it
+ * is destroyed whilst the worker is mid-call to the manager.
+ *
+ * Every call to the manager is made outside the lock, but is preceded
+ * by a check of `cancelled` and an increment of `inFlight` under the
+ * lock. Once cancelled, the stream can therefore tell whether joining
+ * the worker could block on the manager.
+ */
+class PublishStream::State {
+ public:
+  /// A chunk of entities, and their results once sent to the manager.
+  struct Chunk {
+    /// Index of the first entity of the chunk.
+    std::size_t startIndex = 0;
+    EntityReferences entityReferences;
+    trait::TraitsDatas traitsDatas;
+    /// Result per entity, if the manager gave one.
+    std::vector<std::variant<std::monostate, EntityReference, errors::BatchElementError>> results;
+    /// Exception thrown by the manager, if any.
+    std::exception_ptr error;
+    bool done = false;
+  };
+  using ChunkPtr = std::shared_ptr<Chunk>;
+
+  State(ManagerPtr manager, const Operation operation,
+        const access::PublishingAccess publishingAccess, ContextConstPtr context,
+        SuccessCallback successCallback, ErrorCallback errorCallback, const std::size_t chunkSize,
+        const std::size_t maxPendingChunks)
+      : manager_{std::move(manager)},
+        operation_{operation},
+        publishingAccess_{publishingAccess},
+        context_{std::move(context)},
+        successCallback_{std::move(successCallback)},
+        errorCallback_{std::move(errorCallback)},
+        chunkSize_{chunkSize},
+        maxPendingChunks_{maxPendingChunks} {}
+
+  /// Worker thread body: send queued chunks to the manager in turn.
+  void run() {
+    std::unique_lock lock{mutex_};
+    while (true) {
+      workerCond_.wait(lock, [&] { return cancelled_ || !queued_.empty(); });
+      if (cancelled_) {
+        return;
+      }
+      ChunkPtr chunk = std::move(queued_.front());
+      queued_.pop_front();
+
+      ++inFlight_;
+      lock.unlock();
+      send(*chunk);
+      lock.lock();
+      --inFlight_;
+
+      chunk->done = true;
+      consumerCond_.notify_all();
+    }
+  }
+
+  /// Add an entity. See PublishStream::push.
+  void push(EntityReference entityReference, trait::TraitsDataPtr traitsData) {
+    throwIfFailed();
+    if (!traitsData) {
+      throw errors::InputValidationException{"PublishStream: traitsData cannot be null"};
+    }
+    if (!buffer_) {
+      buffer_ = std::make_shared<Chunk>();
+      buffer_->startIndex = pushedCount_;
+      buffer_->entityReferences.reserve(chunkSize_);
+      buffer_->traitsDatas.reserve(chunkSize_);
+    }
+    buffer_->entityReferences.push_back(std::move(entityReference));
+    buffer_->traitsDatas.push_back(std::move(traitsData));
+    ++pushedCount_;
+    if (buffer_->entityReferences.size() == chunkSize_) {
+      submit();
+      deliver(/*wait=*/false);
+    }
+  }
+
+  /// Send any partial chunk and wait for all. See PublishStream::flush.
+  void flush() {
+    throwIfFailed();
+    if (buffer_) {
+      submit();
+    }
+    deliver(/*wait=*/true);
+  }
+
+  [[nodiscard]] std::size_t pushedCount() const { return pushedCount_; }
+
+  [[nodiscard]] std::size_t completedCount() const { return completedCount_; }
+
+  /**
+   * Cancel outstanding work, on destruction of the stream.
+   *
+   * @return Whether the worker is mid-call to the manager.
+   */
+  bool cancelOnDestruction() {
+    const std::lock_guard lock{mutex_};
+    cancel();
+    return inFlight_ > 0;
+  }
+
+ private:
+  /// Call the manager for a chunk, recording its results.
+  void send(Chunk& chunk) {
+    chunk.results.resize(chunk.entityReferences.size());
+    const auto validIndex = [&chunk](const std::size_t index) {
+      if (index >= chunk.results.size()) {
+        throw errors::InputValidationException{fmt::format(
+            "Index '{}' out of bounds for batch size of {}", index, chunk.results.size())};
+      }
+      return index;
+    };
+    const auto onSuccess = [&](const std::size_t index, EntityReference entityReference) {
+      chunk.results[validIndex(index)] = std::move(entityReference);
+    };
+    const auto onError = [&](const std::size_t index, errors::BatchElementError error) {
+      chunk.results[validIndex(index)] = std::move(error);
+    };
+
+    try {
+      if (operation_ == Operation::kPreflight) {
+        manager_->preflight(chunk.entityReferences, chunk.traitsDatas, publishingAccess_, context_,
+                            onSuccess, onError);
+      } else {
+        manager_->register_(chunk.entityReferences, chunk.traitsDatas, publishingAccess_, context_,
+                            onSuccess, onError);
+      }
+    } catch (...) {
+      chunk.error = std::current_exception();
+    }
+    // Inputs are no longer needed, so free them whilst the chunk
+    // awaits the host.
+    chunk.entityReferences = {};
+    chunk.traitsDatas = {};
+  }
+
+  /**
+   * Queue the buffered chunk for the worker, first waiting for (and
+   * delivering) completed chunks if too many are pending.
+   */
+  void submit() {
+    while (true) {
+      {
+        const std::lock_guard lock{mutex_};
+        if (pending_.size() < maxPendingChunks_) {
+          pending_.push_back(buffer_);
+          queued_.push_back(std::move(buffer_));
+          workerCond_.notify_all();
+          return;
+        }
+      }
+      deliverOne(/*wait=*/true);
+    }
+  }
+
+  /**
+   * Give the results of completed chunks to the host, in order.
+   *
+   * @param wait Whether to wait for all pending chunks to complete, or
+   * only deliver those that already have.
+   */
+  void deliver(const bool wait) {
+    while (deliverOne(wait)) {
+    }
+  }
+
+  /**
+   * Give the results of the oldest pending chunk to the host.
+   *
+   * @param wait Whether to wait for the chunk to complete.
+   *
+   * @return Whether a chunk was delivered.
+   */
+  bool deliverOne(const bool wait) {
+    ChunkPtr chunk;
+    {
+      std::unique_lock lock{mutex_};
+      if (wait) {
+        consumerCond_.wait(lock, [&] { return pending_.empty() || pending_.front()->done; });
+      }
+      if (pending_.empty() || !pending_.front()->done) {
+        return false;
+      }
+      chunk = std::move(pending_.front());
+      pending_.pop_front();
+    }
+
+    try {
+      if (chunk->error) {
+        std::rethrow_exception(chunk->error);
+      }
+      for (std::size_t idx = 0; idx < chunk->results.size(); ++idx) {
+        auto& result = chunk->results[idx];
+        if (auto* entityReference = std::get_if<EntityReference>(&result)) {
+          successCallback_(chunk->startIndex + idx, std::move(*entityReference));
+        } else if (auto* error = std::get_if<errors::BatchElementError>(&result)) {
+          errorCallback_(chunk->startIndex + idx, std::move(*error));
+        }
+      }
+    } catch (...) {
+      failed_ = true;
+      {
+        const std::lock_guard lock{mutex_};
+        cancel();
+      }
+      throw;
+    }
+    completedCount_ += chunk->results.size();
+    return true;
+  }
+
+  void throwIfFailed() const {
+    if (failed_) {
+      throw errors::InputValidationException{
+          "PublishStream: cannot continue a stream after a failure"};
+    }
+  }
+
+  /**
+   * Cancel outstanding work. Must be called with the lock held.
+   */
+  void cancel() {
+    cancelled_ = true;
+    queued_.clear();
+    pending_.clear();
+    workerCond_.notify_all();
+  }
+
+  const ManagerPtr manager_;
+  const Operation operation_;
+  const access::PublishingAccess publishingAccess_;
+  const ContextConstPtr context_;
+  const SuccessCallback successCallback_;
+  const ErrorCallback errorCallback_;
+  const std::size_t chunkSize_;
+  const std::size_t maxPendingChunks_;
+
+  // Only accessed by the host's thread.
+  /// Chunk being filled by the host.
+  ChunkPtr buffer_;
+  std::size_t pushedCount_ = 0;
+  std::size_t completedCount_ = 0;
+  /// Whether a chunk failed, finishing the stream.
+  bool failed_ = false;
+
+  std::mutex mutex_;
+  /// Notified when a chunk completes.
+  std::condition_variable consumerCond_;
+  /// Notified when a chunk is queued, or on cancellation.
+  std::condition_variable workerCond_;
+  /// Chunks awaiting the worker.
+  std::deque<ChunkPtr> queued_;
+  /// Chunks sent to the worker whose results are yet to be delivered,
+  /// in order.
+  std::deque<ChunkPtr> pending_;
+  /// Whether the worker is currently calling the manager.
+  std::size_t inFlight_ = 0;
+  bool cancelled_ = false;
+};
+
+PublishStreamPtr PublishStream::make(ManagerPtr manager, const Operation operation,
+                                     const access::PublishingAccess publishingAccess,
+                                     ContextConstPtr context, SuccessCallback successCallback,
+                                     ErrorCallback errorCallback, const std::size_t chunkSize,
+                                     const std::size_t maxPendingChunks) {
+  if (chunkSize == 0) {
+    throw errors::InputValidationException{"PublishStream: chunkSize must be greater than zero"};
+  }
+  if (maxPendingChunks == 0) {
+    throw errors::InputValidationException{
+        "PublishStream: maxPendingChunks must be greater than zero"};
+  }
+  return PublishStreamPtr{new PublishStream{
+      std::move(manager), operation, publishingAccess, std::move(context),
+      std::move(successCallback), std::move(errorCallback), chunkSize, maxPendingChunks}};
+}
+
+PublishStream::PublishStream(ManagerPtr manager, const Operation operation,
+                             const access::PublishingAccess publishingAccess,
+                             ContextConstPtr context, SuccessCallback successCallback,
+                             ErrorCallback errorCallback, const std::size_t chunkSize,
+                             const std::size_t maxPendingChunks)
+    : state_{std::make_shared<State>(std::move(manager), operation, publishingAccess,
+                                     std::move(context), std::move(successCallback),
+                                     std::move(errorCallback), chunkSize, maxPendingChunks)},
+      worker_{[state = state_] { state->run(); }} {}
+
+PublishStream::~PublishStream() {
+  if (state_->cancelOnDestruction()) {
+    // Joining could block on the manager, e.g. one waiting on a lock
+    // held by the calling thread, so leave the worker to finish its
+    // in-flight call in the background.
+    worker_.detach();
+    return;
+  }
+  worker_.join();
+}
+
+void PublishStream::push(EntityReference entityReference, trait::TraitsDataPtr traitsData) {
+  state_->push(std::move(entityReference), std::move(traitsData));
+}
+
+void PublishStream::flush() { state_->flush(); }
+
+std::size_t PublishStream::pushedCount() const { return state_->pushedCount(); }
+
+std::size_t PublishStream::completedCount() const { return state_->completedCount(); }
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -0,0 +1,184 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <cstddef>
+#include <optional>
+#include <utility>
+
+#include <fmt/format.h>
+
+#include <openassetio/export.h>
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
+#include <openassetio/errors/exceptions.hpp>
+#include <openassetio/hostApi/EntityReferencePager.hpp>
+#include <openassetio/hostApi/EntityReferencePagerStream.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/hostApi/RelationshipTraversal.hpp>
+#include <openassetio/internal.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio/trait/collection.hpp>
+
+#include "../errors/exceptionMessages.hpp"
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace hostApi {
+
+RelationshipTraversalPtr RelationshipTraversal::make(
+    ManagerPtr manager, EntityReferences entityReferences,
+    trait::TraitsDatas relationshipTraitsDatas, const access::RelationsAccess relationsAccess,
+    ContextConstPtr context, const std::size_t maxDepth, const std::size_t maxEntities,
+    const std::size_t pageSize, const std::size_t maxConcurrency, trait::TraitSet resultTraitSet,
+    ErrorCallback errorCallback) {
+  if (relationshipTraitsDatas.empty()) {
+    throw errors::InputValidationException{
+        "RelationshipTraversal: at least one relationship must be provided"};
+  }
+  if (std::find(begin(relationshipTraitsDatas), end(relationshipTraitsDatas), nullptr) !=
+      end(relationshipTraitsDatas)) {
+    throw errors::InputValidationException{"RelationshipTraversal: relationship cannot be None"};
+  }
+  if (pageSize == 0) {
+    throw errors::InputValidationException{
+        "RelationshipTraversal: pageSize must be greater than zero"};
+  }
+  if (maxConcurrency == 0) {
+    throw errors::InputValidationException{
+        "RelationshipTraversal: maxConcurrency must be greater than zero"};
+  }
+  return RelationshipTraversalPtr{new RelationshipTraversal{
+      std::move(manager), std::move(entityReferences), std::move(relationshipTraitsDatas),
+      relationsAccess, std::move(context), maxDepth, maxEntities, pageSize, maxConcurrency,
+      std::move(resultTraitSet), std::move(errorCallback)}};
+}
+
+RelationshipTraversal::RelationshipTraversal(
+    ManagerPtr manager, EntityReferences entityReferences,
+    trait::TraitsDatas relationshipTraitsDatas, const access::RelationsAccess relationsAccess,
+    ContextConstPtr context, const std::size_t maxDepth, const std::size_t maxEntities,
+    const std::size_t pageSize, const std::size_t maxConcurrency, trait::TraitSet resultTraitSet,
+    ErrorCallback errorCallback)
+    : manager_{std::move(manager)},
+      relationshipTraitsDatas_{std::move(relationshipTraitsDatas)},
+      relationsAccess_{relationsAccess},
+      context_{std::move(context)},
+      maxDepth_{maxDepth},
+      maxEntities_{maxEntities},
+      pageSize_{pageSize},
+      maxConcurrency_{maxConcurrency},
+      resultTraitSet_{std::move(resultTraitSet)},
+      errorCallback_{std::move(errorCallback)} {
+  for (EntityReference& entityReference : entityReferences) {
+    if (visited_.insert(entityReference).second) {
+      frontier_.push_back(std::move(entityReference));
+    }
+  }
+}
+
+std::optional<RelationshipTraversal::Edges> RelationshipTraversal::next() {
+  while (!finished_) {
+    if (!stream_) {
+      if (frontier_.empty() || depth_ == maxDepth_) {
+        finish();
+        break;
+      }
+      try {
+        startLevel();
+      } catch (...) {
+        finish();
+        throw;
+      }
+      continue;
+    }
+
+    std::optional<EntityReferencePagerStream::Item> item;
+    try {
+      item = stream_->next();
+    } catch (...) {
+      finish();
+      throw;
+    }
+    if (!item) {
+      // Level complete.
+      stream_.reset();
+      continue;
+    }
+
+    const EntityReference& source = sources_[item->sourceIndex];
+    Edges edges;
+    edges.reserve(item->page.size());
+    for (EntityReference& target : item->page) {
+      if (visited_.find(target) == visited_.end()) {
+        if (entityCount_ == maxEntities_) {
+          truncated_ = true;
+          finish();
+          break;
+        }
+        visited_.insert(target);
+        ++entityCount_;
+        if (depth_ < maxDepth_) {
+          frontier_.push_back(target);
+        }
+      }
+      edges.push_back(Edge{source, std::move(target), depth_});
+    }
+    if (!edges.empty()) {
+      return edges;
+    }
+  }
+  return std::nullopt;
+}
+
+bool RelationshipTraversal::truncated() const { return truncated_; }
+
+std::size_t RelationshipTraversal::entityCount() const { return entityCount_; }
+
+void RelationshipTraversal::startLevel() {
+  sources_ = std::move(frontier_);
+  frontier_.clear();
+  const std::size_t sourceDepth = depth_++;
+  const trait::TraitsDataPtr& relationshipTraitsData =
+      relationshipTraitsDatas_[std::min(sourceDepth, relationshipTraitsDatas_.size() - 1)];
+
+  EntityReferencePagerStream::EntityReferencePagers pagers(sources_.size());
+  const auto validIndex = [this](const std::size_t index) {
+    if (index >= sources_.size()) {
+      throw errors::InputValidationException{
+          fmt::format("Index '{}' out of bounds for batch size of {}", index, sources_.size())};
+    }
+    return index;
+  };
+
+  manager_->getWithRelationship(
+      sources_, relationshipTraitsData, pageSize_, relationsAccess_, context_,
+      [&](const std::size_t index, EntityReferencePagerPtr pager) {
+        pagers[validIndex(index)] = std::move(pager);
+      },
+      [&](const std::size_t index, errors::BatchElementError error) {
+        const EntityReference& source = sources_[validIndex(index)];
+        if (errorCallback_) {
+          errorCallback_(source, sourceDepth, std::move(error));
+          return;
+        }
+        auto msg = errors::createBatchElementExceptionMessage(
+            error, index, static_cast<internal::access::Access>(relationsAccess_), source,
+            relationshipTraitsData->traitSet());
+        throw errors::BatchElementException(index, std::move(error), msg);
+      },
+      resultTraitSet_);
+
+  stream_ = EntityReferencePagerStream::make(std::move(pagers), maxConcurrency_);
+}
+
+void RelationshipTraversal::finish() {
+  finished_ = true;
+  // Cancels any outstanding page fetches.
+  stream_.reset();
+  frontier_.clear();
+  sources_.clear();
+}
+}  // namespace hostApi
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
@@ -1,5 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+
 #include <openassetio/export.h>
 #include <openassetio/managerApi/EntityReferencePagerInterface.hpp>
 
@@ -7,6 +9,10 @@ namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
 namespace managerApi {
 
+void EntityReferencePagerInterface::setPageSizeHint(
+    [[maybe_unused]] const std::size_t pageSize,
+    [[maybe_unused]] const HostSessionPtr& hostSession) {}
+
 void EntityReferencePagerInterface::close([[maybe_unused]] const HostSessionPtr& hostSession) {}
 }  // namespace managerApi
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
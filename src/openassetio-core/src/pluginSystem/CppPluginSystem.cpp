@@ -5,15 +5,23 @@
 // OpenImageIO project.
 
 #include <algorithm>
+#include <atomic>
+#include <charconv>
+#include <chrono>
 #include <cstddef>
 #include <cstdlib>
 #include <exception>
 #include <filesystem>
 #include <iterator>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <string>
 #include <string_view>
+#include <system_error>
+#include <thread>
 #include <utility>
+#include <vector>
 #ifdef _WIN32
 #include <windows.h>
 #else
@@ -28,6 +36,9 @@
 #include <openassetio/pluginSystem/CppPluginSystem.hpp>
 #include <openassetio/pluginSystem/CppPluginSystemPlugin.hpp>
 #include <openassetio/typedefs.hpp>
+#include <openassetio/utils/profiling.hpp>
+
+#include "CppPluginSystemDiscoveryIndex.hpp"
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
@@ -97,15 +108,149 @@ constexpr std::string_view kLibExt = ".so";
 // Path separator for encoding multiple search paths in a single string.
 constexpr char kPathSep = ':';
 #endif
+
+/// A library opened by @ref openPlugin, and the plugin it provides.
+struct OpenedPlugin {
+  void* handle;
+  Identifier identifier;
+  CppPluginSystemPluginPtr plugin;
+};
+
+/**
+ * Open a library and construct the plugin it provides, logging the
+ * reason for any failure.
+ *
+ * @param hasEntryPoint Set to false if the library could be opened but
+ * does not expose @p moduleHookName.
+ */
+std::optional<OpenedPlugin> openPlugin(const log::LoggerInterfacePtr& logger,
+                                       const std::filesystem::path& filePath,
+                                       const std::string_view moduleHookName,
+                                       bool& hasEntryPoint) {
+  const utils::StartupProfile::Scope profileScope{"CppPluginSystem.load", filePath.string()};
+
+  // Open the binary.
+  //
+  // Use RTLD_LOCAL to avoid pollution of global namespace, and to
+  // better match Windows behaviour (which ignores the flags, see
+  // above).
+  //
+  // Note that this is considered a `noexcept` operation. On GCC it is
+  // hackily possible to catch exceptions at static initialization time,
+  // but is UB.
+  void* handle = dlopen(filePath.c_str(), RTLD_LAZY | RTLD_LOCAL);
+
+  if (!handle) {
+    logger->debug(fmt::format("CppPluginSystem: Failed to open library '{}': {}",
+                              filePath.string(), dlerror()));
+    return {};
+  }
+
+  // Get the entrypoint function.
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  void* entrypoint = dlsym(handle, moduleHookName.data());
+  if (!entrypoint) {
+    logger->debug(fmt::format("CppPluginSystem: No top-level '{}' function in '{}': {}",
+                              moduleHookName, filePath.string(), dlerror()));
+    dlclose(handle);
+    hasEntryPoint = false;
+    return {};
+  }
+
+  // Load the plugin object.
+  //
+  // Note that this is considered a `noexcept` operation. This is for
+  // the best cross-platform consistency. I.e. By default, POSIX can
+  // support exceptions from both the initial entrypoint function
+  // and from the PluginFactory function pointer. Windows
+  // cannot support exceptions (fatal "access violation") from either.
+
+  // The entry point function should be a no-argument function that
+  // returns a function pointer. I.e. a factory function for creating a
+  // PluginFactory.
+  // NOLINTNEXTLINE(cppcoreguidelines-pro-type-reinterpret-cast)
+  const auto pluginFactoryFactory = reinterpret_cast<PluginFactory (*)()>(entrypoint);
+
+  // Calling the entry point function yields a PluginFactory function
+  // pointer. As noted above, this is a `noexcept` operation.
+  const PluginFactory pluginFactory = pluginFactoryFactory();
+
+  // Finally, we get the actual plugin object from the factory function
+  // pointer. Again, this is a `noexcept` operation.
+  CppPluginSystemPluginPtr plugin = pluginFactory();
+
+  // Check if the shared_ptr contains nullptr.
+  if (!plugin) {
+    logger->warning(
+        fmt::format("CppPluginSystem: Null plugin returned by '{}'", filePath.string()));
+
+    dlclose(handle);
+    return {};
+  }
+
+  // Get plugin's unique identifier.
+  Identifier identifier;
+  try {
+    identifier = plugin->identifier();
+  } catch (const std::exception& exc) {
+    logger->warning(
+        fmt::format("CppPluginSystem: Caught exception calling 'identifier' of '{}': {}",
+                    filePath.string(), exc.what()));
+    plugin.reset();
+  } catch (...) {
+    logger->warning(
+        fmt::format("CppPluginSystem: Caught exception calling 'identifier' of '{}':"
+                    " <unknown non-exception value caught>",
+                    filePath.string()));
+    plugin.reset();
+  }
+
+  // Unload the library if an exception was caught whilst retrieving the
+  // identifier.
+  //
+  // Must wait til after the try-catch to close handle, since exception
+  // object needs a chance to destruct whilst the plugin binary is still
+  // loaded.
+  if (!plugin) {
+    dlclose(handle);
+    return {};
+  }
+
+  return {{handle, std::move(identifier), std::move(plugin)}};
+}
+
+/**
+ * Destroy a plugin then close the library that provides it.
+ */
+void closePlugin(OpenedPlugin& opened) {
+  opened.plugin.reset();  // Must destroy _before_ closing lib.
+  dlclose(opened.handle);
+}
 }  // namespace
 
+/// Result of probing a candidate plugin library.
+struct CppPluginSystem::ProbeResult {
+  /// Stamp of the library, if it should be recorded in the discovery
+  /// index once accepted.
+  std::optional<DiscoveryIndex::FileStamp> stamp;
+  /// Identifier from the discovery index, if loading is deferred.
+  std::optional<Identifier> deferredIdentifier;
+  /// The opened library and its plugin, if successfully loaded.
+  std::optional<OpenedPlugin> opened;
+  /// Whether the library was opened, but didn't expose the hook.
+  bool hasEntryPoint = true;
+  /// Path to the library.
+  std::filesystem::path filePath;
+};
+
 CppPluginSystemPtr CppPluginSystem::make(log::LoggerInterfacePtr logger) {
-  return std::make_shared<CppPluginSystem>(CppPluginSystem{std::move(logger)});
+  return CppPluginSystemPtr{new CppPluginSystem{std::move(logger)}};
 }
 
 void CppPluginSystem::reset() {
   // Note: do not dlclose plugins - they may be in use.
   plugins_.clear();
+  deferredLoads_.clear();
 }
 
 CppPluginSystem::CppPluginSystem(log::LoggerInterfacePtr logger) : logger_{std::move(logger)} {}
@@ -114,7 +259,23 @@ CppPluginSystem::CppPluginSystem(log::LoggerInterfacePtr logger) : logger_{std::
 void CppPluginSystem::scan(const std::string_view paths, const std::string_view pathsEnvVar,
                            const std::string_view moduleHookName,
                            const ValidationCallback& validationCallback) {
-  const auto scanPaths = [&](const std::string_view pathsToScan) {
+  const utils::StartupProfile::Scope profileScope{"CppPluginSystem.scan", paths};
+  using Clock = std::chrono::steady_clock;
+  const Clock::time_point startTime = Clock::now();
+
+  std::optional<DiscoveryIndex> discoveryIndex;
+  if (std::filesystem::path indexPath = discoveryIndexPath(); !indexPath.empty()) {
+    discoveryIndex.emplace(std::move(indexPath), logger_);
+  }
+  DiscoveryIndex* const discoveryIndexPtr = discoveryIndex ? &*discoveryIndex : nullptr;
+
+  const Clock::time_point listStartTime = Clock::now();
+
+  std::vector<std::filesystem::path> scannedDirectories;
+  // Candidate files, in precedence order.
+  std::vector<std::filesystem::path> candidates;
+
+  const auto listPaths = [&](const std::string_view pathsToScan) {
     std::size_t pathsStartIdx = 0;
     std::size_t pathsEndIdx = 0;
 
@@ -131,29 +292,20 @@ void CppPluginSystem::scan(const std::string_view paths, const std::string_view
                                    directoryPath.string()));
         continue;
       }
+      scannedDirectories.push_back(directoryPath);
 
-      // Loop each item in the provided search path.
+      // Assume each item in the search path is a plugin file, to be
+      // checked when probed.
       for (const std::filesystem::directory_entry& directoryEntry :
            std::filesystem::directory_iterator{directoryPath}) {
-        std::filesystem::path filePath = directoryEntry.path();
-
-        // Assume the item in the search path is a plugin file and attempt
-        // to load it.
-        if (MaybeIdentifierAndPlugin idAndPlugin =
-                maybeLoadPlugin(filePath, moduleHookName, validationCallback)) {
-          logger_->debug(fmt::format("CppPluginSystem: Registered plug-in '{}' from '{}'",
-                                     idAndPlugin->first, filePath.string()));
-          // Register the successfully loaded plugin.
-          plugins_[std::move(idAndPlugin->first)] = {std::move(filePath),
-                                                     std::move(idAndPlugin->second)};
-        }
+        candidates.push_back(directoryEntry.path());
       }
     }
   };
 
   // Prefer fixed paths, else fall back to env var.
   if (!paths.empty()) {
-    scanPaths(paths);
+    listPaths(paths);
   } else {
     const std::string_view pathsFromEnvVar = [&] {
       if (pathsEnvVar.empty()) {  // Defend against uninitialised string_view.
@@ -172,9 +324,172 @@ void CppPluginSystem::scan(const std::string_view paths, const std::string_view
           "CppPluginSystem: No search paths specified, no plugins will load - check ${} is set",
           pathsEnvVar));
     } else {
-      scanPaths(pathsFromEnvVar);
+      listPaths(pathsFromEnvVar);
+    }
+  }
+
+  const Clock::time_point listEndTime = Clock::now();
+
+  // Register a probed plugin if it is accepted. Always called in
+  // precedence order, so that the leftmost path wins.
+  Clock::duration acceptDuration{};
+  const auto acceptAndRegister = [&](std::filesystem::path filePath, ProbeResult probeResult) {
+    const Clock::time_point acceptStartTime = Clock::now();
+    if (MaybeIdentifierAndPlugin idAndPlugin = acceptProbedPlugin(
+            std::move(probeResult), moduleHookName, validationCallback, discoveryIndexPtr)) {
+      logger_->debug(fmt::format("CppPluginSystem: Registered plug-in '{}' from '{}'",
+                                 idAndPlugin->first, filePath.string()));
+      if (!idAndPlugin->second) {
+        deferredLoads_.insert_or_assign(idAndPlugin->first,
+                                        DeferredLoad{Str{moduleHookName}, validationCallback});
+      }
+      // Register the successfully loaded (or deferred) plugin.
+      plugins_[std::move(idAndPlugin->first)] = {std::move(filePath),
+                                                 std::move(idAndPlugin->second)};
+    }
+    acceptDuration += Clock::now() - acceptStartTime;
+  };
+
+  const std::size_t threadCount = [&] {
+    const std::size_t requested = scanThreadCount();
+    return std::min(requested == 0 ? std::max(std::thread::hardware_concurrency(), 1U) : requested,
+                    std::max(candidates.size(), std::size_t{1}));
+  }();
+
+  Clock::duration probeDuration{};
+  if (threadCount <= 1) {
+    for (std::filesystem::path& filePath : candidates) {
+      const Clock::time_point probeStartTime = Clock::now();
+      ProbeResult probeResult = probePlugin(filePath, moduleHookName, discoveryIndexPtr);
+      probeDuration += Clock::now() - probeStartTime;
+      acceptAndRegister(std::move(filePath), std::move(probeResult));
+    }
+  } else {
+    // Probe (i.e. stat and load) candidates concurrently, then accept
+    // them serially in order, so precedence is unaffected by which
+    // probes complete first. Note that `plugins_` is only read whilst
+    // probing, so is safe to share between threads.
+    const Clock::time_point probeStartTime = Clock::now();
+    std::vector<ProbeResult> probeResults(candidates.size());
+    std::vector<std::exception_ptr> probeErrors(candidates.size());
+    std::atomic_size_t nextCandidateIdx{0};
+
+    const auto probeCandidates = [&] {
+      for (std::size_t idx = nextCandidateIdx++; idx < candidates.size();
+           idx = nextCandidateIdx++) {
+        try {
+          probeResults[idx] = probePlugin(candidates[idx], moduleHookName, discoveryIndexPtr);
+        } catch (...) {
+          probeErrors[idx] = std::current_exception();
+        }
+      }
+    };
+
+    std::vector<std::thread> threads;
+    threads.reserve(threadCount - 1);
+    for (std::size_t threadIdx = 1; threadIdx < threadCount; ++threadIdx) {
+      threads.emplace_back(probeCandidates);
+    }
+    probeCandidates();
+    for (std::thread& thread : threads) {
+      thread.join();
+    }
+    probeDuration = Clock::now() - probeStartTime;
+
+    for (std::size_t idx = 0; idx < candidates.size(); ++idx) {
+      if (probeErrors[idx]) {
+        std::rethrow_exception(probeErrors[idx]);
+      }
+      acceptAndRegister(std::move(candidates[idx]), std::move(probeResults[idx]));
+    }
+  }
+
+  const Clock::time_point indexSaveStartTime = Clock::now();
+  if (discoveryIndex) {
+    discoveryIndex->prune(scannedDirectories);
+    discoveryIndex->save();
+  }
+  const Clock::time_point endTime = Clock::now();
+
+  if (scannedDirectories.empty()) {
+    // Nothing scanned, so nothing worth reporting.
+    return;
+  }
+
+  const auto seconds = [](const Clock::duration duration) {
+    return std::chrono::duration<double>{duration}.count();
+  };
+  logger_->debug(fmt::format(
+      "CppPluginSystem: Scanned {} candidate(s) from {} search path(s) for '{}' in {:.3f}s"
+      " (index: {:.3f}s, listing: {:.3f}s, probing: {:.3f}s using {} thread(s), registration:"
+      " {:.3f}s)",
+      candidates.size(), scannedDirectories.size(), moduleHookName, seconds(endTime - startTime),
+      seconds((listStartTime - startTime) + (endTime - indexSaveStartTime)),
+      seconds(listEndTime - listStartTime), seconds(probeDuration), threadCount,
+      seconds(acceptDuration)));
+}
+
+// NOLINTNEXTLINE(bugprone-easily-swappable-parameters)
+void CppPluginSystem::rebuildDiscoveryIndex(const std::string_view paths,
+                                            const std::string_view pathsEnvVar,
+                                            const std::string_view moduleHookName,
+                                            const ValidationCallback& validationCallback) {
+  if (const std::filesystem::path indexPath = discoveryIndexPath(); !indexPath.empty()) {
+    std::error_code errorCode;
+    std::filesystem::remove(indexPath, errorCode);
+    if (errorCode) {
+      logger_->warning(fmt::format("CppPluginSystem: Failed to remove discovery index '{}': {}",
+                                   indexPath.string(), errorCode.message()));
+    }
+  }
+  scan(paths, pathsEnvVar, moduleHookName, validationCallback);
+}
+
+void CppPluginSystem::setDiscoveryIndexPath(std::filesystem::path indexPath) {
+  discoveryIndexPath_ = std::move(indexPath);
+}
+
+void CppPluginSystem::setLazyLoading(const bool lazyLoading) { lazyLoading_ = lazyLoading; }
+
+bool CppPluginSystem::lazyLoading() const {
+  if (lazyLoading_) {
+    return *lazyLoading_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  const char* lazyLoading = std::getenv(kLazyLoadingEnvVar.data());
+  return lazyLoading != nullptr && *lazyLoading != '\0' && std::string_view{lazyLoading} != "0";
+}
+
+void CppPluginSystem::setScanThreadCount(const std::size_t threadCount) {
+  scanThreadCount_ = threadCount;
+}
+
+std::size_t CppPluginSystem::scanThreadCount() const {
+  if (scanThreadCount_) {
+    return *scanThreadCount_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  if (const char* threadCountStr = std::getenv(kScanThreadCountEnvVar.data())) {
+    const std::string_view threadCountView{threadCountStr};
+    std::size_t threadCount = 1;
+    const char* const end = threadCountView.data() + threadCountView.size();
+    if (const auto [ptr, errc] = std::from_chars(threadCountView.data(), end, threadCount);
+        errc == std::errc{} && ptr == end) {
+      return threadCount;
     }
   }
+  return 1;
+}
+
+std::filesystem::path CppPluginSystem::discoveryIndexPath() const {
+  if (!discoveryIndexPath_.empty()) {
+    return discoveryIndexPath_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  if (const char* indexPath = std::getenv(kDiscoveryIndexEnvVar.data())) {
+    return indexPath;
+  }
+  return {};
 }
 
 Identifiers CppPluginSystem::identifiers() const {
@@ -192,131 +507,165 @@ const CppPluginSystem::PathAndPlugin& CppPluginSystem::plugin(const Identifier&
         "CppPluginSystem: No plug-in registered with the identifier '{}'", identifier)};
   }
 
+  // Ensure only one thread loads a deferred plugin, and that other
+  // threads see the result.
+  const std::lock_guard lock{deferredLoadsMutex_};
+  if (!iter->second.second) {
+    loadDeferredPlugin(iter->first, iter->second);
+  }
+
   return iter->second;
 }
 
-CppPluginSystem::MaybeIdentifierAndPlugin CppPluginSystem::maybeLoadPlugin(
-    const std::filesystem::path& filePath, const std::string_view moduleHookName,
-    const ValidationCallback& validationCallback) {
+void CppPluginSystem::loadDeferredPlugin(const Identifier& identifier,
+                                         PathAndPlugin& pathAndPlugin) const {
+  const auto deferredLoadIter = deferredLoads_.find(identifier);
+  const DeferredLoad& deferredLoad = deferredLoadIter->second;
+  const std::filesystem::path& filePath = pathAndPlugin.first;
+
+  logger_->debug(fmt::format("CppPluginSystem: Loading deferred plug-in '{}' from '{}'",
+                             identifier, filePath.string()));
+
+  bool hasEntryPoint = true;
+  std::optional<OpenedPlugin> opened =
+      openPlugin(logger_, filePath, deferredLoad.moduleHookName, hasEntryPoint);
+  if (!opened) {
+    throw errors::InputValidationException{fmt::format(
+        "CppPluginSystem: Failed to load plug-in '{}' from '{}'", identifier, filePath.string())};
+  }
+
+  if (opened->identifier != identifier) {
+    // The library has changed since it was indexed.
+    Str message = fmt::format(
+        "CppPluginSystem: Failed to load plug-in '{}' from '{}'. Library now provides '{}'",
+        identifier, filePath.string(), opened->identifier);
+    closePlugin(*opened);
+    throw errors::InputValidationException{std::move(message)};
+  }
+
+  if (auto maybeInvalidReason = deferredLoad.validationCallback(opened->plugin)) {
+    closePlugin(*opened);
+    throw errors::InputValidationException{
+        fmt::format("CppPluginSystem: Failed to load plug-in '{}' from '{}'. {}", identifier,
+                    filePath.string(), *maybeInvalidReason)};
+  }
+
+  pathAndPlugin.second = std::move(opened->plugin);
+  deferredLoads_.erase(deferredLoadIter);
+}
+
+CppPluginSystem::ProbeResult CppPluginSystem::probePlugin(const std::filesystem::path& filePath,
+                                                          const std::string_view moduleHookName,
+                                                          DiscoveryIndex* discoveryIndex) const {
+  ProbeResult result;
+  result.filePath = filePath;
+
   // Check the proposed path is actually a file.
   if (!is_regular_file(filePath)) {
     logger_->debug(fmt::format("CppPluginSystem: Ignoring as it is not a library binary '{}'",
                                filePath.string()));
-    return {};
+    return result;
   }
 
   // Check the proposed file name looks like a shared library.
   if (filePath.extension() != kLibExt) {
     logger_->debug(fmt::format("CppPluginSystem: Ignoring as it is not a library binary '{}'",
                                filePath.string()));
-    return {};
+    return result;
   }
 
-  // Open the binary.
-  //
-  // Use RTLD_LOCAL to avoid pollution of global namespace, and to
-  // better match Windows behaviour (which ignores the flags, see
-  // above).
-  //
-  // Note that this is considered a `noexcept` operation. On GCC it is
-  // hackily possible to catch exceptions at static initialization time,
-  // but is UB.
-  void* handle = dlopen(filePath.c_str(), RTLD_LAZY | RTLD_LOCAL);
-
-  if (!handle) {
-    logger_->debug(fmt::format("CppPluginSystem: Failed to open library '{}': {}",
-                               filePath.string(), dlerror()));
-    return {};
-  }
-
-  // Get the entrypoint function.
-  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
-  void* entrypoint = dlsym(handle, moduleHookName.data());
-  if (!entrypoint) {
-    logger_->debug(fmt::format("CppPluginSystem: No top-level '{}' function in '{}': {}",
-                               moduleHookName, filePath.string(), dlerror()));
-    dlclose(handle);
-    return {};
+  // Consult the discovery index, if any, to avoid loading libraries
+  // that we already know won't be registered.
+  if (discoveryIndex && (result.stamp = DiscoveryIndex::stampOf(filePath))) {
+    if (auto hookResult = discoveryIndex->lookup(filePath, *result.stamp, moduleHookName)) {
+      // Up to date, so no need to re-record.
+      result.stamp.reset();
+
+      Identifier& indexedIdentifier = hookResult->identifier;
+      if (indexedIdentifier.empty()) {
+        logger_->debug(fmt::format(
+            "CppPluginSystem: Ignoring as discovery index records no top-level '{}' function"
+            " in '{}'",
+            moduleHookName, filePath.string()));
+        return result;
+      }
+      if (hookResult->failedValidation) {
+        logger_->warning(fmt::format(
+            "CppPluginSystem: Skipping '{}' defined in '{}'. Discovery index records that it"
+            " failed validation",
+            indexedIdentifier, filePath.string()));
+        return result;
+      }
+      if (const auto iter = plugins_.find(indexedIdentifier); iter != plugins_.end()) {
+        logger_->warning(fmt::format(
+            "CppPluginSystem: Skipping '{}' defined in '{}'. Already registered by '{}'",
+            indexedIdentifier, filePath.string(), iter->second.first.string()));
+        return result;
+      }
+      if (lazyLoading()) {
+        result.deferredIdentifier = std::move(indexedIdentifier);
+        return result;
+      }
+    }
   }
 
-  // Load the plugin object.
-  //
-  // Note that this is considered a `noexcept` operation. This is for
-  // the best cross-platform consistency. I.e. By default, POSIX can
-  // support exceptions from both the initial entrypoint function
-  // and from the PluginFactory function pointer. Windows
-  // cannot support exceptions (fatal "access violation") from either.
-
-  // The entry point function should be a no-argument function that
-  // returns a function pointer. I.e. a factory function for creating a
-  // PluginFactory.
-  // NOLINTNEXTLINE(cppcoreguidelines-pro-type-reinterpret-cast)
-  const auto pluginFactoryFactory = reinterpret_cast<PluginFactory (*)()>(entrypoint);
-
-  // Calling the entry point function yields a PluginFactory function
-  // pointer. As noted above, this is a `noexcept` operation.
-  const PluginFactory pluginFactory = pluginFactoryFactory();
-
-  // Finally, we get the actual plugin object from the factory function
-  // pointer. Again, this is a `noexcept` operation.
-  CppPluginSystemPluginPtr plugin = pluginFactory();
-
-  // Check if the shared_ptr contains nullptr.
-  if (!plugin) {
-    logger_->warning(
-        fmt::format("CppPluginSystem: Null plugin returned by '{}'", filePath.string()));
+  result.opened = openPlugin(logger_, filePath, moduleHookName, result.hasEntryPoint);
+  return result;
+}
 
-    dlclose(handle);
-    return {};
+CppPluginSystem::MaybeIdentifierAndPlugin CppPluginSystem::acceptProbedPlugin(
+    ProbeResult probeResult, const std::string_view moduleHookName,
+    const ValidationCallback& validationCallback, DiscoveryIndex* discoveryIndex) {
+  const std::filesystem::path& filePath = probeResult.filePath;
+
+  if (probeResult.deferredIdentifier) {
+    Identifier& identifier = *probeResult.deferredIdentifier;
+    if (const auto iter = plugins_.find(identifier); iter != plugins_.end()) {
+      logger_->warning(
+          fmt::format("CppPluginSystem: Skipping '{}' defined in '{}'. Already registered by '{}'",
+                      identifier, filePath.string(), iter->second.first.string()));
+      return {};
+    }
+    logger_->debug(fmt::format("CppPluginSystem: Deferring loading of '{}' from '{}'", identifier,
+                               filePath.string()));
+    return {{std::move(identifier), nullptr}};
   }
 
-  // Get plugin's unique identifier.
-  Identifier identifier;
-  try {
-    identifier = plugin->identifier();
-  } catch (const std::exception& exc) {
-    logger_->warning(
-        fmt::format("CppPluginSystem: Caught exception calling 'identifier' of '{}': {}",
-                    filePath.string(), exc.what()));
-    plugin.reset();
-  } catch (...) {
-    logger_->warning(
-        fmt::format("CppPluginSystem: Caught exception calling 'identifier' of '{}':"
-                    " <unknown non-exception value caught>",
-                    filePath.string()));
-    plugin.reset();
-  }
+  // Record the result of probing the library in the discovery index.
+  const auto recordInIndex = [&](DiscoveryIndex::HookResult hookResult) {
+    if (probeResult.stamp) {
+      discoveryIndex->record(filePath, *probeResult.stamp, moduleHookName, std::move(hookResult));
+    }
+  };
 
-  // Unload the library if an exception was caught whilst retrieving the
-  // identifier.
-  //
-  // Must wait til after the try-catch to close handle, since exception
-  // object needs a chance to destruct whilst the plugin binary is still
-  // loaded.
-  if (!plugin) {
-    dlclose(handle);
+  if (!probeResult.opened) {
+    if (!probeResult.hasEntryPoint) {
+      recordInIndex({});
+    }
     return {};
   }
+  OpenedPlugin& opened = *probeResult.opened;
 
-  if (auto maybeInvalidReason = validationCallback(plugin)) {
-    logger_->warning(fmt::format("CppPluginSystem: Skipping '{}' defined in '{}'. {}", identifier,
-                                 filePath.string(), *maybeInvalidReason));
-    plugin.reset();  // Must destroy _before_ closing lib.
-    dlclose(handle);
+  auto maybeInvalidReason = validationCallback(opened.plugin);
+  recordInIndex({opened.identifier, maybeInvalidReason.has_value()});
+
+  if (maybeInvalidReason) {
+    logger_->warning(fmt::format("CppPluginSystem: Skipping '{}' defined in '{}'. {}",
+                                 opened.identifier, filePath.string(), *maybeInvalidReason));
+    closePlugin(opened);
     return {};
   }
 
   // Ensure it's not already been registered.
-  if (const auto iter = plugins_.find(identifier); iter != plugins_.end()) {
+  if (const auto iter = plugins_.find(opened.identifier); iter != plugins_.end()) {
     logger_->warning(
         fmt::format("CppPluginSystem: Skipping '{}' defined in '{}'. Already registered by '{}'",
-                    identifier, filePath.string(), iter->second.first.string()));
-    plugin.reset();  // Must destroy _before_ closing lib.
-    dlclose(handle);
+                    opened.identifier, filePath.string(), iter->second.first.string()));
+    closePlugin(opened);
     return {};
   }
 
-  return {{std::move(identifier), std::move(plugin)}};
+  return {{std::move(opened.identifier), std::move(opened.plugin)}};
 }
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
@@ -0,0 +1,305 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include "CppPluginSystemDiscoveryIndex.hpp"
+
+#include <algorithm>
+#include <array>
+#include <charconv>
+#include <cstdint>
+#include <filesystem>
+#include <fstream>
+#include <functional>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <string_view>
+#include <system_error>
+#include <thread>
+#include <utility>
+#include <vector>
+#ifdef _WIN32
+#include <process.h>
+#else
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#include <fmt/core.h>
+
+#include <openassetio/export.h>
+#include <openassetio/log/LoggerInterface.hpp>
+#include <openassetio/pluginSystem/CppPluginSystem.hpp>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace pluginSystem {
+
+namespace {
+/// First line of an index file. Bump the version if the format changes.
+constexpr std::string_view kIndexHeader = "openassetio-cpp-plugin-index\t2";
+constexpr char kFieldSep = '\t';
+/// Separates a hook from the identifier of a valid plugin.
+constexpr char kHookSep = '=';
+/// Separates a hook from the identifier of a plugin that failed
+/// validation.
+constexpr char kFailedValidationHookSep = '!';
+constexpr std::array kHookSeps{kHookSep, kFailedValidationHookSep};
+
+/**
+ * Serialise read-merge-write cycles within this process. Cross-process
+ * updates rely on atomic rename, and may be lost (but not corrupted).
+ */
+std::mutex& saveMutex() {
+  static std::mutex mutex;
+  return mutex;
+}
+
+/// Split off and return the next field of a line.
+std::string_view nextField(std::string_view& line) {
+  const std::size_t sepIdx = line.find(kFieldSep);
+  const std::string_view field = line.substr(0, sepIdx);
+  line = sepIdx == std::string_view::npos ? std::string_view{} : line.substr(sepIdx + 1);
+  return field;
+}
+
+template <class T>
+std::optional<T> parseInt(const std::string_view field) {
+  T value{};
+  const char* const end = field.data() + field.size();
+  if (const auto [ptr, errc] = std::from_chars(field.data(), end, value);
+      errc != std::errc{} || ptr != end) {
+    return std::nullopt;
+  }
+  return value;
+}
+}  // namespace
+
+std::optional<CppPluginSystem::DiscoveryIndex::FileStamp> CppPluginSystem::DiscoveryIndex::stampOf(
+    const std::filesystem::path& filePath) {
+#ifdef _WIN32
+  std::error_code errorCode;
+  const std::uintmax_t size = std::filesystem::file_size(filePath, errorCode);
+  if (errorCode) {
+    return std::nullopt;
+  }
+  const auto mtime = std::filesystem::last_write_time(filePath, errorCode);
+  if (errorCode) {
+    return std::nullopt;
+  }
+  // No cheap equivalent of an inode via std::filesystem.
+  return FileStamp{size, static_cast<std::int64_t>(mtime.time_since_epoch().count()), 0};
+#else
+  struct stat info{};
+  if (::stat(filePath.c_str(), &info) != 0) {
+    return std::nullopt;
+  }
+  constexpr std::int64_t kNanosecondsPerSecond = 1'000'000'000;
+#ifdef __APPLE__
+  const auto& mtime = info.st_mtimespec;
+#else
+  const auto& mtime = info.st_mtim;
+#endif
+  return FileStamp{static_cast<std::uintmax_t>(info.st_size),
+                   static_cast<std::int64_t>(mtime.tv_sec) * kNanosecondsPerSecond +
+                       static_cast<std::int64_t>(mtime.tv_nsec),
+                   info.st_ino};
+#endif
+}
+
+CppPluginSystem::DiscoveryIndex::DiscoveryIndex(std::filesystem::path indexPath,
+                                                log::LoggerInterfacePtr logger)
+    : indexPath_{std::move(indexPath)}, logger_{std::move(logger)}, entries_{read()} {
+  logger_->debug(fmt::format("CppPluginSystem: Using discovery index '{}' with {} entries",
+                             indexPath_.string(), entries_.size()));
+}
+
+std::optional<CppPluginSystem::DiscoveryIndex::HookResult> CppPluginSystem::DiscoveryIndex::lookup(
+    const std::filesystem::path& libraryPath, const FileStamp& stamp,
+    const std::string_view moduleHookName) {
+  {
+    const std::lock_guard lock{seenMutex_};
+    seen_.insert(libraryPath.string());
+  }
+
+  const auto entryIter = entries_.find(libraryPath);
+  if (entryIter == entries_.end()) {
+    return std::nullopt;
+  }
+  const Entry& entry = entryIter->second;
+  if (entry.stamp != stamp) {
+    logger_->debug(fmt::format("CppPluginSystem: Discovery index entry for '{}' is stale",
+                               libraryPath.string()));
+    return std::nullopt;
+  }
+  const auto hookIter = entry.resultsByHook.find(moduleHookName);
+  if (hookIter == entry.resultsByHook.end()) {
+    return std::nullopt;
+  }
+  return hookIter->second;
+}
+
+void CppPluginSystem::DiscoveryIndex::record(const std::filesystem::path& libraryPath,
+                                             const FileStamp& stamp,
+                                             const std::string_view moduleHookName,
+                                             HookResult hookResult) {
+  const Str libraryPathStr = libraryPath.string();
+  // Such paths are vanishingly rare, and would corrupt the format.
+  if (libraryPathStr.find_first_of("\t\r\n") != Str::npos) {
+    return;
+  }
+  {
+    const std::lock_guard lock{seenMutex_};
+    seen_.insert(libraryPathStr);
+  }
+
+  Entry& entry = entries_[libraryPath];
+  if (entry.stamp != stamp) {
+    // New or modified library, so any other hooks must be re-probed.
+    entry = Entry{stamp, {}};
+  }
+  entry.resultsByHook.insert_or_assign(Str{moduleHookName}, std::move(hookResult));
+  changes_.insert_or_assign(libraryPath, entry);
+}
+
+void CppPluginSystem::DiscoveryIndex::prune(
+    const std::vector<std::filesystem::path>& scannedDirectories) {
+  for (auto entryIter = entries_.begin(); entryIter != entries_.end();) {
+    const std::filesystem::path& libraryPath = entryIter->first;
+    const bool isInScannedDirectory =
+        std::find(scannedDirectories.begin(), scannedDirectories.end(),
+                  libraryPath.parent_path()) != scannedDirectories.end();
+
+    if (isInScannedDirectory && seen_.count(libraryPath.string()) == 0) {
+      logger_->debug(fmt::format("CppPluginSystem: Removing '{}' from discovery index",
+                                 libraryPath.string()));
+      changes_.insert_or_assign(libraryPath, std::nullopt);
+      entryIter = entries_.erase(entryIter);
+    } else {
+      ++entryIter;
+    }
+  }
+}
+
+void CppPluginSystem::DiscoveryIndex::save() {
+  if (changes_.empty()) {
+    return;
+  }
+
+  const std::lock_guard lock{saveMutex()};
+
+  // Another process (or plugin system) may have updated the index
+  // since we read it, so merge our changes into the latest version.
+  Entries entries = read();
+  for (auto& [libraryPath, maybeEntry] : changes_) {
+    if (!maybeEntry) {
+      entries.erase(libraryPath);
+      continue;
+    }
+    if (const auto iter = entries.find(libraryPath);
+        iter != entries.end() && iter->second.stamp == maybeEntry->stamp) {
+      // Retain results for other hooks.
+      maybeEntry->resultsByHook.merge(iter->second.resultsByHook);
+    }
+    entries.insert_or_assign(libraryPath, std::move(*maybeEntry));
+  }
+
+  write(entries);
+  changes_.clear();
+}
+
+CppPluginSystem::DiscoveryIndex::Entries CppPluginSystem::DiscoveryIndex::read() const {
+  Entries entries;
+
+  std::ifstream stream{indexPath_};
+  if (!stream) {
+    return entries;
+  }
+
+  Str line;
+  if (!std::getline(stream, line) || line != kIndexHeader) {
+    logger_->debug(fmt::format("CppPluginSystem: Ignoring unrecognised discovery index '{}'",
+                               indexPath_.string()));
+    return entries;
+  }
+
+  // Each line is: size, mtime, inode, path, then zero or more
+  // hook=identifier (or hook!identifier, if the plugin failed
+  // validation) pairs, all tab separated. Malformed lines are skipped,
+  // so the library will be probed again.
+  while (std::getline(stream, line)) {
+    std::string_view fields{line};
+    const auto size = parseInt<std::uintmax_t>(nextField(fields));
+    const auto mtime = parseInt<std::int64_t>(nextField(fields));
+    const auto inode = parseInt<std::uintmax_t>(nextField(fields));
+    const std::string_view libraryPath = nextField(fields);
+    if (!size || !mtime || !inode || libraryPath.empty()) {
+      continue;
+    }
+
+    Entry entry{{*size, *mtime, *inode}, {}};
+    while (!fields.empty()) {
+      const std::string_view hookAndIdentifier = nextField(fields);
+      const std::size_t sepIdx =
+          hookAndIdentifier.find_first_of(std::string_view{kHookSeps.data(), kHookSeps.size()});
+      if (sepIdx == std::string_view::npos) {
+        continue;
+      }
+      entry.resultsByHook.insert_or_assign(
+          Str{hookAndIdentifier.substr(0, sepIdx)},
+          HookResult{Str{hookAndIdentifier.substr(sepIdx + 1)},
+                     hookAndIdentifier[sepIdx] == kFailedValidationHookSep});
+    }
+    entries.insert_or_assign(std::filesystem::path{libraryPath}, std::move(entry));
+  }
+
+  return entries;
+}
+
+void CppPluginSystem::DiscoveryIndex::write(const Entries& entries) const {
+#ifdef _WIN32
+  const auto processId = _getpid();
+#else
+  const auto processId = getpid();
+#endif
+  // Write to a uniquely named sibling then rename over the index, so
+  // that readers never observe a partially written file.
+  std::filesystem::path tempPath = indexPath_;
+  tempPath += fmt::format(".{}.{}.tmp", processId,
+                          std::hash<std::thread::id>{}(std::this_thread::get_id()));
+  {
+    std::ofstream stream{tempPath, std::ios::trunc};
+    stream << kIndexHeader << '\n';
+    for (const auto& [libraryPath, entry] : entries) {
+      stream << entry.stamp.size << kFieldSep << entry.stamp.mtime << kFieldSep
+             << entry.stamp.inode << kFieldSep << libraryPath.string();
+      for (const auto& [hook, hookResult] : entry.resultsByHook) {
+        stream << kFieldSep << hook
+               << (hookResult.failedValidation ? kFailedValidationHookSep : kHookSep)
+               << hookResult.identifier;
+      }
+      stream << '\n';
+    }
+    if (!stream.flush()) {
+      logger_->warning(fmt::format("CppPluginSystem: Failed to write discovery index '{}'",
+                                   indexPath_.string()));
+      std::error_code ignored;
+      std::filesystem::remove(tempPath, ignored);
+      return;
+    }
+  }
+
+  std::error_code errorCode;
+  std::filesystem::rename(tempPath, indexPath_, errorCode);
+  if (errorCode) {
+    logger_->warning(fmt::format("CppPluginSystem: Failed to write discovery index '{}': {}",
+                                 indexPath_.string(), errorCode.message()));
+    std::filesystem::remove(tempPath, errorCode);
+    return;
+  }
+  logger_->debug(
+      fmt::format("CppPluginSystem: Updated discovery index '{}'", indexPath_.string()));
+}
+}  // namespace pluginSystem
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
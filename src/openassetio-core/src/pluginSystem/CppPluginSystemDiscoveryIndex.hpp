@@ -0,0 +1,128 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#pragma once
+
+#include <cstdint>
+#include <filesystem>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <optional>
+#include <string_view>
+#include <unordered_set>
+#include <vector>
+
+#include <openassetio/export.h>
+#include <openassetio/log/LoggerInterface.hpp>
+#include <openassetio/pluginSystem/CppPluginSystem.hpp>
+#include <openassetio/typedefs.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace pluginSystem {
+
+/**
+ * On-disk cache of the results of probing shared libraries for plugin
+ * entry points.
+ *
+ * Each entry records a library's path, a stamp (size, modification
+ * time and inode) used to cheaply detect changes via `stat`, and, for
+ * each entry point hook name the library has been probed for, the
+ * identifier of the plugin it provides (or an empty string if it does
+ * not expose that hook), and whether that plugin failed validation.
+ *
+ * Validation results are recorded against the hook name, so the index
+ * assumes that the same validation is applied to all plugins scanned
+ * for a given hook.
+ *
+ * The index is read on construction and changes are merged back into
+ * the file on @ref save.
+ */
+class CppPluginSystem::DiscoveryIndex {
+ public:
+  /// Cheap-to-query file metadata used to detect modified libraries.
+  struct FileStamp {
+    std::uintmax_t size;
+    std::int64_t mtime;
+    std::uintmax_t inode;
+
+    bool operator==(const FileStamp& other) const {
+      return size == other.size && mtime == other.mtime && inode == other.inode;
+    }
+    bool operator!=(const FileStamp& other) const { return !(*this == other); }
+  };
+
+  /// Result of probing a library for a hook.
+  struct HookResult {
+    /// Plugin identifier, or an empty string if the library does not
+    /// expose the hook.
+    Identifier identifier;
+    /// Whether the plugin was rejected by the validation callback.
+    bool failedValidation = false;
+  };
+
+  /**
+   * Query the stamp of a file, following symlinks.
+   *
+   * @return Stamp of the file, or nullopt if it could not be queried.
+   */
+  static std::optional<FileStamp> stampOf(const std::filesystem::path& filePath);
+
+  /**
+   * Load the index from disk.
+   *
+   * A missing, unreadable or incompatible index file is treated as an
+   * empty index.
+   */
+  DiscoveryIndex(std::filesystem::path indexPath, log::LoggerInterfacePtr logger);
+
+  /**
+   * Look up the result of probing a library for a hook.
+   *
+   * Also marks the library as seen, so it is not removed by @ref
+   * prune. Safe to call concurrently with other lookups.
+   *
+   * @return The indexed result, or nullopt if the library is not
+   * indexed for this hook or its entry is stale.
+   */
+  std::optional<HookResult> lookup(const std::filesystem::path& libraryPath,
+                                   const FileStamp& stamp, std::string_view moduleHookName);
+
+  /**
+   * Record the result of probing a library for a hook.
+   */
+  void record(const std::filesystem::path& libraryPath, const FileStamp& stamp,
+              std::string_view moduleHookName, HookResult hookResult);
+
+  /**
+   * Remove entries for libraries in the given directories that were
+   * not seen by @ref lookup, i.e. that no longer exist.
+   */
+  void prune(const std::vector<std::filesystem::path>& scannedDirectories);
+
+  /**
+   * Merge any changes into the index file on disk.
+   */
+  void save();
+
+ private:
+  struct Entry {
+    FileStamp stamp;
+    std::map<Str, HookResult, std::less<>> resultsByHook;
+  };
+  using Entries = std::map<std::filesystem::path, Entry>;
+
+  [[nodiscard]] Entries read() const;
+  void write(const Entries& entries) const;
+
+  std::filesystem::path indexPath_;
+  log::LoggerInterfacePtr logger_;
+  Entries entries_;
+  /// Entries added or modified (value) or removed (nullopt) since load.
+  std::map<std::filesystem::path, std::optional<Entry>> changes_;
+  std::unordered_set<Str> seen_;
+  std::mutex seenMutex_;
+};
+}  // namespace pluginSystem
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
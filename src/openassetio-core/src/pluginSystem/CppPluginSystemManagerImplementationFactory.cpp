@@ -4,6 +4,7 @@
 
 #include <cstdlib>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string_view>
 #include <utility>
@@ -33,14 +34,14 @@ const CppPluginSystem::ValidationCallback kCheckIsManagerPlugin{
 
 CppPluginSystemManagerImplementationFactoryPtr CppPluginSystemManagerImplementationFactory::make(
     Str paths, log::LoggerInterfacePtr logger) {
-  return std::make_shared<CppPluginSystemManagerImplementationFactory>(
-      CppPluginSystemManagerImplementationFactory{std::move(paths), std::move(logger)});
+  return CppPluginSystemManagerImplementationFactoryPtr{
+      new CppPluginSystemManagerImplementationFactory{std::move(paths), std::move(logger)}};
 }
 
 CppPluginSystemManagerImplementationFactoryPtr CppPluginSystemManagerImplementationFactory::make(
     log::LoggerInterfacePtr logger) {
-  return std::make_shared<CppPluginSystemManagerImplementationFactory>(
-      CppPluginSystemManagerImplementationFactory{std::move(logger)});
+  return CppPluginSystemManagerImplementationFactoryPtr{
+      new CppPluginSystemManagerImplementationFactory{std::move(logger)}};
 }
 
 CppPluginSystemManagerImplementationFactory::CppPluginSystemManagerImplementationFactory(
@@ -52,23 +53,12 @@ CppPluginSystemManagerImplementationFactory::CppPluginSystemManagerImplementatio
     : CppPluginSystemManagerImplementationFactory{"", std::move(logger)} {}
 
 Identifiers CppPluginSystemManagerImplementationFactory::identifiers() {
-  if (!pluginSystem_) {
-    // Lazy load plugins.
-    pluginSystem_ = CppPluginSystem::make(logger());
-    pluginSystem_->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsManagerPlugin);
-  }
-
-  return pluginSystem_->identifiers();
+  return scannedPluginSystem()->identifiers();
 }
 
 managerApi::ManagerInterfacePtr CppPluginSystemManagerImplementationFactory::instantiate(
     const Identifier& identifier) {
-  if (!pluginSystem_) {
-    // Lazy load plugins.
-    pluginSystem_ = CppPluginSystem::make(logger());
-    pluginSystem_->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsManagerPlugin);
-  }
-  const auto& [path, plugin] = pluginSystem_->plugin(identifier);
+  const auto& [path, plugin] = scannedPluginSystem()->plugin(identifier);
 
   // Should definitely be a manager plugin, as validated by
   // `kCheckIsManagerPlugin`. We use the exception-throwing version of
@@ -77,6 +67,23 @@ managerApi::ManagerInterfacePtr CppPluginSystemManagerImplementationFactory::ins
 
   return managerPlugin.interface();
 }
+
+const CppPluginSystemPtr& CppPluginSystemManagerImplementationFactory::scannedPluginSystem() {
+  // The factory may be queried from multiple threads concurrently
+  // (e.g. a factory shared between host threads), so ensure only one
+  // thread performs the lazy scan.
+  // Once scanned, the plugin system is safe to query concurrently
+  // (including deferred plugin loading), so it is safe to use without
+  // holding the lock.
+  const std::lock_guard lock{pluginSystemMutex_};
+  if (!pluginSystem_) {
+    // Lazy load plugins.
+    auto pluginSystem = CppPluginSystem::make(logger());
+    pluginSystem->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsManagerPlugin);
+    pluginSystem_ = std::move(pluginSystem);
+  }
+  return pluginSystem_;
+}
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
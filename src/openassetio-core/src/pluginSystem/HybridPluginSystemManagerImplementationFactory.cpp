@@ -3,12 +3,22 @@
 #include <openassetio/pluginSystem/HybridPluginSystemManagerImplementationFactory.hpp>
 
 #include <algorithm>
+#include <array>
 #include <cassert>
 #include <cstddef>
+#include <cstdlib>
+#include <exception>
+#include <functional>
+#include <future>
 #include <iterator>
 #include <memory>
+#include <numeric>
+#include <optional>
+#include <string_view>
+#include <tuple>
 #include <unordered_map>
 #include <utility>
+#include <variant>
 #include <vector>
 
 #include <fmt/core.h>
@@ -17,11 +27,16 @@
 #include <openassetio/EntityReference.hpp>
 #include <openassetio/InfoDictionary.hpp>
 #include <openassetio/access.hpp>
+#include <openassetio/constants.hpp>
+#include <openassetio/errors/BatchElementError.hpp>
 #include <openassetio/errors/exceptions.hpp>
 #include <openassetio/hostApi/ManagerImplementationFactoryInterface.hpp>
+#include <openassetio/log/LoggerInterface.hpp>
+#include <openassetio/managerApi/HostSession.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
 #include <openassetio/trait/collection.hpp>
 #include <openassetio/typedefs.hpp>
+#include <openassetio/utils/profiling.hpp>
 
 namespace openassetio {
 inline namespace OPENASSETIO_CORE_ABI_VERSION {
@@ -29,6 +44,66 @@ namespace pluginSystem {
 
 namespace {
 
+/// Names of batch element error codes, as used in the environment.
+constexpr std::array<std::pair<std::string_view, errors::BatchElementError::ErrorCode>, 8>
+    kErrorCodeNames{{
+        {"kUnknown", errors::BatchElementError::ErrorCode::kUnknown},
+        {"kInvalidEntityReference", errors::BatchElementError::ErrorCode::kInvalidEntityReference},
+        {"kMalformedEntityReference",
+         errors::BatchElementError::ErrorCode::kMalformedEntityReference},
+        {"kEntityAccessError", errors::BatchElementError::ErrorCode::kEntityAccessError},
+        {"kEntityResolutionError", errors::BatchElementError::ErrorCode::kEntityResolutionError},
+        {"kInvalidPreflightHint", errors::BatchElementError::ErrorCode::kInvalidPreflightHint},
+        {"kInvalidTraitSet", errors::BatchElementError::ErrorCode::kInvalidTraitSet},
+        {"kAuthError", errors::BatchElementError::ErrorCode::kAuthError},
+    }};
+
+/// Indices of a subset of the elements of a batch.
+using ElementIndices = std::vector<std::size_t>;
+
+/**
+ * Select a subset of the elements of a batch.
+ */
+template <class T>
+std::vector<T> selectElements(const std::vector<T>& elements, const ElementIndices& indices) {
+  std::vector<T> selected;
+  selected.reserve(indices.size());
+  for (const std::size_t idx : indices) {
+    selected.push_back(elements[idx]);
+  }
+  return selected;
+}
+
+/**
+ * Calls to a batch callback, buffered for later invocation.
+ */
+using DeferredCallbacks = std::vector<std::function<void()>>;
+
+/**
+ * Wrap a batch callback such that indices into a sub-batch are mapped
+ * back to indices into the original batch.
+ *
+ * If a buffer is given, calls are appended to it (along with copies of
+ * their arguments), rather than being forwarded immediately.
+ */
+template <class... Args>
+std::function<void(std::size_t, Args...)> remapIndices(
+    const std::function<void(std::size_t, Args...)>& callback, const ElementIndices& indices,
+    DeferredCallbacks* deferredCallbacks = nullptr) {
+  if (deferredCallbacks == nullptr) {
+    return [&callback, &indices](const std::size_t idx, Args... args) {
+      callback(indices[idx], std::forward<Args>(args)...);
+    };
+  }
+  return [&callback, &indices, deferredCallbacks](const std::size_t idx, Args... args) {
+    deferredCallbacks->emplace_back(
+        [&callback, batchIdx = indices[idx],
+         argsTuple = std::make_tuple(std::forward<Args>(args)...)]() mutable {
+          std::apply([&](auto&... arg) { callback(batchIdx, std::move(arg)...); }, argsTuple);
+        });
+  };
+}
+
 /**
  * A ManagerInterface implementation that composes multiple child
  * ManagerInterfaces and forwards API calls to one of the children.
@@ -42,13 +117,61 @@ namespace {
  * For API calls that have no associated capability, either the first
  * child is chosen, or the results from all children are merged - see
  * method-specific docs for details.
+ *
+ * If entity reference routing is enabled, API calls taking a batch of
+ * entity references are instead partitioned per element amongst the
+ * capable children - see
+ * HybridPluginSystemManagerImplementationFactory::setEntityReferenceRouting.
+ *
+ * If fallback error codes are set, elements that fail with one of
+ * those codes are retried by the next capable child - see
+ * HybridPluginSystemManagerImplementationFactory::setFallbackErrorCodes.
+ *
+ * If concurrent initialization is enabled, children are initialized
+ * and probed for their capabilities concurrently - see
+ * HybridPluginSystemManagerImplementationFactory::setConcurrentInitialization.
  */
 class HybridManagerInterface final : public managerApi::ManagerInterface {
   using ManagerInterfaces = std::vector<managerApi::ManagerInterfacePtr>;
 
+  /// How a child claims entity references, for routing.
+  struct ChildRouting {
+    managerApi::ManagerInterfacePtr managerInterface;
+    /// Entity reference prefix advertised by the child, if any.
+    std::optional<Str> prefix;
+    /// Whether the child has kEntityReferenceIdentification.
+    bool canIdentify;
+  };
+
+  /// A sub-batch routed to a single child.
+  struct Route {
+    /// Index into the list of children with the capability.
+    std::size_t candidateIdx;
+    ElementIndices indices;
+  };
+  using Routes = std::vector<Route>;
+
+  /// A sub-batch to dispatch to a single child.
+  struct SubBatch {
+    const managerApi::ManagerInterfacePtr& managerInterface;
+    /// Indices of the elements in the original batch.
+    const ElementIndices& indices;
+    /// Error callback taking indices into the original batch.
+    const BatchElementErrorCallback& errorCallback;
+    /// Buffer for success callbacks, if they must not be called
+    /// directly.
+    DeferredCallbacks* deferredCallbacks;
+  };
+
  public:
-  explicit HybridManagerInterface(ManagerInterfaces managerInterfacess)
-      : managerInterfaces_{std::move(managerInterfacess)} {
+  HybridManagerInterface(
+      ManagerInterfaces managerInterfacess, const bool entityReferenceRouting,
+      HybridPluginSystemManagerImplementationFactory::ErrorCodes fallbackErrorCodes,
+      const bool concurrentInitialization)
+      : managerInterfaces_{std::move(managerInterfacess)},
+        entityReferenceRouting_{entityReferenceRouting},
+        fallbackErrorCodes_{std::move(fallbackErrorCodes)},
+        concurrentInitialization_{concurrentInitialization} {
     // Precondition.
     // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-array-to-pointer-decay)
     assert(!managerInterfaces_.empty());
@@ -73,11 +196,34 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
   /**
    * Merge the results of `info()` from all child implementations, with
    * the first implementation taking precedence in case of a conflict.
+   *
+   * If routing by entity reference, the entity reference prefix is
+   * only retained if all children advertise the same prefix, since
+   * otherwise the host would reject references belonging to the other
+   * children.
    */
   [[nodiscard]] InfoDictionary info() override {
     InfoDictionary result;
-    for (const auto& managerInterface : managerInterfaces_) {
-      result.merge(managerInterface->info());
+    const Str prefixKey{constants::kInfoKey_EntityReferencesMatchPrefix};
+    std::optional<InfoDictionaryValue> firstPrefix;
+    bool prefixesDiffer = false;
+    for (std::size_t childIdx = 0; childIdx < managerInterfaces_.size(); ++childIdx) {
+      InfoDictionary childInfo = managerInterfaces_[childIdx]->info();
+      if (entityReferenceRouting_) {
+        std::optional<InfoDictionaryValue> prefix;
+        if (const auto iter = childInfo.find(prefixKey); iter != childInfo.end()) {
+          prefix = iter->second;
+        }
+        if (childIdx == 0) {
+          firstPrefix = std::move(prefix);
+        } else if (prefix != firstPrefix) {
+          prefixesDiffer = true;
+        }
+      }
+      result.merge(childInfo);
+    }
+    if (prefixesDiffer) {
+      result.erase(prefixKey);
     }
     return result;
   }
@@ -111,12 +257,38 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
    * of capability to implementation is constructed, which will be used
    * to dispatch to the appropriate implementation in subsequent API
    * methods.
+   *
+   * If concurrent initialization is enabled, see
+   * initializeChildrenConcurrently.
    */
   void initialize(const InfoDictionary managerSettings,
                   const managerApi::HostSessionPtr& hostSession) override {
-    for (const auto& managerInterface : managerInterfaces_) {
-      managerInterface->initialize(managerSettings, hostSession);
+    childCapabilities_.clear();
+    if (concurrentInitialization_) {
+      initializeChildrenConcurrently(managerSettings, hostSession);
+    } else {
+      for (const auto& managerInterface : managerInterfaces_) {
+        managerInterface->initialize(managerSettings, hostSession);
+      }
     }
+    if (entityReferenceRouting_) {
+      initializeRouting();
+    }
+    if (entityReferenceRouting_ || !fallbackErrorCodes_.empty()) {
+      // Cache the list of all children that support each capability,
+      // in priority order, to route to and fall back through.
+      capableChildrenByCapability_.clear();
+      for (std::size_t capabilityIdx = 0; capabilityIdx < kCapabilityNames.size();
+           ++capabilityIdx) {
+        const auto capability = static_cast<Capability>(capabilityIdx);
+        for (std::size_t childIdx = 0; childIdx < managerInterfaces_.size(); ++childIdx) {
+          if (childHasCapability(childIdx, capability)) {
+            capableChildrenByCapability_[capability].push_back(childIdx);
+          }
+        }
+      }
+    }
+
     // Cache a mapping of the first child interface that supports each
     // capability.
     //
@@ -129,9 +301,9 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
     managerInterfacesByCapability_.reserve(kCapabilityNames.size());
     for (std::size_t capabilityIdx = 0; capabilityIdx < kCapabilityNames.size(); ++capabilityIdx) {
       const auto capability = static_cast<Capability>(capabilityIdx);
-      for (const auto& managerInterface : managerInterfaces_) {
-        if (managerInterface->hasCapability(capability)) {
-          managerInterfacesByCapability_[capability] = managerInterface;
+      for (std::size_t childIdx = 0; childIdx < managerInterfaces_.size(); ++childIdx) {
+        if (childHasCapability(childIdx, capability)) {
+          managerInterfacesByCapability_[capability] = managerInterfaces_[childIdx];
           break;
         }
       }
@@ -206,8 +378,28 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                                                stateFromPersistenceToken, token, hostSession);
   }
 
+  /**
+   * If routing by entity reference, a string is an entity reference if
+   * any child claims it (excluding children that would claim any
+   * string).
+   */
   [[nodiscard]] bool isEntityReferenceString(
       const Str& someString, const managerApi::HostSessionPtr& hostSession) override {
+    if (entityReferenceRouting_) {
+      bool anyCanIdentify = false;
+      for (const ChildRouting& child : childRoutings_) {
+        if (!child.prefix && !child.canIdentify) {
+          continue;
+        }
+        anyCanIdentify = true;
+        if (claims(child, someString, hostSession)) {
+          return true;
+        }
+      }
+      if (anyCanIdentify) {
+        return false;
+      }
+    }
     return INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kEntityReferenceIdentification,
                                                isEntityReferenceString, someString, hostSession);
   }
@@ -216,6 +408,16 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                     const managerApi::HostSessionPtr& hostSession,
                     const ExistsSuccessCallback& successCallback,
                     const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(Capability::kExistenceQueries, entityReferences, hostSession, errorCallback,
+                    [&](const SubBatch& subBatch) {
+                      subBatch.managerInterface->entityExists(
+                          selectElements(entityReferences, subBatch.indices), context, hostSession,
+                          remapIndices(successCallback, subBatch.indices,
+                                       subBatch.deferredCallbacks),
+                          remapIndices(subBatch.errorCallback, subBatch.indices));
+                    })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kExistenceQueries, entityExists,
                                         entityReferences, context, hostSession, successCallback,
                                         errorCallback);
@@ -226,6 +428,17 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                     const ContextConstPtr& context, const managerApi::HostSessionPtr& hostSession,
                     const EntityTraitsSuccessCallback& successCallback,
                     const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(Capability::kEntityTraitIntrospection, entityReferences, hostSession,
+                    errorCallback, [&](const SubBatch& subBatch) {
+                      subBatch.managerInterface->entityTraits(
+                          selectElements(entityReferences, subBatch.indices), entityTraitsAccess,
+                          context, hostSession,
+                          remapIndices(successCallback, subBatch.indices,
+                                       subBatch.deferredCallbacks),
+                          remapIndices(subBatch.errorCallback, subBatch.indices));
+                    })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kEntityTraitIntrospection, entityTraits,
                                         entityReferences, entityTraitsAccess, context, hostSession,
                                         successCallback, errorCallback);
@@ -236,6 +449,17 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                const managerApi::HostSessionPtr& hostSession,
                const ResolveSuccessCallback& successCallback,
                const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(Capability::kResolution, entityReferences, hostSession, errorCallback,
+                    [&](const SubBatch& subBatch) {
+                      subBatch.managerInterface->resolve(
+                          selectElements(entityReferences, subBatch.indices), traitSet,
+                          resolveAccess, context, hostSession,
+                          remapIndices(successCallback, subBatch.indices,
+                                       subBatch.deferredCallbacks),
+                          remapIndices(subBatch.errorCallback, subBatch.indices));
+                    })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kResolution, resolve, entityReferences,
                                         traitSet, resolveAccess, context, hostSession,
                                         successCallback, errorCallback);
@@ -247,6 +471,17 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                               const managerApi::HostSessionPtr& hostSession,
                               const DefaultEntityReferenceSuccessCallback& successCallback,
                               const BatchElementErrorCallback& errorCallback) override {
+    if (invokeWithFallback(Capability::kDefaultEntityReferences, 0, traitSets.size(),
+                           errorCallback, [&](const SubBatch& subBatch) {
+                             subBatch.managerInterface->defaultEntityReference(
+                                 selectElements(traitSets, subBatch.indices), defaultEntityAccess,
+                                 context, hostSession,
+                                 remapIndices(successCallback, subBatch.indices,
+                                              subBatch.deferredCallbacks),
+                                 remapIndices(subBatch.errorCallback, subBatch.indices));
+                           })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kDefaultEntityReferences,
                                         defaultEntityReference, traitSets, defaultEntityAccess,
                                         context, hostSession, successCallback, errorCallback);
@@ -260,6 +495,17 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                            const managerApi::HostSessionPtr& hostSession,
                            const RelationshipQuerySuccessCallback& successCallback,
                            const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(
+            Capability::kRelationshipQueries, entityReferences, hostSession, errorCallback,
+            [&](const SubBatch& subBatch) {
+              subBatch.managerInterface->getWithRelationship(
+                  selectElements(entityReferences, subBatch.indices), relationshipTraitsData,
+                  resultTraitSet, pageSize, relationsAccess, context, hostSession,
+                  remapIndices(successCallback, subBatch.indices, subBatch.deferredCallbacks),
+                  remapIndices(subBatch.errorCallback, subBatch.indices));
+            })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kRelationshipQueries, getWithRelationship,
                                         entityReferences, relationshipTraitsData, resultTraitSet,
                                         pageSize, relationsAccess, context, hostSession,
@@ -274,6 +520,30 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                             const managerApi::HostSessionPtr& hostSession,
                             const RelationshipQuerySuccessCallback& successCallback,
                             const BatchElementErrorCallback& errorCallback) override {
+    // The batch here is of relationships, all for the same entity, so
+    // the whole batch is routed to the child claiming the entity.
+    const Routes routes =
+        routesFor(Capability::kRelationshipQueries, {entityReference}, hostSession);
+    const std::size_t firstCandidateIdx = routes.empty() ? 0 : routes.front().candidateIdx;
+
+    if (invokeWithFallback(
+            Capability::kRelationshipQueries, firstCandidateIdx, relationshipTraitsDatas.size(),
+            errorCallback, [&](const SubBatch& subBatch) {
+              subBatch.managerInterface->getWithRelationships(
+                  entityReference, selectElements(relationshipTraitsDatas, subBatch.indices),
+                  resultTraitSet, pageSize, relationsAccess, context, hostSession,
+                  remapIndices(successCallback, subBatch.indices, subBatch.deferredCallbacks),
+                  remapIndices(subBatch.errorCallback, subBatch.indices));
+            })) {
+      return;
+    }
+    if (!routes.empty()) {
+      managerInterfaces_[capableChildren(Capability::kRelationshipQueries)[firstCandidateIdx]]
+          ->getWithRelationships(entityReference, relationshipTraitsDatas, resultTraitSet,
+                                 pageSize, relationsAccess, context, hostSession, successCallback,
+                                 errorCallback);
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kRelationshipQueries, getWithRelationships,
                                         entityReference, relationshipTraitsDatas, resultTraitSet,
                                         pageSize, relationsAccess, context, hostSession,
@@ -285,6 +555,18 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                  const managerApi::HostSessionPtr& hostSession,
                  const PreflightSuccessCallback& successCallback,
                  const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(Capability::kPublishing, entityReferences, hostSession, errorCallback,
+                    [&](const SubBatch& subBatch) {
+                      subBatch.managerInterface->preflight(
+                          selectElements(entityReferences, subBatch.indices),
+                          selectElements(traitsHints, subBatch.indices), publishingAccess, context,
+                          hostSession,
+                          remapIndices(successCallback, subBatch.indices,
+                                       subBatch.deferredCallbacks),
+                          remapIndices(subBatch.errorCallback, subBatch.indices));
+                    })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kPublishing, preflight, entityReferences,
                                         traitsHints, publishingAccess, context, hostSession,
                                         successCallback, errorCallback);
@@ -296,15 +578,432 @@ class HybridManagerInterface final : public managerApi::ManagerInterface {
                  const managerApi::HostSessionPtr& hostSession,
                  const RegisterSuccessCallback& successCallback,
                  const BatchElementErrorCallback& errorCallback) override {
+    if (invokeBatch(Capability::kPublishing, entityReferences, hostSession, errorCallback,
+                    [&](const SubBatch& subBatch) {
+                      subBatch.managerInterface->register_(
+                          selectElements(entityReferences, subBatch.indices),
+                          selectElements(entityTraitsDatas, subBatch.indices), publishingAccess,
+                          context, hostSession,
+                          remapIndices(successCallback, subBatch.indices,
+                                       subBatch.deferredCallbacks),
+                          remapIndices(subBatch.errorCallback, subBatch.indices));
+                    })) {
+      return;
+    }
     INVOKE_CAPABLE_MANAGER_FOR_FUNCTION(Capability::kPublishing, register_, entityReferences,
                                         entityTraitsDatas, publishingAccess, context, hostSession,
                                         successCallback, errorCallback);
   }
 
  private:
+  /**
+   * Initialize all children concurrently, each on its own thread, and
+   * probe each child for all of its capabilities once initialized.
+   *
+   * This allows, e.g., one child opening a database connection to
+   * overlap with another warming a cache, so that initialization takes
+   * as long as the slowest child, rather than the sum of all children.
+   *
+   * The first child is initialized on the calling thread, the rest on
+   * worker threads. All children are initialized, even if some fail.
+   * If multiple children throw, the exception from the earliest child
+   * is rethrown, once all children have finished, so that the error
+   * reported does not depend on thread timing. Errors from later
+   * children are logged.
+   */
+  void initializeChildrenConcurrently(const InfoDictionary& managerSettings,
+                                      const managerApi::HostSessionPtr& hostSession) {
+    const auto initializeChild = [&](const managerApi::ManagerInterfacePtr& managerInterface) {
+      managerInterface->initialize(managerSettings, hostSession);
+      std::vector<bool> capabilities(kCapabilityNames.size());
+      for (std::size_t capabilityIdx = 0; capabilityIdx < kCapabilityNames.size();
+           ++capabilityIdx) {
+        capabilities[capabilityIdx] =
+            managerInterface->hasCapability(static_cast<Capability>(capabilityIdx));
+      }
+      return capabilities;
+    };
+
+    std::vector<std::future<std::vector<bool>>> futures;
+    futures.reserve(managerInterfaces_.size());
+
+    std::packaged_task<std::vector<bool>()> firstChildTask{
+        [&] { return initializeChild(managerInterfaces_.front()); }};
+    futures.push_back(firstChildTask.get_future());
+
+    for (auto childIter = next(cbegin(managerInterfaces_)); childIter != cend(managerInterfaces_);
+         ++childIter) {
+      futures.push_back(std::async(std::launch::async, initializeChild, std::cref(*childIter)));
+    }
+
+    firstChildTask();
+
+    std::vector<std::vector<bool>> childCapabilities;
+    childCapabilities.reserve(futures.size());
+    std::exception_ptr firstError;
+    for (std::size_t childIdx = 0; childIdx < futures.size(); ++childIdx) {
+      try {
+        childCapabilities.push_back(futures[childIdx].get());
+      } catch (const std::exception& exc) {
+        if (firstError) {
+          logDiscardedInitializeError(childIdx, exc.what(), hostSession);
+        } else {
+          firstError = std::current_exception();
+        }
+      } catch (...) {
+        if (firstError) {
+          logDiscardedInitializeError(childIdx, "unknown error", hostSession);
+        } else {
+          firstError = std::current_exception();
+        }
+      }
+    }
+    if (firstError) {
+      std::rethrow_exception(firstError);
+    }
+    childCapabilities_ = std::move(childCapabilities);
+  }
+
+  /**
+   * Log the error from a child whose initialization failed after an
+   * earlier child also failed.
+   */
+  void logDiscardedInitializeError(const std::size_t childIdx, const std::string_view message,
+                                   const managerApi::HostSessionPtr& hostSession) const {
+    hostSession->logger()->warning(
+        fmt::format("HybridPluginSystem: Child {} of '{}' also failed to initialize: {}", childIdx,
+                    managerInterfaces_[childIdx]->identifier(), message));
+  }
+
+  /**
+   * Whether a child has a capability, using the result of probing
+   * during concurrent initialization, if available.
+   */
+  bool childHasCapability(const std::size_t childIdx, const Capability capability) {
+    if (!childCapabilities_.empty()) {
+      return childCapabilities_[childIdx][static_cast<std::size_t>(capability)];
+    }
+    return managerInterfaces_[childIdx]->hasCapability(capability);
+  }
+
+  /**
+   * Query how each child claims entity references, for use when
+   * routing.
+   */
+  void initializeRouting() {
+    const Str prefixKey{constants::kInfoKey_EntityReferencesMatchPrefix};
+    childRoutings_.clear();
+    childRoutings_.reserve(managerInterfaces_.size());
+    for (std::size_t childIdx = 0; childIdx < managerInterfaces_.size(); ++childIdx) {
+      const managerApi::ManagerInterfacePtr& managerInterface = managerInterfaces_[childIdx];
+      ChildRouting child{managerInterface, std::nullopt,
+                         childHasCapability(childIdx, Capability::kEntityReferenceIdentification)};
+      const InfoDictionary childInfo = managerInterface->info();
+      if (const auto iter = childInfo.find(prefixKey); iter != childInfo.end()) {
+        if (const auto* prefix = std::get_if<Str>(&iter->second)) {
+          child.prefix = *prefix;
+        }
+      }
+      childRoutings_.push_back(std::move(child));
+    }
+  }
+
+  /**
+   * Whether a child claims an entity reference string for routing.
+   */
+  static bool claims(const ChildRouting& child, const Str& entityReferenceString,
+                     const managerApi::HostSessionPtr& hostSession) {
+    if (child.prefix) {
+      return entityReferenceString.rfind(*child.prefix, 0) != Str::npos;
+    }
+    if (child.canIdentify) {
+      return child.managerInterface->isEntityReferenceString(entityReferenceString, hostSession);
+    }
+    return true;
+  }
+
+  /**
+   * Partition a batch amongst the children with a capability.
+   *
+   * @return Sub-batches in child priority order, or an empty list if
+   * routing is disabled or the whole batch would go to the first
+   * capable child, in which case the standard dispatch should be used.
+   */
+  Routes routesFor(const Capability capability, const EntityReferences& entityReferences,
+                   const managerApi::HostSessionPtr& hostSession) const {
+    if (!entityReferenceRouting_) {
+      return {};
+    }
+    const std::vector<std::size_t>& candidates = capableChildren(capability);
+    if (candidates.size() < 2) {
+      return {};
+    }
+
+    std::vector<ElementIndices> indicesByCandidate(candidates.size());
+    for (std::size_t elementIdx = 0; elementIdx < entityReferences.size(); ++elementIdx) {
+      const Str& entityReferenceString = entityReferences[elementIdx].toString();
+      std::size_t chosen = 0;
+      for (std::size_t candidateIdx = 0; candidateIdx < candidates.size(); ++candidateIdx) {
+        if (claims(childRoutings_[candidates[candidateIdx]], entityReferenceString, hostSession)) {
+          chosen = candidateIdx;
+          break;
+        }
+      }
+      indicesByCandidate[chosen].push_back(elementIdx);
+    }
+
+    if (indicesByCandidate.front().size() == entityReferences.size()) {
+      return {};
+    }
+
+    Routes routes;
+    for (std::size_t candidateIdx = 0; candidateIdx < candidates.size(); ++candidateIdx) {
+      if (!indicesByCandidate[candidateIdx].empty()) {
+        routes.push_back(Route{candidateIdx, std::move(indicesByCandidate[candidateIdx])});
+      }
+    }
+    return routes;
+  }
+
+  /**
+   * Get the indices of the children that have a capability, in
+   * priority order.
+   */
+  const std::vector<std::size_t>& capableChildren(const Capability capability) const {
+    static const std::vector<std::size_t> kNoChildren;
+    const auto iter = capableChildrenByCapability_.find(capability);
+    return iter == capableChildrenByCapability_.end() ? kNoChildren : iter->second;
+  }
+
+  /**
+   * Dispatch a batch of entity references, routing and/or falling back
+   * amongst capable children as configured.
+   *
+   * If routed, the first sub-batch is invoked on this thread, the rest
+   * on worker threads. Host callbacks are never called from worker
+   * threads, since they may deadlock, e.g. on the Python GIL held by a
+   * Python child whilst the host's Python callback waits for it.
+   * Instead, each sub-batch buffers its results, which are passed on
+   * from this thread, in sub-batch order, once all have finished. If
+   * any sub-batches throw, then the exception from the earliest is
+   * rethrown, after passing on the results that were buffered.
+   *
+   * @param invoke Callable taking a SubBatch to dispatch.
+   *
+   * @return Whether the batch was dispatched. If false, the caller
+   * should use the standard dispatch.
+   */
+  template <class Invoke>
+  bool invokeBatch(const Capability capability, const EntityReferences& entityReferences,
+                   const managerApi::HostSessionPtr& hostSession,
+                   const BatchElementErrorCallback& errorCallback, const Invoke& invoke) const {
+    const Routes routes = routesFor(capability, entityReferences, hostSession);
+    if (routes.empty()) {
+      return invokeWithFallback(capability, 0, entityReferences.size(), errorCallback, invoke);
+    }
+
+    std::vector<DeferredCallbacks> deferredCallbacksPerRoute(routes.size());
+    const auto invokeRoute = [&](const std::size_t routeIdx) {
+      DeferredCallbacks& deferredCallbacks = deferredCallbacksPerRoute[routeIdx];
+      const BatchElementErrorCallback deferredErrorCallback =
+          [&errorCallback, &deferredCallbacks](const std::size_t idx,
+                                               errors::BatchElementError error) {
+            deferredCallbacks.emplace_back(
+                [&errorCallback, idx, error = std::move(error)]() mutable {
+                  errorCallback(idx, std::move(error));
+                });
+          };
+      invokeWithFallbackFrom(capableChildren(capability), routes[routeIdx].candidateIdx,
+                             routes[routeIdx].indices, deferredErrorCallback, &deferredCallbacks,
+                             invoke);
+    };
+
+    std::vector<std::future<void>> futures;
+    futures.reserve(routes.size());
+
+    std::packaged_task<void()> firstRouteTask{[&] { invokeRoute(0); }};
+    futures.push_back(firstRouteTask.get_future());
+
+    for (std::size_t routeIdx = 1; routeIdx < routes.size(); ++routeIdx) {
+      futures.push_back(std::async(std::launch::async, invokeRoute, routeIdx));
+    }
+
+    firstRouteTask();
+
+    // Note that futures from std::async block on destruction, so all
+    // worker threads are joined even if `get` throws.
+    std::exception_ptr firstException;
+    for (auto& future : futures) {
+      try {
+        future.get();
+      } catch (...) {
+        if (!firstException) {
+          firstException = std::current_exception();
+        }
+      }
+    }
+
+    for (DeferredCallbacks& deferredCallbacks : deferredCallbacksPerRoute) {
+      for (auto& deferredCallback : deferredCallbacks) {
+        deferredCallback();
+      }
+    }
+
+    if (firstException) {
+      std::rethrow_exception(firstException);
+    }
+    return true;
+  }
+
+  /**
+   * Dispatch a whole batch to a capable child, falling back to
+   * subsequent capable children for failed elements.
+   *
+   * @param firstCandidateIdx Index into the list of children with the
+   * capability of the child to dispatch to first.
+   *
+   * @return Whether the batch was dispatched. If false, fallback is
+   * disabled or there is nothing to fall back to, and the caller
+   * should use the standard dispatch.
+   */
+  template <class Invoke>
+  bool invokeWithFallback(const Capability capability, const std::size_t firstCandidateIdx,
+                          const std::size_t batchSize,
+                          const BatchElementErrorCallback& errorCallback,
+                          const Invoke& invoke) const {
+    if (fallbackErrorCodes_.empty()) {
+      return false;
+    }
+    const std::vector<std::size_t>& candidates = capableChildren(capability);
+    if (firstCandidateIdx + 1 >= candidates.size()) {
+      return false;
+    }
+    ElementIndices indices(batchSize);
+    std::iota(begin(indices), end(indices), std::size_t{0});
+    invokeWithFallbackFrom(candidates, firstCandidateIdx, std::move(indices), errorCallback,
+                           nullptr, invoke);
+    return true;
+  }
+
+  /**
+   * Dispatch a sub-batch to a child, then retry elements that failed
+   * with a fallback error code on the next capable child, and so on.
+   *
+   * Errors from the last child attempted are always passed on.
+   *
+   * If @p deferredCallbacks is given, success callbacks are buffered
+   * there rather than called, and @p errorCallback is expected to
+   * buffer likewise. Elements to retry are collected directly from
+   * each child's errors, so never depend on host callbacks.
+   */
+  template <class Invoke>
+  void invokeWithFallbackFrom(const std::vector<std::size_t>& candidates, std::size_t candidateIdx,
+                              ElementIndices indices,
+                              const BatchElementErrorCallback& errorCallback,
+                              DeferredCallbacks* deferredCallbacks, const Invoke& invoke) const {
+    while (!indices.empty()) {
+      const managerApi::ManagerInterfacePtr& managerInterface =
+          managerInterfaces_[candidates[candidateIdx]];
+
+      if (fallbackErrorCodes_.empty() || candidateIdx + 1 == candidates.size()) {
+        invoke(SubBatch{managerInterface, indices, errorCallback, deferredCallbacks});
+        return;
+      }
+
+      ElementIndices fallbackIndices;
+      // Invoked by the child, on the thread invoking it.
+      const BatchElementErrorCallback fallbackErrorCallback =
+          [&](const std::size_t idx, errors::BatchElementError error) {
+            if (find(cbegin(fallbackErrorCodes_), cend(fallbackErrorCodes_), error.code) !=
+                cend(fallbackErrorCodes_)) {
+              fallbackIndices.push_back(idx);
+            } else {
+              errorCallback(idx, std::move(error));
+            }
+          };
+      invoke(SubBatch{managerInterface, indices, fallbackErrorCallback, deferredCallbacks});
+
+      // Callbacks may arrive in any order, but keep the reduced batch
+      // in the original order.
+      sort(begin(fallbackIndices), end(fallbackIndices));
+      indices = std::move(fallbackIndices);
+      ++candidateIdx;
+    }
+  }
+
   ManagerInterfaces managerInterfaces_;
   std::unordered_map<Capability, managerApi::ManagerInterfacePtr> managerInterfacesByCapability_;
+  bool entityReferenceRouting_;
+  HybridPluginSystemManagerImplementationFactory::ErrorCodes fallbackErrorCodes_;
+  bool concurrentInitialization_;
+  std::vector<ChildRouting> childRoutings_;
+  std::unordered_map<Capability, std::vector<std::size_t>> capableChildrenByCapability_;
+  /// Capabilities of each child, if probed during initialization.
+  std::vector<std::vector<bool>> childCapabilities_;
 };
+
+/**
+ * Query the identifiers of each factory.
+ *
+ * Factories typically scan for plugins lazily on first query, which
+ * can be slow (filesystem traversal, loading libraries/modules).
+ * If requested, querying each factory on its own thread allows, e.g.,
+ * a C++ plugin scan to proceed in parallel with a Python plugin scan,
+ * rather than one waiting on the other.
+ *
+ * @param factories Factories to query.
+ *
+ * @param concurrent Whether to query factories concurrently, rather
+ * than one after another on the calling thread.
+ *
+ * @return Identifiers of each factory, in the same order as @p
+ * factories.
+ *
+ * @throws Any exception thrown by a factory. If querying concurrently
+ * and multiple factories throw, the exception from the earliest
+ * factory is rethrown, once all factories have finished.
+ */
+std::vector<Identifiers> identifiersPerFactory(
+    const HybridPluginSystemManagerImplementationFactory::ManagerImplementationFactoryInterfaces&
+        factories,
+    const bool concurrent) {
+  const auto queryFactory = [](const hostApi::ManagerImplementationFactoryInterfacePtr& factory) {
+    return factory->identifiers();
+  };
+
+  if (!concurrent) {
+    std::vector<Identifiers> identifiers;
+    identifiers.reserve(factories.size());
+    for (const auto& factory : factories) {
+      identifiers.push_back(queryFactory(factory));
+    }
+    return identifiers;
+  }
+
+  std::vector<std::future<Identifiers>> futures;
+  futures.reserve(factories.size());
+
+  // The first factory is queried on this thread (below), the rest on
+  // worker threads.
+  std::packaged_task<Identifiers()> firstFactoryTask{
+      [&] { return queryFactory(factories.front()); }};
+  futures.push_back(firstFactoryTask.get_future());
+
+  for (auto factoryIter = next(cbegin(factories)); factoryIter != cend(factories); ++factoryIter) {
+    futures.push_back(std::async(std::launch::async, queryFactory, std::cref(*factoryIter)));
+  }
+
+  firstFactoryTask();
+
+  // Note that futures from std::async block on destruction, so all
+  // worker threads are joined even if `get` throws.
+  std::vector<Identifiers> identifiers;
+  identifiers.reserve(futures.size());
+  for (auto& future : futures) {
+    identifiers.push_back(future.get());
+  }
+  return identifiers;
+}
 }  // namespace
 
 HybridPluginSystemManagerImplementationFactoryPtr
@@ -326,8 +1025,7 @@ HybridPluginSystemManagerImplementationFactory::HybridPluginSystemManagerImpleme
 Identifiers HybridPluginSystemManagerImplementationFactory::identifiers() {
   Identifiers identifiers;
   // Collect all identifiers from all factories.
-  for (const auto& factory : factories_) {
-    Identifiers factoryIdentifiers = factory->identifiers();
+  for (Identifiers& factoryIdentifiers : identifiersPerFactory(factories_, concurrentScan())) {
     identifiers.insert(end(identifiers), make_move_iterator(begin(factoryIdentifiers)),
                        make_move_iterator(end(factoryIdentifiers)));
   }
@@ -339,13 +1037,18 @@ Identifiers HybridPluginSystemManagerImplementationFactory::identifiers() {
 
 managerApi::ManagerInterfacePtr HybridPluginSystemManagerImplementationFactory::instantiate(
     const Identifier& identifier) {
+  const utils::StartupProfile::Scope profileScope{
+      "HybridPluginSystemManagerImplementationFactory.instantiate", identifier};
   std::vector<managerApi::ManagerInterfacePtr> managerInterfaces;
 
-  for (const auto& factory : factories_) {
-    const Identifiers& factoryIdentifiers = factory->identifiers();
+  const std::vector<Identifiers> identifiersByFactory =
+      identifiersPerFactory(factories_, concurrentScan());
+
+  for (std::size_t factoryIdx = 0; factoryIdx < factories_.size(); ++factoryIdx) {
+    const Identifiers& factoryIdentifiers = identifiersByFactory[factoryIdx];
     if (const auto iter = find(cbegin(factoryIdentifiers), cend(factoryIdentifiers), identifier);
         iter != cend(factoryIdentifiers)) {
-      managerInterfaces.push_back(factory->instantiate(identifier));
+      managerInterfaces.push_back(factories_[factoryIdx]->instantiate(identifier));
     }
   }
 
@@ -358,7 +1061,88 @@ managerApi::ManagerInterfacePtr HybridPluginSystemManagerImplementationFactory::
     return std::move(managerInterfaces[0]);
   }
 
-  return std::make_shared<HybridManagerInterface>(std::move(managerInterfaces));
+  return std::make_shared<HybridManagerInterface>(std::move(managerInterfaces),
+                                                  entityReferenceRouting(), fallbackErrorCodes(),
+                                                  concurrentInitialization());
+}
+
+void HybridPluginSystemManagerImplementationFactory::setEntityReferenceRouting(
+    const bool entityReferenceRouting) {
+  entityReferenceRouting_ = entityReferenceRouting;
+}
+
+bool HybridPluginSystemManagerImplementationFactory::entityReferenceRouting() const {
+  if (entityReferenceRouting_) {
+    return *entityReferenceRouting_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  const char* routing = std::getenv(kEntityReferenceRoutingEnvVar.data());
+  return routing != nullptr && *routing != '\0' && std::string_view{routing} != "0";
+}
+
+void HybridPluginSystemManagerImplementationFactory::setConcurrentInitialization(
+    const bool concurrentInitialization) {
+  concurrentInitialization_ = concurrentInitialization;
+}
+
+bool HybridPluginSystemManagerImplementationFactory::concurrentInitialization() const {
+  if (concurrentInitialization_) {
+    return *concurrentInitialization_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  const char* concurrent = std::getenv(kConcurrentInitializationEnvVar.data());
+  return concurrent != nullptr && *concurrent != '\0' && std::string_view{concurrent} != "0";
+}
+
+void HybridPluginSystemManagerImplementationFactory::setConcurrentScan(const bool concurrentScan) {
+  concurrentScan_ = concurrentScan;
+}
+
+bool HybridPluginSystemManagerImplementationFactory::concurrentScan() const {
+  if (concurrentScan_) {
+    return *concurrentScan_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  const char* concurrent = std::getenv(kConcurrentScanEnvVar.data());
+  return concurrent != nullptr && *concurrent != '\0' && std::string_view{concurrent} != "0";
+}
+
+void HybridPluginSystemManagerImplementationFactory::setFallbackErrorCodes(ErrorCodes errorCodes) {
+  fallbackErrorCodes_ = std::move(errorCodes);
+}
+
+HybridPluginSystemManagerImplementationFactory::ErrorCodes
+HybridPluginSystemManagerImplementationFactory::fallbackErrorCodes() const {
+  if (fallbackErrorCodes_) {
+    return *fallbackErrorCodes_;
+  }
+  // NOLINTNEXTLINE(*-suspicious-stringview-data-usage)
+  const char* envValue = std::getenv(kFallbackErrorCodesEnvVar.data());
+  if (envValue == nullptr) {
+    return {};
+  }
+
+  ErrorCodes errorCodes;
+  std::string_view remaining{envValue};
+  while (!remaining.empty()) {
+    const std::size_t sepIdx = remaining.find(',');
+    const std::string_view name = remaining.substr(0, sepIdx);
+    remaining =
+        sepIdx == std::string_view::npos ? std::string_view{} : remaining.substr(sepIdx + 1);
+    if (name.empty()) {
+      continue;
+    }
+    const auto iter = find_if(cbegin(kErrorCodeNames), cend(kErrorCodeNames),
+                              [&](const auto& nameAndCode) { return nameAndCode.first == name; });
+    if (iter == cend(kErrorCodeNames)) {
+      logger()->warning(
+          fmt::format("HybridPluginSystem: Ignoring unrecognised error code '{}' in {}", name,
+                      kFallbackErrorCodesEnvVar));
+      continue;
+    }
+    errorCodes.push_back(iter->second);
+  }
+  return errorCodes;
 }
 }  // namespace pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
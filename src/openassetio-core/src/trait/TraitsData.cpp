@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 
+#include <atomic>
 #include <memory>
 #include <unordered_map>
 #include <utility>
@@ -97,19 +98,39 @@ TraitsDataPtr TraitsData::make(const TraitsDataConstPtr& other) {
   return std::shared_ptr<TraitsData>(new TraitsData(*other));
 }
 
-TraitsData::TraitsData() : impl_{std::make_unique<Impl>()} {}
+TraitsData::TraitsData() : impl_{std::make_shared<Impl>()} {}
 
-TraitsData::TraitsData(const TraitSet& traitSet) : impl_{std::make_unique<Impl>(traitSet)} {}
+TraitsData::TraitsData(const TraitSet& traitSet) : impl_{std::make_shared<Impl>(traitSet)} {}
 
-TraitsData::TraitsData(const TraitsData& other) : impl_{std::make_unique<Impl>(*other.impl_)} {}
+// Copy-on-write - share the data until either instance is modified.
+TraitsData::TraitsData(const TraitsData& other) : impl_{other.impl_} {}
 
 TraitsData::~TraitsData() = default;
 
+void TraitsData::detach() {
+  if (frozen_) {
+    throw errors::InputValidationException{"Cannot modify a frozen TraitsData"};
+  }
+  if (impl_.use_count() == 1) {
+    // Synchronise with the release of the last other owner (if any),
+    // so that its reads of the data happen-before our writes.
+    std::atomic_thread_fence(std::memory_order_acquire);
+    return;
+  }
+  impl_ = std::make_shared<Impl>(*impl_);
+}
+
 TraitSet TraitsData::traitSet() const { return impl_->traitSet(); }
 
-void TraitsData::addTrait(const TraitId& traitId) { impl_->addTrait(traitId); }
+void TraitsData::addTrait(const TraitId& traitId) {
+  detach();
+  impl_->addTrait(traitId);
+}
 
-void TraitsData::addTraits(const TraitSet& traitSet) { impl_->addTraits(traitSet); }
+void TraitsData::addTraits(const TraitSet& traitSet) {
+  detach();
+  impl_->addTraits(traitSet);
+}
 
 bool TraitsData::hasTrait(const TraitId& traitId) const { return impl_->hasTrait(traitId); }
 
@@ -120,6 +141,7 @@ bool TraitsData::getTraitProperty(property::Value* out, const TraitId& traitId,
 
 void TraitsData::setTraitProperty(const TraitId& traitId, const property::Key& propertyKey,
                                   property::Value propertyValue) {
+  detach();
   impl_->setTraitProperty(traitId, propertyKey, std::move(propertyValue));
 }
 
@@ -127,9 +149,15 @@ property::KeySet TraitsData::traitPropertyKeys(const TraitId& traitId) const {
   return impl_->traitPropertyKeys(traitId);
 }
 
-bool TraitsData::operator==(const TraitsData& other) const { return *impl_ == *other.impl_; }
+bool TraitsData::operator==(const TraitsData& other) const {
+  return impl_ == other.impl_ || *impl_ == *other.impl_;
+}
 
 bool TraitsData::operator!=(const TraitsData& other) const { return !(*this == other); }
+
+void TraitsData::freeze() { frozen_ = true; }
+
+bool TraitsData::isFrozen() const { return frozen_; }
 }  // namespace trait
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio
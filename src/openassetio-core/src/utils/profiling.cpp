@@ -0,0 +1,189 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <cstdlib>
+#include <fstream>
+#include <mutex>
+#include <optional>
+#include <string_view>
+#include <utility>
+
+#include <fmt/core.h>
+
+#include <openassetio/export.h>
+#include <openassetio/typedefs.hpp>
+#include <openassetio/utils/profiling.hpp>
+
+namespace openassetio {
+inline namespace OPENASSETIO_CORE_ABI_VERSION {
+namespace utils {
+
+const Str StartupProfile::kStartupProfileEnvVarName{"OPENASSETIO_STARTUP_PROFILE"};
+
+namespace {
+using Clock = std::chrono::steady_clock;
+using Seconds = std::chrono::duration<double>;
+
+/// Reference point for event start times.
+const Clock::time_point kEpoch = Clock::now();
+
+/// Values of `enabledState`.
+constexpr std::int8_t kUnknown = -1;
+constexpr std::int8_t kDisabled = 0;
+constexpr std::int8_t kEnabled = 1;
+
+/**
+ * Whether profiling is enabled, or kUnknown if the env var should be
+ * (re-)read. Kept separately from the rest of the profile state so the
+ * check in Scope's constructor is lock-free.
+ */
+std::atomic<std::int8_t> enabledState{kUnknown};
+
+/// Nesting depth of scopes on the current thread.
+thread_local std::size_t threadDepth = 0;
+/// Index of the current thread, assigned on first recorded event.
+thread_local std::optional<std::size_t> threadIdx;
+
+void appendJsonString(Str& out, const std::string_view str) {
+  out += '"';
+  for (const char chr : str) {
+    switch (chr) {
+      case '"':
+        out += "\\\"";
+        break;
+      case '\\':
+        out += "\\\\";
+        break;
+      case '\n':
+        out += "\\n";
+        break;
+      case '\t':
+        out += "\\t";
+        break;
+      default:
+        if (static_cast<unsigned char>(chr) < 0x20) {
+          out += fmt::format("\\u{:04x}", static_cast<unsigned>(chr));
+        } else {
+          out += chr;
+        }
+    }
+  }
+  out += '"';
+}
+
+/// Serialise events as JSON. See StartupProfile::toJson.
+Str eventsToJson(const StartupProfile::Events& recordedEvents) {
+  Str json = "{\"events\": [";
+  for (std::size_t eventIdx = 0; eventIdx < recordedEvents.size(); ++eventIdx) {
+    const StartupProfile::Event& event = recordedEvents[eventIdx];
+    json += eventIdx == 0 ? "\n  {\"name\": " : ",\n  {\"name\": ";
+    appendJsonString(json, event.name);
+    json += ", \"detail\": ";
+    appendJsonString(json, event.detail);
+    json += fmt::format(R"(, "start": {:.6f}, "duration": {:.6f}, "depth": {}, "thread": {}}})",
+                        event.start, event.duration, event.depth, event.thread);
+  }
+  json += recordedEvents.empty() ? "]}\n" : "\n]}\n";
+  return json;
+}
+
+/// Recorded events, and where to write them on exit, if anywhere.
+struct Profile {
+  std::mutex mutex;
+  StartupProfile::Events events;
+  std::size_t threadCount = 0;
+  Str reportPath;
+
+  Profile() = default;
+  Profile(const Profile&) = delete;
+  Profile(Profile&&) = delete;
+  Profile& operator=(const Profile&) = delete;
+  Profile& operator=(Profile&&) = delete;
+
+  /// Write the report requested via the env var, if any.
+  ~Profile() {
+    if (reportPath.empty() || events.empty()) {
+      return;
+    }
+    std::ofstream stream{reportPath, std::ios::trunc};
+    stream << eventsToJson(events);
+  }
+};
+
+Profile& profile() {
+  static Profile instance;
+  return instance;
+}
+}  // namespace
+
+StartupProfile::Scope::Scope(const std::string_view name, const std::string_view detail) {
+  if (!StartupProfile::enabled()) {
+    return;
+  }
+  event_.emplace(Event{Str{name}, Str{detail}, 0, 0, threadDepth++, 0});
+  startTime_ = Clock::now();
+}
+
+StartupProfile::Scope::~Scope() { end(); }
+
+void StartupProfile::Scope::end() {
+  if (!event_) {
+    return;
+  }
+  const Clock::time_point endTime = Clock::now();
+  --threadDepth;
+  event_->start = Seconds{startTime_ - kEpoch}.count();
+  event_->duration = Seconds{endTime - startTime_}.count();
+
+  Profile& state = profile();
+  const std::lock_guard lock{state.mutex};
+  if (!threadIdx) {
+    threadIdx = state.threadCount++;
+  }
+  event_->thread = *threadIdx;
+  state.events.push_back(std::move(*event_));
+  event_.reset();
+}
+
+void StartupProfile::setEnabled(const std::optional<bool> enabled) {
+  enabledState = enabled ? (*enabled ? kEnabled : kDisabled) : kUnknown;
+}
+
+bool StartupProfile::enabled() {
+  if (const std::int8_t state = enabledState.load(std::memory_order_relaxed); state != kUnknown) {
+    return state == kEnabled;
+  }
+
+  const char* envValue = std::getenv(kStartupProfileEnvVarName.c_str());
+  const bool envEnabled =
+      envValue != nullptr && *envValue != '\0' && std::string_view{envValue} != "0";
+  if (envEnabled && std::string_view{envValue} != "1") {
+    Profile& state = profile();
+    const std::lock_guard lock{state.mutex};
+    state.reportPath = envValue;
+  }
+  // Cache, unless overridden concurrently via setEnabled.
+  std::int8_t expected = kUnknown;
+  enabledState.compare_exchange_strong(expected, envEnabled ? kEnabled : kDisabled);
+  return envEnabled;
+}
+
+StartupProfile::Events StartupProfile::events() {
+  Profile& state = profile();
+  const std::lock_guard lock{state.mutex};
+  return state.events;
+}
+
+Str StartupProfile::toJson() { return eventsToJson(events()); }
+
+void StartupProfile::reset() {
+  Profile& state = profile();
+  const std::lock_guard lock{state.mutex};
+  state.events.clear();
+}
+}  // namespace utils
+}  // namespace OPENASSETIO_CORE_ABI_VERSION
+}  // namespace openassetio
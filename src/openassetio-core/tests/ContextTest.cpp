@@ -1,14 +1,14 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2022-2025 The Foundry Visionmongers Ltd
+#include <memory>
 #include <type_traits>
+#include <utility>
 
 #include <catch2/catch.hpp>
 
 #include <openassetio/Context.hpp>
-#include <openassetio/macros.hpp>
-
-OPENASSETIO_FWD_DECLARE(trait, TraitsData)
-OPENASSETIO_FWD_DECLARE(managerApi, ManagerStateBase)
+#include <openassetio/managerApi/ManagerStateBase.hpp>
+#include <openassetio/trait/TraitsData.hpp>
 
 using openassetio::Context;
 
@@ -24,3 +24,42 @@ SCENARIO("Default construction") {
     THEN("the locale is not null") { CHECK(context->locale); }
   }
 }
+
+SCENARIO("Context copying and moving") {
+  struct TestState final : openassetio::managerApi::ManagerStateBase {};
+
+  GIVEN("a Context with a locale and manager state") {
+    const Context::Ptr context =
+        Context::make(openassetio::trait::TraitsData::make(), std::make_shared<TestState>());
+
+    WHEN("the Context is copied") {
+      const Context copy{*context};  // NOLINT(performance-unnecessary-copy-initialization)
+
+      THEN("the copy shares the locale and manager state") {
+        CHECK(copy.locale == context->locale);
+        CHECK(copy.managerState == context->managerState);
+      }
+    }
+
+    WHEN("the Context is copy assigned") {
+      Context copy = *Context::make();
+      copy = *context;
+
+      THEN("the copy shares the locale and manager state") {
+        CHECK(copy.locale == context->locale);
+        CHECK(copy.managerState == context->managerState);
+      }
+    }
+
+    WHEN("the Context is moved") {
+      const auto locale = context->locale;
+      const auto managerState = context->managerState;
+      const Context moved{std::move(*context)};
+
+      THEN("the moved-to Context has the locale and manager state") {
+        CHECK(moved.locale == locale);
+        CHECK(moved.managerState == managerState);
+      }
+    }
+  }
+}
@@ -0,0 +1,85 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <memory>
+#include <string_view>
+
+#include <export.h>
+
+#include <openassetio/EntityReference.hpp>
+#include <openassetio/InfoDictionary.hpp>
+#include <openassetio/access.hpp>
+#include <openassetio/constants.hpp>
+#include <openassetio/managerApi/ManagerInterface.hpp>
+#include <openassetio/pluginSystem/CppPluginSystemManagerPlugin.hpp>
+#include <openassetio/pluginSystem/CppPluginSystemPlugin.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio/trait/collection.hpp>
+#include <openassetio/typedefs.hpp>
+
+#include "StubManagerInterface.hpp"
+
+namespace {
+/// Prefix of entity references claimed by this manager.
+constexpr std::string_view kPrefix = "cpp://";
+
+/**
+ * Manager that claims entity references with the prefix "cpp://", and
+ * resolves each to its reference string, as the "ref" property of the
+ * trait "t".
+ */
+struct PrefixResolvingManagerInterface : StubManagerInterface {
+  bool hasCapability(const Capability capability) override {
+    return capability == Capability::kEntityReferenceIdentification ||
+           capability == Capability::kManagementPolicyQueries ||
+           capability == Capability::kEntityTraitIntrospection ||
+           capability == Capability::kResolution;
+  }
+
+  openassetio::InfoDictionary info() override {
+    return {{openassetio::Str{openassetio::constants::kInfoKey_EntityReferencesMatchPrefix},
+             openassetio::Str{kPrefix}}};
+  }
+
+  bool isEntityReferenceString(
+      const openassetio::Str& someString,
+      [[maybe_unused]] const openassetio::managerApi::HostSessionPtr& hostSession) override {
+    return someString.rfind(kPrefix, 0) == 0;
+  }
+
+  void resolve(const openassetio::EntityReferences& entityReferences,
+               [[maybe_unused]] const openassetio::trait::TraitSet& traitSet,
+               [[maybe_unused]] const openassetio::access::ResolveAccess resolveAccess,
+               [[maybe_unused]] const openassetio::ContextConstPtr& context,
+               [[maybe_unused]] const openassetio::managerApi::HostSessionPtr& hostSession,
+               const ResolveSuccessCallback& successCallback,
+               [[maybe_unused]] const BatchElementErrorCallback& errorCallback) override {
+    for (std::size_t idx = 0; idx < entityReferences.size(); ++idx) {
+      auto traitsData = openassetio::trait::TraitsData::make();
+      traitsData->setTraitProperty("t", "ref", entityReferences[idx].toString());
+      successCallback(idx, traitsData);
+    }
+  }
+};
+}  // namespace
+
+struct Plugin : openassetio::pluginSystem::CppPluginSystemManagerPlugin {
+  [[nodiscard]] openassetio::Identifier identifier() const override {
+    return "org.openassetio.test.pluginSystem."
+           // NOLINTNEXTLINE(misc-include-cleaner) - definition provided on command line.
+           "resources." OPENASSETIO_CORE_PLUGINSYSTEM_TEST_PLUGIN_ID_SUFFIX;
+  }
+  openassetio::managerApi::ManagerInterfacePtr interface() override {
+    return std::make_shared<PrefixResolvingManagerInterface>();
+  }
+};
+
+extern "C" {
+
+OPENASSETIO_CORE_PLUGINSYSTEM_TEST_EXPORT
+openassetio::pluginSystem::PluginFactory openassetioPlugin() noexcept {
+  return []() noexcept -> openassetio::pluginSystem::CppPluginSystemPluginPtr {
+    return std::make_shared<Plugin>();
+  };
+}
+}
@@ -7,6 +7,7 @@
 #include <pybind11/stl.h>
 
 #include <openassetio/Context.hpp>
+#include <openassetio/errors/exceptions.hpp>
 #include <openassetio/managerApi/ManagerStateBase.hpp>
 #include <openassetio/trait/TraitsData.hpp>
 #include <openassetio/utils/ostream.hpp>
@@ -14,6 +15,32 @@
 #include "PyRetainingSharedPtr.hpp"
 #include "_openassetio.hpp"
 
+namespace {
+/**
+ * Throw if attempting to modify a snapshot, which in C++ is prevented
+ * by constness.
+ */
+void throwIfSnapshot(const openassetio::Context& context) {
+  if (context.isSnapshot()) {
+    throw openassetio::errors::InputValidationException{"Cannot modify a Context snapshot"};
+  }
+}
+
+/**
+ * Resolve the (possibly deferred) manager state of a context, releasing
+ * the GIL whilst doing so.
+ *
+ * Resolving a deferred state holds a lock whilst calling the manager,
+ * which may acquire the GIL (e.g. for a Python manager), so the GIL
+ * must not be held whilst waiting for that lock.
+ */
+openassetio::managerApi::ManagerStateBasePtr resolveManagerStateWithoutGil(
+    const openassetio::Context& context) {
+  const py::gil_scoped_release release{};
+  return context.resolveManagerState();
+}
+}  // namespace
+
 void registerContext(const py::module& mod) {
   using openassetio::Context;
   using openassetio::ContextPtr;
@@ -43,10 +70,37 @@ void registerContext(const py::module& mod) {
              stringStream << self;
              return stringStream.str();
            })
-      .def_readwrite("locale", &Context::locale)
+      // Pickling delegates to the locale and manager state. Note that
+      // manager state objects are typically not picklable - to
+      // transport a Context with manager state between processes, use
+      // `Manager.persistenceTokenForContext` and
+      // `Manager.contextFromPersistenceToken`.
+      .def(py::pickle(
+          [](const Context& self) {
+            return py::make_tuple(self.locale, resolveManagerStateWithoutGil(self));
+          },
+          [](const py::tuple& state) {
+            return Context::make(state[0].cast<PyRetainingTraitsDataPtr>(),
+                                 state[1].cast<PyRetainingManagerStateBasePtr>());
+          }))
+      .def_property(
+          "locale", [](const Context& self) { return self.locale; },
+          // Explicit `is_method` for a consistent signature with
+          // `def_readwrite`.
+          py::cpp_function(
+              [](Context& self, openassetio::trait::TraitsDataPtr locale) {
+                throwIfSnapshot(self);
+                self.locale = std::move(locale);
+              },
+              py::is_method(context)))
+      .def("resolveManagerState", &Context::resolveManagerState,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("snapshot", &Context::snapshot, py::call_guard<py::gil_scoped_release>{})
+      .def("isSnapshot", &Context::isSnapshot)
       .def_property(
-          "managerState", [](const Context& self) { return self.managerState; },
+          "managerState", [](const Context& self) { return resolveManagerStateWithoutGil(self); },
           [](Context& self, PyRetainingManagerStateBasePtr managerState) {
+            throwIfSnapshot(self);
             self.managerState = std::move(managerState);
           });
 }
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #include <sstream>
+#include <utility>
 
 #include <fmt/core.h>
 
@@ -35,5 +36,7 @@ void registerEntityReference(const py::module& mod) {
       .def(py::self < py::self)   // NOLINT(misc-redundant-expression)
       .def(py::self <= py::self)  // NOLINT(misc-redundant-expression)
       .def("__hash__",
-           [](const EntityReference& self) { return std::hash<EntityReference>{}(self); });
+           [](const EntityReference& self) { return std::hash<EntityReference>{}(self); })
+      .def(py::pickle([](const EntityReference& self) { return self.toString(); },
+                      [](openassetio::Str state) { return EntityReference{std::move(state)}; }));
 }
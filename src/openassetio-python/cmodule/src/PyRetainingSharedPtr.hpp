@@ -43,6 +43,10 @@ inline namespace OPENASSETIO_CORE_ABI_VERSION {
  * function", or similar, if the Python object goes out of scope but a
  * C++ object still holds a shared_ptr to (the C++ base class of) it.
  *
+ * Instances can be freely copied and destroyed across threads, with or
+ * without the GIL held. The Python refcount is only ever modified with
+ * the GIL held (see @ref python::pointers::createPyRetainingPtr).
+ *
  * @tparam T Wrapped type.
  */
 template <class T>
@@ -48,9 +48,13 @@ PYBIND11_MODULE(_openassetio, mod) {
   registerHostSession(managerApi);
   registerEntityReferencePagerInterface(managerApi);
   registerEntityReferencePager(hostApi);
+  registerEntityReferencePagerStream(hostApi);
   registerManagerInterface(managerApi);
   registerManagerImplementationFactoryInterface(hostApi);
   registerManager(hostApi);
+  registerRelationshipTraversal(hostApi);
+  registerPublishStream(hostApi);
+  registerPublishPipeline(hostApi);
   registerManagerFactory(hostApi);
   registerUtils(utils);
   registerCppPluginSystemPlugin(pluginSystem);
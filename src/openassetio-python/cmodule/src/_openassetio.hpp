@@ -111,6 +111,18 @@ void registerExceptions(const py::module& mod);
 /// Register the EntityReferencePager class with Python.
 void registerEntityReferencePager(const py::module& mod);
 
+/// Register the EntityReferencePagerStream class with Python.
+void registerEntityReferencePagerStream(const py::module& mod);
+
+/// Register the RelationshipTraversal class with Python.
+void registerRelationshipTraversal(const py::module& mod);
+
+/// Register the PublishStream class with Python.
+void registerPublishStream(const py::module& mod);
+
+/// Register the PublishPipeline class with Python.
+void registerPublishPipeline(const py::module& mod);
+
 /// Register the EntityReferencePagerInterface class with Python.
 void registerEntityReferencePagerInterface(const py::module& mod);
 
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
 #include <sstream>
+#include <type_traits>
 
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
@@ -32,6 +33,18 @@ void registerBatchElementError(const py::module& mod) {
       .def(py::self == py::self)  // NOLINT(misc-redundant-expression)
       .def_readonly("code", &BatchElementError::code)
       .def_readonly("message", &BatchElementError::message)
+      .def(py::pickle(
+          [](const BatchElementError& self) {
+            return py::make_tuple(
+                static_cast<std::underlying_type_t<BatchElementError::ErrorCode>>(self.code),
+                self.message);
+          },
+          [](const py::tuple& state) {
+            return BatchElementError{
+                static_cast<BatchElementError::ErrorCode>(
+                    state[0].cast<std::underlying_type_t<BatchElementError::ErrorCode>>()),
+                state[1].cast<openassetio::Str>()};
+          }))
       .def("__str__", [](const BatchElementError& self) {
         std::ostringstream stringStream;
         stringStream << self;
@@ -208,13 +208,18 @@ void registerPyExceptionClass(const std::string_view pyClassName, const py::modu
       // type. The `globals` and `locals` dict parameters dictate the
       // scope of execution, so we use this to ensure the definition is
       // scoped to the correct Python module.
-      py::exec(R"pybind(
+      //
+      // Note: the source is wrapped in a `py::str`, since pybind11
+      // otherwise imports `textwrap` (and hence `re`) to dedent string
+      // literals that begin with a newline, adding appreciably to
+      // `import openassetio` time.
+      py::exec(py::str{R"pybind(
 class BatchElementException(OpenAssetIOException):
     def __init__(self, index: int, error, message: str):
         self.index = index
         self.error = error
         self.message = message
-        super().__init__(message))pybind",
+        super().__init__(message))pybind"},
                mod.attr("__dict__"), mod.attr("__dict__"));
 
       // Retrieve a handle to the exception type just created by executing
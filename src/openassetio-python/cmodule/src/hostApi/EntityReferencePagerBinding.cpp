@@ -1,8 +1,13 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <optional>
+#include <utility>
+
 #include <pybind11/functional.h>
 #include <pybind11/stl.h>
 
+#include <openassetio/EntityReference.hpp>
 #include <openassetio/hostApi/EntityReferencePager.hpp>
 
 // NOLINTBEGIN(misc-include-cleaner) - required for pybind11
@@ -12,16 +17,143 @@
 
 #include "../_openassetio.hpp"
 
+namespace {
+using openassetio::hostApi::EntityReferencePager;
+using openassetio::hostApi::EntityReferencePagerPtr;
+
+/**
+ * Python iterator over the non-empty pages of a pager, starting from
+ * its current page.
+ *
+ * Each step queries and advances the pager, and fetches the page, in
+ * a single call with the GIL released.
+ */
+class PageIterator {
+ public:
+  explicit PageIterator(EntityReferencePagerPtr pager) : pager_{std::move(pager)} {}
+
+  /**
+   * Fetch the next non-empty page.
+   *
+   * @return Next page, or nullopt if there are no more pages.
+   */
+  std::optional<EntityReferencePager::Page> nextPage() {
+    if (exhausted_) {
+      return std::nullopt;
+    }
+    const py::gil_scoped_release release{};
+    while (true) {
+      if (started_) {
+        if (!pager_->hasNext()) {
+          exhausted_ = true;
+          return std::nullopt;
+        }
+        pager_->next();
+      }
+      started_ = true;
+      EntityReferencePager::Page page = pager_->get();
+      if (!page.empty()) {
+        return page;
+      }
+    }
+  }
+
+ private:
+  EntityReferencePagerPtr pager_;
+  bool started_ = false;
+  bool exhausted_ = false;
+};
+
+/**
+ * Python iterator over the entity references of all pages of a pager,
+ * starting from its current page.
+ *
+ * Pages are fetched as in PageIterator, then elements are yielded from
+ * the buffered page without calling into the pager.
+ */
+class EntityReferenceIterator {
+ public:
+  explicit EntityReferenceIterator(EntityReferencePagerPtr pager) : pages_{std::move(pager)} {}
+
+  /**
+   * Get the next entity reference.
+   *
+   * @return Next entity reference, or nullopt if there are no more
+   * pages.
+   */
+  std::optional<openassetio::EntityReference> nextEntityReference() {
+    while (elementIdx_ == page_.size()) {
+      std::optional<EntityReferencePager::Page> page = pages_.nextPage();
+      if (!page) {
+        return std::nullopt;
+      }
+      page_ = std::move(*page);
+      elementIdx_ = 0;
+    }
+    return page_[elementIdx_++];
+  }
+
+ private:
+  PageIterator pages_;
+  EntityReferencePager::Page page_;
+  std::size_t elementIdx_ = 0;
+};
+}  // namespace
+
 void registerEntityReferencePager(const py::module& mod) {
-  using openassetio::hostApi::EntityReferencePager;
-  using openassetio::hostApi::EntityReferencePagerPtr;
+  py::class_<EntityReferencePager, EntityReferencePagerPtr> pager{mod, "EntityReferencePager",
+                                                                  py::is_final()};
+
+  py::class_<EntityReferencePager::Statistics>{pager, "Statistics", py::is_final()}
+      .def_readonly("pageCount", &EntityReferencePager::Statistics::pageCount)
+      .def_readonly("entityReferenceCount",
+                    &EntityReferencePager::Statistics::entityReferenceCount)
+      .def_readonly("pageSizes", &EntityReferencePager::Statistics::pageSizes)
+      .def_readonly("fetchSeconds", &EntityReferencePager::Statistics::fetchSeconds);
+
+  py::class_<PageIterator>{pager, "PageIterator", py::is_final()}
+      .def("__iter__", [](PageIterator& self) -> PageIterator& { return self; })
+      .def("__next__", [](PageIterator& self) {
+        std::optional<EntityReferencePager::Page> page = self.nextPage();
+        if (!page) {
+          throw py::stop_iteration{};
+        }
+        return std::move(*page);
+      });
+
+  py::class_<EntityReferenceIterator>{pager, "EntityReferenceIterator", py::is_final()}
+      .def("__iter__",
+           [](EntityReferenceIterator& self) -> EntityReferenceIterator& { return self; })
+      .def("__next__", [](EntityReferenceIterator& self) {
+        std::optional<openassetio::EntityReference> entityReference = self.nextEntityReference();
+        if (!entityReference) {
+          throw py::stop_iteration{};
+        }
+        return std::move(*entityReference);
+      });
 
-  py::class_<EntityReferencePager, EntityReferencePagerPtr>{mod, "EntityReferencePager",
-                                                            py::is_final()}
+  pager
       .def(py::init(RetainCommonPyArgs::forFn<&EntityReferencePager::make>()),
            py::arg("entityReferencePagerInterface").none(false),
-           py::arg("hostSession").none(false))
+           py::arg("hostSession").none(false), py::arg("pageSize") = 0)
+      .def_readonly_static("kDefaultTargetPageSeconds",
+                           &EntityReferencePager::kDefaultTargetPageSeconds)
       .def("hasNext", &EntityReferencePager::hasNext, py::call_guard<py::gil_scoped_release>{})
       .def("get", &EntityReferencePager::get, py::call_guard<py::gil_scoped_release>{})
-      .def("next", &EntityReferencePager::next, py::call_guard<py::gil_scoped_release>{});
+      .def("next", &EntityReferencePager::next, py::call_guard<py::gil_scoped_release>{})
+      .def("setPrefetchDepth", &EntityReferencePager::setPrefetchDepth, py::arg("prefetchDepth"),
+           py::call_guard<py::gil_scoped_release>{})
+      .def("prefetchDepth", &EntityReferencePager::prefetchDepth,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("setAdaptivePageSize", &EntityReferencePager::setAdaptivePageSize,
+           py::arg("minPageSize"), py::arg("maxPageSize"),
+           py::arg("targetPageSeconds") = EntityReferencePager::kDefaultTargetPageSeconds,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("pageSize", &EntityReferencePager::pageSize, py::call_guard<py::gil_scoped_release>{})
+      .def("statistics", &EntityReferencePager::statistics,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("pages", [](const EntityReferencePagerPtr& self) { return PageIterator{self}; })
+      .def("entityReferences",
+           [](const EntityReferencePagerPtr& self) { return EntityReferenceIterator{self}; })
+      .def("__iter__", [](const EntityReferencePagerPtr& self) { return PageIterator{self}; });
 }
@@ -0,0 +1,36 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <optional>
+#include <utility>
+
+#include <pybind11/stl.h>
+
+#include <openassetio/hostApi/EntityReferencePager.hpp>
+#include <openassetio/hostApi/EntityReferencePagerStream.hpp>
+
+#include "../_openassetio.hpp"
+
+void registerEntityReferencePagerStream(const py::module& mod) {
+  using openassetio::hostApi::EntityReferencePagerStream;
+  using openassetio::hostApi::EntityReferencePagerStreamPtr;
+
+  py::class_<EntityReferencePagerStream, EntityReferencePagerStreamPtr>{
+      mod, "EntityReferencePagerStream", py::is_final()}
+      .def(py::init(&EntityReferencePagerStream::make), py::arg("pagers"),
+           py::arg("maxConcurrency") = EntityReferencePagerStream::kDefaultMaxConcurrency,
+           py::arg("ordered") = false)
+      .def_readonly_static("kDefaultMaxConcurrency",
+                           &EntityReferencePagerStream::kDefaultMaxConcurrency)
+      .def("__iter__", [](const py::object& self) { return self; })
+      .def("__next__", [](EntityReferencePagerStream& self) {
+        std::optional<EntityReferencePagerStream::Item> item;
+        {
+          const py::gil_scoped_release release{};
+          item = self.next();
+        }
+        if (!item) {
+          throw py::stop_iteration{};
+        }
+        return py::make_tuple(item->sourceIndex, std::move(item->page));
+      });
+}
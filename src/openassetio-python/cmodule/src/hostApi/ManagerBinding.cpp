@@ -107,11 +107,20 @@ void registerManager(const py::module& mod) {
           py::call_guard<py::gil_scoped_release>{})
       .def("createContext", &Manager::createContext, py::call_guard<py::gil_scoped_release>{})
       .def("createChildContext", &Manager::createChildContext,
-           py::arg("parentContext").none(false), py::call_guard<py::gil_scoped_release>{})
+           py::arg("parentContext").none(false), py::arg("deferManagerState") = false,
+           py::call_guard<py::gil_scoped_release>{})
       .def("persistenceTokenForContext", &Manager::persistenceTokenForContext,
            py::arg("context").none(false), py::call_guard<py::gil_scoped_release>{})
       .def("contextFromPersistenceToken", &Manager::contextFromPersistenceToken, py::arg("token"),
            py::call_guard<py::gil_scoped_release>{})
+      .def("persistenceTokensForContexts", &Manager::persistenceTokensForContexts,
+           py::arg("contexts"), py::call_guard<py::gil_scoped_release>{})
+      .def("contextsFromPersistenceTokens", &Manager::contextsFromPersistenceTokens,
+           py::arg("tokens"), py::call_guard<py::gil_scoped_release>{})
+      .def("setPersistenceTokenCacheCapacity", &Manager::setPersistenceTokenCacheCapacity,
+           py::arg("capacity"), py::call_guard<py::gil_scoped_release>{})
+      .def("persistenceTokenCacheCapacity", &Manager::persistenceTokenCacheCapacity,
+           py::call_guard<py::gil_scoped_release>{})
       .def("isEntityReferenceString", &Manager::isEntityReferenceString, py::arg("someString"),
            py::call_guard<py::gil_scoped_release>{})
       .def("createEntityReference", &Manager::createEntityReference,
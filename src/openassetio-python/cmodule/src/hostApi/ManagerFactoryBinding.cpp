@@ -44,6 +44,11 @@ void registerManagerFactory(const py::module& mod) {
            py::call_guard<py::gil_scoped_release>{})
       .def_readonly_static("kDefaultManagerConfigEnvVarName",
                            &ManagerFactory::kDefaultManagerConfigEnvVarName)
+      .def_readonly_static("kManagerPoolingEnvVarName", &ManagerFactory::kManagerPoolingEnvVarName)
+      .def_static("setManagerPooling", &ManagerFactory::setManagerPooling, py::arg("enabled"),
+                  py::call_guard<py::gil_scoped_release>{})
+      .def_static("managerPooling", &ManagerFactory::managerPooling,
+                  py::call_guard<py::gil_scoped_release>{})
       .def("createManager", &ManagerFactory::createManager, py::arg("identifier"),
            py::call_guard<py::gil_scoped_release>{})
       .def_static("createManagerForInterface",
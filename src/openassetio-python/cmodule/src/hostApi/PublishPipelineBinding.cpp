@@ -0,0 +1,33 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <pybind11/functional.h>
+
+#include <openassetio/hostApi/PublishPipeline.hpp>
+#include <openassetio/hostApi/PublishStream.hpp>
+
+// NOLINTBEGIN(misc-include-cleaner) - required for pybind11
+#include <openassetio/Context.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+// NOLINTEND(misc-include-cleaner)
+
+#include "../_openassetio.hpp"
+
+void registerPublishPipeline(const py::module& mod) {
+  using openassetio::hostApi::PublishPipeline;
+  using openassetio::hostApi::PublishPipelinePtr;
+  using openassetio::hostApi::PublishStream;
+
+  py::class_<PublishPipeline, PublishPipelinePtr>{mod, "PublishPipeline", py::is_final()}
+      .def(py::init(&PublishPipeline::make), py::arg("manager").none(false),
+           py::arg("publishingAccess"), py::arg("context").none(false), py::arg("writeCallback"),
+           py::arg("successCallback"), py::arg("errorCallback"),
+           py::arg("chunkSize") = PublishStream::kDefaultChunkSize,
+           py::arg("maxPendingChunks") = PublishStream::kDefaultMaxPendingChunks)
+      .def("push", &PublishPipeline::push, py::arg("entityReference"),
+           py::arg("traitsHint").none(false), py::call_guard<py::gil_scoped_release>{})
+      .def("flush", &PublishPipeline::flush, py::call_guard<py::gil_scoped_release>{})
+      .def("pushedCount", &PublishPipeline::pushedCount, py::call_guard<py::gil_scoped_release>{})
+      .def("completedCount", &PublishPipeline::completedCount,
+           py::call_guard<py::gil_scoped_release>{});
+}
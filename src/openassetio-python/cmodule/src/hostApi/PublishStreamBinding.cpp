@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <pybind11/functional.h>
+
+#include <openassetio/hostApi/PublishStream.hpp>
+
+// NOLINTBEGIN(misc-include-cleaner) - required for pybind11
+#include <openassetio/Context.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+// NOLINTEND(misc-include-cleaner)
+
+#include "../_openassetio.hpp"
+
+void registerPublishStream(const py::module& mod) {
+  using openassetio::hostApi::PublishStream;
+  using openassetio::hostApi::PublishStreamPtr;
+
+  py::class_<PublishStream, PublishStreamPtr> stream{mod, "PublishStream", py::is_final()};
+
+  py::enum_<PublishStream::Operation>{stream, "Operation"}
+      .value("kPreflight", PublishStream::Operation::kPreflight)
+      .value("kRegister", PublishStream::Operation::kRegister);
+
+  stream
+      .def(py::init(&PublishStream::make), py::arg("manager").none(false), py::arg("operation"),
+           py::arg("publishingAccess"), py::arg("context").none(false), py::arg("successCallback"),
+           py::arg("errorCallback"), py::arg("chunkSize") = PublishStream::kDefaultChunkSize,
+           py::arg("maxPendingChunks") = PublishStream::kDefaultMaxPendingChunks)
+      .def_readonly_static("kDefaultChunkSize", &PublishStream::kDefaultChunkSize)
+      .def_readonly_static("kDefaultMaxPendingChunks", &PublishStream::kDefaultMaxPendingChunks)
+      .def("push", &PublishStream::push, py::arg("entityReference"),
+           py::arg("traitsData").none(false), py::call_guard<py::gil_scoped_release>{})
+      .def("flush", &PublishStream::flush, py::call_guard<py::gil_scoped_release>{})
+      .def("pushedCount", &PublishStream::pushedCount, py::call_guard<py::gil_scoped_release>{})
+      .def("completedCount", &PublishStream::completedCount,
+           py::call_guard<py::gil_scoped_release>{});
+}
@@ -0,0 +1,102 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+#include <optional>
+#include <utility>
+
+#include <pybind11/functional.h>
+#include <pybind11/stl.h>
+
+#include <openassetio/hostApi/EntityReferencePagerStream.hpp>
+#include <openassetio/hostApi/RelationshipTraversal.hpp>
+
+// NOLINTBEGIN(misc-include-cleaner) - required for pybind11
+#include <openassetio/Context.hpp>
+#include <openassetio/hostApi/Manager.hpp>
+#include <openassetio/trait/TraitsData.hpp>
+// NOLINTEND(misc-include-cleaner)
+
+#include "../_openassetio.hpp"
+
+namespace {
+using openassetio::hostApi::RelationshipTraversal;
+using openassetio::hostApi::RelationshipTraversalPtr;
+
+/**
+ * Python iterator over the remaining edges of a traversal.
+ *
+ * Edges are fetched a page at a time, with the GIL released, then
+ * yielded from the buffered page without calling into the traversal.
+ */
+class EdgeIterator {
+ public:
+  explicit EdgeIterator(RelationshipTraversalPtr traversal) : traversal_{std::move(traversal)} {}
+
+  /**
+   * Get the next edge.
+   *
+   * @return Next edge, or nullopt if the traversal is finished.
+   */
+  std::optional<RelationshipTraversal::Edge> nextEdge() {
+    while (edgeIdx_ == edges_.size()) {
+      std::optional<RelationshipTraversal::Edges> edges;
+      {
+        const py::gil_scoped_release release{};
+        edges = traversal_->next();
+      }
+      if (!edges) {
+        return std::nullopt;
+      }
+      edges_ = std::move(*edges);
+      edgeIdx_ = 0;
+    }
+    return std::move(edges_[edgeIdx_++]);
+  }
+
+ private:
+  RelationshipTraversalPtr traversal_;
+  RelationshipTraversal::Edges edges_;
+  std::size_t edgeIdx_ = 0;
+};
+}  // namespace
+
+void registerRelationshipTraversal(const py::module& mod) {
+  using openassetio::hostApi::EntityReferencePagerStream;
+
+  py::class_<RelationshipTraversal, RelationshipTraversalPtr> traversal{
+      mod, "RelationshipTraversal", py::is_final()};
+
+  py::class_<RelationshipTraversal::Edge>{traversal, "Edge", py::is_final()}
+      .def_readonly("source", &RelationshipTraversal::Edge::source)
+      .def_readonly("target", &RelationshipTraversal::Edge::target)
+      .def_readonly("depth", &RelationshipTraversal::Edge::depth);
+
+  py::class_<EdgeIterator>{traversal, "EdgeIterator", py::is_final()}
+      .def("__iter__", [](EdgeIterator& self) -> EdgeIterator& { return self; })
+      .def("__next__", [](EdgeIterator& self) {
+        std::optional<RelationshipTraversal::Edge> edge = self.nextEdge();
+        if (!edge) {
+          throw py::stop_iteration{};
+        }
+        return std::move(*edge);
+      });
+
+  traversal
+      .def(py::init(&RelationshipTraversal::make), py::arg("manager").none(false),
+           py::arg("entityReferences"), py::arg("relationshipTraitsDatas"),
+           py::arg("relationsAccess"), py::arg("context").none(false),
+           py::arg("maxDepth") = RelationshipTraversal::kUnlimited,
+           py::arg("maxEntities") = RelationshipTraversal::kUnlimited,
+           py::arg("pageSize") = RelationshipTraversal::kDefaultPageSize,
+           py::arg("maxConcurrency") = EntityReferencePagerStream::kDefaultMaxConcurrency,
+           py::arg("resultTraitSet") = openassetio::trait::TraitSet{},
+           py::arg("errorCallback") = RelationshipTraversal::ErrorCallback{})
+      .def_readonly_static("kUnlimited", &RelationshipTraversal::kUnlimited)
+      .def_readonly_static("kDefaultPageSize", &RelationshipTraversal::kDefaultPageSize)
+      .def("next", &RelationshipTraversal::next, py::call_guard<py::gil_scoped_release>{})
+      .def("truncated", &RelationshipTraversal::truncated,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("entityCount", &RelationshipTraversal::entityCount,
+           py::call_guard<py::gil_scoped_release>{})
+      .def("__iter__", [](const RelationshipTraversalPtr& self) { return EdgeIterator{self}; });
+}
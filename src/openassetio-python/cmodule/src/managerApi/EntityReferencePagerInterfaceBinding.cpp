@@ -1,5 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
+#include <cstddef>
+
 #include <pybind11/functional.h>
 #include <pybind11/stl.h>
 
@@ -34,6 +36,11 @@ struct PyEntityReferencePagerInterface : EntityReferencePagerInterface {
     OPENASSETIO_PYBIND11_OVERRIDE_PURE(void, EntityReferencePagerInterface, next, hostSession);
   }
 
+  void setPageSizeHint(const std::size_t pageSize, const HostSessionPtr& hostSession) override {
+    OPENASSETIO_PYBIND11_OVERRIDE(void, EntityReferencePagerInterface, setPageSizeHint, pageSize,
+                                  hostSession);
+  }
+
   void close(const HostSessionPtr& hostSession) override {
     OPENASSETIO_PYBIND11_OVERRIDE(void, EntityReferencePagerInterface, close, hostSession);
   }
@@ -57,6 +64,8 @@ void registerEntityReferencePagerInterface(const py::module& mod) {
            py::call_guard<py::gil_scoped_release>{})
       .def("next", &EntityReferencePagerInterface::next, py::arg("hostSession").none(false),
            py::call_guard<py::gil_scoped_release>{})
+      .def("setPageSizeHint", &EntityReferencePagerInterface::setPageSizeHint, py::arg("pageSize"),
+           py::arg("hostSession").none(false), py::call_guard<py::gil_scoped_release>{})
       .def("close", &EntityReferencePagerInterface::close, py::arg("hostSession").none(false),
            py::call_guard<py::gil_scoped_release>{});
 }
@@ -17,18 +17,33 @@
 void registerCppPluginSystem(const py::module_ &mod) {
   using openassetio::pluginSystem::CppPluginSystem;
 
-  // Only bother releasing the GIL for `scan`, since that's the only
-  // method that potentially calls out to virtual method(s). Tests will
+  // Only bother releasing the GIL for `scan` (and
+  // `rebuildDiscoveryIndex`, which wraps it) and `plugin` (which may
+  // load a deferred plugin), since they're the only methods that
+  // potentially call out to virtual method(s). Tests will
   // catch if this changes (e.g. if we add logger calls in the other
   // methods).
 
   py::class_<CppPluginSystem, CppPluginSystem::Ptr>(mod, "CppPluginSystem", py::is_final())
       .def(py::init(RetainCommonPyArgs::forFn<&CppPluginSystem::make>()),
            py::arg("logger").none(false))
+      .def_readonly_static("kDiscoveryIndexEnvVar", &CppPluginSystem::kDiscoveryIndexEnvVar)
+      .def_readonly_static("kLazyLoadingEnvVar", &CppPluginSystem::kLazyLoadingEnvVar)
+      .def_readonly_static("kScanThreadCountEnvVar", &CppPluginSystem::kScanThreadCountEnvVar)
       .def("reset", &CppPluginSystem::reset)
       .def("scan", &CppPluginSystem::scan, py::arg("paths"), py::arg("pathsEnvVar"),
            py::arg("moduleHookName"), py::arg("validationCallback"),
            py::call_guard<py::gil_scoped_release>{})
+      .def("rebuildDiscoveryIndex", &CppPluginSystem::rebuildDiscoveryIndex, py::arg("paths"),
+           py::arg("pathsEnvVar"), py::arg("moduleHookName"), py::arg("validationCallback"),
+           py::call_guard<py::gil_scoped_release>{})
+      .def("setDiscoveryIndexPath", &CppPluginSystem::setDiscoveryIndexPath, py::arg("indexPath"))
+      .def("discoveryIndexPath", &CppPluginSystem::discoveryIndexPath)
+      .def("setLazyLoading", &CppPluginSystem::setLazyLoading, py::arg("lazyLoading"))
+      .def("lazyLoading", &CppPluginSystem::lazyLoading)
+      .def("setScanThreadCount", &CppPluginSystem::setScanThreadCount, py::arg("threadCount"))
+      .def("scanThreadCount", &CppPluginSystem::scanThreadCount)
       .def("identifiers", &CppPluginSystem::identifiers)
-      .def("plugin", &CppPluginSystem::plugin, py::arg("identifier"));
+      .def("plugin", &CppPluginSystem::plugin, py::arg("identifier"),
+           py::call_guard<py::gil_scoped_release>{});
 }
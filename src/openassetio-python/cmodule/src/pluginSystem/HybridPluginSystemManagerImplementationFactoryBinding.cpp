@@ -48,6 +48,35 @@ void registerHybridPluginSystemManagerImplementationFactory(const py::module_& m
                  std::move(logger));
            }),
            py::arg("factories"), py::arg("logger").none(false))
+      .def_readonly_static(
+          "kEntityReferenceRoutingEnvVar",
+          &HybridPluginSystemManagerImplementationFactory::kEntityReferenceRoutingEnvVar)
+      .def("setEntityReferenceRouting",
+           &HybridPluginSystemManagerImplementationFactory::setEntityReferenceRouting,
+           py::arg("entityReferenceRouting"))
+      .def("entityReferenceRouting",
+           &HybridPluginSystemManagerImplementationFactory::entityReferenceRouting)
+      .def_readonly_static(
+          "kFallbackErrorCodesEnvVar",
+          &HybridPluginSystemManagerImplementationFactory::kFallbackErrorCodesEnvVar)
+      .def("setFallbackErrorCodes",
+           &HybridPluginSystemManagerImplementationFactory::setFallbackErrorCodes,
+           py::arg("fallbackErrorCodes"))
+      .def("fallbackErrorCodes",
+           &HybridPluginSystemManagerImplementationFactory::fallbackErrorCodes)
+      .def_readonly_static(
+          "kConcurrentInitializationEnvVar",
+          &HybridPluginSystemManagerImplementationFactory::kConcurrentInitializationEnvVar)
+      .def("setConcurrentInitialization",
+           &HybridPluginSystemManagerImplementationFactory::setConcurrentInitialization,
+           py::arg("concurrentInitialization"))
+      .def("concurrentInitialization",
+           &HybridPluginSystemManagerImplementationFactory::concurrentInitialization)
+      .def_readonly_static("kConcurrentScanEnvVar",
+                           &HybridPluginSystemManagerImplementationFactory::kConcurrentScanEnvVar)
+      .def("setConcurrentScan", &HybridPluginSystemManagerImplementationFactory::setConcurrentScan,
+           py::arg("concurrentScan"))
+      .def("concurrentScan", &HybridPluginSystemManagerImplementationFactory::concurrentScan)
       .def("identifiers", &HybridPluginSystemManagerImplementationFactory::identifiers,
            py::call_guard<py::gil_scoped_release>{})
       .def("instantiate", &HybridPluginSystemManagerImplementationFactory::instantiate,
@@ -1,11 +1,20 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2013-2025 The Foundry Visionmongers Ltd
+#include <cstdint>
+#include <cstring>
 #include <optional>
 #include <sstream>
+#include <string>
+#include <string_view>
+#include <type_traits>
+#include <variant>
+
+#include <fmt/core.h>
 
 #include <pybind11/operators.h>
 #include <pybind11/stl.h>
 
+#include <openassetio/errors/exceptions.hpp>
 #include <openassetio/trait/TraitsData.hpp>
 #include <openassetio/trait/collection.hpp>
 #include <openassetio/trait/property.hpp>
@@ -13,6 +22,198 @@
 
 #include "../_openassetio.hpp"
 
+namespace {
+using openassetio::trait::TraitsData;
+using openassetio::trait::TraitsDataPtr;
+namespace trait = openassetio::trait;
+namespace property = openassetio::trait::property;
+
+/**
+ * @name Pickle encoding
+ *
+ * TraitsData is pickled as a compact binary blob, rather than as
+ * nested Python containers, to minimise the cost of sending large
+ * numbers of TraitsData between processes (e.g. resolve results from
+ * a process pool).
+ *
+ * The encoding is:
+ *
+ * - Format version (1 byte).
+ * - Trait count (uint32), then for each trait:
+ *   - Trait ID (string).
+ *   - Property count (uint32), then for each property:
+ *     - Property key (string).
+ *     - Value type (1 byte), i.e. the `property::Value` variant index.
+ *     - Value: 1 byte for Bool; 8 bytes for Int and Float; string for
+ *       Str.
+ *
+ * where strings are a uint32 byte length followed by the (UTF-8)
+ * bytes, and all integers are little-endian.
+ *
+ * @{
+ */
+/// Bump if the encoding changes, so old pickles are rejected cleanly.
+constexpr std::uint8_t kPickleFormatVersion = 1;
+
+/// Index of the given type in the `property::Value` variant.
+template <class T, std::size_t I = 0>
+constexpr std::uint8_t variantIndex() {
+  if constexpr (std::is_same_v<std::variant_alternative_t<I, property::Value>, T>) {
+    return I;
+  } else {
+    return variantIndex<T, I + 1>();
+  }
+}
+
+template <class Int>
+void appendLittleEndian(std::string& buffer, const Int value) {
+  using Unsigned = std::make_unsigned_t<Int>;
+  const auto bits = static_cast<std::uint64_t>(static_cast<Unsigned>(value));
+  for (std::size_t byteIdx = 0; byteIdx < sizeof(Unsigned); ++byteIdx) {
+    buffer.push_back(static_cast<char>((bits >> (8U * byteIdx)) & 0xFFU));
+  }
+}
+
+void appendString(std::string& buffer, const std::string_view str) {
+  appendLittleEndian(buffer, static_cast<std::uint32_t>(str.size()));
+  buffer.append(str);
+}
+
+void appendValue(std::string& buffer, const property::Value& value) {
+  buffer.push_back(static_cast<char>(value.index()));
+  std::visit(
+      [&buffer](const auto& typedValue) {
+        using Type = std::decay_t<decltype(typedValue)>;
+        if constexpr (std::is_same_v<Type, openassetio::Bool>) {
+          buffer.push_back(static_cast<char>(typedValue));
+        } else if constexpr (std::is_same_v<Type, openassetio::Int>) {
+          appendLittleEndian(buffer, static_cast<std::int64_t>(typedValue));
+        } else if constexpr (std::is_same_v<Type, openassetio::Float>) {
+          static_assert(sizeof(openassetio::Float) == sizeof(std::uint64_t));
+          std::uint64_t bits{};
+          std::memcpy(&bits, &typedValue, sizeof(bits));
+          appendLittleEndian(buffer, bits);
+        } else {
+          appendString(buffer, typedValue);
+        }
+      },
+      value);
+}
+
+py::bytes encodeTraitsData(const TraitsData& traitsData) {
+  std::string buffer;
+  buffer.push_back(static_cast<char>(kPickleFormatVersion));
+
+  const trait::TraitSet traitSet = traitsData.traitSet();
+  appendLittleEndian(buffer, static_cast<std::uint32_t>(traitSet.size()));
+
+  for (const trait::TraitId& traitId : traitSet) {
+    appendString(buffer, traitId);
+
+    const property::KeySet keys = traitsData.traitPropertyKeys(traitId);
+    appendLittleEndian(buffer, static_cast<std::uint32_t>(keys.size()));
+
+    for (const property::Key& key : keys) {
+      appendString(buffer, key);
+      property::Value value;
+      traitsData.getTraitProperty(&value, traitId, key);
+      appendValue(buffer, value);
+    }
+  }
+  return py::bytes{buffer};
+}
+
+/**
+ * Sequential reader over an encoded buffer, throwing if the buffer is
+ * exhausted prematurely.
+ */
+class PickleReader {
+ public:
+  explicit PickleReader(const std::string_view buffer) : buffer_{buffer} {}
+
+  template <class Int>
+  Int readLittleEndian() {
+    using Unsigned = std::make_unsigned_t<Int>;
+    const std::string_view bytes = read(sizeof(Unsigned));
+    std::uint64_t bits = 0;
+    for (std::size_t byteIdx = 0; byteIdx < sizeof(Unsigned); ++byteIdx) {
+      bits |= std::uint64_t{static_cast<unsigned char>(bytes[byteIdx])} << (8U * byteIdx);
+    }
+    return static_cast<Int>(static_cast<Unsigned>(bits));
+  }
+
+  std::string_view readString() { return read(readLittleEndian<std::uint32_t>()); }
+
+  property::Value readValue() {
+    const auto typeIndex = readLittleEndian<std::uint8_t>();
+    switch (typeIndex) {
+      case variantIndex<openassetio::Bool>():
+        return openassetio::Bool{readLittleEndian<std::uint8_t>() != 0};
+      case variantIndex<openassetio::Int>():
+        return openassetio::Int{readLittleEndian<std::int64_t>()};
+      case variantIndex<openassetio::Float>(): {
+        const auto bits = readLittleEndian<std::uint64_t>();
+        openassetio::Float value{};
+        std::memcpy(&value, &bits, sizeof(value));
+        return value;
+      }
+      case variantIndex<openassetio::Str>():
+        return openassetio::Str{readString()};
+      default:
+        throw openassetio::errors::InputValidationException{
+            fmt::format("Invalid TraitsData pickle: unknown property type {}", typeIndex)};
+    }
+  }
+
+  [[nodiscard]] bool atEnd() const { return pos_ == buffer_.size(); }
+
+ private:
+  std::string_view read(const std::size_t size) {
+    if (buffer_.size() - pos_ < size) {
+      throw openassetio::errors::InputValidationException{
+          "Invalid TraitsData pickle: unexpected end of data"};
+    }
+    const std::string_view result = buffer_.substr(pos_, size);
+    pos_ += size;
+    return result;
+  }
+
+  std::string_view buffer_;
+  std::size_t pos_{0};
+};
+
+TraitsDataPtr decodeTraitsData(const std::string_view buffer) {
+  PickleReader reader{buffer};
+
+  if (const auto version = reader.readLittleEndian<std::uint8_t>();
+      version != kPickleFormatVersion) {
+    throw openassetio::errors::InputValidationException{
+        fmt::format("Invalid TraitsData pickle: unsupported format version {}", version)};
+  }
+
+  TraitsDataPtr traitsData = TraitsData::make();
+
+  const auto traitCount = reader.readLittleEndian<std::uint32_t>();
+  for (std::uint32_t traitIdx = 0; traitIdx < traitCount; ++traitIdx) {
+    const trait::TraitId traitId{reader.readString()};
+    traitsData->addTrait(traitId);
+
+    const auto propertyCount = reader.readLittleEndian<std::uint32_t>();
+    for (std::uint32_t propertyIdx = 0; propertyIdx < propertyCount; ++propertyIdx) {
+      const property::Key key{reader.readString()};
+      traitsData->setTraitProperty(traitId, key, reader.readValue());
+    }
+  }
+
+  if (!reader.atEnd()) {
+    throw openassetio::errors::InputValidationException{
+        "Invalid TraitsData pickle: unexpected trailing data"};
+  }
+  return traitsData;
+}
+/// @}
+}  // namespace
+
 void registerTraitsData(const py::module& mod) {
   using openassetio::trait::TraitsData;
   using openassetio::trait::TraitsDataConstPtr;
@@ -44,7 +245,13 @@ void registerTraitsData(const py::module& mod) {
           },
           py::arg("traitId"), py::arg("propertyKey"))
       .def("traitPropertyKeys", &TraitsData::traitPropertyKeys, py::arg("traitId"))
+      .def("freeze", &TraitsData::freeze)
+      .def("isFrozen", &TraitsData::isFrozen)
       .def(py::self == py::self)  // NOLINT(misc-redundant-expression)
+      .def(py::pickle([](const TraitsData& self) { return encodeTraitsData(self); },
+                      [](const py::bytes& state) {
+                        return decodeTraitsData(static_cast<std::string_view>(state));
+                      }))
       .def("__str__",
            [](const TraitsData& self) {
              std::ostringstream stringStream;
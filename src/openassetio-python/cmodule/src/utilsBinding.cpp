@@ -4,6 +4,7 @@
 #include <pybind11/stl.h>
 
 #include <openassetio/utils/path.hpp>
+#include <openassetio/utils/profiling.hpp>
 #include <openassetio/utils/substitute.hpp>
 
 #include "_openassetio.hpp"
@@ -24,4 +25,37 @@ void registerUtils(py::module_ &mod) {
            py::arg("pathType") = utils::PathType::kSystem);
 
   mod.def("substitute", &utils::substitute, py::arg("input"), py::arg("substitutions"));
+
+  py::class_<utils::StartupProfile> startupProfile{mod, "StartupProfile"};
+
+  py::class_<utils::StartupProfile::Event>{startupProfile, "Event"}
+      .def_readonly("name", &utils::StartupProfile::Event::name)
+      .def_readonly("detail", &utils::StartupProfile::Event::detail)
+      .def_readonly("start", &utils::StartupProfile::Event::start)
+      .def_readonly("duration", &utils::StartupProfile::Event::duration)
+      .def_readonly("depth", &utils::StartupProfile::Event::depth)
+      .def_readonly("thread", &utils::StartupProfile::Event::thread);
+
+  // Usable as a context manager from Python.
+  py::class_<utils::StartupProfile::Scope>{startupProfile, "Scope"}
+      .def(py::init<std::string_view, std::string_view>(), py::arg("name"),
+           py::arg("detail") = std::string_view{})
+      .def("end", &utils::StartupProfile::Scope::end)
+      .def(
+          "__enter__",
+          [](utils::StartupProfile::Scope &self) -> utils::StartupProfile::Scope & {
+            return self;
+          },
+          py::return_value_policy::reference)
+      .def("__exit__", [](utils::StartupProfile::Scope &self,
+                          [[maybe_unused]] const py::args &args) { self.end(); });
+
+  startupProfile
+      .def_readonly_static("kStartupProfileEnvVarName",
+                           &utils::StartupProfile::kStartupProfileEnvVarName)
+      .def_static("setEnabled", &utils::StartupProfile::setEnabled, py::arg("enabled"))
+      .def_static("enabled", &utils::StartupProfile::enabled)
+      .def_static("events", &utils::StartupProfile::events)
+      .def_static("toJson", &utils::StartupProfile::toJson)
+      .def_static("reset", &utils::StartupProfile::reset);
 }
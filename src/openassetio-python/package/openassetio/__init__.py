@@ -68,6 +68,7 @@ The documentation for OpenAssetIO can be found here:
    https://docs.openassetio.org/OpenAssetIO
 """
 
+import importlib
 import os
 
 # If Windows, we may need to wrangle DLL search paths.
@@ -87,3 +88,35 @@ from ._openassetio import (
     patchVersion,
     versionString,
 )
+
+## Submodules imported on first attribute access, rather than when this
+# package is imported, so that lightweight scripts only pay for what
+# they use. Explicit imports (e.g. `from openassetio import hostApi`)
+# continue to work as normal.
+_lazySubmodules = frozenset(
+    (
+        "access",
+        "errors",
+        "hostApi",
+        "log",
+        "managerApi",
+        "pluginSystem",
+        "test",
+        "trait",
+        "ui",
+        "utils",
+    )
+)
+
+
+def __getattr__(name):  # pylint: disable=invalid-name
+    """
+    Import a submodule on first access (PEP 562).
+    """
+    if name in _lazySubmodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():  # pylint: disable=invalid-name
+    return sorted(set(globals()) | _lazySubmodules)
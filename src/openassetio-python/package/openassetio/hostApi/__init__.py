@@ -31,3 +31,7 @@ Manager = _openassetio.hostApi.Manager
 ManagerFactory = _openassetio.hostApi.ManagerFactory
 ManagerImplementationFactoryInterface = _openassetio.hostApi.ManagerImplementationFactoryInterface
 EntityReferencePager = _openassetio.hostApi.EntityReferencePager
+EntityReferencePagerStream = _openassetio.hostApi.EntityReferencePagerStream
+RelationshipTraversal = _openassetio.hostApi.RelationshipTraversal
+PublishStream = _openassetio.hostApi.PublishStream
+PublishPipeline = _openassetio.hostApi.PublishPipeline
@@ -19,13 +19,13 @@ A single-class module, providing the PythonPluginSystem class.
 """
 
 import os.path
-import importlib.metadata
 import importlib.util
-import hashlib
 import sys
+import threading
 import traceback
 
 from ..errors import InputValidationException
+from ..utils import StartupProfile
 
 __all__ = ["PythonPluginSystem"]
 
@@ -38,12 +38,44 @@ class PythonPluginSystem(object):
     registered with its identifier. Once a plug-in has registered an
     identifier, any subsequent registrations with that id will be
     skipped.
+
+    Modules found via path-based discovery may declare a manifest, to
+    allow them to be registered without being imported. This is a
+    top-level `openassetioPluginManifest` variable assigned a `dict`
+    literal, mapping module hook names to the identifier of the plugin
+    provided through that hook, e.g.
+
+    @code{.py}
+    openassetioPluginManifest = {"openassetioPlugin": "org.my.manager"}
+    @endcode
+
+    The manifest is read from the module source without executing it,
+    and the module is only imported when the plugin is first requested
+    via @ref plugin. Modules whose manifest does not list the hook being
+    scanned for are skipped.
+
+    Entry point discovery can be cached on disk, see @ref
+    setEntryPointCachePath.
     """
 
     __validModuleExtensions = (".py", ".pyc")
 
+    ## The name of the top-level variable holding a plugin's manifest.
+    kManifestVariableName = "openassetioPluginManifest"
+
+    ## The Environment Variable to read the entry point cache path from.
+    kEntryPointCacheEnvVar = "OPENASSETIO_PYTHON_ENTRY_POINT_CACHE"
+
+    ## Version of the entry point cache file format. Bump if the format
+    ## changes.
+    __entryPointCacheVersion = 1
+
     def __init__(self, logger):
         self.__logger = logger
+        self.__entryPointCachePath = None
+        # Guards deferred imports, since plugins may be requested from
+        # multiple threads concurrently.
+        self.__deferredLoadsLock = threading.Lock()
         self.reset()
 
     def reset(self):
@@ -52,6 +84,7 @@ class PythonPluginSystem(object):
         """
         self.__map = {}
         self.__paths = {}
+        self.__deferredLoads = {}
 
     def scan(
         self,
@@ -93,23 +126,24 @@ class PythonPluginSystem(object):
         if not paths:
             paths = os.environ.get(pathsEnvVar)
 
-        if disableEntryPoints is None:
-            disableEntryPoints = os.environ.get(disableEntryPointsEnvVar, False)
+        with StartupProfile.Scope("PythonPluginSystem.scan", paths or ""):
+            if disableEntryPoints is None:
+                disableEntryPoints = os.environ.get(disableEntryPointsEnvVar, False)
 
-        if not paths and disableEntryPoints:
-            self.__logger.debug(
-                "PythonPluginSystem: No search paths specified and entry point plugins are"
-                f" disabled, no plugins will load - check ${pathsEnvVar} is set.",
-            )
-            return
+            if not paths and disableEntryPoints:
+                self.__logger.debug(
+                    "PythonPluginSystem: No search paths specified and entry point plugins are"
+                    f" disabled, no plugins will load - check ${pathsEnvVar} is set.",
+                )
+                return
 
-        if paths:
-            self.scan_paths(paths, moduleHookName)
+            if paths:
+                self.scan_paths(paths, moduleHookName)
 
-        if not disableEntryPoints:
-            self.scan_entry_points(entryPointName, moduleHookName)
-        else:
-            self.__logger.debug("Entry point based plugins are disabled")
+            if not disableEntryPoints:
+                self.scan_entry_points(entryPointName, moduleHookName)
+            else:
+                self.__logger.debug("Entry point based plugins are disabled")
 
     def scan_paths(self, paths, moduleHookName):
         """
@@ -124,6 +158,9 @@ class PythonPluginSystem(object):
         @note Precedence order is undefined for plugins sharing the
         same identifier within the same directory.
 
+        Modules that declare a manifest (see @ref PythonPluginSystem)
+        are registered without being imported.
+
         @param paths `str` A list of paths to search, delimited by
         `os.pathsep`.
 
@@ -159,6 +196,9 @@ class PythonPluginSystem(object):
                         )
                         continue
 
+                if self.__registerFromManifest(itemPath, moduleHookName):
+                    continue
+
                 self.__logger.debug(f"PythonPluginSystem: Attempting to load {itemPath}")
 
                 self.__load(itemPath, moduleHookName)
@@ -177,18 +217,52 @@ class PythonPluginSystem(object):
         @param moduleHookName `str` The name of the top-level variable
         that contains the plugin class.
 
+        If an entry point cache is configured (see @ref
+        setEntryPointCachePath), and it is up to date with respect to
+        the modification times of the `sys.path` entries, then plugins
+        are registered from the cache without querying package
+        metadata, and each entry point is only loaded when its plugin is
+        first requested via @ref plugin. Otherwise, all entry points are
+        loaded and the cache is updated.
+
+        @note Entry points that fail to load are not cached, and so are
+        not retried until the cache becomes stale.
+
         @returns True if entry point discovery is possible, False if
         there was a problem loading importlib.metadata.
         """
+        # Captured before querying metadata, so that any concurrent
+        # modification results in the cache being considered stale.
+        sysPathStamps = self.__sysPathStamps()
+        cachePath = self.entryPointCachePath()
+        cacheKey = f"{entryPointName}\t{moduleHookName}"
+
+        if cachePath:
+            cachedEntryPoints = self.__readEntryPointCache(cachePath).get(cacheKey)
+            if cachedEntryPoints and cachedEntryPoints.get("sysPath") == sysPathStamps:
+                self.__logger.debug(
+                    f"PythonPluginSystem: Using cached '{entryPointName}' entry points from"
+                    f" '{cachePath}'"
+                )
+                for cachedEntryPoint in cachedEntryPoints["entryPoints"]:
+                    self.__registerCachedEntryPoint(**cachedEntryPoint)
+                return True
+
+        # Deferred, since importing importlib.metadata is comparatively
+        # expensive and entry point discovery may be disabled.
+        from importlib import metadata  # pylint: disable=import-outside-toplevel
 
         self.__logger.debug(
             f"PythonPluginSystem: Searching packages for '{entryPointName}' entry points."
         )
 
-        for entryPoint in importlib.metadata.entry_points(group=entryPointName):
+        discoveredEntryPoints = []
+
+        for entryPoint in metadata.entry_points(group=entryPointName):
             self.__logger.debug(f"PythonPluginSystem: Found entry point in {entryPoint.name}")
             try:
-                module = entryPoint.load()
+                with StartupProfile.Scope("PythonPluginSystem.loadEntryPoint", entryPoint.value):
+                    module = entryPoint.load()
             except Exception:  # pylint: disable=broad-except
                 self.__logger.error(
                     f"PythonPluginSystem: Caught exception loading {entryPoint.name}:\n"
@@ -198,20 +272,70 @@ class PythonPluginSystem(object):
 
             if moduleHook := getattr(module, moduleHookName, None):
                 self.register(moduleHook, module.__file__)
+                hookName = moduleHookName
             elif hasattr(module, "plugin"):
                 self.__logger.warning(
                     "PythonPluginSystem: Use of top-level 'plugin' variable is deprecated, "
                     f"use `{moduleHookName}` instead. {module.__file__}"
                 )
                 self.register(module.plugin, module.__file__)
+                moduleHook = module.plugin
+                hookName = "plugin"
             else:
                 self.__logger.error(
                     f"PythonPluginSystem: No top-level '{moduleHookName}' variable "
                     f"{module.__file__}"
                 )
+                continue
+
+            discoveredEntryPoints.append(
+                {
+                    "value": entryPoint.value,
+                    "hookName": hookName,
+                    "identifier": moduleHook.identifier(),
+                    "path": module.__file__,
+                }
+            )
+
+        if cachePath:
+            self.__writeEntryPointCache(
+                cachePath,
+                cacheKey,
+                {"sysPath": sysPathStamps, "entryPoints": discoveredEntryPoints},
+            )
 
         return True
 
+    def setEntryPointCachePath(self, path):
+        """
+        Sets the path of the file used to cache entry point discovery
+        results, overriding the @ref kEntryPointCacheEnvVar environment
+        variable.
+
+        The cache is keyed on the `sys.path` entries and their
+        modification times, so is refreshed when distributions are
+        installed or removed.
+
+        @param path `Optional[str]` Path to the cache file, which need
+        not exist. An empty string disables caching. None reverts to
+        using the environment variable.
+        """
+        self.__entryPointCachePath = path
+
+    def entryPointCachePath(self):
+        """
+        Returns the path of the file used to cache entry point
+        discovery results.
+
+        @return `str` The path set via @ref setEntryPointCachePath, if
+        any, otherwise the value of the @ref kEntryPointCacheEnvVar
+        environment variable. An empty string means caching is
+        disabled.
+        """
+        if self.__entryPointCachePath is not None:
+            return self.__entryPointCachePath
+        return os.environ.get(self.kEntryPointCacheEnvVar, "")
+
     def identifiers(self):
         """
         Returns the identifiers known to the plugin system.
@@ -226,17 +350,27 @@ class PythonPluginSystem(object):
         """
         Retrieves the plugin that provides the given identifier.
 
+        If the plugin was registered from a manifest or cached entry
+        point, its module is imported on the first call.
+
         @return @ref openassetio.pluginSystem.PythonPluginSystemPlugin
         "PythonPluginSystemPlugin"
 
         @exception errors.InputValidationException Raised if no plugin
-        provides the specified identifier.
+        provides the specified identifier, or if the module of a
+        deferred plugin fails to load or does not provide the expected
+        plugin.
         """
 
         if identifier not in self.__map:
             msg = "PythonPluginSystem: No plug-in registered with the identifier '%s'" % identifier
             raise InputValidationException(msg)
 
+        if self.__map[identifier] is None:
+            with self.__deferredLoadsLock:
+                if self.__map[identifier] is None:
+                    self.__loadDeferred(identifier)
+
         return self.__map[identifier]
 
     def register(self, cls, path="<unknown>"):
@@ -267,18 +401,325 @@ class PythonPluginSystem(object):
         self.__map[identifier] = cls
         self.__paths[identifier] = path
 
-    def __load(self, path, moduleHookName):
+    def __registerFromManifest(self, path, moduleHookName):
         """
-        Loads the specified python file and registers it's plugin.
-        The file must expose a top-level variable with a name
-        corresponding to the given module hook name.
+        Registers the plugin declared by the manifest of the specified
+        python file, if it has one, without importing it.
 
         @param path `str` This can be either a single-file module,
         or the __init__.py at the root of a package.
 
         @param moduleHookName `str` The name of the top-level variable
         that contains the plugin class.
+
+        @return `bool` True if the file has a valid manifest, and so
+        should not be imported, False otherwise.
+        """
+        manifest = self.__readManifest(path)
+        if manifest is None:
+            return False
+
+        identifier = manifest.get(moduleHookName)
+        if identifier is None:
+            self.__logger.debug(
+                f"PythonPluginSystem: Ignoring as manifest does not declare '{moduleHookName}'"
+                f" {path}"
+            )
+            return True
+
+        if identifier in self.__map:
+            self.__logger.warning(
+                f"PythonPluginSystem: Skipping plug-in '{identifier}' declared in '{path}'. "
+                f"Already registered by '{self.__paths[identifier]}'"
+            )
+            return True
+
+        self.__logger.debug(
+            f"PythonPluginSystem: Registered plug-in '{identifier}' from manifest in '{path}'"
+        )
+        self.__map[identifier] = None
+        self.__paths[identifier] = path
+        self.__deferredLoads[identifier] = (lambda: self.__import(path), moduleHookName)
+        return True
+
+    def __registerCachedEntryPoint(self, value, hookName, identifier, path):
+        """
+        Registers a plugin from a cached entry point, deferring loading
+        the entry point until the plugin is requested.
+
+        @param value `str` The entry point's object reference.
+
+        @param hookName `str` The name of the top-level variable that
+        contains the plugin class.
+
+        @param identifier `str` The plugin's identifier.
+
+        @param path `str` The file of the entry point's module.
+        """
+        if identifier in self.__map:
+            self.__logger.warning(
+                f"PythonPluginSystem: Skipping plug-in '{identifier}' defined in '{path}'. "
+                f"Already registered by '{self.__paths[identifier]}'"
+            )
+            return
+
+        self.__logger.debug(
+            f"PythonPluginSystem: Registered plug-in '{identifier}' from cached entry point"
+            f" '{value}'"
+        )
+        self.__map[identifier] = None
+        self.__paths[identifier] = path
+        self.__deferredLoads[identifier] = (
+            lambda: self.__importEntryPoint(value),
+            hookName,
+        )
+
+    def __importEntryPoint(self, value):
+        """
+        Loads the object referenced by an entry point, equivalent to
+        `importlib.metadata.EntryPoint.load`, without querying package
+        metadata.
+
+        @param value `str` The entry point's object reference, of the
+        form `module[:attr[.attr...]] [extras]`.
+
+        @return The referenced object, or None if it failed to load, in
+        which case the error is logged.
+        """
+        modulePath, _, attrPath = value.partition("[")[0].partition(":")
+        try:
+            with StartupProfile.Scope("PythonPluginSystem.loadEntryPoint", value):
+                obj = importlib.import_module(modulePath.strip())
+            for attr in filter(None, attrPath.strip().split(".")):
+                obj = getattr(obj, attr)
+        except Exception:  # pylint: disable=broad-except
+            self.__logger.error(
+                f"PythonPluginSystem: Caught exception loading {value}:\n" + traceback.format_exc()
+            )
+            return None
+        return obj
+
+    @staticmethod
+    def __sysPathStamps():
+        """
+        Returns the `sys.path` entries along with their modification
+        times, used to detect changes to installed distributions.
+
+        @return `List[List]` Pairs of path and modification time in
+        nanoseconds, or None if the path does not exist.
+        """
+        stamps = []
+        for entry in sys.path:
+            try:
+                mtime = os.stat(entry or os.curdir).st_mtime_ns
+            except OSError:
+                mtime = None
+            stamps.append([entry, mtime])
+        return stamps
+
+    def __readEntryPointCache(self, cachePath):
         """
+        Reads the entry point cache file.
+
+        A missing, unreadable or incompatible cache is treated as empty.
+
+        @return `Dict[str, dict]` Cached discovery results, keyed by
+        entry point group and module hook name.
+        """
+        # Deferred, since only needed if caching is enabled.
+        import json  # pylint: disable=import-outside-toplevel
+
+        try:
+            with open(cachePath, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("version") != self.__entryPointCacheVersion:
+            self.__logger.debug(
+                f"PythonPluginSystem: Ignoring unrecognised entry point cache '{cachePath}'"
+            )
+            return {}
+
+        return cache.get("entries", {})
+
+    def __writeEntryPointCache(self, cachePath, cacheKey, entry):
+        """
+        Merges discovery results into the entry point cache file.
+
+        The file is written to a temporary sibling and renamed into
+        place, so readers never observe a partially written file.
+
+        @param cacheKey `str` Entry point group and module hook name.
+
+        @param entry `dict` Discovery results for the key.
+        """
+        # Deferred, since only needed if caching is enabled.
+        import json  # pylint: disable=import-outside-toplevel
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        entries = self.__readEntryPointCache(cachePath)
+        entries[cacheKey] = entry
+
+        tempPath = None
+        try:
+            tempFd, tempPath = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(cachePath)), suffix=".tmp"
+            )
+            with os.fdopen(tempFd, "w", encoding="utf-8") as file:
+                json.dump({"version": self.__entryPointCacheVersion, "entries": entries}, file)
+            os.replace(tempPath, cachePath)
+        except OSError as exc:
+            self.__logger.warning(
+                f"PythonPluginSystem: Failed to write entry point cache '{cachePath}': {exc}"
+            )
+            if tempPath is not None and os.path.exists(tempPath):
+                os.remove(tempPath)
+            return
+
+        self.__logger.debug(f"PythonPluginSystem: Updated entry point cache '{cachePath}'")
+
+    def __readManifest(self, path):
+        """
+        Reads the manifest of the specified python file, without
+        executing it.
+
+        @param path `str` Path to a python source file.
+
+        @return `Optional[Dict[str, str]]` Mapping of module hook name
+        to plugin identifier, or None if the file does not have a valid
+        manifest.
+        """
+        source = self.__readManifestSource(path)
+        if source is None:
+            return None
+        return self.__parseManifest(source, path)
+
+    def __readManifestSource(self, path):
+        """
+        Reads the source of the specified file, if it could contain a
+        manifest.
+
+        @param path `str` Path to a candidate plugin file.
+
+        @return `Optional[bytes]` The file's source, or None if it is
+        not a readable python source file that mentions the manifest
+        variable.
+        """
+        if not path.endswith(".py"):
+            return None
+
+        try:
+            with open(path, "rb") as file:
+                source = file.read()
+        except OSError:
+            return None
+
+        # Avoid the cost of parsing files that cannot have a manifest.
+        if self.kManifestVariableName.encode() not in source:
+            return None
+
+        return source
+
+    def __parseManifest(self, source, path):
+        """
+        Finds and evaluates the manifest assignment in python source.
+
+        @param source `bytes` Python source code.
+
+        @param path `str` Path the source was read from, for reporting.
+
+        @return `Optional[Dict[str, str]]` Mapping of module hook name
+        to plugin identifier, or None if the source does not have a
+        valid manifest.
+        """
+        # Deferred, since only needed for plugins with a manifest.
+        import ast  # pylint: disable=import-outside-toplevel
+
+        try:
+            tree = ast.parse(source, path)
+        except (SyntaxError, ValueError):
+            # Defer to the import to report the problem.
+            return None
+
+        for node in tree.body:
+            if not (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == self.kManifestVariableName
+            ):
+                continue
+            try:
+                manifest = ast.literal_eval(node.value)
+            except ValueError:
+                manifest = None
+            if not isinstance(manifest, dict) or not all(
+                isinstance(key, str) and isinstance(value, str) for key, value in manifest.items()
+            ):
+                self.__logger.warning(
+                    f"PythonPluginSystem: Ignoring invalid '{self.kManifestVariableName}', "
+                    f"expected a dict literal of str to str {path}"
+                )
+                return None
+            return manifest
+
+        return None
+
+    def __loadDeferred(self, identifier):
+        """
+        Imports the module of a plugin registered from a manifest or
+        cached entry point, and replaces its registration with the
+        plugin it provides.
+
+        @param identifier `str` Identifier of a deferred plugin.
+
+        @exception errors.InputValidationException Raised if the module
+        fails to load or does not provide the declared plugin.
+        """
+        path = self.__paths[identifier]
+        loadModule, moduleHookName = self.__deferredLoads[identifier]
+
+        self.__logger.debug(
+            f"PythonPluginSystem: Loading deferred plug-in '{identifier}' from {path}"
+        )
+
+        module = loadModule()
+        if module is None:
+            raise InputValidationException(
+                f"PythonPluginSystem: Failed to load plug-in '{identifier}' from '{path}'"
+            )
+
+        moduleHook = getattr(module, moduleHookName, None)
+        if moduleHook is None:
+            raise InputValidationException(
+                f"PythonPluginSystem: Failed to load plug-in '{identifier}' from '{path}'. "
+                f"No top-level '{moduleHookName}' variable"
+            )
+
+        if (actualIdentifier := moduleHook.identifier()) != identifier:
+            raise InputValidationException(
+                f"PythonPluginSystem: Failed to load plug-in '{identifier}' from '{path}'. "
+                f"Module provides '{actualIdentifier}'"
+            )
+
+        moduleHook.__file__ = path
+        self.__map[identifier] = moduleHook
+        del self.__deferredLoads[identifier]
+
+    def __import(self, path):
+        """
+        Imports the specified python file under a unique module name.
+
+        @param path `str` This can be either a single-file module,
+        or the __init__.py at the root of a package.
+
+        @return The imported module, or None if it failed to import, in
+        which case the error is logged.
+        """
+
+        # Deferred to avoid the import cost unless a plugin is loaded.
+        import hashlib  # pylint: disable=import-outside-toplevel
 
         # Make a unique namespace to ensure the plugin identifier is
         # all that really matters
@@ -295,12 +736,31 @@ class PythonPluginSystem(object):
             #   'No module named '<moduleName>'
             sys.modules[spec.name] = module
 
-            spec.loader.exec_module(module)
+            with StartupProfile.Scope("PythonPluginSystem.import", path):
+                spec.loader.exec_module(module)
 
         except Exception:  # pylint: disable=broad-except
             self.__logger.error(
                 f"PythonPluginSystem: Caught exception loading {path}:\n" + traceback.format_exc()
             )
+            return None
+
+        return module
+
+    def __load(self, path, moduleHookName):
+        """
+        Loads the specified python file and registers it's plugin.
+        The file must expose a top-level variable with a name
+        corresponding to the given module hook name.
+
+        @param path `str` This can be either a single-file module,
+        or the __init__.py at the root of a package.
+
+        @param moduleHookName `str` The name of the top-level variable
+        that contains the plugin class.
+        """
+        module = self.__import(path)
+        if module is None:
             return
 
         if moduleHook := getattr(module, moduleHookName, None):
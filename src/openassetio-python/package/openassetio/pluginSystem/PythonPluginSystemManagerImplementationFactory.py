@@ -19,6 +19,8 @@ A single-class module, providing the
 PythonPluginSystemManagerImplementationFactory class.
 """
 
+import threading
+
 from ..hostApi import ManagerImplementationFactoryInterface
 
 from .PythonPluginSystem import PythonPluginSystem
@@ -59,6 +61,11 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
     it is not in use, to avoid unnecessary filesystem access during
     library initialization. **OPENASSETIO_PLUGIN_PATH** plugins take
     precedence over any entry point based ones.
+
+    @envvar **OPENASSETIO_PYTHON_ENTRY_POINT_CACHE** *str* Path to a
+    file used to cache entry point discovery results between processes.
+    See @ref openassetio.pluginSystem.PythonPluginSystem.PythonPluginSystem.setEntryPointCachePath
+    "PythonPluginSystem.setEntryPointCachePath".
     """
 
     ## The Environment Variable to read the plug-in search path from
@@ -95,17 +102,32 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         super(PythonPluginSystemManagerImplementationFactory, self).__init__(logger)
 
         self.__pluginManager = None
+        # Guards the lazy scan, since the factory may be queried from
+        # multiple threads concurrently.
+        self.__scanLock = threading.Lock()
         self.__paths = paths
         self.__disableEntryPointsPlugins = disableEntryPointsPlugins
 
+    def __ensureScanned(self):
+        """
+        Scans for plugins if not already done, ensuring only a single
+        scan occurs if called from multiple threads concurrently.
+        """
+        if self.__pluginManager:
+            return
+        with self.__scanLock:
+            if not self.__pluginManager:
+                self.__scan()
+
     def __scan(self):
         """
         Scans for PythonPluginSystemManagerPlugins, and registers them
         with the factory instance.
         """
-        # Construct this here, so we have this even if we early out
-        self.__pluginManager = PythonPluginSystem(self._logger)
-        self.__pluginManager.scan(
+        # Only publish once fully populated, so other threads never
+        # see a partially scanned plugin system.
+        pluginManager = PythonPluginSystem(self._logger)
+        pluginManager.scan(
             self.__paths,
             self.kPluginEnvVar,
             self.kPackageEntryPointGroup,
@@ -113,6 +135,7 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
             self.__disableEntryPointsPlugins,
             self.kModuleHookName,
         )
+        self.__pluginManager = pluginManager
 
     def identifiers(self):
         """
@@ -120,8 +143,7 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         @see @ref openassetio.pluginSystem.PythonPluginSystemManagerPlugin
         "PythonPluginSystemManagerPlugin"
         """
-        if not self.__pluginManager:
-            self.__scan()
+        self.__ensureScanned()
 
         return self.__pluginManager.identifiers()
 
@@ -143,8 +165,7 @@ class PythonPluginSystemManagerImplementationFactory(ManagerImplementationFactor
         no `interface` method.
         """
 
-        if not self.__pluginManager:
-            self.__scan()
+        self.__ensureScanned()
 
         self._logger.log(self._logger.Severity.kDebug, f"Instantiating {identifier}")
         plugin = self.__pluginManager.plugin(identifier)
@@ -18,3 +18,22 @@
 Packages and modules specifically related to the @ref
 glossary_UI_Delegate system.
 """
+
+import importlib
+
+## Submodules imported on first attribute access, rather than when this
+# package is imported.
+_lazySubmodules = frozenset(("access", "hostApi", "managerApi", "pluginSystem"))
+
+
+def __getattr__(name):  # pylint: disable=invalid-name
+    """
+    Import a submodule on first access (PEP 562).
+    """
+    if name in _lazySubmodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():  # pylint: disable=invalid-name
+    return sorted(set(globals()) | _lazySubmodules)
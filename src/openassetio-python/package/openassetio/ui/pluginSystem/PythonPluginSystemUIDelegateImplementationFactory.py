@@ -19,6 +19,8 @@ A single-class module, providing the
 PythonPluginSystemUIDelegateImplementationFactory class.
 """
 
+import threading
+
 from ..hostApi import UIDelegateImplementationFactoryInterface
 
 from ...pluginSystem.PythonPluginSystem import PythonPluginSystem
@@ -96,17 +98,32 @@ class PythonPluginSystemUIDelegateImplementationFactory(UIDelegateImplementation
         super(PythonPluginSystemUIDelegateImplementationFactory, self).__init__(logger)
 
         self.__pluginManager = None
+        # Guards the lazy scan, since the factory may be queried from
+        # multiple threads concurrently.
+        self.__scanLock = threading.Lock()
         self.__paths = paths
         self.__disableEntryPointsPlugins = disableEntryPointsPlugins
 
+    def __ensureScanned(self):
+        """
+        Scans for plugins if not already done, ensuring only a single
+        scan occurs if called from multiple threads concurrently.
+        """
+        if self.__pluginManager:
+            return
+        with self.__scanLock:
+            if not self.__pluginManager:
+                self.__scan()
+
     def __scan(self):
         """
         Scans for PythonPluginSystemUIDelegatePlugins, and registers them
         with the factory instance.
         """
-        # Construct this here, so we have this even if we early out
-        self.__pluginManager = PythonPluginSystem(self._logger)
-        self.__pluginManager.scan(
+        # Only publish once fully populated, so other threads never
+        # see a partially scanned plugin system.
+        pluginManager = PythonPluginSystem(self._logger)
+        pluginManager.scan(
             self.__paths,
             self.kPluginEnvVar,
             self.kPackageEntryPointGroup,
@@ -114,6 +131,7 @@ class PythonPluginSystemUIDelegateImplementationFactory(UIDelegateImplementation
             self.__disableEntryPointsPlugins,
             self.kModuleHookName,
         )
+        self.__pluginManager = pluginManager
 
     def identifiers(self):
         """
@@ -122,8 +140,7 @@ class PythonPluginSystemUIDelegateImplementationFactory(UIDelegateImplementation
         openassetio.ui.pluginSystem.PythonPluginSystemUIDelegatePlugin
         "PythonPluginSystemUIDelegatePlugin"
         """
-        if not self.__pluginManager:
-            self.__scan()
+        self.__ensureScanned()
 
         return self.__pluginManager.identifiers()
 
@@ -145,8 +162,7 @@ class PythonPluginSystemUIDelegateImplementationFactory(UIDelegateImplementation
         no `interface` method.
         """
 
-        if not self.__pluginManager:
-            self.__scan()
+        self.__ensureScanned()
 
         self._logger.log(self._logger.Severity.kDebug, f"Instantiating {identifier}")
         plugin = self.__pluginManager.plugin(identifier)
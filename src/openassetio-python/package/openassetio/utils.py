@@ -25,3 +25,5 @@ PathType = _openassetio.utils.PathType
 FileUrlPathConverter = _openassetio.utils.FileUrlPathConverter
 
 substitute = _openassetio.utils.substitute
+
+StartupProfile = _openassetio.utils.StartupProfile
@@ -108,6 +108,79 @@ class Test_CppPluginSystem_gil:
 
         _path, _plugin = a_cpp_plugin_system.plugin(the_cpp_gil_check_plugin_identifier)
 
+    def test_rebuildDiscoveryIndex(
+        self,
+        the_cpp_gil_check_plugin_identifier,
+        the_cpp_gil_check_manager_plugin_path,
+        the_cpp_gil_check_module_hook,
+        a_cpp_plugin_system,
+        tmp_path,
+    ):
+        a_cpp_plugin_system.setDiscoveryIndexPath(tmp_path / "index")
+
+        a_cpp_plugin_system.rebuildDiscoveryIndex(
+            the_cpp_gil_check_manager_plugin_path, "", the_cpp_gil_check_module_hook, noop
+        )
+
+        assert a_cpp_plugin_system.identifiers() == [the_cpp_gil_check_plugin_identifier]
+
+    def test_plugin_when_deferred(
+        self,
+        the_cpp_gil_check_plugin_identifier,
+        the_cpp_gil_check_manager_plugin_path,
+        the_cpp_gil_check_module_hook,
+        a_cpp_plugin_system,
+        tmp_path,
+    ):
+        a_cpp_plugin_system.setDiscoveryIndexPath(tmp_path / "index")
+        a_cpp_plugin_system.setLazyLoading(True)
+        # Populate the index.
+        a_cpp_plugin_system.scan(
+            the_cpp_gil_check_manager_plugin_path, "", the_cpp_gil_check_module_hook, noop
+        )
+        a_cpp_plugin_system.reset()
+        a_cpp_plugin_system.scan(
+            the_cpp_gil_check_manager_plugin_path, "", the_cpp_gil_check_module_hook, noop
+        )
+
+        _path, _plugin = a_cpp_plugin_system.plugin(the_cpp_gil_check_plugin_identifier)
+
+    def test_setLazyLoading(self, a_cpp_plugin_system):
+        a_cpp_plugin_system.setLazyLoading(True)
+
+    def test_lazyLoading(self, a_cpp_plugin_system):
+        a_cpp_plugin_system.setLazyLoading(True)
+
+        assert a_cpp_plugin_system.lazyLoading() is True
+
+    def test_setScanThreadCount(self, a_cpp_plugin_system):
+        a_cpp_plugin_system.setScanThreadCount(2)
+
+    def test_scanThreadCount(self, a_cpp_plugin_system):
+        a_cpp_plugin_system.setScanThreadCount(2)
+
+        assert a_cpp_plugin_system.scanThreadCount() == 2
+
+    def test_scan_in_parallel(
+        self,
+        the_cpp_gil_check_manager_plugin_path,
+        the_cpp_gil_check_module_hook,
+        a_cpp_plugin_system,
+    ):
+        a_cpp_plugin_system.setScanThreadCount(2)
+
+        a_cpp_plugin_system.scan(
+            the_cpp_gil_check_manager_plugin_path, "", the_cpp_gil_check_module_hook, noop
+        )
+
+    def test_setDiscoveryIndexPath(self, a_cpp_plugin_system, tmp_path):
+        a_cpp_plugin_system.setDiscoveryIndexPath(tmp_path / "index")
+
+    def test_discoveryIndexPath(self, a_cpp_plugin_system, tmp_path):
+        a_cpp_plugin_system.setDiscoveryIndexPath(tmp_path / "index")
+
+        assert a_cpp_plugin_system.discoveryIndexPath() == tmp_path / "index"
+
 
 class Test_CppPluginSystemManagerImplementationFactory_gil:
     """
@@ -78,6 +78,9 @@ class Test_EntityReferencePagerInterface_gil:
     def test_next(self, a_threaded_entity_ref_pager_interface, a_host_session):
         a_threaded_entity_ref_pager_interface.next(a_host_session)
 
+    def test_setPageSizeHint(self, a_threaded_entity_ref_pager_interface, a_host_session):
+        a_threaded_entity_ref_pager_interface.setPageSizeHint(10, a_host_session)
+
 
 class Test_EntityReferencePager_gil:
     """
@@ -115,6 +118,33 @@ class Test_EntityReferencePager_gil:
     def test_next(self, a_threaded_entity_ref_pager):
         a_threaded_entity_ref_pager.next()
 
+    def test_pages(self, a_threaded_entity_ref_pager, mock_entity_reference_pager_interface):
+        mock_entity_reference_pager_interface.mock.get.return_value = []
+        mock_entity_reference_pager_interface.mock.hasNext.return_value = False
+        list(a_threaded_entity_ref_pager.pages())
+
+    def test_entityReferences(
+        self, a_threaded_entity_ref_pager, mock_entity_reference_pager_interface
+    ):
+        mock_entity_reference_pager_interface.mock.get.return_value = []
+        mock_entity_reference_pager_interface.mock.hasNext.return_value = False
+        list(a_threaded_entity_ref_pager.entityReferences())
+
+    def test_setPrefetchDepth(self, a_threaded_entity_ref_pager):
+        a_threaded_entity_ref_pager.setPrefetchDepth(0)
+
+    def test_prefetchDepth(self, a_threaded_entity_ref_pager):
+        a_threaded_entity_ref_pager.prefetchDepth()
+
+    def test_setAdaptivePageSize(self, a_threaded_entity_ref_pager):
+        a_threaded_entity_ref_pager.setAdaptivePageSize(1, 10)
+
+    def test_pageSize(self, a_threaded_entity_ref_pager):
+        a_threaded_entity_ref_pager.pageSize()
+
+    def test_statistics(self, a_threaded_entity_ref_pager):
+        a_threaded_entity_ref_pager.statistics()
+
 
 @pytest.fixture
 def a_threaded_entity_ref_pager(a_threaded_entity_ref_pager_interface, a_host_session):
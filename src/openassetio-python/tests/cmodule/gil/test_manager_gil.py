@@ -87,6 +87,18 @@ class Test_Manager_gil:
     def test_persistenceTokenForContext(self, a_threaded_manager, a_context):
         a_threaded_manager.persistenceTokenForContext(a_context)
 
+    def test_persistenceTokensForContexts(self, a_threaded_manager, a_context):
+        a_threaded_manager.persistenceTokensForContexts([a_context])
+
+    def test_contextsFromPersistenceTokens(self, a_threaded_manager):
+        a_threaded_manager.contextsFromPersistenceTokens([""])
+
+    def test_setPersistenceTokenCacheCapacity(self, a_threaded_manager):
+        a_threaded_manager.setPersistenceTokenCacheCapacity(1)
+
+    def test_persistenceTokenCacheCapacity(self, a_threaded_manager):
+        a_threaded_manager.persistenceTokenCacheCapacity()
+
     def test_defaultEntityReference(self, a_threaded_manager, a_context):
         tag = Manager.BatchElementErrorPolicyTag
         an_access = access.DefaultEntityAccess.kRead
@@ -27,6 +27,7 @@ import pytest
 
 # pylint: disable=no-name-in-module
 from openassetio import _openassetio
+from openassetio.errors import BatchElementError
 from openassetio.hostApi import ManagerImplementationFactoryInterface, ManagerFactory
 from openassetio.pluginSystem import HybridPluginSystemManagerImplementationFactory
 
@@ -111,6 +112,44 @@ class Test_HybridPluginSystemManagerImplementationFactory_gil:
         mock_manager_impl_factory.mock.instantiate.return_value = mock_manager_interface
         a_threaded_hybrid_impl_factory.instantiate("")
 
+    def test_setEntityReferenceRouting(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setEntityReferenceRouting(True)
+
+    def test_entityReferenceRouting(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setEntityReferenceRouting(True)
+
+        assert a_threaded_hybrid_impl_factory.entityReferenceRouting() is True
+
+    def test_setFallbackErrorCodes(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setFallbackErrorCodes(
+            [BatchElementError.ErrorCode.kInvalidTraitSet]
+        )
+
+    def test_fallbackErrorCodes(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setFallbackErrorCodes(
+            [BatchElementError.ErrorCode.kInvalidTraitSet]
+        )
+
+        assert a_threaded_hybrid_impl_factory.fallbackErrorCodes() == [
+            BatchElementError.ErrorCode.kInvalidTraitSet
+        ]
+
+    def test_setConcurrentInitialization(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setConcurrentInitialization(True)
+
+    def test_concurrentInitialization(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setConcurrentInitialization(True)
+
+        assert a_threaded_hybrid_impl_factory.concurrentInitialization() is True
+
+    def test_setConcurrentScan(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setConcurrentScan(True)
+
+    def test_concurrentScan(self, a_threaded_hybrid_impl_factory):
+        a_threaded_hybrid_impl_factory.setConcurrentScan(True)
+
+        assert a_threaded_hybrid_impl_factory.concurrentScan() is True
+
 
 class Test_ManagerFactory_gil:
     """
@@ -240,6 +279,15 @@ class Test_ManagerFactory_gil:
 
         mock_manager_impl_factory.mock.identifiers.assert_called()
 
+    def test_setManagerPooling(self, a_threaded_manager_factory):
+        try:
+            a_threaded_manager_factory.setManagerPooling(True)
+        finally:
+            a_threaded_manager_factory.setManagerPooling(None)
+
+    def test_managerPooling(self, a_threaded_manager_factory):
+        a_threaded_manager_factory.managerPooling()
+
 
 @pytest.fixture
 def a_threaded_manager_factory(mock_host_interface, a_threaded_manager_impl_factory, mock_logger):
@@ -0,0 +1,78 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Testing that PublishPipeline methods release the GIL.
+"""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import pytest
+
+from openassetio.access import PublishingAccess
+from openassetio.hostApi import Manager, PublishPipeline
+
+
+class Test_PublishPipeline_gil:
+    """
+    Check all methods release the GIL during C++ function body
+    execution.
+
+    See docstring for similar test under `gil/Test_Manager.py`
+    for details on how these tests are structured.
+    """
+
+    def test_all_methods_covered(self, find_unimplemented_test_cases):
+        """
+        Ensure this test class covers all methods.
+        """
+        unimplemented = find_unimplemented_test_cases(PublishPipeline, self)
+
+        if unimplemented:
+            print("\nSome test cases not implemented. Method templates can be found below:\n")
+            for method in unimplemented:
+                print(f"""
+    def test_{method}(self, a_threaded_publish_pipeline):
+        a_threaded_publish_pipeline.{method}()
+""")
+
+        assert unimplemented == []
+
+    def test_push(self, a_threaded_publish_pipeline, an_entity_reference, a_traits_data):
+        a_threaded_publish_pipeline.push(an_entity_reference, a_traits_data)
+
+    def test_flush(self, a_threaded_publish_pipeline, an_entity_reference, a_traits_data):
+        a_threaded_publish_pipeline.push(an_entity_reference, a_traits_data)
+        a_threaded_publish_pipeline.flush()
+
+    def test_pushedCount(self, a_threaded_publish_pipeline):
+        a_threaded_publish_pipeline.pushedCount()
+
+    def test_completedCount(self, a_threaded_publish_pipeline):
+        a_threaded_publish_pipeline.completedCount()
+
+
+@pytest.fixture
+def a_threaded_publish_pipeline(a_threaded_mock_manager_interface, a_host_session, a_context):
+    return PublishPipeline(
+        Manager(a_threaded_mock_manager_interface, a_host_session),
+        PublishingAccess.kWrite,
+        a_context,
+        lambda _idx, _ref: None,
+        lambda _idx, _ref: None,
+        lambda _idx, _error: None,
+        chunkSize=1,
+    )
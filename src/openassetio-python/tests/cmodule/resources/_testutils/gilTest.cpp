@@ -129,6 +129,7 @@ struct ThreadedEntityReferencePagerInterface : managerApi::EntityReferencePagerI
   IMPLEMENT_MOCK1(hasNext);
   IMPLEMENT_MOCK1(get);
   IMPLEMENT_MOCK1(next);
+  IMPLEMENT_MOCK2(setPageSizeHint);
   IMPLEMENT_MOCK1(close);
 };
 
@@ -47,12 +47,36 @@ from openassetio.managerApi import (
 )
 from openassetio.hostApi import HostInterface
 from openassetio.trait import TraitsData
+from openassetio.utils import StartupProfile
 from openassetio.ui.managerApi import UIDelegateInterface, UIDelegateStateInterface
 from openassetio.ui.hostApi import UIDelegateRequestInterface
 
 # pylint: disable=invalid-name
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark: performance measurement, skipped unless"
+        " OPENASSETIO_TEST_ENABLE_BENCHMARKS=1",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Skip benchmark tests unless explicitly enabled.
+
+    Benchmarks are slow and their results are only meaningful on
+    an otherwise idle machine, so they are opt-in.
+    """
+    if os.environ.get("OPENASSETIO_TEST_ENABLE_BENCHMARKS") == "1":
+        return
+    skip_benchmark = pytest.mark.skip(reason="OPENASSETIO_TEST_ENABLE_BENCHMARKS not set")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="session")
 def regex_matcher():
     return RegexMatch
@@ -83,6 +107,19 @@ def unload_openassetio_modules():
         sys.modules[name] = module
 
 
+@pytest.fixture
+def startup_profile_enabled():
+    """
+    Enables startup profiling with no previously recorded events, then
+    restores the default afterwards.
+    """
+    StartupProfile.setEnabled(True)
+    StartupProfile.reset()
+    yield
+    StartupProfile.setEnabled(None)
+    StartupProfile.reset()
+
+
 @pytest.fixture
 def mock_logger():
     """
@@ -611,6 +648,9 @@ class MockEntityReferencePagerInterface(EntityReferencePagerInterface):
     def next(self, hostSession):
         self.mock.next(hostSession)
 
+    def setPageSizeHint(self, pageSize, hostSession):
+        self.mock.setPageSizeHint(pageSize, hostSession)
+
     def close(self, hostSession):
         self.mock.close(hostSession)
 
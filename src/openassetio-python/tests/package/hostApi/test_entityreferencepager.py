@@ -19,11 +19,14 @@ Tests that cover the openassetio.hostApi.EntityReferencePager wrapper class.
 
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
+import threading
+import time
 import weakref
 
 import pytest
 
 from openassetio import EntityReference
+from openassetio.errors import InputValidationException
 from openassetio.hostApi import EntityReferencePager
 from openassetio.log import LoggerInterface
 from openassetio.managerApi import EntityReferencePagerInterface
@@ -94,6 +97,474 @@ class Test_EntityReferencePager_get:
         method.assert_called_once_with(a_host_session)
 
 
+class Test_EntityReferencePager_prefetchDepth:
+    def test_when_not_set_then_zero(self, an_entity_reference_pager):
+        assert an_entity_reference_pager.prefetchDepth() == 0
+
+    def test_when_set_then_returns_set_depth(self, a_paged_pager_interface, a_host_session):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+
+        pager.setPrefetchDepth(3)
+
+        assert pager.prefetchDepth() == 3
+
+
+class Test_EntityReferencePager_setPrefetchDepth:
+    def test_when_set_then_pages_fetched_ahead_up_to_depth(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+
+        pager.setPrefetchDepth(2)
+
+        # Current page plus two pages ahead.
+        a_paged_pager_interface.wait_for_gets(3)
+        time.sleep(0.05)
+        assert a_paged_pager_interface.get_count == 3
+
+        pager.next()
+
+        a_paged_pager_interface.wait_for_gets(4)
+        time.sleep(0.05)
+        assert a_paged_pager_interface.get_count == 4
+
+    def test_when_prefetching_then_all_pages_returned_in_order_and_fetched_once(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(2)
+
+        assert read_all_pages(pager) == a_paged_pager_interface.pages
+        assert a_paged_pager_interface.get_count == len(a_paged_pager_interface.pages)
+
+    def test_when_advanced_beyond_last_page_then_passed_through_to_interface(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(10)
+        read_all_pages(pager)
+
+        pager.next()
+
+        assert pager.get() == []
+        assert pager.hasNext() is False
+        assert a_paged_pager_interface.index == len(a_paged_pager_interface.pages)
+
+    def test_when_fetching_page_fails_then_raised_by_get_of_that_page(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        a_paged_pager_interface.fail_get_at = 2
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(10)
+
+        assert pager.get() == a_paged_pager_interface.pages[0]
+        pager.next()
+        assert pager.get() == a_paged_pager_interface.pages[1]
+        assert pager.hasNext() is True
+        pager.next()
+
+        with pytest.raises(RuntimeError, match="get failed at 2"):
+            pager.get()
+
+        # Subsequent calls are passed through to the interface.
+        a_paged_pager_interface.fail_get_at = None
+        assert pager.get() == a_paged_pager_interface.pages[2]
+
+    def test_when_advancing_page_fails_then_raised_by_next(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        a_paged_pager_interface.fail_next_at = 1
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(10)
+
+        assert pager.get() == a_paged_pager_interface.pages[0]
+        pager.next()
+        assert pager.get() == a_paged_pager_interface.pages[1]
+
+        with pytest.raises(RuntimeError, match="next failed at 1"):
+            pager.next()
+
+    def test_when_set_to_zero_then_buffered_pages_returned_then_passed_through(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(2)
+        a_paged_pager_interface.wait_for_gets(3)
+
+        pager.setPrefetchDepth(0)
+
+        assert read_all_pages(pager) == a_paged_pager_interface.pages
+        assert a_paged_pager_interface.get_count == len(a_paged_pager_interface.pages)
+
+    def test_when_destroyed_then_prefetching_cancelled_and_interface_closed_last(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(2)
+        a_paged_pager_interface.wait_for_gets(3)
+
+        del pager
+
+        # Closing may be deferred if the worker is still mid-fetch.
+        assert a_paged_pager_interface.closed.wait(timeout=5)
+        assert a_paged_pager_interface.calls[-1] == "close"
+        assert a_paged_pager_interface.calls.count("close") == 1
+
+    def test_when_destroyed_mid_fetch_then_interface_closed_once_fetch_completes(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        a_paged_pager_interface.block_get_at = 1
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(2)
+        assert a_paged_pager_interface.get_blocked.wait(timeout=5)
+
+        del pager
+
+        assert "close" not in a_paged_pager_interface.calls
+
+        a_paged_pager_interface.unblock_get.set()
+
+        assert a_paged_pager_interface.closed.wait(timeout=5)
+        assert a_paged_pager_interface.calls[-1] == "close"
+        assert a_paged_pager_interface.calls.count("close") == 1
+
+
+class Test_EntityReferencePager_iter:
+    def test_yields_each_page_in_order(self, a_paged_pager_interface, a_host_session):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+
+        assert list(pager) == a_paged_pager_interface.pages
+
+    def test_when_pager_already_advanced_then_starts_from_current_page(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.next()
+
+        assert list(pager) == a_paged_pager_interface.pages[1:]
+
+
+class Test_EntityReferencePager_pages:
+    def test_yields_each_page_in_order(self, a_paged_pager_interface, a_host_session):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+
+        assert list(pager.pages()) == a_paged_pager_interface.pages
+
+    def test_when_pages_empty_then_skipped(self, a_host_session):
+        ref = EntityReference("ref")
+        pager_interface = PagedEntityReferencePagerInterface([[], [ref], [], [], [ref, ref], []])
+        pager = EntityReferencePager(pager_interface, a_host_session)
+
+        assert list(pager.pages()) == [[ref], [ref, ref]]
+
+    def test_when_no_pages_then_yields_nothing(self, a_host_session):
+        pager = EntityReferencePager(PagedEntityReferencePagerInterface([[]]), a_host_session)
+
+        assert not list(pager.pages())
+
+    def test_when_exhausted_then_interface_not_called_again(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pages = pager.pages()
+        list(pages)
+        call_count = len(a_paged_pager_interface.calls)
+
+        with pytest.raises(StopIteration):
+            next(pages)
+
+        assert len(a_paged_pager_interface.calls) == call_count
+
+    def test_when_interface_raises_then_exception_propagated(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        a_paged_pager_interface.fail_get_at = 1
+        pages = EntityReferencePager(a_paged_pager_interface, a_host_session).pages()
+
+        assert next(pages) == a_paged_pager_interface.pages[0]
+
+        with pytest.raises(RuntimeError, match="get failed at 1"):
+            next(pages)
+
+    def test_when_prefetching_then_yields_each_page_in_order(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        pager.setPrefetchDepth(2)
+
+        assert list(pager.pages()) == a_paged_pager_interface.pages
+
+    def test_iterator_keeps_pager_alive(self, a_paged_pager_interface, a_host_session):
+        pages = EntityReferencePager(a_paged_pager_interface, a_host_session).pages()
+
+        assert list(pages) == a_paged_pager_interface.pages
+        assert "close" not in a_paged_pager_interface.calls
+
+        del pages
+
+        assert a_paged_pager_interface.calls[-1] == "close"
+
+
+class Test_EntityReferencePager_entityReferences:
+    def test_yields_each_entity_reference_of_each_page_in_order(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+
+        assert list(pager.entityReferences()) == [
+            ref for page in a_paged_pager_interface.pages for ref in page
+        ]
+
+    def test_when_pages_empty_then_skipped(self, a_host_session):
+        refs = [EntityReference(f"ref{idx}") for idx in range(3)]
+        pager_interface = PagedEntityReferencePagerInterface([[], [refs[0]], [], refs[1:], []])
+        pager = EntityReferencePager(pager_interface, a_host_session)
+
+        assert list(pager.entityReferences()) == refs
+
+    def test_when_iterated_lazily_then_pages_fetched_on_demand(
+        self, a_paged_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_paged_pager_interface, a_host_session)
+        refs = pager.entityReferences()
+
+        for _ in range(len(a_paged_pager_interface.pages[0])):
+            next(refs)
+
+        assert a_paged_pager_interface.get_count == 1
+
+        next(refs)
+
+        assert a_paged_pager_interface.get_count == 2
+
+
+class Test_EntityReferencePager_pageSize:
+    def test_when_not_given_then_zero(self, an_entity_reference_pager):
+        assert an_entity_reference_pager.pageSize() == 0
+
+    def test_when_given_then_returned(self, mock_entity_reference_pager_interface, a_host_session):
+        pager = EntityReferencePager(mock_entity_reference_pager_interface, a_host_session, 7)
+        assert pager.pageSize() == 7
+
+
+class Test_EntityReferencePager_statistics:
+    def test_default_target_page_seconds(self):
+        assert EntityReferencePager.kDefaultTargetPageSeconds == 0.1
+
+    def test_when_no_pages_fetched_then_empty(self, an_entity_reference_pager):
+        statistics = an_entity_reference_pager.statistics()
+
+        assert statistics.pageCount == 0
+        assert statistics.entityReferenceCount == 0
+        assert statistics.pageSizes == []
+        assert statistics.fetchSeconds == 0
+
+    def test_records_each_page_fetched_once(self, a_sized_pager_interface, a_host_session):
+        pager = EntityReferencePager(a_sized_pager_interface, a_host_session, 4)
+
+        pager.get()
+        pager.get()
+        pages = read_all_pages(pager)
+
+        statistics = pager.statistics()
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert statistics.pageCount == 3
+        assert statistics.entityReferenceCount == 10
+        assert statistics.pageSizes == [4, 4, 4]
+        assert statistics.fetchSeconds > 0
+
+    def test_when_prefetching_then_includes_prefetched_pages(
+        self, a_sized_pager_interface, a_host_session
+    ):
+        pager = EntityReferencePager(a_sized_pager_interface, a_host_session, 4)
+        pager.setPrefetchDepth(5)
+
+        read_all_pages(pager)
+
+        statistics = pager.statistics()
+        assert statistics.pageCount == 3
+        assert statistics.entityReferenceCount == 10
+
+
+class Test_EntityReferencePager_setAdaptivePageSize:
+    @pytest.mark.parametrize(
+        "args,message",
+        [
+            ((0, 10), "minPageSize must be greater than zero."),
+            ((11, 10), "minPageSize must not be greater than maxPageSize."),
+            ((1, 10, 0), "targetPageSeconds must be greater than zero."),
+            ((1, 10, -1), "targetPageSeconds must be greater than zero."),
+        ],
+    )
+    def test_when_invalid_then_raises_InputValidationException(
+        self, an_entity_reference_pager, args, message
+    ):
+        with pytest.raises(InputValidationException, match=message):
+            an_entity_reference_pager.setAdaptivePageSize(*args)
+
+    def test_when_pages_fast_then_page_size_doubled_up_to_max(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(100, 2)
+        pager = EntityReferencePager(pager_interface, a_host_session, 2)
+        pager.setAdaptivePageSize(2, 16, targetPageSeconds=10)
+
+        pages = read_all_pages(pager)
+
+        assert [len(page) for page in pages] == [2, 4, 8, 16, 16, 16, 16, 16, 6]
+        assert pager_interface.hints == [4, 8, 16]
+        assert pager.statistics().pageSizes == [2, 4, 8, 16, 16, 16, 16, 16, 16]
+        assert pager.pageSize() == 16
+
+    def test_when_pages_slow_then_page_size_halved_down_to_min(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(40, 16, get_seconds=0.02)
+        pager = EntityReferencePager(pager_interface, a_host_session, 16)
+        pager.setAdaptivePageSize(4, 16, targetPageSeconds=0.01)
+
+        pages = read_all_pages(pager)
+
+        assert [len(page) for page in pages] == [16, 8, 4, 4, 4, 4]
+        assert pager_interface.hints == [8, 4]
+
+    def test_when_query_page_size_outside_bounds_then_clamped(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(40, 30)
+        pager = EntityReferencePager(pager_interface, a_host_session, 30)
+
+        pager.setAdaptivePageSize(2, 10, targetPageSeconds=10)
+
+        assert pager.pageSize() == 10
+        pages = read_all_pages(pager)
+        assert [len(page) for page in pages] == [30, 10]
+        assert pager_interface.hints == [10]
+
+    def test_when_query_page_size_unknown_then_starts_at_min(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(10, 5)
+        pager = EntityReferencePager(pager_interface, a_host_session)
+
+        pager.setAdaptivePageSize(3, 10, targetPageSeconds=10)
+
+        assert pager.pageSize() == 3
+        pages = read_all_pages(pager)
+        assert [len(page) for page in pages] == [5, 3, 2]
+        # Second page was full and fast, so grown before the final page.
+        assert pager_interface.hints == [3, 6]
+
+    def test_when_page_not_full_then_page_size_not_grown(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(3, 4)
+        pager = EntityReferencePager(pager_interface, a_host_session, 4)
+        pager.setAdaptivePageSize(1, 16, targetPageSeconds=10)
+
+        pager.get()
+        pager.next()
+
+        assert not pager_interface.hints
+        assert pager.pageSize() == 4
+
+    def test_when_prefetching_then_page_size_adapted_in_background(self, a_host_session):
+        pager_interface = SizedEntityReferencePagerInterface(100, 2)
+        pager = EntityReferencePager(pager_interface, a_host_session, 2)
+        pager.setAdaptivePageSize(2, 16, targetPageSeconds=10)
+        pager.setPrefetchDepth(3)
+
+        pages = read_all_pages(pager)
+
+        assert [len(page) for page in pages] == [2, 4, 8, 16, 16, 16, 16, 16, 6]
+        assert pager_interface.hints == [4, 8, 16]
+
+
+def read_all_pages(pager):
+    pages = [pager.get()]
+    while pager.hasNext():
+        pager.next()
+        pages.append(pager.get())
+    return pages
+
+
+class PagedEntityReferencePagerInterface(EntityReferencePagerInterface):
+    """
+    Pager interface over a fixed list of pages, that records calls and
+    can be configured to fail or block at a given page.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, pages):
+        EntityReferencePagerInterface.__init__(self)
+        self.pages = pages
+        self.index = 0
+        self.calls = []
+        self.get_count = 0
+        self.fail_get_at = None
+        self.fail_next_at = None
+        self.block_get_at = None
+        self.get_blocked = threading.Event()
+        self.unblock_get = threading.Event()
+        self.closed = threading.Event()
+        self.__condition = threading.Condition()
+
+    def hasNext(self, _hostSession):
+        self.calls.append("hasNext")
+        return self.index + 1 < len(self.pages)
+
+    def get(self, _hostSession):
+        self.calls.append("get")
+        if self.index == self.block_get_at:
+            self.get_blocked.set()
+            self.unblock_get.wait(timeout=5)
+        if self.index == self.fail_get_at:
+            raise RuntimeError(f"get failed at {self.index}")
+        with self.__condition:
+            self.get_count += 1
+            self.__condition.notify_all()
+        if self.index >= len(self.pages):
+            return []
+        return self.pages[self.index]
+
+    def next(self, _hostSession):
+        self.calls.append("next")
+        if self.index == self.fail_next_at:
+            raise RuntimeError(f"next failed at {self.index}")
+        self.index += 1
+
+    def close(self, _hostSession):
+        self.calls.append("close")
+        self.closed.set()
+
+    def wait_for_gets(self, count):
+        with self.__condition:
+            assert self.__condition.wait_for(lambda: self.get_count >= count, timeout=5)
+
+
+class SizedEntityReferencePagerInterface(EntityReferencePagerInterface):
+    """
+    Pager interface over a number of entity references, that applies
+    page size hints to subsequent pages.
+    """
+
+    def __init__(self, count, page_size, get_seconds=0):
+        EntityReferencePagerInterface.__init__(self)
+        self.refs = [EntityReference(f"ref{idx}") for idx in range(count)]
+        self.offset = 0
+        self.page_size = page_size
+        self.next_page_size = page_size
+        self.get_seconds = get_seconds
+        self.hints = []
+
+    def hasNext(self, _hostSession):
+        return self.offset + self.page_size < len(self.refs)
+
+    def get(self, _hostSession):
+        if self.get_seconds:
+            time.sleep(self.get_seconds)
+        return self.refs[self.offset : self.offset + self.page_size]
+
+    def next(self, _hostSession):
+        self.offset += self.page_size
+        self.page_size = self.next_page_size
+
+    def setPageSizeHint(self, pageSize, _hostSession):
+        self.hints.append(pageSize)
+        self.next_page_size = pageSize
+
+
 class FakeEntityReferencePagerInterface(EntityReferencePagerInterface):
     """
     Throwaway pager interface def, so we can create a temporary
@@ -169,3 +640,15 @@ class Test_EntityReferencePager_destruction:
 @pytest.fixture
 def an_entity_reference_pager(mock_entity_reference_pager_interface, a_host_session):
     return EntityReferencePager(mock_entity_reference_pager_interface, a_host_session)
+
+
+@pytest.fixture
+def a_sized_pager_interface():
+    return SizedEntityReferencePagerInterface(10, 4)
+
+
+@pytest.fixture
+def a_paged_pager_interface():
+    return PagedEntityReferencePagerInterface(
+        [[EntityReference(f"page{page}/{idx}") for idx in range(3)] for page in range(5)]
+    )
@@ -0,0 +1,305 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the openassetio.hostApi.EntityReferencePagerStream
+class.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import threading
+import time
+
+import pytest
+
+from openassetio import EntityReference, errors
+from openassetio.hostApi import EntityReferencePager, EntityReferencePagerStream
+from openassetio.managerApi import EntityReferencePagerInterface
+
+
+class Test_EntityReferencePagerStream_init:
+    def test_default_max_concurrency(self):
+        assert EntityReferencePagerStream.kDefaultMaxConcurrency == 8
+
+    def test_when_max_concurrency_zero_then_raises_InputValidationException(self):
+        with pytest.raises(
+            errors.InputValidationException,
+            match="EntityReferencePagerStream: maxConcurrency must be greater than zero",
+        ):
+            EntityReferencePagerStream([], 0)
+
+
+class Test_EntityReferencePagerStream_iter:
+    def test_when_no_pagers_then_yields_nothing(self):
+        assert not list(EntityReferencePagerStream([]))
+
+    def test_yields_all_pages_tagged_with_source_index_in_order_per_source(self, a_host_session):
+        page_lists = make_page_lists(source_count=6, page_count=4)
+        pagers = make_pagers(page_lists, a_host_session)
+
+        items = list(EntityReferencePagerStream(pagers, maxConcurrency=3))
+
+        assert len(items) == 6 * 4
+        for source_idx, pages in enumerate(page_lists):
+            assert [page for idx, page in items if idx == source_idx] == pages
+
+    def test_when_ordered_then_yields_all_pages_of_each_source_in_turn(self, a_host_session):
+        page_lists = make_page_lists(source_count=6, page_count=4)
+        # Make earlier sources slower, so they would finish last if
+        # unordered.
+        pagers = [
+            EntityReferencePager(
+                PagedEntityReferencePagerInterface(pages, delay=0.002 * (6 - idx)),
+                a_host_session,
+            )
+            for idx, pages in enumerate(page_lists)
+        ]
+
+        items = list(EntityReferencePagerStream(pagers, maxConcurrency=3, ordered=True))
+
+        assert items == [
+            (source_idx, page) for source_idx, pages in enumerate(page_lists) for page in pages
+        ]
+
+    @pytest.mark.parametrize("ordered", (False, True))
+    def test_when_pager_is_None_then_treated_as_having_no_pages(self, a_host_session, ordered):
+        page_lists = make_page_lists(source_count=2, page_count=2)
+        pagers = make_pagers(page_lists, a_host_session)
+
+        items = list(
+            EntityReferencePagerStream([None, pagers[0], None, pagers[1]], ordered=ordered)
+        )
+
+        assert sorted(items, key=lambda item: item[0]) == [
+            (1, page_lists[0][0]),
+            (1, page_lists[0][1]),
+            (3, page_lists[1][0]),
+            (3, page_lists[1][1]),
+        ]
+
+    def test_when_pages_empty_then_skipped(self, a_host_session):
+        ref = EntityReference("ref")
+        pager = EntityReferencePager(
+            PagedEntityReferencePagerInterface([[], [ref], [], []]), a_host_session
+        )
+
+        assert list(EntityReferencePagerStream([pager])) == [(0, [ref])]
+
+    def test_when_pager_already_advanced_then_starts_from_current_page(self, a_host_session):
+        page_lists = make_page_lists(source_count=1, page_count=3)
+        [pager] = make_pagers(page_lists, a_host_session)
+        pager.next()
+
+        assert list(EntityReferencePagerStream([pager])) == [
+            (0, page) for page in page_lists[0][1:]
+        ]
+
+    def test_pagers_traversed_concurrently(self, a_host_session):
+        # Each pager blocks until all have started, so would time out
+        # if traversed one at a time.
+        barrier = threading.Barrier(3, timeout=5)
+        page_lists = make_page_lists(source_count=3, page_count=1)
+        pagers = [
+            EntityReferencePager(
+                PagedEntityReferencePagerInterface(pages, on_get=barrier.wait), a_host_session
+            )
+            for pages in page_lists
+        ]
+
+        items = list(EntityReferencePagerStream(pagers, maxConcurrency=3))
+
+        assert len(items) == 3
+
+    def test_concurrency_limited_to_max_concurrency(self, a_host_session):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def on_get():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.002)
+            with lock:
+                in_flight -= 1
+
+        page_lists = make_page_lists(source_count=12, page_count=2)
+        pagers = [
+            EntityReferencePager(
+                PagedEntityReferencePagerInterface(pages, on_get=on_get), a_host_session
+            )
+            for pages in page_lists
+        ]
+
+        items = list(EntityReferencePagerStream(pagers, maxConcurrency=3))
+
+        assert len(items) == 12 * 2
+        assert 1 <= max_in_flight <= 3
+
+    def test_pagers_released_once_exhausted(self, a_host_session):
+        page_lists = make_page_lists(source_count=4, page_count=2)
+        interfaces = [PagedEntityReferencePagerInterface(pages) for pages in page_lists]
+        stream = EntityReferencePagerStream(
+            [EntityReferencePager(interface, a_host_session) for interface in interfaces]
+        )
+
+        list(stream)
+
+        for interface in interfaces:
+            assert interface.calls.count("close") == 1
+            assert interface.calls[-1] == "close"
+
+    @pytest.mark.parametrize("ordered", (False, True))
+    def test_when_pager_raises_then_exception_propagated_and_stream_finished(
+        self, a_host_session, ordered
+    ):
+        page_lists = make_page_lists(source_count=3, page_count=2)
+        interfaces = [PagedEntityReferencePagerInterface(pages) for pages in page_lists]
+        interfaces[1].fail_get_at = 1
+        stream = EntityReferencePagerStream(
+            [EntityReferencePager(interface, a_host_session) for interface in interfaces],
+            ordered=ordered,
+        )
+        items = []
+
+        with pytest.raises(RuntimeError, match="get failed at 1"):
+            for item in stream:
+                items.append(item)
+
+        assert (1, page_lists[1][0]) in items
+        if ordered:
+            # All pages of earlier sources are yielded before the error.
+            assert items == [(0, page_lists[0][0]), (0, page_lists[0][1]), (1, page_lists[1][0])]
+
+        with pytest.raises(StopIteration):
+            next(stream)
+
+    def test_when_destroyed_mid_stream_then_all_pagers_closed(self, a_host_session):
+        page_lists = make_page_lists(source_count=10, page_count=20)
+        interfaces = [
+            PagedEntityReferencePagerInterface(pages, delay=0.001) for pages in page_lists
+        ]
+        stream = EntityReferencePagerStream(
+            [EntityReferencePager(interface, a_host_session) for interface in interfaces],
+            maxConcurrency=2,
+        )
+        next(stream)
+
+        del stream
+
+        for interface in interfaces:
+            assert interface.closed.wait(timeout=5)
+            assert interface.calls.count("close") == 1
+            assert interface.calls[-1] == "close"
+
+
+@pytest.mark.benchmark
+def test_benchmark_stream_vs_serial_traversal(a_host_session, capsys):
+    sourceCount = 200
+    pageCount = 5
+    latency = 0.001
+    page_lists = make_page_lists(source_count=sourceCount, page_count=pageCount)
+
+    def makeLatentPagers():
+        return [
+            EntityReferencePager(
+                PagedEntityReferencePagerInterface(pages, delay=latency), a_host_session
+            )
+            for pages in page_lists
+        ]
+
+    pagers = makeLatentPagers()
+    start = time.perf_counter()
+    serialItems = [(idx, page) for idx, pager in enumerate(pagers) for page in pager.pages()]
+    serialDuration = time.perf_counter() - start
+    del pagers
+
+    timings = {}
+    for maxConcurrency in (4, 16, 64):
+        pagers = makeLatentPagers()
+        start = time.perf_counter()
+        items = list(EntityReferencePagerStream(pagers, maxConcurrency, ordered=True))
+        timings[maxConcurrency] = time.perf_counter() - start
+        assert items == serialItems
+        del pagers
+
+    with capsys.disabled():
+        print(f"\n{sourceCount} pagers x {pageCount} pages, {latency * 1000:.0f}ms per page")
+        print(f"  serial: {serialDuration:.3f}s")
+        for maxConcurrency, duration in timings.items():
+            print(
+                f"  stream, maxConcurrency={maxConcurrency}: {duration:.3f}s"
+                f" (speedup x{serialDuration / duration:.2f})"
+            )
+
+
+def make_page_lists(source_count, page_count):
+    return [
+        [
+            [EntityReference(f"src{source}/page{page}/{idx}") for idx in range(3)]
+            for page in range(page_count)
+        ]
+        for source in range(source_count)
+    ]
+
+
+def make_pagers(page_lists, host_session):
+    return [
+        EntityReferencePager(PagedEntityReferencePagerInterface(pages), host_session)
+        for pages in page_lists
+    ]
+
+
+class PagedEntityReferencePagerInterface(EntityReferencePagerInterface):
+    """
+    Pager interface over a fixed list of pages, that records calls and
+    can be configured to be slow or to fail at a given page.
+    """
+
+    def __init__(self, pages, delay=0, on_get=None):
+        EntityReferencePagerInterface.__init__(self)
+        self.pages = pages
+        self.index = 0
+        self.calls = []
+        self.delay = delay
+        self.on_get = on_get
+        self.fail_get_at = None
+        self.closed = threading.Event()
+
+    def hasNext(self, _hostSession):
+        self.calls.append("hasNext")
+        return self.index + 1 < len(self.pages)
+
+    def get(self, _hostSession):
+        self.calls.append("get")
+        if self.delay:
+            time.sleep(self.delay)
+        if self.on_get is not None:
+            self.on_get()
+        if self.index == self.fail_get_at:
+            raise RuntimeError(f"get failed at {self.index}")
+        if self.index >= len(self.pages):
+            return []
+        return self.pages[self.index]
+
+    def next(self, _hostSession):
+        self.calls.append("next")
+        self.index += 1
+
+    def close(self, _hostSession):
+        self.calls.append("close")
+        self.closed.set()
@@ -3277,6 +3277,134 @@ class Test_Manager_createChildContext:
         assert context_b.locale == context_b.locale
         mock_manager_interface.mock.createChildState.assert_not_called()
 
+    def test_when_deferred_then_createChildState_not_called_until_first_use(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.createState.return_value = state_a
+        mock_manager_interface.mock.createChildState.return_value = state_b
+        mock_manager_interface.mock.managementPolicy.return_value = [TraitsData()]
+        context_a = manager.createContext()
+        context_a.locale.setTraitProperty("a", "v", 1)
+
+        context_b = manager.createChildContext(context_a, deferManagerState=True)
+
+        mock_manager_interface.mock.createChildState.assert_not_called()
+        assert context_b.locale == context_a.locale
+
+        manager.managementPolicy([{"a"}], access.PolicyAccess.kRead, context_b)
+        manager.managementPolicy([{"a"}], access.PolicyAccess.kRead, context_b)
+
+        mock_manager_interface.mock.createChildState.assert_called_once_with(
+            state_a, a_host_session
+        )
+        passed_context = mock_manager_interface.mock.managementPolicy.call_args[0][2]
+        assert passed_context.managerState is state_b
+
+    def test_when_deferred_then_managerState_resolved_on_access(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        context_a = Context(TraitsData(), state_a)
+        mock_manager_interface.mock.createChildState.return_value = state_b
+
+        context_b = manager.createChildContext(context_a, deferManagerState=True)
+
+        assert context_b.managerState is state_b
+        assert context_b.resolveManagerState() is state_b
+        mock_manager_interface.mock.createChildState.assert_called_once_with(
+            state_a, a_host_session
+        )
+
+    def test_when_deferred_then_persistenceTokenForContext_uses_child_state(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.createChildState.return_value = state_b
+        mock_manager_interface.mock.persistenceTokenForState.return_value = "token"
+
+        context_b = manager.createChildContext(
+            Context(TraitsData(), state_a), deferManagerState=True
+        )
+
+        assert manager.persistenceTokenForContext(context_b) == "token"
+        mock_manager_interface.mock.persistenceTokenForState.assert_called_once_with(
+            state_b, a_host_session
+        )
+
+    def test_when_deferred_and_parent_deferred_then_parent_state_created_first(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        state_c = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.createChildState.side_effect = [state_b, state_c]
+        context_a = Context(TraitsData(), state_a)
+        context_b = manager.createChildContext(context_a, deferManagerState=True)
+
+        context_c = manager.createChildContext(context_b, deferManagerState=True)
+
+        mock_manager_interface.mock.createChildState.assert_not_called()
+        assert context_c.managerState is state_c
+        assert context_b.managerState is state_b
+        assert mock_manager_interface.mock.createChildState.call_args_list == [
+            mock.call(state_a, a_host_session),
+            mock.call(state_b, a_host_session),
+        ]
+
+    def test_when_not_deferred_and_parent_deferred_then_parent_state_created_first(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        state_c = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.createChildState.side_effect = [state_b, state_c]
+        context_b = manager.createChildContext(
+            Context(TraitsData(), state_a), deferManagerState=True
+        )
+
+        context_c = manager.createChildContext(context_b)
+
+        assert mock_manager_interface.mock.createChildState.call_args_list == [
+            mock.call(state_a, a_host_session),
+            mock.call(state_b, a_host_session),
+        ]
+        assert context_c.managerState is state_c
+
+    def test_when_deferred_and_parent_has_no_managerState_then_createChildState_not_called(
+        self, manager, mock_manager_interface
+    ):
+        context_b = manager.createChildContext(Context(), deferManagerState=True)
+
+        assert context_b.managerState is None
+        mock_manager_interface.mock.createChildState.assert_not_called()
+
+    def test_when_deferred_and_managerState_assigned_then_deferred_state_discarded(
+        self, manager, mock_manager_interface
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        context_b = manager.createChildContext(
+            Context(TraitsData(), state_a), deferManagerState=True
+        )
+
+        context_b.managerState = state_b
+
+        assert context_b.managerState is state_b
+        mock_manager_interface.mock.createChildState.assert_not_called()
+
+    def test_when_deferred_then_locale_is_copied(self, manager):
+        context_a = Context()
+        context_a.locale.setTraitProperty("a", "v", 1)
+
+        context_b = manager.createChildContext(context_a, deferManagerState=True)
+        context_b.locale.setTraitProperty("a", "v", 2)
+
+        assert context_a.locale.getTraitProperty("a", "v") == 1
+
 
 class Test_Manager_persistenceTokenForContext:
     def test_when_called_then_the_managers_persistence_token_is_returned(
@@ -3330,6 +3458,234 @@ class Test_Manager_contextFromPersistenceToken:
         mock_manager_interface.mock.stateFromPersistenceToken.assert_not_called()
 
 
+class Test_Manager_persistenceTokensForContexts:
+    def test_when_called_then_token_returned_for_each_context_in_order(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        states = [managerApi.ManagerStateBase() for _ in range(3)]
+        contexts = [Context(TraitsData(), state) for state in states]
+        contexts.insert(1, Context())
+        mock_manager_interface.mock.persistenceTokenForState.side_effect = lambda state, _: str(
+            states.index(state)
+        )
+
+        tokens = manager.persistenceTokensForContexts(contexts)
+
+        assert tokens == ["0", "", "1", "2"]
+        assert mock_manager_interface.mock.persistenceTokenForState.call_args_list == [
+            mock.call(state, a_host_session) for state in states
+        ]
+
+    def test_when_empty_then_returns_empty_list(self, manager, mock_manager_interface):
+        assert manager.persistenceTokensForContexts([]) == []
+        mock_manager_interface.mock.persistenceTokenForState.assert_not_called()
+
+    def test_when_context_is_None_then_raises_InputValidationException(
+        self, manager, mock_manager_interface
+    ):
+        a_context = Context(TraitsData(), managerApi.ManagerStateBase())
+
+        with pytest.raises(InputValidationException, match="Context at index 1 is null."):
+            manager.persistenceTokensForContexts([a_context, None])
+
+        mock_manager_interface.mock.persistenceTokenForState.assert_not_called()
+
+    def test_when_cache_disabled_and_states_repeated_then_each_state_queried_once(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        state_a = managerApi.ManagerStateBase()
+        state_b = managerApi.ManagerStateBase()
+        context_a = Context(TraitsData(), state_a)
+        another_context_a = Context(TraitsData(), state_a)
+        context_b = Context(TraitsData(), state_b)
+        tokens = {id(state_a): "a_token", id(state_b): "b_token"}
+        mock_manager_interface.mock.persistenceTokenForState.side_effect = lambda state, _: tokens[
+            id(state)
+        ]
+
+        actual = manager.persistenceTokensForContexts(
+            [context_a, context_b, Context(), another_context_a, context_a, context_b]
+        )
+
+        assert actual == ["a_token", "b_token", "", "a_token", "a_token", "b_token"]
+        assert mock_manager_interface.mock.persistenceTokenForState.call_args_list == [
+            mock.call(state_a, a_host_session),
+            mock.call(state_b, a_host_session),
+        ]
+
+
+class Test_Manager_contextsFromPersistenceTokens:
+    def test_when_called_then_new_context_returned_for_each_token_in_order(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        states = {"a": managerApi.ManagerStateBase(), "b": managerApi.ManagerStateBase()}
+        mock_manager_interface.mock.stateFromPersistenceToken.side_effect = (
+            lambda token, _: states[token]
+        )
+
+        contexts = manager.contextsFromPersistenceTokens(["a", "", "b"])
+
+        assert [context.managerState for context in contexts] == [states["a"], None, states["b"]]
+        assert mock_manager_interface.mock.stateFromPersistenceToken.call_args_list == [
+            mock.call("a", a_host_session),
+            mock.call("b", a_host_session),
+        ]
+
+    def test_when_cache_disabled_and_tokens_repeated_then_restored_each_time(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        mock_manager_interface.mock.stateFromPersistenceToken.side_effect = (
+            lambda *_: managerApi.ManagerStateBase()
+        )
+
+        contexts = manager.contextsFromPersistenceTokens(["a", "", "a"])
+
+        context_a1, empty_context, context_a2 = contexts
+        assert empty_context.managerState is None
+        assert context_a1.managerState is not context_a2.managerState
+        assert mock_manager_interface.mock.stateFromPersistenceToken.call_args_list == [
+            mock.call("a", a_host_session),
+            mock.call("a", a_host_session),
+        ]
+
+    def test_when_cache_enabled_and_tokens_repeated_then_each_token_restored_once(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        mock_manager_interface.mock.stateFromPersistenceToken.side_effect = (
+            lambda *_: managerApi.ManagerStateBase()
+        )
+        # Fewer entries than distinct tokens, so deduplication within
+        # the batch does not rely on the cache retaining every state.
+        manager.setPersistenceTokenCacheCapacity(1)
+
+        contexts = manager.contextsFromPersistenceTokens(["a", "b", "", "a", "a", "b"])
+
+        assert len({id(context) for context in contexts}) == 6
+        context_a, context_b, empty_context = contexts[:3]
+        assert context_a.managerState is not context_b.managerState
+        assert empty_context.managerState is None
+        assert [context.managerState for context in contexts[3:]] == [
+            context_a.managerState,
+            context_a.managerState,
+            context_b.managerState,
+        ]
+        assert mock_manager_interface.mock.stateFromPersistenceToken.call_args_list == [
+            mock.call("a", a_host_session),
+            mock.call("b", a_host_session),
+        ]
+
+
+class Test_Manager_setPersistenceTokenCacheCapacity:
+    def test_when_not_set_then_cache_disabled(self, manager):
+        assert manager.persistenceTokenCacheCapacity() == 0
+
+    def test_when_set_then_capacity_updated(self, manager):
+        manager.setPersistenceTokenCacheCapacity(10)
+        assert manager.persistenceTokenCacheCapacity() == 10
+
+    def test_when_enabled_then_repeated_state_serialised_once(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        a_state = managerApi.ManagerStateBase()
+        context_a = Context(TraitsData(), a_state)
+        context_b = Context(TraitsData(), a_state)
+        mock_manager_interface.mock.persistenceTokenForState.return_value = "a_token"
+        manager.setPersistenceTokenCacheCapacity(10)
+
+        tokens = manager.persistenceTokensForContexts([context_a, context_b])
+        token = manager.persistenceTokenForContext(context_a)
+
+        assert tokens == ["a_token", "a_token"]
+        assert token == "a_token"
+        mock_manager_interface.mock.persistenceTokenForState.assert_called_once_with(
+            a_state, a_host_session
+        )
+
+    def test_when_enabled_then_repeated_token_restored_once_and_state_shared(
+        self, manager, mock_manager_interface, a_host_session
+    ):
+        a_state = managerApi.ManagerStateBase()
+        mock_manager_interface.mock.stateFromPersistenceToken.return_value = a_state
+        manager.setPersistenceTokenCacheCapacity(10)
+
+        context_a, context_b = manager.contextsFromPersistenceTokens(["a_token", "a_token"])
+        context_c = manager.contextFromPersistenceToken("a_token")
+
+        assert context_a is not context_b
+        assert context_a.managerState is a_state
+        assert context_b.managerState is a_state
+        assert context_c.managerState is a_state
+        mock_manager_interface.mock.stateFromPersistenceToken.assert_called_once_with(
+            "a_token", a_host_session
+        )
+
+    def test_when_enabled_then_restored_state_serialised_without_query(
+        self, manager, mock_manager_interface
+    ):
+        mock_manager_interface.mock.stateFromPersistenceToken.return_value = (
+            managerApi.ManagerStateBase()
+        )
+        manager.setPersistenceTokenCacheCapacity(10)
+        a_context = manager.contextFromPersistenceToken("a_token")
+
+        assert manager.persistenceTokenForContext(a_context) == "a_token"
+        mock_manager_interface.mock.persistenceTokenForState.assert_not_called()
+
+    def test_when_manager_restores_no_state_then_not_cached(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.stateFromPersistenceToken.return_value = None
+        manager.setPersistenceTokenCacheCapacity(10)
+
+        manager.contextFromPersistenceToken("a_token")
+        manager.contextFromPersistenceToken("a_token")
+
+        assert mock_manager_interface.mock.stateFromPersistenceToken.call_count == 2
+
+    def test_when_full_then_least_recently_used_evicted(self, manager, mock_manager_interface):
+        states = [managerApi.ManagerStateBase() for _ in range(3)]
+        contexts = [Context(TraitsData(), state) for state in states]
+        mock_manager_interface.mock.persistenceTokenForState.side_effect = lambda state, _: str(
+            states.index(state)
+        )
+        manager.setPersistenceTokenCacheCapacity(2)
+
+        manager.persistenceTokensForContexts(contexts[:2])
+        # Use 0, so 1 is least recently used.
+        manager.persistenceTokenForContext(contexts[0])
+        manager.persistenceTokenForContext(contexts[2])
+        mock_manager_interface.mock.persistenceTokenForState.reset_mock()
+
+        manager.persistenceTokensForContexts([contexts[0], contexts[2], contexts[1]])
+
+        assert mock_manager_interface.mock.persistenceTokenForState.call_args_list == [
+            mock.call(states[1], mock.ANY)
+        ]
+
+    def test_when_disabled_then_entries_discarded(self, manager, mock_manager_interface):
+        a_context = Context(TraitsData(), managerApi.ManagerStateBase())
+        mock_manager_interface.mock.persistenceTokenForState.return_value = "a_token"
+        manager.setPersistenceTokenCacheCapacity(10)
+        manager.persistenceTokenForContext(a_context)
+
+        manager.setPersistenceTokenCacheCapacity(0)
+        manager.setPersistenceTokenCacheCapacity(10)
+        manager.persistenceTokenForContext(a_context)
+
+        assert mock_manager_interface.mock.persistenceTokenForState.call_count == 2
+
+    def test_when_flushCaches_called_then_entries_discarded(self, manager, mock_manager_interface):
+        mock_manager_interface.mock.stateFromPersistenceToken.side_effect = (
+            lambda *_: managerApi.ManagerStateBase()
+        )
+        manager.setPersistenceTokenCacheCapacity(10)
+        manager.contextFromPersistenceToken("a_token")
+
+        manager.flushCaches()
+        manager.contextFromPersistenceToken("a_token")
+
+        assert mock_manager_interface.mock.stateFromPersistenceToken.call_count == 2
+        assert manager.persistenceTokenCacheCapacity() == 10
+
+
 @pytest.fixture
 def manager(mock_manager_interface, a_host_session):
     # Default to accepting anything as an entity reference string, to
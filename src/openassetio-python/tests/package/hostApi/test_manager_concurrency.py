@@ -0,0 +1,229 @@
+#
+#   Copyright 2013-2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that exercise the Manager API from multiple Python threads.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name,unused-argument
+# pylint: disable=missing-class-docstring,missing-function-docstring
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import itertools
+import pickle
+import time
+
+import pytest
+
+from openassetio import Context, EntityReference
+from openassetio.access import ResolveAccess
+from openassetio.errors import BatchElementError
+from openassetio.hostApi import HostInterface, Manager
+from openassetio.log import ConsoleLogger
+from openassetio.managerApi import Host, HostSession, ManagerInterface
+from openassetio.trait import TraitsData
+
+kTraitId = "threadTest"
+kPropertyKey = "ref"
+kPrefix = "thread://"
+
+kThreadCount = 8
+kIterationsPerThread = 50
+kBatchSize = 64
+
+
+class Test_Manager_resolve_concurrent:
+    def test_when_resolving_from_many_threads_then_all_results_correct(self, manager):
+        def resolveBatches(threadIdx):
+            context = manager.createContext()
+            for iteration in range(kIterationsPerThread):
+                refStrs = [f"{kPrefix}{threadIdx}/{iteration}/{idx}" for idx in range(kBatchSize)]
+                refs = [manager.createEntityReference(refStr) for refStr in refStrs]
+                results = manager.resolve(refs, {kTraitId}, ResolveAccess.kRead, context)
+                assert [
+                    result.getTraitProperty(kTraitId, kPropertyKey) for result in results
+                ] == refStrs
+
+        with ThreadPoolExecutor(max_workers=kThreadCount) as executor:
+            # Evaluate results to propagate any assertion errors.
+            list(executor.map(resolveBatches, range(kThreadCount)))
+
+    def test_when_errors_from_many_threads_then_all_errors_routed_correctly(self, manager):
+        def resolveBatch(context, threadIdx, iteration):
+            refs = [
+                manager.createEntityReference(f"{kPrefix}error/{threadIdx}/{iteration}/{idx}")
+                for idx in range(kBatchSize)
+            ]
+            errors = {}
+
+            def onError(idx, error):
+                errors[idx] = error.message
+
+            manager.resolve(
+                refs,
+                {kTraitId},
+                ResolveAccess.kRead,
+                context,
+                lambda idx, _: pytest.fail("Unexpected success"),
+                onError,
+            )
+            assert errors == {idx: refs[idx].toString() for idx in range(kBatchSize)}
+
+        def resolveBatches(threadIdx):
+            context = manager.createContext()
+            for iteration in range(kIterationsPerThread):
+                resolveBatch(context, threadIdx, iteration)
+
+        with ThreadPoolExecutor(max_workers=kThreadCount) as executor:
+            list(executor.map(resolveBatches, range(kThreadCount)))
+
+
+@pytest.mark.benchmark
+def test_benchmark_resolve_scaling_with_thread_count(manager, capsys):
+    totalBatches = 512
+    refs = [manager.createEntityReference(f"{kPrefix}{idx}") for idx in range(kBatchSize)]
+    context = manager.createContext()
+
+    def resolveBatch(_):
+        manager.resolve(refs, {kTraitId}, ResolveAccess.kRead, context)
+
+    timings = {}
+    for threadCount in (1, 2, 4, 8):
+        with ThreadPoolExecutor(max_workers=threadCount) as executor:
+            start = time.perf_counter()
+            list(executor.map(resolveBatch, range(totalBatches)))
+            timings[threadCount] = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(f"\nresolve() x {totalBatches} batches of {kBatchSize}")
+        for threadCount, duration in timings.items():
+            print(
+                f"  {threadCount} thread(s): {duration:.3f}s"
+                f" (speedup x{timings[1] / duration:.2f})"
+            )
+
+
+@pytest.mark.benchmark
+def test_benchmark_resolve_fan_out_to_process_pool(capsys):
+    refCount = 200_000
+    processCount = 4
+    chunkSize = 5_000
+    refStrs = [f"{kPrefix}{idx}" for idx in range(refCount)]
+    refs = [EntityReference(refStr) for refStr in refStrs]
+    context = Context()
+    context.locale.setTraitProperty("a_locale_trait", "a_property", "a value")
+
+    start = time.perf_counter()
+    serialResults = resolveInWorkerProcess(refs, context)
+    serialDuration = time.perf_counter() - start
+
+    chunks = [refs[idx : idx + chunkSize] for idx in range(0, refCount, chunkSize)]
+    with ProcessPoolExecutor(max_workers=processCount) as executor:
+        # Warm up the pool, so process startup isn't measured.
+        list(executor.map(resolveInWorkerProcess, chunks[:processCount], [context] * processCount))
+
+        start = time.perf_counter()
+        poolResults = list(
+            itertools.chain.from_iterable(
+                executor.map(resolveInWorkerProcess, chunks, itertools.repeat(context))
+            )
+        )
+        poolDuration = time.perf_counter() - start
+
+    assert poolResults == serialResults
+    assert [result.getTraitProperty(kTraitId, kPropertyKey) for result in poolResults] == refStrs
+
+    with capsys.disabled():
+        print(f"\nresolve() of {refCount} refs")
+        print(f"  serial: {serialDuration:.3f}s")
+        print(
+            f"  {processCount} processes ({chunkSize} refs per task): {poolDuration:.3f}s"
+            f" (speedup x{serialDuration / poolDuration:.2f})"
+        )
+        print(f"  pickled result size: {len(pickle.dumps(poolResults[0]))} bytes")
+
+
+def resolveInWorkerProcess(refs, context):
+    """
+    Resolve a batch of references in a worker process, reusing a single
+    Manager per process.
+    """
+    # pylint: disable=global-statement
+    global _workerManager
+    if _workerManager is None:
+        hostSession = HostSession(Host(WorkerHostInterface()), ConsoleLogger())
+        _workerManager = Manager(ThreadSafeManagerInterface(), hostSession)
+    return _workerManager.resolve(refs, {kTraitId}, ResolveAccess.kRead, context)
+
+
+_workerManager = None
+
+
+class WorkerHostInterface(HostInterface):
+    def identifier(self):
+        return "org.openassetio.test.worker"
+
+    def displayName(self):
+        return "Process pool worker"
+
+
+class ThreadSafeManagerInterface(ManagerInterface):
+    """
+    Minimal stateless manager whose resolve echoes the reference back as
+    a trait property, or errors for references containing "error/".
+    """
+
+    def identifier(self):
+        return "org.openassetio.test.threadSafe"
+
+    def displayName(self):
+        return "Thread-safe test manager"
+
+    def hasCapability(self, capability):
+        return capability in (
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+            ManagerInterface.Capability.kManagementPolicyQueries,
+            ManagerInterface.Capability.kEntityTraitIntrospection,
+            ManagerInterface.Capability.kResolution,
+        )
+
+    def isEntityReferenceString(self, someString, hostSession):
+        return someString.startswith(kPrefix)
+
+    def resolve(
+        self,
+        entityRefs,
+        traitSet,
+        resolveAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        for idx, ref in enumerate(entityRefs):
+            refStr = ref.toString()
+            if refStr.startswith(f"{kPrefix}error/"):
+                errorCallback(
+                    idx,
+                    BatchElementError(BatchElementError.ErrorCode.kEntityResolutionError, refStr),
+                )
+                continue
+            data = TraitsData()
+            data.setTraitProperty(kTraitId, kPropertyKey, refStr)
+            successCallback(idx, data)
+
+
+@pytest.fixture
+def manager(a_host_session):
+    return Manager(ThreadSafeManagerInterface(), a_host_session)
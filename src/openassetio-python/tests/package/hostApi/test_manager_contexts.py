@@ -0,0 +1,288 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that exercise creation and use of many contexts, against a
+minimal stateful manager.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from openassetio.access import PolicyAccess
+from openassetio.hostApi import Manager
+from openassetio.managerApi import ManagerInterface, ManagerStateBase
+from openassetio.trait import TraitsData
+
+
+class Test_Manager_createChildContext_deferred:
+    def test_when_first_used_from_many_threads_then_state_created_once(
+        self, manager, manager_interface
+    ):
+        threadCount = 8
+        barrier = threading.Barrier(threadCount, timeout=5)
+        parent = manager.createContext()
+        child = manager.createChildContext(parent, deferManagerState=True)
+
+        def useContext(_):
+            barrier.wait()
+            manager.managementPolicy([{"a"}], PolicyAccess.kRead, child)
+            return child.managerState
+
+        with ThreadPoolExecutor(max_workers=threadCount) as executor:
+            states = list(executor.map(useContext, range(threadCount)))
+
+        assert manager_interface.childStateCount == 1
+        assert all(state is states[0] for state in states)
+        assert states[0].parent is parent.managerState
+
+    @pytest.mark.parametrize(
+        "getState",
+        [lambda context: context.managerState, lambda context: context.__getstate__()[1]],
+        ids=["managerState", "__getstate__"],
+    )
+    def test_when_accessed_whilst_created_on_other_thread_then_no_deadlock(
+        self, manager, manager_interface, getState
+    ):
+        manager_interface.childStateDelay = 0.1
+        parent = manager.createContext()
+        child = manager.createChildContext(parent, deferManagerState=True)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(child.resolveManagerState)
+            # Access the state whilst the other thread is mid-way
+            # through creating it, with its lock held.
+            assert manager_interface.creatingChildState.wait(timeout=5)
+            state = getState(child)
+
+            assert future.result() is state
+
+        assert manager_interface.childStateCount == 1
+
+    def test_when_never_used_then_state_never_created(self, manager, manager_interface):
+        parent = manager.createContext()
+
+        for _ in range(100):
+            manager.createChildContext(parent, deferManagerState=True)
+
+        assert manager_interface.childStateCount == 0
+
+
+class Test_Context_snapshot_concurrent:
+    def test_when_used_from_many_threads_while_original_modified_then_locale_unchanged(
+        self, manager, manager_interface
+    ):
+        threadCount = 8
+        iterations = 200
+        context = manager.createContext()
+        context.locale.setTraitProperty("aLocaleTrait", "value", 0)
+        snapshot = context.snapshot()
+        stop = threading.Event()
+
+        def modifyOriginal():
+            value = 0
+            while not stop.is_set():
+                value += 1
+                context.locale.setTraitProperty("aLocaleTrait", "value", value)
+
+        def useSnapshot(_):
+            for _ in range(iterations):
+                manager.managementPolicy([{"a"}], PolicyAccess.kRead, snapshot)
+
+        modifier = threading.Thread(target=modifyOriginal)
+        modifier.start()
+        try:
+            with ThreadPoolExecutor(max_workers=threadCount) as executor:
+                list(executor.map(useSnapshot, range(threadCount)))
+        finally:
+            stop.set()
+            modifier.join()
+
+        assert manager_interface.frozenLocaleValues == {0}
+        assert snapshot.managerState is context.managerState
+
+    def test_when_parent_state_deferred_then_created_by_snapshot(self, manager, manager_interface):
+        parent = manager.createContext()
+        child = manager.createChildContext(parent, deferManagerState=True)
+
+        snapshot = child.snapshot()
+
+        assert manager_interface.childStateCount == 1
+        assert snapshot.managerState is child.managerState
+        assert snapshot.managerState.parent is parent.managerState
+
+
+@pytest.mark.benchmark
+def test_benchmark_per_thread_child_contexts_vs_shared_snapshot(manager, capsys):
+    threadCount = 8
+    tasksPerThread = 20_000
+    context = manager.createContext()
+    context.locale.setTraitProperty("aLocaleTrait", "value", 1)
+
+    def runWithChildContexts(_):
+        for _ in range(tasksPerThread):
+            manager.managementPolicy(
+                [{"a"}], PolicyAccess.kRead, manager.createChildContext(context)
+            )
+
+    snapshot = context.snapshot()
+
+    def runWithSnapshot(_):
+        for _ in range(tasksPerThread):
+            manager.managementPolicy([{"a"}], PolicyAccess.kRead, snapshot)
+
+    timings = {}
+    for name, task in (
+        ("child context per task", runWithChildContexts),
+        ("snapshot", runWithSnapshot),
+    ):
+        with ThreadPoolExecutor(max_workers=threadCount) as executor:
+            start = time.perf_counter()
+            list(executor.map(task, range(threadCount)))
+            timings[name] = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(f"\nmanagementPolicy() x {threadCount * tasksPerThread} over {threadCount} threads")
+        for name, duration in timings.items():
+            print(f"  {name}: {duration:.3f}s")
+
+
+@pytest.mark.benchmark
+def test_benchmark_create_child_contexts(manager, capsys):
+    childCount = 1_000_000
+    parent = manager.createContext()
+    for idx in range(10):
+        parent.locale.setTraitProperty("aLocaleTrait", f"property{idx}", f"value{idx}")
+
+    timings = {}
+    for deferManagerState in (False, True):
+        start = time.perf_counter()
+        for _ in range(childCount):
+            manager.createChildContext(parent, deferManagerState)
+        timings[deferManagerState] = time.perf_counter() - start
+
+    with capsys.disabled():
+        print(f"\ncreateChildContext() x {childCount}")
+        print(f"  eager manager state: {timings[False]:.3f}s")
+        print(
+            f"  deferred manager state: {timings[True]:.3f}s"
+            f" (speedup x{timings[False] / timings[True]:.2f})"
+        )
+
+
+@pytest.mark.benchmark
+def test_benchmark_persistence_tokens_with_and_without_cache(manager, capsys):
+    taskCount = 50_000
+    # A farm submission where every task shares the submitting
+    # context, and a worker that restores the tokens of many tasks.
+    context = manager.createContext()
+    contexts = [context] * taskCount
+
+    timings = {}
+    for capacity in (0, 1024):
+        manager.setPersistenceTokenCacheCapacity(capacity)
+        start = time.perf_counter()
+        tokens = manager.persistenceTokensForContexts(contexts)
+        restored = manager.contextsFromPersistenceTokens(tokens)
+        timings[capacity] = time.perf_counter() - start
+        assert len(restored) == taskCount
+
+    with capsys.disabled():
+        print(f"\npersistenceTokensForContexts() + contextsFromPersistenceTokens() x {taskCount}")
+        print(f"  no cache: {timings[0]:.3f}s")
+        print(f"  cache: {timings[1024]:.3f}s (speedup x{timings[0] / timings[1024]:.2f})")
+
+
+class ChildState(ManagerStateBase):
+    def __init__(self, parent=None):
+        ManagerStateBase.__init__(self)
+        self.parent = parent
+
+
+class StatefulManagerInterface(ManagerInterface):
+    """
+    Minimal manager supporting stateful contexts, that counts the
+    number of child states created, and records the locale values seen
+    in frozen locales.
+
+    Child state creation signals `creatingChildState`, then takes
+    `childStateDelay` seconds.
+
+    All states share the same persistence token.
+    """
+
+    def __init__(self):
+        ManagerInterface.__init__(self)
+        self.childStateCount = 0
+        self.childStateDelay = 0
+        self.creatingChildState = threading.Event()
+        self.frozenLocaleValues = set()
+        self.__lock = threading.Lock()
+
+    def identifier(self):
+        return "org.openassetio.test.stateful"
+
+    def displayName(self):
+        return "Stateful test manager"
+
+    def hasCapability(self, capability):
+        return capability in (
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+            ManagerInterface.Capability.kManagementPolicyQueries,
+            ManagerInterface.Capability.kEntityTraitIntrospection,
+            ManagerInterface.Capability.kStatefulContexts,
+        )
+
+    def isEntityReferenceString(self, someString, _hostSession):
+        return someString.startswith("stateful://")
+
+    def managementPolicy(self, traitSets, _policyAccess, context, _hostSession):
+        if context.locale.isFrozen():
+            value = context.locale.getTraitProperty("aLocaleTrait", "value")
+            with self.__lock:
+                self.frozenLocaleValues.add(value)
+        return [TraitsData() for _ in traitSets]
+
+    def createState(self, _hostSession):
+        return ChildState()
+
+    def createChildState(self, parentState, _hostSession):
+        self.creatingChildState.set()
+        if self.childStateDelay:
+            time.sleep(self.childStateDelay)
+        with self.__lock:
+            self.childStateCount += 1
+        return ChildState(parentState)
+
+    def persistenceTokenForState(self, _state, _hostSession):
+        return "stateful-token"
+
+    def stateFromPersistenceToken(self, _token, _hostSession):
+        return ChildState()
+
+
+@pytest.fixture
+def manager_interface():
+    return StatefulManagerInterface()
+
+
+@pytest.fixture
+def manager(manager_interface, a_host_session):
+    return Manager(manager_interface, a_host_session)
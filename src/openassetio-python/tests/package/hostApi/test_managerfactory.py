@@ -19,6 +19,7 @@ Tests that cover the openassetio.hostApi.ManagerFactory class.
 
 # pylint: disable=bad-option-value,invalid-name,redefined-outer-name,too-many-arguments,too-many-positional-arguments,duplicate-code
 # pylint: disable=missing-class-docstring,missing-function-docstring
+import gc
 import os
 import pathlib
 from unittest import mock
@@ -28,6 +29,7 @@ import pytest
 from openassetio import errors
 from openassetio.hostApi import ManagerFactory, Manager, ManagerImplementationFactoryInterface
 from openassetio.log import LoggerInterface
+from openassetio.utils import StartupProfile
 
 
 class Test_ManagerFactory_ManagerDetail_equality:
@@ -448,6 +450,162 @@ class Test_ManagerFactory_defaultManagerForInterface:
             )
 
 
+class Test_ManagerFactory_kManagerPoolingEnvVarName:
+    def test_has_expected_value(self):
+        assert ManagerFactory.kManagerPoolingEnvVarName == "OPENASSETIO_MANAGER_POOLING"
+
+
+class Test_ManagerFactory_managerPooling:
+    def test_when_env_var_not_set_then_false(self, monkeypatch):
+        monkeypatch.delenv(ManagerFactory.kManagerPoolingEnvVarName, raising=False)
+        assert ManagerFactory.managerPooling() is False
+
+    @pytest.mark.parametrize(
+        "value,expected", [("1", True), ("yes", True), ("0", False), ("", False)]
+    )
+    def test_when_env_var_set_then_reflects_env_var(self, value, expected, monkeypatch):
+        monkeypatch.setenv(ManagerFactory.kManagerPoolingEnvVarName, value)
+        assert ManagerFactory.managerPooling() is expected
+
+    @pytest.mark.usefixtures("reset_manager_pooling")
+    def test_when_set_then_overrides_env_var(self, monkeypatch):
+        monkeypatch.setenv(ManagerFactory.kManagerPoolingEnvVarName, "1")
+
+        ManagerFactory.setManagerPooling(False)
+        assert ManagerFactory.managerPooling() is False
+
+        ManagerFactory.setManagerPooling(None)
+        assert ManagerFactory.managerPooling() is True
+
+
+class Test_ManagerFactory_defaultManagerForInterface_with_pooling:
+    @pytest.mark.usefixtures("reset_manager_pooling")
+    def test_when_pooling_disabled_then_new_manager_each_time(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_logger,
+    ):
+        ManagerFactory.setManagerPooling(False)
+
+        first = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        second = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert first is not second
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+
+    @pytest.mark.usefixtures("manager_pooling_enabled")
+    def test_when_same_config_and_host_then_same_initialized_manager_returned(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_manager_interface,
+        mock_logger,
+    ):
+        first = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        second = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert second is first
+        mock_manager_implementation_factory.mock.instantiate.assert_called_once_with("a.manager")
+        mock_manager_interface.mock.initialize.assert_called_once()
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kDebug, "Reusing pooled manager 'a.manager'"
+        )
+
+    @pytest.mark.usefixtures("reset_manager_pooling")
+    def test_when_pooling_enabled_by_env_var_then_same_manager_returned(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_logger,
+        monkeypatch,
+    ):
+        monkeypatch.setenv(ManagerFactory.kManagerPoolingEnvVarName, "1")
+
+        first = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        second = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert second is first
+
+    @pytest.mark.usefixtures("manager_pooling_enabled")
+    def test_when_different_settings_then_different_managers(
+        self,
+        tmp_path,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_logger,
+    ):
+        mock_host_interface.mock.identifier.return_value = "a.host"
+        config_a = write_manager_config(tmp_path / "a.toml", "a.manager", "a value")
+        config_b = write_manager_config(tmp_path / "b.toml", "a.manager", "another value")
+
+        first = ManagerFactory.defaultManagerForInterface(
+            config_a, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        second = ManagerFactory.defaultManagerForInterface(
+            config_b, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert second is not first
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+
+    @pytest.mark.usefixtures("manager_pooling_enabled")
+    def test_when_different_host_identifier_then_different_managers(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_logger,
+    ):
+        first = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        mock_host_interface.mock.identifier.return_value = "another.host"
+        second = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert second is not first
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+
+    @pytest.mark.usefixtures("manager_pooling_enabled")
+    def test_when_all_references_released_then_new_manager_created(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_manager_interface,
+        mock_logger,
+    ):
+        manager = ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+        del manager
+        gc.collect()
+
+        ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert mock_manager_implementation_factory.mock.instantiate.call_count == 2
+        assert mock_manager_interface.mock.initialize.call_count == 2
+
+
 class Test_ManagerFactory_createManager:
     def test_returns_a_manager(self, a_manager_factory):
         manager = a_manager_factory.createManager("a.manager")
@@ -511,6 +669,56 @@ class Test_ManagerFactory_createManagerForInterface:
         assert_expected_manager(manager)
 
 
+class Test_ManagerFactory_defaultManagerForInterface_startup_profile:
+    @pytest.mark.usefixtures("startup_profile_enabled")
+    def test_when_profiling_enabled_then_creation_and_initialization_recorded(
+        self,
+        a_manager_config,
+        mock_host_interface,
+        mock_manager_implementation_factory,
+        mock_manager_interface,
+        mock_logger,
+    ):
+        mock_manager_interface.mock.identifier.return_value = "a.manager"
+
+        ManagerFactory.defaultManagerForInterface(
+            a_manager_config, mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+
+        assert [(event.name, event.detail, event.depth) for event in StartupProfile.events()] == [
+            ("ManagerInterface.initialize", "", 2),
+            ("ManagerInterface.info", "", 2),
+            ("Manager.initialize", "a.manager", 1),
+            ("ManagerFactory.defaultManagerForInterface", a_manager_config, 0),
+        ]
+
+
+@pytest.fixture
+def reset_manager_pooling():
+    yield
+    ManagerFactory.setManagerPooling(None)
+
+
+@pytest.fixture
+def manager_pooling_enabled(reset_manager_pooling):  # pylint: disable=unused-argument
+    ManagerFactory.setManagerPooling(True)
+
+
+@pytest.fixture
+def a_manager_config(tmp_path, mock_host_interface):
+    mock_host_interface.mock.identifier.return_value = "a.host"
+    return write_manager_config(tmp_path / "manager.toml", "a.manager", "a value")
+
+
+def write_manager_config(path, identifier, setting_value):
+    path.write_text(
+        f'[manager]\nidentifier = "{identifier}"\n\n'
+        f'[manager.settings]\na_setting = "{setting_value}"\n',
+        encoding="utf-8",
+    )
+    return str(path)
+
+
 @pytest.fixture
 def assert_expected_manager(mock_host_interface, mock_manager_interface):
     # Assert the expected manager is constructed and is given the
@@ -0,0 +1,458 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the openassetio.hostApi.PublishPipeline class.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import threading
+import time
+
+import pytest
+
+from openassetio import EntityReference
+from openassetio.access import PublishingAccess
+from openassetio.errors import BatchElementError, InputValidationException
+from openassetio.hostApi import Manager, PublishPipeline
+from openassetio.managerApi import ManagerInterface
+from openassetio.trait import TraitsData
+
+
+class Test_PublishPipeline_init:
+    def test_when_chunk_size_zero_then_raises_InputValidationException(
+        self, a_publish_manager, a_context, a_publishing_host
+    ):
+        with pytest.raises(
+            InputValidationException, match="PublishPipeline: chunkSize must be greater than zero"
+        ):
+            make_pipeline(a_publish_manager, a_context, a_publishing_host, chunkSize=0)
+
+    def test_when_max_pending_chunks_zero_then_raises_InputValidationException(
+        self, a_publish_manager, a_context, a_publishing_host
+    ):
+        with pytest.raises(
+            InputValidationException,
+            match="PublishPipeline: maxPendingChunks must be greater than zero",
+        ):
+            make_pipeline(a_publish_manager, a_context, a_publishing_host, maxPendingChunks=0)
+
+
+class Test_PublishPipeline_push:
+    def test_when_traits_hint_is_None_then_raises_TypeError(
+        self, a_publish_manager, a_context, a_publishing_host
+    ):
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host)
+
+        with pytest.raises(TypeError):
+            pipeline.push(ref(0), None)
+
+    def test_preflight_of_next_chunk_and_register_of_previous_overlap_write(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        overlaps = []
+
+        def write(idx, preflightedRef):
+            if idx == 1:
+                # Whilst chunk 1 is written, chunk 2 is preflighted and
+                # chunk 0 is registered.
+                overlaps.append(a_publish_manager_interface.started("preflight", "ref:2"))
+                overlaps.append(a_publish_manager_interface.started("register", "working:0"))
+            return a_publishing_host.write(idx, preflightedRef)
+
+        pipeline = PublishPipeline(
+            a_publish_manager,
+            PublishingAccess.kWrite,
+            a_context,
+            write,
+            a_publishing_host.on_success,
+            a_publishing_host.on_error,
+            chunkSize=1,
+        )
+
+        for idx in range(4):
+            pipeline.push(ref(idx), TraitsData({"aHint"}))
+        pipeline.flush()
+
+        assert overlaps == [True, True]
+        assert a_publishing_host.successes == [(idx, f"published:{idx}") for idx in range(4)]
+
+
+class Test_PublishPipeline_flush:
+    def test_preflights_writes_then_registers_in_chunks(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host, chunkSize=2)
+
+        for idx in range(3):
+            pipeline.push(ref(idx), TraitsData({"aHint"}))
+        pipeline.flush()
+
+        # Stages run concurrently, so calls are only ordered per stage.
+        assert a_publish_manager_interface.callsTo("preflight") == [
+            (["ref:0", "ref:1"], [{"aHint"}] * 2),
+            (["ref:2"], [{"aHint"}]),
+        ]
+        assert a_publish_manager_interface.callsTo("register") == [
+            (["working:0", "working:1"], [{"written0"}, {"written1"}]),
+            (["working:2"], [{"written2"}]),
+        ]
+        assert a_publishing_host.writes == [(0, "working:0"), (1, "working:1"), (2, "working:2")]
+        assert a_publishing_host.successes == [
+            (0, "published:0"),
+            (1, "published:1"),
+            (2, "published:2"),
+        ]
+        assert a_publishing_host.errors == []
+        assert pipeline.pushedCount() == 3
+        assert pipeline.completedCount() == 3
+
+    def test_when_preflight_fails_then_error_given_and_entity_not_written(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        a_publish_manager_interface.failing = {"ref:1"}
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host, chunkSize=2)
+
+        for idx in range(3):
+            pipeline.push(ref(idx), TraitsData())
+        pipeline.flush()
+
+        assert a_publishing_host.writes == [(0, "working:0"), (2, "working:2")]
+        assert a_publishing_host.successes == [(0, "published:0"), (2, "published:2")]
+        assert a_publishing_host.errors == [
+            (1, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "ref:1"))
+        ]
+        assert pipeline.completedCount() == 3
+
+    def test_when_register_fails_then_error_given_with_pipeline_index(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        # Entity 1 fails preflight and entity 2 is skipped by the host,
+        # so register stream indices differ from pipeline indices.
+        a_publish_manager_interface.failing = {"ref:1", "working:4"}
+        a_publishing_host.skipping = {2}
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host, chunkSize=2)
+
+        for idx in range(6):
+            pipeline.push(ref(idx), TraitsData())
+        pipeline.flush()
+
+        assert a_publishing_host.successes == [
+            (0, "published:0"),
+            (3, "published:3"),
+            (5, "published:5"),
+        ]
+        assert a_publishing_host.errors == [
+            (1, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "ref:1")),
+            (4, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "working:4")),
+        ]
+        assert pipeline.completedCount() == 6
+
+    def test_when_write_returns_None_then_entity_not_registered(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        a_publishing_host.skipping = {0}
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host)
+
+        pipeline.push(ref(0), TraitsData())
+        pipeline.push(ref(1), TraitsData())
+        pipeline.flush()
+
+        assert a_publish_manager_interface.callsTo("register") == [(["working:1"], [{"written1"}])]
+        assert a_publishing_host.successes == [(1, "published:1")]
+        assert pipeline.completedCount() == 2
+
+    def test_when_register_raises_then_exception_propagated(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_publishing_host
+    ):
+        a_publish_manager_interface.raising = {"working:1"}
+        pipeline = make_pipeline(a_publish_manager, a_context, a_publishing_host, chunkSize=2)
+
+        with pytest.raises(RuntimeError, match="register of working:1 failed"):
+            # The chunk may complete, and so raise, before `flush`.
+            pipeline.push(ref(0), TraitsData())
+            pipeline.push(ref(1), TraitsData())
+            pipeline.flush()
+
+        assert a_publishing_host.successes == []
+
+    def test_when_write_raises_then_exception_propagated_and_pipeline_finished(
+        self, a_publish_manager, a_context, a_publishing_host
+    ):
+        def write(idx, _preflightedRef):
+            raise ValueError(f"write failed at {idx}")
+
+        pipeline = PublishPipeline(
+            a_publish_manager,
+            PublishingAccess.kWrite,
+            a_context,
+            write,
+            a_publishing_host.on_success,
+            a_publishing_host.on_error,
+        )
+        pipeline.push(ref(0), TraitsData())
+
+        with pytest.raises(ValueError, match="write failed at 0"):
+            pipeline.flush()
+
+        with pytest.raises(InputValidationException):
+            pipeline.push(ref(1), TraitsData())
+
+
+@pytest.mark.benchmark
+def test_benchmark_pipeline_vs_serial_publish(a_host_session, capsys):
+    entityCount = 10_000
+    chunkSize = 500
+    # Simulated cost of each stage per entity.
+    secondsPerEntity = 0.05 / chunkSize
+
+    interface = PublishManagerInterface(secondsPerEntity=secondsPerEntity)
+    manager = Manager(interface, a_host_session)
+    references = [ref(idx) for idx in range(entityCount)]
+    hints = [TraitsData({"aHint"}) for _ in range(entityCount)]
+
+    def write(_idx, _preflightedRef):
+        time.sleep(secondsPerEntity)
+        return TraitsData({"aTrait"})
+
+    timings = {
+        "serial": time_serial_publish(manager, references, hints, write),
+        "pipeline": time_pipeline_publish(manager, references, hints, write, chunkSize),
+    }
+
+    with capsys.disabled():
+        print(f"\npreflight(), write, register() x {entityCount} in chunks of {chunkSize}")
+        print(f"  serial: {timings['serial']:.3f}s")
+        print(
+            f"  pipeline: {timings['pipeline']:.3f}s"
+            f" (speedup x{timings['serial'] / timings['pipeline']:.2f})"
+        )
+
+
+def time_serial_publish(manager, references, hints, write):
+    """
+    Time preflighting all entities, then writing each, then registering
+    all entities, one stage after the other.
+    """
+    context = manager.createContext()
+    results = []
+    preflighted = [None] * len(references)
+
+    def on_preflighted(idx, preflightedRef):
+        preflighted[idx] = preflightedRef
+
+    start = time.perf_counter()
+    manager.preflight(
+        references,
+        hints,
+        PublishingAccess.kWrite,
+        context,
+        on_preflighted,
+        lambda idx, _error: None,
+    )
+    written = [write(idx, preflightedRef) for idx, preflightedRef in enumerate(preflighted)]
+    manager.register(
+        preflighted,
+        written,
+        PublishingAccess.kWrite,
+        context,
+        lambda idx, _ref: results.append(idx),
+        lambda idx, _error: None,
+    )
+    duration = time.perf_counter() - start
+    assert len(results) == len(references)
+    return duration
+
+
+def time_pipeline_publish(manager, references, hints, write, chunkSize):
+    """
+    Time publishing via a PublishPipeline, overlapping the stages.
+    """
+    results = []
+    start = time.perf_counter()
+    pipeline = PublishPipeline(
+        manager,
+        PublishingAccess.kWrite,
+        manager.createContext(),
+        write,
+        lambda idx, _ref: results.append(idx),
+        lambda idx, _error: None,
+        chunkSize=chunkSize,
+    )
+    for reference, hint in zip(references, hints):
+        pipeline.push(reference, hint)
+    pipeline.flush()
+    duration = time.perf_counter() - start
+    assert results == list(range(len(references)))
+    return duration
+
+
+class Host:
+    """
+    Host that "writes" each preflighted entity, recording the writes
+    and results.
+    """
+
+    def __init__(self):
+        self.writes = []
+        self.skipping = set()
+        self.successes = []
+        self.errors = []
+
+    def write(self, idx, preflightedRef):
+        self.writes.append((idx, preflightedRef.toString()))
+        if idx in self.skipping:
+            return None
+        return TraitsData({f"written{idx}"})
+
+    def on_success(self, idx, entityReference):
+        self.successes.append((idx, entityReference.toString()))
+
+    def on_error(self, idx, error):
+        self.errors.append((idx, error))
+
+
+class PublishManagerInterface(ManagerInterface):
+    """
+    Manager that preflights `ref:N` as `working:N` and registers
+    `working:N` as `published:N`, recording its calls, with
+    configurable per-element failures and exceptions.
+    """
+
+    def __init__(self, secondsPerEntity=0):
+        ManagerInterface.__init__(self)
+        self.calls = []
+        self.failing = set()
+        self.raising = set()
+        self.secondsPerEntity = secondsPerEntity
+        self.__started = {}
+        self.__lock = threading.Lock()
+
+    def callsTo(self, method):
+        return [(refStrs, traitSets) for name, refStrs, traitSets in self.calls if name == method]
+
+    def started(self, method, refStr, timeout=5):
+        """
+        Wait for a call to start for the given entity reference.
+        """
+        with self.__lock:
+            event = self.__started.setdefault((method, refStr), threading.Event())
+        return event.wait(timeout)
+
+    def identifier(self):
+        return "org.openassetio.test.publish"
+
+    def displayName(self):
+        return "Publish test manager"
+
+    def hasCapability(self, capability):
+        return capability in (
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+            ManagerInterface.Capability.kManagementPolicyQueries,
+            ManagerInterface.Capability.kPublishing,
+        )
+
+    def isEntityReferenceString(self, someString, _hostSession):
+        return someString.startswith(("ref:", "working:", "published:"))
+
+    def preflight(
+        self,
+        targetEntityRefs,
+        traitsHints,
+        _publishingAccess,
+        _context,
+        _hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        self.__publish(
+            "preflight", targetEntityRefs, traitsHints, "working:", successCallback, errorCallback
+        )
+
+    def register(
+        self,
+        targetEntityRefs,
+        entityTraitsDatas,
+        _publishingAccess,
+        _context,
+        _hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        self.__publish(
+            "register",
+            targetEntityRefs,
+            entityTraitsDatas,
+            "published:",
+            successCallback,
+            errorCallback,
+        )
+
+    def __publish(
+        self, method, targetEntityRefs, traitsDatas, prefix, successCallback, errorCallback
+    ):
+        refStrs = [entityRef.toString() for entityRef in targetEntityRefs]
+        with self.__lock:
+            for refStr in refStrs:
+                self.__started.setdefault((method, refStr), threading.Event()).set()
+            self.calls.append((method, refStrs, [data.traitSet() for data in traitsDatas]))
+        if self.secondsPerEntity:
+            time.sleep(self.secondsPerEntity * len(targetEntityRefs))
+        for idx, refStr in enumerate(refStrs):
+            if refStr in self.raising:
+                raise RuntimeError(f"{method} of {refStr} failed")
+            if refStr in self.failing:
+                errorCallback(
+                    idx, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, refStr)
+                )
+                continue
+            successCallback(idx, EntityReference(prefix + refStr.split(":")[1]))
+
+
+def ref(idx):
+    return EntityReference(f"ref:{idx}")
+
+
+def make_pipeline(manager, context, host, **kwargs):
+    return PublishPipeline(
+        manager,
+        PublishingAccess.kWrite,
+        context,
+        host.write,
+        host.on_success,
+        host.on_error,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def a_publishing_host():
+    return Host()
+
+
+@pytest.fixture
+def a_publish_manager_interface():
+    return PublishManagerInterface()
+
+
+@pytest.fixture
+def a_publish_manager(a_publish_manager_interface, a_host_session):
+    return Manager(a_publish_manager_interface, a_host_session)
+
+
+@pytest.fixture
+def a_context(a_publish_manager):
+    return a_publish_manager.createContext()
@@ -0,0 +1,488 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the openassetio.hostApi.PublishStream class.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import threading
+import time
+
+import pytest
+
+from openassetio import EntityReference
+from openassetio.access import PublishingAccess
+from openassetio.errors import BatchElementError, InputValidationException
+from openassetio.hostApi import Manager, PublishStream
+from openassetio.managerApi import ManagerInterface
+from openassetio.trait import TraitsData
+
+kFailedMessage = "PublishStream: cannot continue a stream after a failure"
+
+
+class Test_PublishStream_constants:
+    def test_kDefaultChunkSize(self):
+        assert PublishStream.kDefaultChunkSize == 1000
+
+    def test_kDefaultMaxPendingChunks(self):
+        assert PublishStream.kDefaultMaxPendingChunks == 2
+
+
+class Test_PublishStream_init:
+    def test_when_chunk_size_zero_then_raises_InputValidationException(
+        self, a_publish_manager, a_context, a_results
+    ):
+        with pytest.raises(
+            InputValidationException, match="PublishStream: chunkSize must be greater than zero"
+        ):
+            make_stream(a_publish_manager, a_context, a_results, chunkSize=0)
+
+    def test_when_max_pending_chunks_zero_then_raises_InputValidationException(
+        self, a_publish_manager, a_context, a_results
+    ):
+        with pytest.raises(
+            InputValidationException,
+            match="PublishStream: maxPendingChunks must be greater than zero",
+        ):
+            make_stream(a_publish_manager, a_context, a_results, maxPendingChunks=0)
+
+
+class Test_PublishStream_push:
+    def test_when_traits_data_is_None_then_raises_TypeError(
+        self, a_publish_manager, a_context, a_results
+    ):
+        stream = make_stream(a_publish_manager, a_context, a_results)
+
+        with pytest.raises(TypeError):
+            stream.push(ref(0), None)
+
+    def test_when_chunk_not_full_then_manager_not_called(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=3)
+
+        stream.push(ref(0), TraitsData())
+        stream.push(ref(1), TraitsData())
+
+        assert a_publish_manager_interface.calls == []
+        assert stream.pushedCount() == 2
+        assert stream.completedCount() == 0
+
+    def test_when_max_chunks_pending_then_blocks_until_oldest_complete(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        a_publish_manager_interface.gate = threading.Event()
+        stream = make_stream(
+            a_publish_manager, a_context, a_results, chunkSize=1, maxPendingChunks=1
+        )
+        stream.push(ref(0), TraitsData())
+
+        pusher = threading.Thread(target=stream.push, args=(ref(1), TraitsData()))
+        pusher.start()
+        pusher.join(timeout=0.2)
+        assert pusher.is_alive()
+        assert a_results.successes == []
+
+        a_publish_manager_interface.gate.set()
+        pusher.join(timeout=5)
+        assert not pusher.is_alive()
+        assert a_results.successes[0] == (0, "published:0")
+
+    def test_when_chunks_complete_then_results_delivered_before_flush(
+        self, a_publish_manager, a_context, a_results
+    ):
+        stream = make_stream(
+            a_publish_manager, a_context, a_results, chunkSize=1, maxPendingChunks=1
+        )
+
+        for idx in range(3):
+            stream.push(ref(idx), TraitsData())
+
+        assert stream.completedCount() >= 2
+        assert a_results.successes[:2] == [(0, "published:0"), (1, "published:1")]
+
+
+class Test_PublishStream_flush:
+    @pytest.mark.parametrize(
+        "operation,expected_method",
+        [
+            (PublishStream.Operation.kPreflight, "preflight"),
+            (PublishStream.Operation.kRegister, "register"),
+        ],
+    )
+    def test_sends_entities_in_chunks_to_operation(
+        self,
+        a_publish_manager,
+        a_publish_manager_interface,
+        a_context,
+        a_results,
+        operation,
+        expected_method,
+    ):
+        stream = make_stream(
+            a_publish_manager, a_context, a_results, operation=operation, chunkSize=3
+        )
+
+        for idx in range(7):
+            stream.push(ref(idx), TraitsData({f"trait{idx}"}))
+        stream.flush()
+
+        assert a_publish_manager_interface.calls == [
+            (expected_method, [f"ref:{idx}" for idx in range(0, 3)], PublishingAccess.kWrite),
+            (expected_method, [f"ref:{idx}" for idx in range(3, 6)], PublishingAccess.kWrite),
+            (expected_method, ["ref:6"], PublishingAccess.kWrite),
+        ]
+        assert a_publish_manager_interface.traitSets == [{f"trait{idx}"} for idx in range(7)]
+        assert a_results.successes == [(idx, f"published:{idx}") for idx in range(7)]
+        assert a_results.errors == []
+        assert stream.completedCount() == 7
+
+    def test_when_elements_fail_then_errors_given_with_stream_index(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        a_publish_manager_interface.failing = {"ref:1", "ref:4"}
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=3)
+
+        for idx in range(5):
+            stream.push(ref(idx), TraitsData())
+        stream.flush()
+
+        assert a_results.successes == [(0, "published:0"), (2, "published:2"), (3, "published:3")]
+        assert a_results.errors == [
+            (1, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "ref:1")),
+            (4, BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, "ref:4")),
+        ]
+
+    def test_when_nothing_pushed_then_manager_not_called(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        stream = make_stream(a_publish_manager, a_context, a_results)
+
+        stream.flush()
+
+        assert a_publish_manager_interface.calls == []
+
+    def test_when_manager_raises_then_exception_propagated_and_stream_finished(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        a_publish_manager_interface.raising = {"ref:3"}
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=3)
+
+        for idx in range(5):
+            stream.push(ref(idx), TraitsData())
+
+        with pytest.raises(RuntimeError, match="publish of ref:3 failed"):
+            stream.flush()
+
+        assert [idx for idx, _ in a_results.successes] == [0, 1, 2]
+
+        with pytest.raises(InputValidationException, match=kFailedMessage):
+            stream.push(ref(5), TraitsData())
+
+        with pytest.raises(InputValidationException, match=kFailedMessage):
+            stream.flush()
+
+    def test_when_callback_raises_then_exception_propagated_and_stream_finished(
+        self, a_publish_manager, a_context
+    ):
+        def fail(idx, _ref):
+            raise ValueError(f"callback failed at {idx}")
+
+        stream = PublishStream(
+            a_publish_manager,
+            PublishStream.Operation.kRegister,
+            PublishingAccess.kWrite,
+            a_context,
+            fail,
+            lambda _idx, _error: None,
+        )
+        stream.push(ref(0), TraitsData())
+
+        with pytest.raises(ValueError, match="callback failed at 0"):
+            stream.flush()
+
+        with pytest.raises(InputValidationException, match=kFailedMessage):
+            stream.flush()
+
+    def test_when_manager_gives_out_of_range_index_then_raises_InputValidationException(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        a_publish_manager_interface.index_offset = 1
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=2)
+
+        with pytest.raises(
+            InputValidationException, match="Index '2' out of bounds for batch size of 2"
+        ):
+            # The chunk may complete, and so raise, before `flush`.
+            stream.push(ref(0), TraitsData())
+            stream.push(ref(1), TraitsData())
+            stream.flush()
+
+
+class Test_PublishStream_destruction:
+    def test_when_not_flushed_then_buffered_entities_discarded(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=3)
+        stream.push(ref(0), TraitsData())
+
+        del stream
+
+        assert a_publish_manager_interface.calls == []
+        assert a_results.successes == []
+
+    def test_when_manager_call_in_flight_then_does_not_block(
+        self, a_publish_manager, a_publish_manager_interface, a_context, a_results
+    ):
+        a_publish_manager_interface.gate = threading.Event()
+        stream = make_stream(a_publish_manager, a_context, a_results, chunkSize=1)
+        stream.push(ref(0), TraitsData())
+
+        del stream
+        a_publish_manager_interface.gate.set()
+
+        assert a_results.successes == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_stream_vs_single_batch_register(a_host_session, capsys):
+    entityCount = 20_000
+    chunkSize = 1000
+    # Simulated cost of the host producing each chunk of data, and of
+    # the manager registering each entity.
+    hostSecondsPerChunk = 0.05
+    managerSecondsPerEntity = 0.05 / chunkSize
+
+    interface = PublishManagerInterface(secondsPerEntity=managerSecondsPerEntity)
+    manager = Manager(interface, a_host_session)
+    references = [ref(idx) for idx in range(entityCount)]
+
+    def produce(start):
+        time.sleep(hostSecondsPerChunk)
+        return [TraitsData({"aTrait"}) for _ in range(start, start + chunkSize)]
+
+    timings = {
+        "single batch": time_single_batch_register(manager, references, produce, chunkSize),
+        "stream": time_stream_register(manager, references, produce, chunkSize),
+    }
+
+    with capsys.disabled():
+        print(f"\nregister() x {entityCount} entities produced in chunks of {chunkSize}")
+        print(f"  single batch: {timings['single batch']:.3f}s")
+        print(
+            f"  stream: {timings['stream']:.3f}s"
+            f" (speedup x{timings['single batch'] / timings['stream']:.2f})"
+        )
+
+
+def time_single_batch_register(manager, references, produce, chunkSize):
+    """
+    Time producing all data up front, then registering it in a single
+    batch.
+    """
+    results = []
+    start = time.perf_counter()
+    traitsDatas = []
+    for chunkStart in range(0, len(references), chunkSize):
+        traitsDatas.extend(produce(chunkStart))
+    manager.register(
+        references,
+        traitsDatas,
+        PublishingAccess.kWrite,
+        manager.createContext(),
+        lambda idx, _ref: results.append(idx),
+        lambda idx, _error: None,
+    )
+    duration = time.perf_counter() - start
+    assert len(results) == len(references)
+    return duration
+
+
+def time_stream_register(manager, references, produce, chunkSize):
+    """
+    Time registering data via a PublishStream as each chunk is
+    produced.
+    """
+    results = []
+    start = time.perf_counter()
+    stream = PublishStream(
+        manager,
+        PublishStream.Operation.kRegister,
+        PublishingAccess.kWrite,
+        manager.createContext(),
+        lambda idx, _ref: results.append(idx),
+        lambda idx, _error: None,
+        chunkSize=chunkSize,
+    )
+    for chunkStart in range(0, len(references), chunkSize):
+        for offset, traitsData in enumerate(produce(chunkStart)):
+            stream.push(references[chunkStart + offset], traitsData)
+    stream.flush()
+    duration = time.perf_counter() - start
+    assert results == list(range(len(references)))
+    return duration
+
+
+class Results:
+    def __init__(self):
+        self.successes = []
+        self.errors = []
+
+    def on_success(self, idx, entityReference):
+        self.successes.append((idx, entityReference.toString()))
+
+    def on_error(self, idx, error):
+        self.errors.append((idx, error))
+
+
+class PublishManagerInterface(ManagerInterface):
+    """
+    Manager that publishes `ref:N` as `published:N`, recording its
+    calls, with configurable per-element failures and exceptions.
+    """
+
+    def __init__(self, secondsPerEntity=0):
+        ManagerInterface.__init__(self)
+        self.calls = []
+        self.traitSets = []
+        self.failing = set()
+        self.raising = set()
+        self.index_offset = 0
+        self.gate = None
+        self.secondsPerEntity = secondsPerEntity
+
+    def identifier(self):
+        return "org.openassetio.test.publish"
+
+    def displayName(self):
+        return "Publish test manager"
+
+    def hasCapability(self, capability):
+        return capability in (
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+            ManagerInterface.Capability.kManagementPolicyQueries,
+            ManagerInterface.Capability.kPublishing,
+        )
+
+    def isEntityReferenceString(self, someString, _hostSession):
+        return someString.startswith("ref:")
+
+    def preflight(
+        self,
+        targetEntityRefs,
+        traitsHints,
+        publishingAccess,
+        _context,
+        _hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        self.__publish(
+            "preflight",
+            targetEntityRefs,
+            traitsHints,
+            publishingAccess,
+            successCallback,
+            errorCallback,
+        )
+
+    def register(
+        self,
+        targetEntityRefs,
+        entityTraitsDatas,
+        publishingAccess,
+        _context,
+        _hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        self.__publish(
+            "register",
+            targetEntityRefs,
+            entityTraitsDatas,
+            publishingAccess,
+            successCallback,
+            errorCallback,
+        )
+
+    def __publish(
+        self,
+        method,
+        targetEntityRefs,
+        traitsDatas,
+        publishingAccess,
+        successCallback,
+        errorCallback,
+    ):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.secondsPerEntity:
+            time.sleep(self.secondsPerEntity * len(targetEntityRefs))
+        refStrs = [entityRef.toString() for entityRef in targetEntityRefs]
+        self.calls.append((method, refStrs, publishingAccess))
+        self.traitSets.extend(traitsData.traitSet() for traitsData in traitsDatas)
+        for idx, refStr in enumerate(refStrs):
+            if refStr in self.raising:
+                raise RuntimeError(f"publish of {refStr} failed")
+            if refStr in self.failing:
+                errorCallback(
+                    idx + self.index_offset,
+                    BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, refStr),
+                )
+                continue
+            successCallback(
+                idx + self.index_offset,
+                EntityReference(refStr.replace("ref:", "published:")),
+            )
+
+
+def ref(idx):
+    return EntityReference(f"ref:{idx}")
+
+
+def make_stream(manager, context, results, **kwargs):
+    kwargs.setdefault("operation", PublishStream.Operation.kRegister)
+    operation = kwargs.pop("operation")
+    return PublishStream(
+        manager,
+        operation,
+        PublishingAccess.kWrite,
+        context,
+        results.on_success,
+        results.on_error,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def a_results():
+    return Results()
+
+
+@pytest.fixture
+def a_publish_manager_interface():
+    return PublishManagerInterface()
+
+
+@pytest.fixture
+def a_publish_manager(a_publish_manager_interface, a_host_session):
+    return Manager(a_publish_manager_interface, a_host_session)
+
+
+@pytest.fixture
+def a_context(a_publish_manager):
+    return a_publish_manager.createContext()
@@ -0,0 +1,585 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the openassetio.hostApi.RelationshipTraversal class.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+import time
+
+import pytest
+
+from openassetio import Context, EntityReference
+from openassetio.access import RelationsAccess
+from openassetio.errors import BatchElementError, BatchElementException, InputValidationException
+from openassetio.hostApi import Manager, RelationshipTraversal
+from openassetio.managerApi import EntityReferencePagerInterface, ManagerInterface
+from openassetio.trait import TraitsData
+
+kUsesTrait = "uses"
+kContainsTrait = "contains"
+
+
+class Test_RelationshipTraversal_constants:
+    def test_kUnlimited_is_max_size(self):
+        assert RelationshipTraversal.kUnlimited == 2**64 - 1
+
+    def test_kDefaultPageSize(self):
+        assert RelationshipTraversal.kDefaultPageSize == 100
+
+
+class Test_RelationshipTraversal_init:
+    def test_when_no_relationships_then_raises_InputValidationException(
+        self, a_graph_manager, a_context
+    ):
+        with pytest.raises(
+            InputValidationException,
+            match="RelationshipTraversal: at least one relationship must be provided",
+        ):
+            RelationshipTraversal(a_graph_manager, [], [], RelationsAccess.kRead, a_context)
+
+    def test_when_relationship_is_None_then_raises_InputValidationException(
+        self, a_graph_manager, a_context, uses
+    ):
+        with pytest.raises(
+            InputValidationException, match="RelationshipTraversal: relationship cannot be None"
+        ):
+            RelationshipTraversal(
+                a_graph_manager, [], [uses, None], RelationsAccess.kRead, a_context
+            )
+
+    def test_when_page_size_zero_then_raises_InputValidationException(
+        self, a_graph_manager, a_context, uses
+    ):
+        with pytest.raises(
+            InputValidationException,
+            match="RelationshipTraversal: pageSize must be greater than zero",
+        ):
+            RelationshipTraversal(
+                a_graph_manager, [], [uses], RelationsAccess.kRead, a_context, pageSize=0
+            )
+
+    def test_when_max_concurrency_zero_then_raises_InputValidationException(
+        self, a_graph_manager, a_context, uses
+    ):
+        with pytest.raises(
+            InputValidationException,
+            match="RelationshipTraversal: maxConcurrency must be greater than zero",
+        ):
+            RelationshipTraversal(
+                a_graph_manager, [], [uses], RelationsAccess.kRead, a_context, maxConcurrency=0
+            )
+
+    def test_does_not_query_manager(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        RelationshipTraversal(
+            a_graph_manager, refs("shot"), [uses], RelationsAccess.kRead, a_context
+        )
+
+        assert a_graph_manager_interface.queries == []
+
+
+class Test_RelationshipTraversal_iter:
+    def test_yields_edges_of_closure_level_by_level(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "shot": {kUsesTrait: ["rig", "cache"]},
+            "rig": {kUsesTrait: ["texA", "texB"]},
+            "cache": {kUsesTrait: ["texB"]},
+            "texB": {kUsesTrait: ["image"]},
+        }
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("shot"), [uses], RelationsAccess.kRead, a_context
+        )
+        edges = edge_tuples(traversal)
+
+        assert sorted(edges) == sorted(
+            [
+                ("shot", "rig", 1),
+                ("shot", "cache", 1),
+                ("rig", "texA", 2),
+                ("rig", "texB", 2),
+                ("cache", "texB", 2),
+                ("texB", "image", 3),
+            ]
+        )
+        assert [edge[2] for edge in edges] == sorted(edge[2] for edge in edges)
+        assert traversal.entityCount() == 5
+        assert not traversal.truncated()
+
+    def test_each_level_queried_in_one_batch_and_each_entity_queried_once(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "shot": {kUsesTrait: ["rig", "cache"]},
+            "rig": {kUsesTrait: ["tex"]},
+            "cache": {kUsesTrait: ["tex", "shot"]},
+        }
+
+        edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("shot"), [uses], RelationsAccess.kRead, a_context
+            )
+        )
+
+        assert [
+            (sorted(sources), relationship)
+            for sources, relationship in a_graph_manager_interface.queries
+        ] == [
+            (["shot"], kUsesTrait),
+            (["cache", "rig"], kUsesTrait),
+            (["tex"], kUsesTrait),
+        ]
+
+    def test_edges_to_already_found_entities_are_yielded(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "a": {kUsesTrait: ["b"]},
+            "b": {kUsesTrait: ["a", "b"]},
+        }
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context
+            )
+        )
+
+        assert edges == [("a", "b", 1), ("b", "a", 2), ("b", "b", 2)]
+
+    def test_when_duplicate_roots_then_queried_once(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b"]}}
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("a", "a"), [uses], RelationsAccess.kRead, a_context
+            )
+        )
+
+        assert edges == [("a", "b", 1)]
+        assert a_graph_manager_interface.queries[0] == (["a"], kUsesTrait)
+
+    def test_when_no_roots_then_yields_nothing_and_does_not_query(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        traversal = RelationshipTraversal(
+            a_graph_manager, [], [uses], RelationsAccess.kRead, a_context
+        )
+
+        assert traversal.next() is None
+        assert a_graph_manager_interface.queries == []
+
+    def test_when_multiple_relationships_then_used_per_hop_with_last_repeated(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        contains = TraitsData({kContainsTrait})
+        a_graph_manager_interface.graph = {
+            "seq": {kContainsTrait: ["shot"], kUsesTrait: ["ignored"]},
+            "shot": {kUsesTrait: ["rig"], kContainsTrait: ["ignored"]},
+            "rig": {kUsesTrait: ["tex"]},
+        }
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("seq"), [contains, uses], RelationsAccess.kRead, a_context
+            )
+        )
+
+        assert edges == [("seq", "shot", 1), ("shot", "rig", 2), ("rig", "tex", 3)]
+        assert [relationship for _, relationship in a_graph_manager_interface.queries] == [
+            kContainsTrait,
+            kUsesTrait,
+            kUsesTrait,
+            kUsesTrait,
+        ]
+
+    def test_relations_access_page_size_and_result_trait_set_forwarded(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b"]}}
+
+        edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager,
+                refs("a"),
+                [uses],
+                RelationsAccess.kWrite,
+                a_context,
+                pageSize=7,
+                resultTraitSet={"a_trait"},
+            )
+        )
+
+        assert (
+            a_graph_manager_interface.call_args == [(RelationsAccess.kWrite, 7, {"a_trait"})] * 2
+        )
+
+
+class Test_RelationshipTraversal_maxDepth:
+    def test_when_max_depth_zero_then_yields_nothing_and_does_not_query(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b"]}}
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context, maxDepth=0
+            )
+        )
+
+        assert edges == []
+        assert a_graph_manager_interface.queries == []
+
+    def test_when_max_depth_reached_then_found_entities_not_queried(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "a": {kUsesTrait: ["b"]},
+            "b": {kUsesTrait: ["c"]},
+            "c": {kUsesTrait: ["d"]},
+        }
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context, maxDepth=2
+            )
+        )
+
+        assert edges == [("a", "b", 1), ("b", "c", 2)]
+        assert [sources for sources, _ in a_graph_manager_interface.queries] == [["a"], ["b"]]
+
+
+class Test_RelationshipTraversal_maxEntities:
+    def test_when_budget_exceeded_then_stops_and_reports_truncated(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "a": {kUsesTrait: ["b", "a", "c", "d"]},
+            "b": {kUsesTrait: ["e"]},
+        }
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context, maxEntities=1
+        )
+        edges = edge_tuples(traversal)
+
+        assert edges == [("a", "b", 1), ("a", "a", 1)]
+        assert traversal.truncated()
+        assert traversal.entityCount() == 1
+        assert traversal.next() is None
+        assert len(a_graph_manager_interface.queries) == 1
+
+    def test_when_budget_exactly_met_then_not_truncated(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b", "c"]}, "c": {kUsesTrait: ["b"]}}
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context, maxEntities=2
+        )
+        edges = edge_tuples(traversal)
+
+        assert edges == [("a", "b", 1), ("a", "c", 1), ("c", "b", 2)]
+        assert not traversal.truncated()
+        assert traversal.entityCount() == 2
+
+
+class Test_RelationshipTraversal_next:
+    def test_returns_edges_a_page_at_a_time(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b", "c", "d", "e", "f"]}}
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context, pageSize=2
+        )
+
+        batches = []
+        while (edges := traversal.next()) is not None:
+            batches.append([edge.target.toString() for edge in edges])
+
+        assert batches == [["b", "c"], ["d", "e"], ["f"]]
+
+    def test_edge_has_source_target_and_depth(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b"]}}
+
+        [edge] = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context
+        ).next()
+
+        assert isinstance(edge, RelationshipTraversal.Edge)
+        assert edge.source == EntityReference("a")
+        assert edge.target == EntityReference("b")
+        assert edge.depth == 1
+
+
+class Test_RelationshipTraversal_errors:
+    def test_when_no_error_callback_then_raises_and_finishes(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b", "c"]}}
+        a_graph_manager_interface.failing = {"c"}
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context
+        )
+        assert traversal.next() is not None
+
+        with pytest.raises(BatchElementException) as exc_info:
+            traversal.next()
+
+        assert exc_info.value.error.code == BatchElementError.ErrorCode.kEntityAccessError
+        assert "[entity=c]" in exc_info.value.message
+        assert "[access=read]" in exc_info.value.message
+        assert traversal.next() is None
+
+    def test_when_error_callback_then_called_and_traversal_continues(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {
+            "a": {kUsesTrait: ["b", "c"]},
+            "b": {kUsesTrait: ["d"]},
+            "c": {kUsesTrait: ["e"]},
+        }
+        a_graph_manager_interface.failing = {"c"}
+        errors = []
+
+        edges = edge_tuples(
+            RelationshipTraversal(
+                a_graph_manager,
+                refs("a"),
+                [uses],
+                RelationsAccess.kRead,
+                a_context,
+                errorCallback=lambda ref, depth, error: errors.append(
+                    (ref.toString(), depth, error.code)
+                ),
+            )
+        )
+
+        assert sorted(edges) == [("a", "b", 1), ("a", "c", 1), ("b", "d", 2)]
+        assert errors == [("c", 1, BatchElementError.ErrorCode.kEntityAccessError)]
+
+    def test_when_pager_raises_then_exception_propagated_and_finishes(
+        self, a_graph_manager, a_graph_manager_interface, a_context, uses
+    ):
+        a_graph_manager_interface.graph = {"a": {kUsesTrait: ["b"]}}
+        a_graph_manager_interface.failing_pages = {"a"}
+
+        traversal = RelationshipTraversal(
+            a_graph_manager, refs("a"), [uses], RelationsAccess.kRead, a_context
+        )
+
+        with pytest.raises(RuntimeError, match="page of a failed"):
+            traversal.next()
+
+        assert traversal.next() is None
+
+
+@pytest.mark.benchmark
+def test_benchmark_traversal_vs_per_entity_bfs(a_host_session, capsys):
+    # Tree of depth 4 with fan-out 6, with latency per manager call
+    # and per page.
+    fanOut = 6
+    depth = 4
+    latency = 0.001
+    manager = Manager(tree_graph_manager_interface(fanOut, depth, latency), a_host_session)
+    context = Context()
+    uses = TraitsData({kUsesTrait})
+
+    start = time.perf_counter()
+    serialEdges = per_entity_bfs_edges(manager, "root", uses, context)
+    serialDuration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    traversalEdges = [
+        (edge.source.toString(), edge.target.toString())
+        for edge in RelationshipTraversal(
+            manager, refs("root"), [uses], RelationsAccess.kRead, context, maxConcurrency=32
+        )
+    ]
+    traversalDuration = time.perf_counter() - start
+
+    assert sorted(traversalEdges) == sorted(serialEdges)
+
+    with capsys.disabled():
+        print(
+            f"\nclosure of {len(serialEdges)} edges (fan-out {fanOut}, depth {depth},"
+            f" {latency * 1000:.0f}ms per call)"
+        )
+        print(f"  per-entity BFS: {serialDuration:.3f}s")
+        print(
+            f"  RelationshipTraversal: {traversalDuration:.3f}s"
+            f" (speedup x{serialDuration / traversalDuration:.2f})"
+        )
+
+
+def tree_graph_manager_interface(fanOut, depth, latency):
+    """
+    Create a graph manager interface over a tree rooted at "root", with
+    the given fan-out and depth of `kUsesTrait` relationships.
+    """
+    interface = GraphManagerInterface(latency=latency)
+    frontier = ["root"]
+    for _ in range(depth):
+        nextFrontier = []
+        for node in frontier:
+            children = [f"{node}/{idx}" for idx in range(fanOut)]
+            interface.graph[node] = {kUsesTrait: children}
+            nextFrontier.extend(children)
+        frontier = nextFrontier
+    return interface
+
+
+def per_entity_bfs_edges(manager, rootRefStr, relationship, context):
+    """
+    Collect the closure of a relationship by querying one entity at a
+    time, breadth first, as a host would without RelationshipTraversal.
+    """
+    edges = []
+    visited = {rootRefStr}
+    frontier = [EntityReference(rootRefStr)]
+    while frontier:
+        nextFrontier = []
+        for source in frontier:
+            pager = manager.getWithRelationship(
+                source, relationship, 100, RelationsAccess.kRead, context, set()
+            )
+            for target in pager.entityReferences():
+                edges.append((source.toString(), target.toString()))
+                if target.toString() not in visited:
+                    visited.add(target.toString())
+                    nextFrontier.append(target)
+        frontier = nextFrontier
+    return edges
+
+
+def refs(*refStrs):
+    return [EntityReference(refStr) for refStr in refStrs]
+
+
+def edge_tuples(traversal):
+    return [(edge.source.toString(), edge.target.toString(), edge.depth) for edge in traversal]
+
+
+@pytest.fixture
+def uses():
+    return TraitsData({kUsesTrait})
+
+
+@pytest.fixture
+def a_context():
+    return Context()
+
+
+@pytest.fixture
+def a_graph_manager_interface():
+    return GraphManagerInterface()
+
+
+@pytest.fixture
+def a_graph_manager(a_graph_manager_interface, a_host_session):
+    return Manager(a_graph_manager_interface, a_host_session)
+
+
+class ListPagerInterface(EntityReferencePagerInterface):
+    def __init__(self, pages, latency=0, fail=False):
+        EntityReferencePagerInterface.__init__(self)
+        self.pages = pages
+        self.index = 0
+        self.latency = latency
+        self.fail = fail
+
+    def hasNext(self, _hostSession):
+        return self.index + 1 < len(self.pages)
+
+    def get(self, _hostSession):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(self.fail)
+        if self.index >= len(self.pages):
+            return []
+        return self.pages[self.index]
+
+    def next(self, _hostSession):
+        self.index += 1
+
+    def close(self, _hostSession):
+        pass
+
+
+class GraphManagerInterface(ManagerInterface):
+    """
+    Manager over a fixed graph, mapping entity reference strings to the
+    targets of each relationship trait, that records its queries.
+    """
+
+    def __init__(self, latency=0):
+        ManagerInterface.__init__(self)
+        self.graph = {}
+        self.failing = set()
+        self.failing_pages = set()
+        self.latency = latency
+        self.queries = []
+        self.call_args = []
+
+    def identifier(self):
+        return "org.openassetio.test.graph"
+
+    def displayName(self):
+        return "Graph test manager"
+
+    def hasCapability(self, capability):
+        return capability == ManagerInterface.Capability.kRelationshipQueries
+
+    def getWithRelationship(
+        self,
+        entityReferences,
+        relationshipTraitsData,
+        resultTraitSet,
+        pageSize,
+        relationsAccess,
+        _context,
+        _hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        if self.latency:
+            time.sleep(self.latency)
+        [relationship] = relationshipTraitsData.traitSet()
+        self.queries.append(([ref.toString() for ref in entityReferences], relationship))
+        self.call_args.append((relationsAccess, pageSize, resultTraitSet))
+        for idx, ref in enumerate(entityReferences):
+            refStr = ref.toString()
+            if refStr in self.failing:
+                errorCallback(
+                    idx,
+                    BatchElementError(BatchElementError.ErrorCode.kEntityAccessError, refStr),
+                )
+                continue
+            targets = refs(*self.graph.get(refStr, {}).get(relationship, []))
+            pages = [targets[pos : pos + pageSize] for pos in range(0, len(targets), pageSize)]
+            fail = f"page of {refStr} failed" if refStr in self.failing_pages else False
+            successCallback(idx, ListPagerInterface(pages, self.latency, fail))
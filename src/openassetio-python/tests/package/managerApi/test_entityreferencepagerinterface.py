@@ -43,6 +43,15 @@ class Test_EntityReferencePagerInterface_get:
             an_unimplemented_entity_ref_pager_interface.get(a_host_session)
 
 
+class Test_EntityReferencePagerInterface_setPageSizeHint:
+    def test_default_implementation_is_a_no_op(
+        self, an_unimplemented_entity_ref_pager_interface, a_host_session
+    ):
+        assert (
+            an_unimplemented_entity_ref_pager_interface.setPageSizeHint(10, a_host_session) is None
+        )
+
+
 @pytest.fixture
 def an_unimplemented_entity_ref_pager_interface():
     return EntityReferencePagerInterface()
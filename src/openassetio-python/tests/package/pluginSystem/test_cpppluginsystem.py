@@ -23,6 +23,7 @@ These tests check the functionality of the CppPluginSystem class.
 import os
 import pathlib
 import re
+import threading
 
 import pytest
 
@@ -443,6 +444,148 @@ class Test_CppPluginSystem_scan:
         )
 
 
+class Test_CppPluginSystem_scanThreadCount:
+    def test_when_not_set_then_one(self, a_plugin_system, monkeypatch):
+        monkeypatch.delenv(CppPluginSystem.kScanThreadCountEnvVar, raising=False)
+
+        assert a_plugin_system.scanThreadCount() == 1
+
+    def test_when_env_var_set_then_returns_env_var_value(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(CppPluginSystem.kScanThreadCountEnvVar, "8")
+
+        assert a_plugin_system.scanThreadCount() == 8
+
+    def test_when_env_var_malformed_then_one(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(CppPluginSystem.kScanThreadCountEnvVar, "lots")
+
+        assert a_plugin_system.scanThreadCount() == 1
+
+    def test_when_set_then_overrides_env_var(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(CppPluginSystem.kScanThreadCountEnvVar, "8")
+
+        a_plugin_system.setScanThreadCount(0)
+
+        assert a_plugin_system.scanThreadCount() == 0
+
+
+class Test_CppPluginSystem_scan_in_parallel:
+    @pytest.mark.parametrize("thread_count", [0, 2, 16])
+    def test_when_many_paths_then_same_plugins_as_serial_scan(
+        self,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        the_cpp_plugins_root_path,
+        mock_logger,
+        thread_count,
+    ):
+        paths = os.pathsep.join(
+            os.path.join(the_cpp_plugins_root_path, subdir)
+            for subdir in ("broken", "pathC", "pathA", "pathB", "managerA", "managerB")
+        )
+        serial_plugin_system = CppPluginSystem(mock_logger)
+        serial_plugin_system.setScanThreadCount(1)
+        serial_plugin_system.scan(
+            paths, a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+        parallel_plugin_system = CppPluginSystem(mock_logger)
+        parallel_plugin_system.setScanThreadCount(thread_count)
+
+        parallel_plugin_system.scan(
+            paths, a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        identifiers = serial_plugin_system.identifiers()
+        assert len(identifiers) == 2
+        assert sorted(parallel_plugin_system.identifiers()) == sorted(identifiers)
+        for identifier in identifiers:
+            assert (
+                parallel_plugin_system.plugin(identifier)[0]
+                == serial_plugin_system.plugin(identifier)[0]
+            )
+
+    @pytest.mark.parametrize("subdirs", [("pathA", "pathC"), ("pathC", "pathA")])
+    def test_when_multiple_plugins_share_identifiers_then_leftmost_is_used(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        the_cpp_plugins_root_path,
+        plugin_a_identifier,
+        mock_logger,
+        subdirs,
+    ):
+        resources_path = pathlib.Path(the_cpp_plugins_root_path)
+        first_lib, second_lib = (
+            resources_path / subdir / f"{subdir}.{lib_ext}" for subdir in subdirs
+        )
+        a_plugin_system.setScanThreadCount(2)
+
+        a_plugin_system.scan(
+            os.pathsep.join(str(resources_path / subdir) for subdir in subdirs),
+            a_plugin_path_env_var,
+            the_manager_plugin_module_hook,
+            noop,
+        )
+
+        path, _ = a_plugin_system.plugin(plugin_a_identifier)
+        assert path == first_lib
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            f"CppPluginSystem: Skipping '{plugin_a_identifier}' defined in '{second_lib}'."
+            f" Already registered by '{first_lib}'",
+        )
+
+    def test_when_scanned_then_validation_callback_called_on_calling_thread(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        the_cpp_plugins_root_path,
+    ):
+        paths = os.pathsep.join(
+            os.path.join(the_cpp_plugins_root_path, subdir) for subdir in ("pathA", "pathB")
+        )
+        validator_thread_idents = []
+
+        def validator(_):
+            validator_thread_idents.append(threading.get_ident())
+
+        a_plugin_system.setScanThreadCount(2)
+        a_plugin_system.scan(
+            paths, a_plugin_path_env_var, the_manager_plugin_module_hook, validator
+        )
+
+        assert validator_thread_idents == [threading.get_ident()] * 2
+
+
+class Test_CppPluginSystem_scan_timing:
+    @pytest.mark.parametrize("thread_count", [1, 2])
+    def test_when_scanned_then_timing_breakdown_logged(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_cpp_plugin_path,
+        mock_logger,
+        thread_count,
+    ):
+        a_plugin_system.setScanThreadCount(thread_count)
+
+        a_plugin_system.scan(
+            a_cpp_plugin_path, a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        timing_pattern = re.compile(
+            r"CppPluginSystem: Scanned 1 candidate\(s\) from 1 search path\(s\) for"
+            rf" '{the_manager_plugin_module_hook}' in [0-9.]+s \(index: [0-9.]+s, listing:"
+            r" [0-9.]+s, probing: [0-9.]+s using 1 thread\(s\), registration: [0-9.]+s\)"
+        )
+        assert any(
+            severity == mock_logger.Severity.kDebug and timing_pattern.fullmatch(message)
+            for (severity, message), _ in mock_logger.mock.log.call_args_list
+        )
+
+
 class Test_CppPluginSystem_reset:
     def test_when_reset_then_identifiers_empty(
         self,
@@ -0,0 +1,638 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+These tests check the CppPluginSystem features that reduce and measure
+the cost of scanning for plugins at startup, i.e. the persistent
+discovery index, lazy loading of indexed plugins, and startup profiling.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+import pathlib
+import re
+import shutil
+
+import pytest
+
+from openassetio import errors
+from openassetio.pluginSystem import CppPluginSystem
+from openassetio.utils import StartupProfile
+
+lib_ext = "so" if os.name == "posix" else "dll"
+
+
+class Test_CppPluginSystem_discoveryIndexPath:
+    def test_when_not_set_then_empty(self, a_plugin_system, monkeypatch):
+        monkeypatch.delenv(CppPluginSystem.kDiscoveryIndexEnvVar, raising=False)
+
+        assert a_plugin_system.discoveryIndexPath() == pathlib.Path()
+
+    def test_when_env_var_set_then_returns_env_var_path(
+        self, a_plugin_system, tmp_path, monkeypatch
+    ):
+        index_path = tmp_path / "index"
+        monkeypatch.setenv(CppPluginSystem.kDiscoveryIndexEnvVar, str(index_path))
+
+        assert a_plugin_system.discoveryIndexPath() == index_path
+
+    def test_when_set_then_overrides_env_var(self, a_plugin_system, tmp_path, monkeypatch):
+        index_path = tmp_path / "index"
+        monkeypatch.setenv(CppPluginSystem.kDiscoveryIndexEnvVar, str(tmp_path / "other"))
+
+        a_plugin_system.setDiscoveryIndexPath(index_path)
+
+        assert a_plugin_system.discoveryIndexPath() == index_path
+
+
+class Test_CppPluginSystem_scan_with_discovery_index:
+    def test_when_scanned_then_index_records_libraries(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, nonplugin_lib = a_plugin_dir_with_plugin_and_nonplugin
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_plugin_system.identifiers() == [plugin_a_identifier]
+        index_lines = an_index_path.read_text().splitlines()
+        assert index_lines[0] == kIndexHeader
+        assert sorted(index_lines[1:]) == sorted(
+            [
+                index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier),
+                index_line(nonplugin_lib, the_manager_plugin_module_hook, ""),
+            ]
+        )
+
+    def test_when_validator_fails_then_index_records_failure(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent),
+            a_plugin_path_env_var,
+            the_manager_plugin_module_hook,
+            lambda _: "Some reason.",
+        )
+
+        assert a_plugin_system.identifiers() == []
+        assert (
+            index_line(
+                plugin_lib,
+                the_manager_plugin_module_hook,
+                plugin_a_identifier,
+                failed_validation=True,
+            )
+            in an_index_path.read_text().splitlines()
+        )
+
+    def test_when_env_var_set_then_index_used(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        monkeypatch,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        monkeypatch.setenv(CppPluginSystem.kDiscoveryIndexEnvVar, str(an_index_path))
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert an_index_path.is_file()
+
+    def test_when_indexed_as_not_a_plugin_then_library_not_loaded(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        mock_logger,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        # Claim that the real plugin does not expose the hook, so we can
+        # tell if the index is trusted.
+        write_index(an_index_path, index_line(plugin_lib, the_manager_plugin_module_hook, ""))
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_plugin_system.identifiers() == []
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kDebug,
+            "CppPluginSystem: Ignoring as discovery index records no top-level"
+            f" '{the_manager_plugin_module_hook}' function in '{plugin_lib}'",
+        )
+
+    def test_when_indexed_identifier_already_registered_then_library_not_loaded(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        the_cpp_plugins_root_path,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+        mock_logger,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        other_dir = os.path.join(the_cpp_plugins_root_path, "pathB")
+        other_lib = os.path.join(other_dir, f"pathB.{lib_ext}")
+        # Claim that pathB's plugin has the same identifier as pathA's.
+        write_index(
+            an_index_path,
+            index_line(
+                pathlib.Path(other_lib), the_manager_plugin_module_hook, plugin_a_identifier
+            ),
+        )
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            os.pathsep.join((str(plugin_lib.parent), other_dir)),
+            a_plugin_path_env_var,
+            the_manager_plugin_module_hook,
+            noop,
+        )
+
+        assert a_plugin_system.identifiers() == [plugin_a_identifier]
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            f"CppPluginSystem: Skipping '{plugin_a_identifier}' defined in '{other_lib}'."
+            f" Already registered by '{plugin_lib}'",
+        )
+
+    def test_when_indexed_library_modified_then_library_reloaded_and_index_updated(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        write_index(an_index_path, index_line(plugin_lib, the_manager_plugin_module_hook, ""))
+        stat = plugin_lib.stat()
+        os.utime(plugin_lib, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_plugin_system.identifiers() == [plugin_a_identifier]
+        assert (
+            index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier)
+            in an_index_path.read_text().splitlines()
+        )
+
+    def test_when_indexed_library_removed_then_entry_removed(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+    ):
+        plugin_lib, nonplugin_lib = a_plugin_dir_with_plugin_and_nonplugin
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+        nonplugin_lib.unlink()
+
+        a_plugin_system.reset()
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert str(nonplugin_lib) not in an_index_path.read_text()
+        assert str(plugin_lib) in an_index_path.read_text()
+
+    def test_when_index_for_other_hook_exists_then_both_hooks_retained(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+        a_plugin_system.scan(str(plugin_lib.parent), a_plugin_path_env_var, "otherHook", noop)
+
+        assert (
+            index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier)
+            + "\totherHook="
+        ) in an_index_path.read_text().splitlines()
+
+    def test_when_index_unrecognised_then_ignored_and_replaced(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        an_index_path.write_text("some unrecognised content\n")
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_plugin_system.identifiers() == [plugin_a_identifier]
+        assert an_index_path.read_text().splitlines()[0] == kIndexHeader
+
+
+class Test_CppPluginSystem_lazyLoading:
+    def test_when_not_set_then_false(self, a_plugin_system, monkeypatch):
+        monkeypatch.delenv(CppPluginSystem.kLazyLoadingEnvVar, raising=False)
+
+        assert a_plugin_system.lazyLoading() is False
+
+    @pytest.mark.parametrize("value,expected", [("1", True), ("0", False), ("", False)])
+    def test_when_env_var_set_then_returns_env_var_value(
+        self, a_plugin_system, monkeypatch, value, expected
+    ):
+        monkeypatch.setenv(CppPluginSystem.kLazyLoadingEnvVar, value)
+
+        assert a_plugin_system.lazyLoading() is expected
+
+    def test_when_set_then_overrides_env_var(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(CppPluginSystem.kLazyLoadingEnvVar, "1")
+
+        a_plugin_system.setLazyLoading(False)
+
+        assert a_plugin_system.lazyLoading() is False
+
+
+class Test_CppPluginSystem_scan_with_lazy_loading:
+    def test_when_library_indexed_then_library_not_loaded_until_plugin_requested(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+        mock_logger,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        write_index(
+            an_index_path,
+            index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier),
+        )
+
+        a_lazy_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_lazy_plugin_system.identifiers() == [plugin_a_identifier]
+        assert not is_library_loaded(plugin_lib)
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kDebug,
+            f"CppPluginSystem: Deferring loading of '{plugin_a_identifier}' from '{plugin_lib}'",
+        )
+
+        path, plugin = a_lazy_plugin_system.plugin(plugin_a_identifier)
+
+        assert path == plugin_lib
+        assert plugin.identifier() == plugin_a_identifier
+        assert is_library_loaded(plugin_lib)
+
+    def test_when_library_not_indexed_then_library_loaded_during_scan(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+
+        a_lazy_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_lazy_plugin_system.identifiers() == [plugin_a_identifier]
+        assert is_library_loaded(plugin_lib)
+
+    def test_when_indexed_as_failing_validation_then_not_registered_and_not_loaded(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+        mock_logger,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        write_index(
+            an_index_path,
+            index_line(
+                plugin_lib,
+                the_manager_plugin_module_hook,
+                plugin_a_identifier,
+                failed_validation=True,
+            ),
+        )
+
+        a_lazy_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_lazy_plugin_system.identifiers() == []
+        assert not is_library_loaded(plugin_lib)
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            f"CppPluginSystem: Skipping '{plugin_a_identifier}' defined in '{plugin_lib}'."
+            " Discovery index records that it failed validation",
+        )
+
+    def test_when_indexed_as_failing_validation_then_later_plugin_with_same_identifier_used(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        the_cpp_plugins_root_path,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+        tmp_path,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        # A second library providing the same identifier, later in the
+        # search path.
+        other_plugin_dir = tmp_path / "otherPlugins"
+        other_plugin_dir.mkdir()
+        other_plugin_lib = other_plugin_dir / f"pathC.{lib_ext}"
+        shutil.copyfile(
+            pathlib.Path(the_cpp_plugins_root_path) / "pathC" / f"pathC.{lib_ext}",
+            other_plugin_lib,
+        )
+        write_index(
+            an_index_path,
+            index_line(
+                plugin_lib,
+                the_manager_plugin_module_hook,
+                plugin_a_identifier,
+                failed_validation=True,
+            ),
+            index_line(other_plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier),
+        )
+
+        a_lazy_plugin_system.scan(
+            os.pathsep.join((str(plugin_lib.parent), str(other_plugin_dir))),
+            a_plugin_path_env_var,
+            the_manager_plugin_module_hook,
+            noop,
+        )
+
+        assert a_lazy_plugin_system.identifiers() == [plugin_a_identifier]
+        path, _ = a_lazy_plugin_system.plugin(plugin_a_identifier)
+        assert path == other_plugin_lib
+        assert not is_library_loaded(plugin_lib)
+
+    def test_when_deferred_plugin_fails_validation_then_plugin_raises(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        write_index(
+            an_index_path,
+            index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier),
+        )
+        a_lazy_plugin_system.scan(
+            str(plugin_lib.parent),
+            a_plugin_path_env_var,
+            the_manager_plugin_module_hook,
+            lambda _: "Some reason.",
+        )
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match=re.escape(
+                f"CppPluginSystem: Failed to load plug-in '{plugin_a_identifier}' from"
+                f" '{plugin_lib}'. Some reason."
+            ),
+        ):
+            a_lazy_plugin_system.plugin(plugin_a_identifier)
+
+    def test_when_deferred_library_provides_different_identifier_then_plugin_raises(
+        self,
+        a_lazy_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, _ = a_plugin_dir_with_plugin_and_nonplugin
+        write_index(
+            an_index_path,
+            index_line(plugin_lib, the_manager_plugin_module_hook, "some.other.identifier"),
+        )
+        a_lazy_plugin_system.scan(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match=re.escape(
+                "CppPluginSystem: Failed to load plug-in 'some.other.identifier' from"
+                f" '{plugin_lib}'. Library now provides '{plugin_a_identifier}'"
+            ),
+        ):
+            a_lazy_plugin_system.plugin("some.other.identifier")
+
+
+class Test_CppPluginSystem_rebuildDiscoveryIndex:
+    def test_when_index_incorrect_then_libraries_reloaded_and_index_replaced(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_plugin_dir_with_plugin_and_nonplugin,
+        an_index_path,
+        plugin_a_identifier,
+    ):
+        plugin_lib, nonplugin_lib = a_plugin_dir_with_plugin_and_nonplugin
+        # An entry with a matching stamp, but incorrect content, can
+        # only be fixed by a rebuild.
+        write_index(
+            an_index_path,
+            index_line(plugin_lib, the_manager_plugin_module_hook, ""),
+            "0\t0\t0\t/some/other/lib.so\tsomeHook=some.identifier",
+        )
+        a_plugin_system.setDiscoveryIndexPath(an_index_path)
+
+        a_plugin_system.rebuildDiscoveryIndex(
+            str(plugin_lib.parent), a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        assert a_plugin_system.identifiers() == [plugin_a_identifier]
+        assert sorted(an_index_path.read_text().splitlines()[1:]) == sorted(
+            [
+                index_line(plugin_lib, the_manager_plugin_module_hook, plugin_a_identifier),
+                index_line(nonplugin_lib, the_manager_plugin_module_hook, ""),
+            ]
+        )
+
+
+class Test_CppPluginSystem_scan_startup_profile:
+    @pytest.mark.usefixtures("startup_profile_enabled")
+    def test_when_profiling_enabled_then_scan_and_library_loads_recorded(
+        self,
+        a_plugin_system,
+        a_plugin_path_env_var,
+        the_manager_plugin_module_hook,
+        a_cpp_plugin_path,
+    ):
+        a_plugin_system.setScanThreadCount(1)
+
+        a_plugin_system.scan(
+            a_cpp_plugin_path, a_plugin_path_env_var, the_manager_plugin_module_hook, noop
+        )
+
+        *loads, scan = StartupProfile.events()
+        assert (scan.name, scan.detail, scan.depth) == (
+            "CppPluginSystem.scan",
+            a_cpp_plugin_path,
+            0,
+        )
+        assert loads
+        assert all(
+            (load.name, load.depth) == ("CppPluginSystem.load", 1)
+            and load.detail.startswith(a_cpp_plugin_path)
+            for load in loads
+        )
+
+
+@pytest.fixture
+def a_plugin_system(mock_logger):
+    return CppPluginSystem(mock_logger)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_if_no_test_plugins_available(the_cpp_plugins_root_path):
+    """
+    Skip tests in this module if there are no plugins to test against.
+
+    See the equivalent fixture in test_cpppluginsystem.py.
+    """
+    if (
+        not os.path.isdir(the_cpp_plugins_root_path)
+        and os.environ.get("OPENASSETIO_TEST_CPP_PLUGINS_SUBDIR") is None
+    ):
+        pytest.skip("Skipping C++ plugin system tests as no test plugins are available")
+
+
+def noop(_):
+    return None
+
+
+kIndexHeader = "openassetio-cpp-plugin-index\t2"
+
+
+def index_line(lib_path, hook, identifier, failed_validation=False):
+    stat = lib_path.stat()
+    sep = "!" if failed_validation else "="
+    return (
+        f"{stat.st_size}\t{stat.st_mtime_ns}\t{stat.st_ino}\t{lib_path}\t{hook}{sep}{identifier}"
+    )
+
+
+def write_index(index_path, *lines):
+    index_path.write_text("\n".join((kIndexHeader, *lines)) + "\n")
+
+
+def is_library_loaded(lib_path):
+    with open("/proc/self/maps", encoding="utf-8") as maps:
+        return str(lib_path) in maps.read()
+
+
+@pytest.fixture
+def a_lazy_plugin_system(a_plugin_system, an_index_path):
+    if not os.path.exists("/proc/self/maps"):
+        pytest.skip("Checking for loaded libraries requires /proc/self/maps")
+    a_plugin_system.setDiscoveryIndexPath(an_index_path)
+    a_plugin_system.setLazyLoading(True)
+    return a_plugin_system
+
+
+@pytest.fixture
+def an_index_path(tmp_path):
+    return tmp_path / "plugin-index"
+
+
+@pytest.fixture
+def a_plugin_dir_with_plugin_and_nonplugin(the_cpp_plugins_root_path, tmp_path):
+    """
+    Copies of a plugin library and a non-plugin library in a temporary
+    directory, so they can be modified.
+    """
+    if os.name != "posix":
+        pytest.skip("Discovery index stamps use inodes, only available on POSIX")
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    root_path = pathlib.Path(the_cpp_plugins_root_path)
+    plugin_lib = plugin_dir / f"pathA.{lib_ext}"
+    nonplugin_lib = plugin_dir / f"nonplugin.{lib_ext}"
+    shutil.copyfile(root_path / "pathA" / f"pathA.{lib_ext}", plugin_lib)
+    shutil.copyfile(root_path / "broken" / f"nonplugin.{lib_ext}", nonplugin_lib)
+    return plugin_lib, nonplugin_lib
+
+
+@pytest.fixture
+def a_plugin_path_env_var():
+    return "test_CppPluginSystem_path"
@@ -23,6 +23,7 @@ ManagerImplementationFactoryInterface implementation.
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=use-implicit-booleaness-not-comparison
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import re
 
@@ -85,6 +86,24 @@ class Test_CppPluginSystemManagerImplementationFactory_lazy_scanning:
         )
         assert factory.identifiers() == []
 
+    def test_when_called_concurrently_then_scans_once(
+        self, a_cpp_manager_plugin_path, plugin_a_identifier, mock_logger
+    ):
+        factory = CppPluginSystemManagerImplementationFactory(
+            a_cpp_manager_plugin_path, mock_logger
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_identifiers = list(executor.map(lambda _: factory.identifiers(), range(8)))
+
+        assert all_identifiers == [[plugin_a_identifier]] * 8
+        registered_logs = [
+            call
+            for call in mock_logger.mock.log.call_args_list
+            if call.args[1].startswith("CppPluginSystem: Registered plug-in")
+        ]
+        assert len(registered_logs) == 1
+
 
 class Test_CppPluginSystemManagerImplementationFactory_identifiers:
     def test_when_non_manager_plugin_then_logs_warning(
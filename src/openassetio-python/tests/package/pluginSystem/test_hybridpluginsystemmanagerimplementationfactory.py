@@ -19,11 +19,17 @@ HybridPluginSystemManagerImplementationFactory implementation.
 
 import inspect
 import itertools
+import os
+import shutil
+import textwrap
+import threading
+import time
 from unittest import mock
 
 import pytest
-from openassetio import errors, access, Context, EntityReference
+from openassetio import errors, access, constants, Context, EntityReference
 from openassetio.trait import TraitsData
+from openassetio.utils import StartupProfile
 
 # pylint: disable=unused-argument,too-many-lines,too-many-locals
 # pylint: disable=invalid-name,redefined-outer-name,
@@ -31,13 +37,18 @@ from openassetio.trait import TraitsData
 # pylint: disable=too-many-public-methods
 
 
-from openassetio.hostApi import ManagerImplementationFactoryInterface
+from openassetio.hostApi import Manager, ManagerImplementationFactoryInterface
+from openassetio.log import ConsoleLogger, SeverityFilter
 from openassetio.managerApi import (
     ManagerInterface,
     ManagerStateBase,
     EntityReferencePagerInterface,
 )
-from openassetio.pluginSystem import HybridPluginSystemManagerImplementationFactory
+from openassetio.pluginSystem import (
+    CppPluginSystemManagerImplementationFactory,
+    HybridPluginSystemManagerImplementationFactory,
+    PythonPluginSystemManagerImplementationFactory,
+)
 
 
 class Test_HybridPluginSystemManagerImplementationFactory_init:
@@ -70,6 +81,86 @@ class Test_HybridPluginSystemManagerImplementationFactory_identifiers:
         )
         assert factory.identifiers() == ["a", "b", "c", "d"]
 
+    def test_when_concurrent_scan_disabled_then_child_factories_queried_on_calling_thread(
+        self, mock_logger, factory_a, factory_b, monkeypatch
+    ):
+        monkeypatch.delenv(kConcurrentScanEnvVar, raising=False)
+        query_threads = []
+
+        def record_thread_then_return(identifiers):
+            query_threads.append(threading.get_ident())
+            return identifiers
+
+        factory_a.mock.identifiers.side_effect = lambda: record_thread_then_return(["a"])
+        factory_b.mock.identifiers.side_effect = lambda: record_thread_then_return(["b"])
+
+        factory = HybridPluginSystemManagerImplementationFactory(
+            [factory_a, factory_b], mock_logger
+        )
+
+        assert factory.identifiers() == ["a", "b"]
+        assert query_threads == [threading.get_ident()] * 2
+
+    def test_when_concurrent_scan_enabled_then_child_factories_queried_concurrently(
+        self, mock_logger, factory_a, factory_b
+    ):
+        # Each factory blocks until both are being queried, so this
+        # would time out if factories were queried sequentially.
+        both_querying = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_factory_then_return(identifiers):
+            both_querying.wait()
+            return identifiers
+
+        factory_a.mock.identifiers.side_effect = lambda: wait_for_other_factory_then_return(["a"])
+        factory_b.mock.identifiers.side_effect = lambda: wait_for_other_factory_then_return(["b"])
+
+        factory = HybridPluginSystemManagerImplementationFactory(
+            [factory_a, factory_b], mock_logger
+        )
+        factory.setConcurrentScan(True)
+
+        assert factory.identifiers() == ["a", "b"]
+
+    @pytest.mark.parametrize("concurrentScan", (False, True))
+    def test_when_multiple_children_raise_then_first_childs_exception_propagated(
+        self, mock_logger, factory_a, factory_b, concurrentScan
+    ):
+        factory_a.mock.identifiers.side_effect = RuntimeError("from a")
+        factory_b.mock.identifiers.side_effect = RuntimeError("from b")
+
+        factory = HybridPluginSystemManagerImplementationFactory(
+            [factory_a, factory_b], mock_logger
+        )
+        factory.setConcurrentScan(concurrentScan)
+
+        with pytest.raises(RuntimeError, match="from a"):
+            factory.identifiers()
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_concurrentScan:
+    def test_when_env_var_not_set_then_false(self, hybrid_factory, monkeypatch):
+        monkeypatch.delenv(kConcurrentScanEnvVar, raising=False)
+        assert hybrid_factory.concurrentScan() is False
+
+    @pytest.mark.parametrize("value,expected", (("1", True), ("0", False), ("", False)))
+    def test_when_env_var_set_then_reflects_env_var(
+        self, hybrid_factory, monkeypatch, value, expected
+    ):
+        monkeypatch.setenv(kConcurrentScanEnvVar, value)
+        assert hybrid_factory.concurrentScan() is expected
+
+    def test_when_set_then_overrides_env_var(self, hybrid_factory, monkeypatch):
+        monkeypatch.setenv(kConcurrentScanEnvVar, "1")
+        hybrid_factory.setConcurrentScan(False)
+        assert hybrid_factory.concurrentScan() is False
+
+    def test_env_var_name_exposed(self):
+        assert (
+            HybridPluginSystemManagerImplementationFactory.kConcurrentScanEnvVar
+            == kConcurrentScanEnvVar
+        )
+
 
 class Test_HybridPluginSystemManagerImplementationFactory_instantiate:
     def test_when_no_match_from_multiple_child_factories_then_error_raised(
@@ -1539,6 +1630,991 @@ class Test_HybridPluginSystemManagerImplementationFactory_ManagerInterface:
             )
 
 
+@pytest.mark.benchmark
+def test_benchmark_startup_scan_with_cpp_and_python_plugins(
+    tmp_path, the_cpp_plugins_root_path, capsys
+):
+    pluginCount = 100
+    # Use a native logger, as a real host likely would, to avoid the
+    # C++ scan contending for the GIL when logging. Filter out the
+    # warnings about (intentionally) duplicate C++ plugin identifiers.
+    logger = SeverityFilter(ConsoleLogger())
+    logger.setSeverity(SeverityFilter.Severity.kError)
+    cppPluginLib = next(
+        entry.path
+        for entry in os.scandir(os.path.join(the_cpp_plugins_root_path, "managerA"))
+        if entry.is_file()
+    )
+    if not os.path.isfile(cppPluginLib):
+        pytest.skip("C++ test plugins not available")
+
+    cppPluginDir = tmp_path / "cpp"
+    pythonPluginDir = tmp_path / "python"
+    cppPluginDir.mkdir()
+    pythonPluginDir.mkdir()
+    _, cppPluginExt = os.path.splitext(cppPluginLib)
+    for idx in range(pluginCount):
+        shutil.copy(cppPluginLib, cppPluginDir / f"managerA{idx}{cppPluginExt}")
+        (pythonPluginDir / f"plugin{idx}.py").write_text(textwrap.dedent(f"""
+                from openassetio.pluginSystem import PythonPluginSystemManagerPlugin
+
+                class Plugin(PythonPluginSystemManagerPlugin):
+                    @classmethod
+                    def identifier(cls):
+                        return "org.openassetio.test.benchmark.plugin{idx}"
+
+                    @classmethod
+                    def interface(cls):
+                        raise NotImplementedError
+
+                openassetioPlugin = Plugin
+                """))
+
+    def makeCppFactory():
+        return CppPluginSystemManagerImplementationFactory(str(cppPluginDir), logger)
+
+    def makePythonFactory():
+        return PythonPluginSystemManagerImplementationFactory(
+            logger, paths=str(pythonPluginDir), disableEntryPointsPlugins=True
+        )
+
+    start = time.perf_counter()
+    makeCppFactory().identifiers()
+    cppDuration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    makePythonFactory().identifiers()
+    pythonDuration = time.perf_counter() - start
+
+    hybridFactory = HybridPluginSystemManagerImplementationFactory(
+        [makeCppFactory(), makePythonFactory()], logger
+    )
+    hybridFactory.setConcurrentScan(True)
+    start = time.perf_counter()
+    identifiers = hybridFactory.identifiers()
+    hybridDuration = time.perf_counter() - start
+
+    assert len(identifiers) == pluginCount + 1
+
+    with capsys.disabled():
+        print(f"\nScan of {pluginCount} C++ and {pluginCount} Python plugins")
+        print(f"  C++ only: {cppDuration:.3f}s")
+        print(f"  Python only: {pythonDuration:.3f}s")
+        print(
+            f"  Hybrid (concurrent scan): {hybridDuration:.3f}s"
+            f" (vs. {cppDuration + pythonDuration:.3f}s sequential)"
+        )
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_instantiate_startup_profile:
+    def test_when_profiling_enabled_then_instantiate_recorded(
+        self, hybrid_factory, the_plugin_identifier, startup_profile_enabled
+    ):
+        hybrid_factory.instantiate(the_plugin_identifier)
+
+        assert [(event.name, event.detail) for event in StartupProfile.events()] == [
+            (
+                "HybridPluginSystemManagerImplementationFactory.instantiate",
+                the_plugin_identifier,
+            )
+        ]
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_entityReferenceRouting:
+    def test_when_env_var_not_set_then_false(self, hybrid_factory, monkeypatch):
+        monkeypatch.delenv(kRoutingEnvVar, raising=False)
+        assert hybrid_factory.entityReferenceRouting() is False
+
+    @pytest.mark.parametrize("value,expected", [("1", True), ("0", False), ("", False)])
+    def test_when_env_var_set_then_reflects_env_var(
+        self, hybrid_factory, monkeypatch, value, expected
+    ):
+        monkeypatch.setenv(kRoutingEnvVar, value)
+        assert hybrid_factory.entityReferenceRouting() is expected
+
+    def test_when_set_then_overrides_env_var(self, hybrid_factory, monkeypatch):
+        monkeypatch.setenv(kRoutingEnvVar, "1")
+        hybrid_factory.setEntityReferenceRouting(False)
+        assert hybrid_factory.entityReferenceRouting() is False
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_ManagerInterface_routing:
+    def test_when_routing_disabled_then_whole_batch_to_first_capable_child(
+        self,
+        hybrid_factory,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+        monkeypatch,
+    ):
+        monkeypatch.delenv(kRoutingEnvVar, raising=False)
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        hybrid = hybrid_factory.instantiate(the_plugin_identifier)
+        hybrid.initialize({}, a_host_session)
+        refs = [EntityReference("a://1"), EntityReference("b://2")]
+
+        hybrid.resolve(
+            refs, {"t"}, access.ResolveAccess.kRead, a_context, a_host_session, noop, noop
+        )
+
+        assert manager_interface_a.mock.resolve.call_args[0][0] == refs
+        manager_interface_b.mock.resolve.assert_not_called()
+
+    def test_when_elements_claimed_by_different_children_then_sub_batches_routed_and_remapped(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        manager_interface_a.mock.resolve.side_effect = succeed_with_ref_as_trait
+        manager_interface_b.mock.resolve.side_effect = fail_with_ref_as_message
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference(ref) for ref in ("a://1", "b://2", "a://3", "b://4")]
+        successes = {}
+        errors_ = {}
+
+        a_routing_hybrid_manager_interface.resolve(
+            refs,
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            lambda idx, data: successes.update({idx: data.getTraitProperty("t", "ref")}),
+            lambda idx, error: errors_.update({idx: error.message}),
+        )
+
+        assert manager_interface_a.mock.resolve.call_args[0][0] == [refs[0], refs[2]]
+        assert manager_interface_b.mock.resolve.call_args[0][0] == [refs[1], refs[3]]
+        assert successes == {0: "a://1", 2: "a://3"}
+        assert errors_ == {1: "b://2", 3: "b://4"}
+
+    def test_when_all_elements_claimed_by_first_child_then_batch_passed_through(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("a://1"), EntityReference("a://2")]
+
+        a_routing_hybrid_manager_interface.entityExists(
+            refs, a_context, a_host_session, noop, noop
+        )
+
+        manager_interface_a.mock.entityExists.assert_called_once_with(
+            refs, a_context, a_host_session, mock.ANY, mock.ANY
+        )
+        manager_interface_b.mock.entityExists.assert_not_called()
+
+    def test_when_no_child_claims_element_then_routed_to_first_capable_child(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("b://1"), EntityReference("c://2")]
+
+        a_routing_hybrid_manager_interface.entityExists(
+            refs, a_context, a_host_session, noop, noop
+        )
+
+        assert manager_interface_a.mock.entityExists.call_args[0][0] == [refs[1]]
+        assert manager_interface_b.mock.entityExists.call_args[0][0] == [refs[0]]
+
+    def test_when_child_lacks_capability_then_not_routed_to(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(
+            manager_interface_a,
+            manager_interface_b,
+            capabilities_b={ManagerInterface.Capability.kEntityReferenceIdentification},
+        )
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("a://1"), EntityReference("b://2")]
+
+        a_routing_hybrid_manager_interface.resolve(
+            refs, {"t"}, access.ResolveAccess.kRead, a_context, a_host_session, noop, noop
+        )
+
+        assert manager_interface_a.mock.resolve.call_args[0][0] == refs
+        manager_interface_b.mock.resolve.assert_not_called()
+
+    def test_when_preflight_routed_then_parallel_arguments_partitioned(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("b://1"), EntityReference("a://2")]
+        hints = [TraitsData({"b"}), TraitsData({"a"})]
+
+        a_routing_hybrid_manager_interface.preflight(
+            refs,
+            hints,
+            access.PublishingAccess.kWrite,
+            a_context,
+            a_host_session,
+            noop,
+            noop,
+        )
+
+        assert manager_interface_a.mock.preflight.call_args[0][:2] == ([refs[1]], [hints[1]])
+        assert manager_interface_b.mock.preflight.call_args[0][:2] == ([refs[0]], [hints[0]])
+
+    def test_when_routed_then_sub_batches_dispatched_concurrently(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        # Each child waits for the other, so this would time out if the
+        # sub-batches were dispatched sequentially.
+        barrier = threading.Barrier(2, timeout=5)
+        manager_interface_a.mock.resolve.side_effect = lambda *_: barrier.wait()
+        manager_interface_b.mock.resolve.side_effect = lambda *_: barrier.wait()
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("a://1"), EntityReference("b://2")]
+
+        a_routing_hybrid_manager_interface.resolve(
+            refs, {"t"}, access.ResolveAccess.kRead, a_context, a_host_session, noop, noop
+        )
+
+    def test_when_routed_child_raises_then_exception_propagated(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        manager_interface_b.mock.resolve.side_effect = errors.InputValidationException("b failed")
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference("a://1"), EntityReference("b://2")]
+
+        with pytest.raises(errors.InputValidationException, match="b failed"):
+            a_routing_hybrid_manager_interface.resolve(
+                refs, {"t"}, access.ResolveAccess.kRead, a_context, a_host_session, noop, noop
+            )
+
+    def test_when_cpp_and_python_children_then_host_callbacks_called_on_calling_thread(
+        self, the_cpp_plugins_root_path, manager_interface_b, mock_logger, a_host_session
+    ):
+        # C++ child claiming `cpp://` references via its info prefix.
+        identifier = "org.openassetio.test.pluginSystem.resources.prefixResolving"
+        cppFactory = CppPluginSystemManagerImplementationFactory(
+            os.path.join(the_cpp_plugins_root_path, "prefixResolving"), mock_logger
+        )
+        # Python child claiming `py://` references.
+        pythonFactory = MockManagerImplementationFactory(mock_logger)
+        pythonFactory.mock.identifiers.return_value = [identifier]
+        pythonFactory.mock.instantiate.return_value = manager_interface_b
+        manager_interface_b.mock.hasCapability.return_value = True
+        manager_interface_b.mock.isEntityReferenceString.side_effect = (
+            lambda string, _host_session: string.startswith("py://")
+        )
+        manager_interface_b.mock.resolve.side_effect = succeed_with_ref_as_trait
+
+        hybridFactory = HybridPluginSystemManagerImplementationFactory(
+            [cppFactory, pythonFactory], mock_logger
+        )
+        hybridFactory.setEntityReferenceRouting(True)
+        manager = Manager(hybridFactory.instantiate(identifier), a_host_session)
+        manager.initialize({})
+
+        # Interleave references for each child, with enough elements
+        # for the children's sub-batches to overlap.
+        refs = [
+            EntityReference(f"{prefix}{idx}")
+            for idx in range(500)
+            for prefix in ("cpp://", "py://")
+        ]
+        successes = {}
+        errors_ = {}
+        callbackThreads = set()
+
+        def successCallback(idx, data):
+            callbackThreads.add(threading.get_ident())
+            successes[idx] = data.getTraitProperty("t", "ref")
+
+        def errorCallback(idx, error):
+            callbackThreads.add(threading.get_ident())
+            errors_[idx] = error
+
+        manager.resolve(
+            refs,
+            {"t"},
+            access.ResolveAccess.kRead,
+            Context(),
+            successCallback,
+            errorCallback,
+        )
+
+        assert not errors_
+        assert successes == {idx: ref.toString() for idx, ref in enumerate(refs)}
+        assert callbackThreads == {threading.get_ident()}
+
+    def test_when_children_have_different_prefixes_then_info_omits_prefix(
+        self, a_routing_hybrid_manager_interface, manager_interface_a, manager_interface_b
+    ):
+        manager_interface_a.mock.info.return_value = {
+            constants.kInfoKey_EntityReferencesMatchPrefix: "a://",
+            "a": 1,
+        }
+        manager_interface_b.mock.info.return_value = {"b": 2}
+
+        assert a_routing_hybrid_manager_interface.info() == {"a": 1, "b": 2}
+
+    def test_when_children_have_same_prefix_then_info_retains_prefix(
+        self, a_routing_hybrid_manager_interface, manager_interface_a, manager_interface_b
+    ):
+        info = {constants.kInfoKey_EntityReferencesMatchPrefix: "a://"}
+        manager_interface_a.mock.info.return_value = info
+        manager_interface_b.mock.info.return_value = info
+
+        assert a_routing_hybrid_manager_interface.info() == info
+
+    def test_when_any_child_claims_string_then_isEntityReferenceString_true(
+        self,
+        a_routing_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_host_session,
+    ):
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        a_routing_hybrid_manager_interface.initialize({}, a_host_session)
+
+        assert a_routing_hybrid_manager_interface.isEntityReferenceString("a://1", a_host_session)
+        assert a_routing_hybrid_manager_interface.isEntityReferenceString("b://1", a_host_session)
+        assert not a_routing_hybrid_manager_interface.isEntityReferenceString(
+            "c://1", a_host_session
+        )
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_fallbackErrorCodes:
+    def test_when_env_var_not_set_then_empty(self, hybrid_factory, monkeypatch):
+        monkeypatch.delenv(kFallbackEnvVar, raising=False)
+        assert hybrid_factory.fallbackErrorCodes() == []
+
+    def test_when_env_var_set_then_reflects_env_var(self, hybrid_factory, monkeypatch):
+        monkeypatch.setenv(kFallbackEnvVar, "kInvalidTraitSet,kAuthError")
+        assert hybrid_factory.fallbackErrorCodes() == [
+            kErrorCode.kInvalidTraitSet,
+            kErrorCode.kAuthError,
+        ]
+
+    def test_when_env_var_has_unrecognised_name_then_warning_logged_and_name_ignored(
+        self, hybrid_factory, mock_logger, monkeypatch
+    ):
+        monkeypatch.setenv(kFallbackEnvVar, "kInvalidTraitSet,kNotAnErrorCode")
+
+        assert hybrid_factory.fallbackErrorCodes() == [kErrorCode.kInvalidTraitSet]
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            "HybridPluginSystem: Ignoring unrecognised error code 'kNotAnErrorCode' in"
+            f" {kFallbackEnvVar}",
+        )
+
+    def test_when_set_then_overrides_env_var(self, hybrid_factory, monkeypatch):
+        monkeypatch.setenv(kFallbackEnvVar, "kInvalidTraitSet")
+        hybrid_factory.setFallbackErrorCodes([])
+        assert hybrid_factory.fallbackErrorCodes() == []
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_ManagerInterface_fallback:
+    def test_when_fallback_disabled_then_errors_passed_to_host(
+        self,
+        hybrid_factory,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+        monkeypatch,
+    ):
+        monkeypatch.delenv(kFallbackEnvVar, raising=False)
+        manager_interface_a.mock.resolve.side_effect = resolve_failing(
+            {"x://1": kErrorCode.kInvalidTraitSet}
+        )
+        hybrid = hybrid_factory.instantiate(the_plugin_identifier)
+        hybrid.initialize({}, a_host_session)
+        errors_ = {}
+
+        hybrid.resolve(
+            [EntityReference("x://1")],
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            noop,
+            lambda idx, error: errors_.update({idx: error.code}),
+        )
+
+        assert errors_ == {0: kErrorCode.kInvalidTraitSet}
+        manager_interface_b.mock.resolve.assert_not_called()
+
+    def test_when_elements_fail_with_fallback_code_then_retried_as_reduced_batch_on_next_child(
+        self,
+        a_fallback_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        manager_interface_a.mock.resolve.side_effect = resolve_failing(
+            {
+                "x://1": kErrorCode.kInvalidTraitSet,
+                "x://2": kErrorCode.kEntityResolutionError,
+                "x://3": kErrorCode.kInvalidTraitSet,
+            }
+        )
+        manager_interface_b.mock.resolve.side_effect = resolve_failing({})
+        a_fallback_hybrid_manager_interface.initialize({}, a_host_session)
+        refs = [EntityReference(f"x://{idx}") for idx in range(4)]
+        successes = {}
+        errors_ = {}
+
+        a_fallback_hybrid_manager_interface.resolve(
+            refs,
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            lambda idx, data: successes.update({idx: data.getTraitProperty("t", "ref")}),
+            lambda idx, error: errors_.update({idx: error.code}),
+        )
+
+        assert manager_interface_a.mock.resolve.call_args[0][0] == refs
+        assert manager_interface_b.mock.resolve.call_args[0][0] == [refs[1], refs[3]]
+        assert successes == {0: "x://0", 1: "x://1", 3: "x://3"}
+        assert errors_ == {2: kErrorCode.kEntityResolutionError}
+
+    def test_when_no_elements_fail_with_fallback_code_then_next_child_not_called(
+        self,
+        a_fallback_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        manager_interface_a.mock.resolve.side_effect = resolve_failing(
+            {"x://1": kErrorCode.kEntityResolutionError}
+        )
+        a_fallback_hybrid_manager_interface.initialize({}, a_host_session)
+
+        a_fallback_hybrid_manager_interface.resolve(
+            [EntityReference("x://0"), EntityReference("x://1")],
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            noop,
+            noop,
+        )
+
+        manager_interface_b.mock.resolve.assert_not_called()
+
+    def test_when_last_child_fails_with_fallback_code_then_error_passed_to_host(
+        self,
+        a_fallback_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        manager_interface_a.mock.entityExists.side_effect = exists_failing("a failed")
+        manager_interface_b.mock.entityExists.side_effect = exists_failing("b failed")
+        a_fallback_hybrid_manager_interface.initialize({}, a_host_session)
+        errors_ = {}
+
+        a_fallback_hybrid_manager_interface.entityExists(
+            [EntityReference("x://0")],
+            a_context,
+            a_host_session,
+            noop,
+            lambda idx, error: errors_.update({idx: error.message}),
+        )
+
+        assert errors_ == {0: "b failed"}
+
+    def test_when_next_child_lacks_capability_then_error_passed_to_host(
+        self,
+        a_fallback_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        manager_interface_a.mock.entityExists.side_effect = exists_failing("a failed")
+        manager_interface_b.mock.hasCapability.side_effect = (
+            lambda cap: cap != ManagerInterface.Capability.kExistenceQueries
+        )
+        a_fallback_hybrid_manager_interface.initialize({}, a_host_session)
+        errors_ = {}
+
+        a_fallback_hybrid_manager_interface.entityExists(
+            [EntityReference("x://0")],
+            a_context,
+            a_host_session,
+            noop,
+            lambda idx, error: errors_.update({idx: error.message}),
+        )
+
+        assert errors_ == {0: "a failed"}
+        manager_interface_b.mock.entityExists.assert_not_called()
+
+    def test_when_default_entity_reference_fails_then_trait_sets_retried_on_next_child(
+        self,
+        a_fallback_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        def fail_second(traitSets, _access, _context, _hostSession, successCb, errorCb):
+            successCb(0, EntityReference("a://0"))
+            errorCb(1, errors.BatchElementError(kErrorCode.kInvalidTraitSet, ""))
+
+        def succeed(traitSets, _access, _context, _hostSession, successCb, _errorCb):
+            successCb(0, EntityReference("b://0"))
+
+        manager_interface_a.mock.defaultEntityReference.side_effect = fail_second
+        manager_interface_b.mock.defaultEntityReference.side_effect = succeed
+        a_fallback_hybrid_manager_interface.initialize({}, a_host_session)
+        successes = {}
+
+        a_fallback_hybrid_manager_interface.defaultEntityReference(
+            [{"a"}, {"b"}],
+            access.DefaultEntityAccess.kRead,
+            a_context,
+            a_host_session,
+            lambda idx, ref: successes.update({idx: ref.toString()}),
+            noop,
+        )
+
+        assert manager_interface_b.mock.defaultEntityReference.call_args[0][0] == [{"b"}]
+        assert successes == {0: "a://0", 1: "b://0"}
+
+    def test_when_routed_then_elements_fall_back_from_routed_child(
+        self,
+        hybrid_factory,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        hybrid_factory.setEntityReferenceRouting(True)
+        hybrid_factory.setFallbackErrorCodes([kErrorCode.kInvalidTraitSet])
+        hybrid = hybrid_factory.instantiate(the_plugin_identifier)
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        manager_interface_a.mock.resolve.side_effect = resolve_failing(
+            {"a://1": kErrorCode.kInvalidTraitSet}
+        )
+        manager_interface_b.mock.resolve.side_effect = resolve_failing({})
+        hybrid.initialize({}, a_host_session)
+        refs = [EntityReference(ref) for ref in ("a://0", "a://1", "b://2")]
+        successes = {}
+
+        hybrid.resolve(
+            refs,
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            lambda idx, data: successes.update({idx: data.getTraitProperty("t", "ref")}),
+            noop,
+        )
+
+        assert [call[0][0] for call in manager_interface_b.mock.resolve.call_args_list] in (
+            [[refs[2]], [refs[1]]],
+            [[refs[1]], [refs[2]]],
+        )
+        assert successes == {0: "a://0", 1: "a://1", 2: "b://2"}
+
+    def test_when_routed_child_on_worker_falls_back_then_host_callbacks_on_calling_thread(
+        self,
+        factory_a,
+        factory_b,
+        manager_interface_a,
+        manager_interface_b,
+        create_mock_manager_interface,
+        mock_logger,
+        the_plugin_identifier,
+        a_context,
+        a_host_session,
+    ):
+        # Third child, claiming no references, to fall back to from
+        # the second child, whose sub-batch is on a worker thread.
+        manager_interface_c = create_mock_manager_interface()
+        factory_c = MockManagerImplementationFactory(mock_logger)
+        factory_c.mock.identifiers.return_value = [the_plugin_identifier]
+        factory_c.mock.instantiate.return_value = manager_interface_c
+        hybridFactory = HybridPluginSystemManagerImplementationFactory(
+            [factory_a, factory_b, factory_c], mock_logger
+        )
+        hybridFactory.setEntityReferenceRouting(True)
+        hybridFactory.setFallbackErrorCodes([kErrorCode.kInvalidTraitSet])
+        hybrid = hybridFactory.instantiate(the_plugin_identifier)
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        manager_interface_c.mock.hasCapability.return_value = True
+        manager_interface_c.mock.isEntityReferenceString.return_value = False
+        manager_interface_a.mock.resolve.side_effect = resolve_failing({})
+        manager_interface_b.mock.resolve.side_effect = resolve_failing(
+            {"b://1": kErrorCode.kInvalidTraitSet, "b://2": kErrorCode.kEntityResolutionError}
+        )
+        manager_interface_c.mock.resolve.side_effect = resolve_failing({})
+        hybrid.initialize({}, a_host_session)
+        refs = [EntityReference(ref) for ref in ("a://0", "b://1", "b://2", "b://3")]
+        successes = {}
+        errors_ = {}
+        callbackThreads = set()
+
+        def successCallback(idx, data):
+            callbackThreads.add(threading.get_ident())
+            successes[idx] = data.getTraitProperty("t", "ref")
+
+        def errorCallback(idx, error):
+            callbackThreads.add(threading.get_ident())
+            errors_[idx] = error.code
+
+        hybrid.resolve(
+            refs,
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            successCallback,
+            errorCallback,
+        )
+
+        assert manager_interface_c.mock.resolve.call_args[0][0] == [refs[1]]
+        assert successes == {0: "a://0", 1: "b://1", 3: "b://3"}
+        assert errors_ == {2: kErrorCode.kEntityResolutionError}
+        assert callbackThreads == {threading.get_ident()}
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_concurrentInitialization:
+    def test_when_env_var_not_set_then_false(self, hybrid_factory, monkeypatch):
+        monkeypatch.delenv(kConcurrentInitializationEnvVar, raising=False)
+        assert hybrid_factory.concurrentInitialization() is False
+
+    @pytest.mark.parametrize("value,expected", (("1", True), ("0", False), ("", False)))
+    def test_when_env_var_set_then_reflects_env_var(
+        self, hybrid_factory, monkeypatch, value, expected
+    ):
+        monkeypatch.setenv(kConcurrentInitializationEnvVar, value)
+        assert hybrid_factory.concurrentInitialization() is expected
+
+    def test_when_set_then_overrides_env_var(self, hybrid_factory, monkeypatch):
+        monkeypatch.setenv(kConcurrentInitializationEnvVar, "1")
+        hybrid_factory.setConcurrentInitialization(False)
+        assert hybrid_factory.concurrentInitialization() is False
+
+    def test_env_var_name_exposed(self):
+        assert (
+            HybridPluginSystemManagerImplementationFactory.kConcurrentInitializationEnvVar
+            == kConcurrentInitializationEnvVar
+        )
+
+
+class Test_HybridPluginSystemManagerImplementationFactory_ManagerInterface_concurrentInit:
+    def test_when_disabled_then_children_initialized_in_sequence(
+        self,
+        hybrid_factory,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_host_session,
+        monkeypatch,
+    ):
+        monkeypatch.delenv(kConcurrentInitializationEnvVar, raising=False)
+        manager_interface_a.mock.initialize.side_effect = RuntimeError("a failed")
+        hybrid = hybrid_factory.instantiate(the_plugin_identifier)
+
+        with pytest.raises(RuntimeError, match="a failed"):
+            hybrid.initialize({}, a_host_session)
+
+        manager_interface_b.mock.initialize.assert_not_called()
+
+    def test_when_enabled_then_children_initialized_concurrently(
+        self,
+        a_concurrent_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_host_session,
+    ):
+        # Each child blocks until the other has started, so would
+        # time out if initialized in sequence.
+        barrier = threading.Barrier(2, timeout=5)
+        thread_ids = []
+
+        def initialize(*_):
+            thread_ids.append(threading.get_ident())
+            barrier.wait()
+
+        manager_interface_a.mock.initialize.side_effect = initialize
+        manager_interface_b.mock.initialize.side_effect = initialize
+        expected_settings = {"x": 1}
+
+        a_concurrent_hybrid_manager_interface.initialize(expected_settings, a_host_session)
+
+        manager_interface_a.mock.initialize.assert_called_once_with(
+            expected_settings, a_host_session
+        )
+        manager_interface_b.mock.initialize.assert_called_once_with(
+            expected_settings, a_host_session
+        )
+        assert len(set(thread_ids)) == 2
+
+    def test_when_enabled_then_capabilities_aggregated_from_all_children(
+        self,
+        a_concurrent_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        capabilities_a = {
+            ManagerInterface.Capability.kResolution,
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+        }
+        capabilities_b = {
+            ManagerInterface.Capability.kResolution,
+            ManagerInterface.Capability.kPublishing,
+        }
+        manager_interface_a.mock.hasCapability.side_effect = lambda cap: cap in capabilities_a
+        manager_interface_b.mock.hasCapability.side_effect = lambda cap: cap in capabilities_b
+
+        a_concurrent_hybrid_manager_interface.initialize({}, a_host_session)
+
+        for capability in ManagerInterface.Capability.__members__.values():
+            assert a_concurrent_hybrid_manager_interface.hasCapability(capability) is (
+                capability in capabilities_a | capabilities_b
+            )
+
+        # Capabilities are not re-probed after initialization.
+        manager_interface_a.mock.hasCapability.reset_mock()
+        manager_interface_b.mock.hasCapability.reset_mock()
+
+        a_concurrent_hybrid_manager_interface.resolve(
+            [EntityReference("x://1")],
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            noop,
+            noop,
+        )
+        a_concurrent_hybrid_manager_interface.preflight(
+            [EntityReference("x://1")],
+            [TraitsData()],
+            access.PublishingAccess.kWrite,
+            a_context,
+            a_host_session,
+            noop,
+            noop,
+        )
+
+        manager_interface_a.mock.resolve.assert_called_once()
+        manager_interface_b.mock.resolve.assert_not_called()
+        manager_interface_a.mock.preflight.assert_not_called()
+        manager_interface_b.mock.preflight.assert_called_once()
+        manager_interface_a.mock.hasCapability.assert_not_called()
+        manager_interface_b.mock.hasCapability.assert_not_called()
+
+    def test_when_enabled_with_routing_then_probed_capabilities_used_for_routing(
+        self,
+        hybrid_factory,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_context,
+        a_host_session,
+    ):
+        hybrid_factory.setConcurrentInitialization(True)
+        hybrid_factory.setEntityReferenceRouting(True)
+        set_up_routable_children(manager_interface_a, manager_interface_b)
+        hybrid = hybrid_factory.instantiate(the_plugin_identifier)
+        hybrid.initialize({}, a_host_session)
+
+        hybrid.resolve(
+            [EntityReference("a://1"), EntityReference("b://2")],
+            {"t"},
+            access.ResolveAccess.kRead,
+            a_context,
+            a_host_session,
+            noop,
+            noop,
+        )
+
+        assert manager_interface_a.mock.resolve.call_args[0][0] == [EntityReference("a://1")]
+        assert manager_interface_b.mock.resolve.call_args[0][0] == [EntityReference("b://2")]
+
+    def test_when_later_child_fails_then_its_error_raised_after_all_children_initialized(
+        self,
+        a_concurrent_hybrid_manager_interface,
+        manager_interface_a,
+        manager_interface_b,
+        a_host_session,
+    ):
+        manager_interface_b.mock.initialize.side_effect = RuntimeError("b failed")
+
+        with pytest.raises(RuntimeError, match="b failed"):
+            a_concurrent_hybrid_manager_interface.initialize({}, a_host_session)
+
+        manager_interface_a.mock.initialize.assert_called_once()
+
+    def test_when_several_children_fail_then_highest_priority_error_raised_and_others_logged(
+        self,
+        a_concurrent_hybrid_manager_interface,
+        the_plugin_identifier,
+        manager_interface_a,
+        manager_interface_b,
+        a_host_session,
+        mock_logger,
+    ):
+        b_failed = threading.Event()
+
+        def initialize_a(*_):
+            # Ensure the lower priority child fails first.
+            b_failed.wait(timeout=5)
+            raise RuntimeError("a failed")
+
+        def initialize_b(*_):
+            b_failed.set()
+            raise RuntimeError("b failed")
+
+        manager_interface_a.mock.initialize.side_effect = initialize_a
+        manager_interface_b.mock.initialize.side_effect = initialize_b
+        manager_interface_b.mock.identifier.return_value = the_plugin_identifier
+
+        with pytest.raises(RuntimeError, match="a failed"):
+            a_concurrent_hybrid_manager_interface.initialize({}, a_host_session)
+
+        [(_, message)] = [
+            call.args
+            for call in mock_logger.mock.log.call_args_list
+            if call.args[0] == mock_logger.Severity.kWarning
+        ]
+        assert message.startswith(
+            f"HybridPluginSystem: Child 1 of '{the_plugin_identifier}' also failed to"
+            " initialize: "
+        )
+        assert "b failed" in message
+
+
+kConcurrentInitializationEnvVar = "OPENASSETIO_HYBRID_CONCURRENT_INITIALIZATION"
+
+kConcurrentScanEnvVar = "OPENASSETIO_HYBRID_CONCURRENT_SCAN"
+
+kFallbackEnvVar = "OPENASSETIO_HYBRID_FALLBACK_ERROR_CODES"
+kErrorCode = errors.BatchElementError.ErrorCode
+
+
+def resolve_failing(codes_by_ref):
+    """
+    Create a `resolve` side effect that fails the given references with
+    the given error codes, and otherwise succeeds with the reference as
+    a trait property.
+    """
+
+    def resolve(refs, *args):
+        success_callback = args[-2]
+        error_callback = args[-1]
+        for idx, ref in enumerate(refs):
+            if code := codes_by_ref.get(ref.toString()):
+                error_callback(idx, errors.BatchElementError(code, ref.toString()))
+                continue
+            data = TraitsData()
+            data.setTraitProperty("t", "ref", ref.toString())
+            success_callback(idx, data)
+
+    return resolve
+
+
+def exists_failing(message):
+    """
+    Create an `entityExists` side effect that fails all elements with
+    a fallback error code.
+    """
+
+    def entityExists(refs, *args):
+        for idx in range(len(refs)):
+            args[-1](idx, errors.BatchElementError(kErrorCode.kInvalidTraitSet, message))
+
+    return entityExists
+
+
+kRoutingEnvVar = "OPENASSETIO_HYBRID_ENTITY_REFERENCE_ROUTING"
+
+
+def set_up_routable_children(
+    manager_interface_a,
+    manager_interface_b,
+    capabilities_b=frozenset(ManagerInterface.Capability.__members__.values()),
+):
+    """
+    Configure child `a` to claim `a://` references via its info prefix,
+    and child `b` to claim `b://` references via isEntityReferenceString.
+    """
+    manager_interface_a.mock.info.return_value = {
+        constants.kInfoKey_EntityReferencesMatchPrefix: "a://"
+    }
+    manager_interface_a.mock.hasCapability.return_value = True
+    manager_interface_b.mock.hasCapability.side_effect = lambda cap: cap in capabilities_b
+    manager_interface_b.mock.isEntityReferenceString.side_effect = (
+        lambda string, _host_session: string.startswith("b://")
+    )
+
+
+def succeed_with_ref_as_trait(refs, *args):
+    success_callback = args[-2]
+    for idx, ref in enumerate(refs):
+        data = TraitsData()
+        data.setTraitProperty("t", "ref", ref.toString())
+        success_callback(idx, data)
+
+
+def fail_with_ref_as_message(refs, *args):
+    error_callback = args[-1]
+    for idx, ref in enumerate(refs):
+        error_callback(
+            idx,
+            errors.BatchElementError(
+                errors.BatchElementError.ErrorCode.kEntityResolutionError, ref.toString()
+            ),
+        )
+
+
+def noop(*_):
+    pass
+
+
 def test_all_manager_interface_methods_tested(subtests):
     methods_to_test = (
         name
@@ -1589,6 +2665,28 @@ def hybrid_manager_interface(hybrid_factory, the_plugin_identifier):
     return hybrid_factory.instantiate(the_plugin_identifier)
 
 
+@pytest.fixture
+def a_routing_hybrid_manager_interface(hybrid_factory, the_plugin_identifier):
+    hybrid_factory.setEntityReferenceRouting(True)
+    return hybrid_factory.instantiate(the_plugin_identifier)
+
+
+@pytest.fixture
+def a_fallback_hybrid_manager_interface(
+    hybrid_factory, the_plugin_identifier, manager_interface_a, manager_interface_b
+):
+    manager_interface_a.mock.hasCapability.return_value = True
+    manager_interface_b.mock.hasCapability.return_value = True
+    hybrid_factory.setFallbackErrorCodes([errors.BatchElementError.ErrorCode.kInvalidTraitSet])
+    return hybrid_factory.instantiate(the_plugin_identifier)
+
+
+@pytest.fixture
+def a_concurrent_hybrid_manager_interface(hybrid_factory, the_plugin_identifier):
+    hybrid_factory.setConcurrentInitialization(True)
+    return hybrid_factory.instantiate(the_plugin_identifier)
+
+
 @pytest.fixture
 def hybrid_factory(factory_a, factory_b, mock_logger):
     return HybridPluginSystemManagerImplementationFactory([factory_a, factory_b], mock_logger)
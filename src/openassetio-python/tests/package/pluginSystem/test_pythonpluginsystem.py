@@ -20,7 +20,10 @@ These tests check the functionality of the PythonPluginSystem class.
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import importlib
 import os
+import sys
+import time
 from typing import List
 from unittest import mock
 
@@ -29,6 +32,7 @@ import pytest
 from openassetio import errors
 from openassetio.log import ConsoleLogger
 from openassetio.pluginSystem import PythonPluginSystem, PythonPluginSystemPlugin
+from openassetio.utils import StartupProfile
 
 # Entry point group used by the stub plugins in the `resources`
 # directory.
@@ -514,6 +518,194 @@ class Test_PythonPluginSystem_scan_entry_points:
         )
 
 
+class Test_PythonPluginSystem_entryPointCachePath:
+    def test_when_env_var_not_set_then_returns_empty_string(self, a_plugin_system, monkeypatch):
+        monkeypatch.delenv(PythonPluginSystem.kEntryPointCacheEnvVar, raising=False)
+        assert a_plugin_system.entryPointCachePath() == ""
+
+    def test_when_env_var_set_then_returns_env_var(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(PythonPluginSystem.kEntryPointCacheEnvVar, "/some/cache")
+        assert a_plugin_system.entryPointCachePath() == "/some/cache"
+
+    def test_when_set_then_overrides_env_var(self, a_plugin_system, monkeypatch):
+        monkeypatch.setenv(PythonPluginSystem.kEntryPointCacheEnvVar, "/some/cache")
+
+        a_plugin_system.setEntryPointCachePath("")
+        assert a_plugin_system.entryPointCachePath() == ""
+
+        a_plugin_system.setEntryPointCachePath("/other/cache")
+        assert a_plugin_system.entryPointCachePath() == "/other/cache"
+
+        a_plugin_system.setEntryPointCachePath(None)
+        assert a_plugin_system.entryPointCachePath() == "/some/cache"
+
+
+class Test_PythonPluginSystem_scan_entry_points_with_cache:
+    def test_when_cache_missing_then_entry_points_loaded_and_cache_written(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert a_plugin_system.identifiers() == [kEntryPointIdentifier]
+        assert entry_point_import_count(module_path) == 1
+        assert os.path.exists(a_cache_path)
+
+    def test_when_cache_up_to_date_then_registered_without_loading_entry_points(
+        self, mock_logger, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, the_manager_plugin_module_hook, a_site_dir)
+        plugin_system = PythonPluginSystem(mock_logger)
+        plugin_system.setEntryPointCachePath(a_cache_path)
+
+        plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert plugin_system.identifiers() == [kEntryPointIdentifier]
+        assert entry_point_import_count(module_path) == 1
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kDebug,
+            f"PythonPluginSystem: Using cached '{PLUGIN_ENTRY_POINT_GROUP}' entry points from"
+            f" '{a_cache_path}'",
+        )
+
+    def test_when_cached_plugin_requested_then_entry_point_loaded_once(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, the_manager_plugin_module_hook, a_site_dir)
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        plugin = a_plugin_system.plugin(kEntryPointIdentifier)
+        same_plugin = a_plugin_system.plugin(kEntryPointIdentifier)
+
+        assert plugin.identifier() == kEntryPointIdentifier
+        assert plugin.__file__ == str(module_path)
+        assert same_plugin is plugin
+        assert entry_point_import_count(module_path) == 2
+
+    def test_when_distribution_installed_then_cache_refreshed(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, the_manager_plugin_module_hook, a_site_dir)
+        write_entry_point_dist(a_site_dir, "new_plugin", "org.openassetio.test.new")
+        importlib.invalidate_caches()
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert sorted(a_plugin_system.identifiers()) == sorted(
+            [kEntryPointIdentifier, "org.openassetio.test.new"]
+        )
+
+    def test_when_cache_for_other_hook_then_entry_points_loaded(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, "someOtherHook", a_site_dir)
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert a_plugin_system.identifiers() == [kEntryPointIdentifier]
+        assert entry_point_import_count(module_path) == 2
+
+    def test_when_cache_unrecognised_then_entry_points_loaded_and_cache_rewritten(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        with open(a_cache_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("not json")
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+        forget_modules(a_site_dir)
+        a_plugin_system.reset()
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert a_plugin_system.identifiers() == [kEntryPointIdentifier]
+        assert entry_point_import_count(module_path) == 1
+
+    def test_when_cached_entry_point_broken_then_plugin_raises_InputValidationException(
+        self, a_plugin_system, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, the_manager_plugin_module_hook, a_site_dir)
+        # Break the module without modifying the site directory.
+        module_path.write_text('raise RuntimeError("An exception")\n', encoding="utf-8")
+        a_plugin_system.setEntryPointCachePath(a_cache_path)
+        a_plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match=f"PythonPluginSystem: Failed to load plug-in '{kEntryPointIdentifier}'"
+            f" from '{module_path}'$",
+        ):
+            a_plugin_system.plugin(kEntryPointIdentifier)
+
+    def test_when_cached_identifier_already_used_then_skipped(
+        self, mock_logger, the_manager_plugin_module_hook, a_site_dir, a_cache_path
+    ):
+        module_path = write_entry_point_dist(a_site_dir, "cached_plugin", kEntryPointIdentifier)
+        populate_entry_point_cache(a_cache_path, the_manager_plugin_module_hook, a_site_dir)
+        plugin_system = PythonPluginSystem(mock_logger)
+        plugin_system.setEntryPointCachePath(a_cache_path)
+
+        class ExpectedPlugin(PythonPluginSystemPlugin):
+            @classmethod
+            def identifier(cls):
+                return kEntryPointIdentifier
+
+        plugin_system.register(ExpectedPlugin, "/some/plugin/path")
+
+        plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+
+        assert plugin_system.plugin(kEntryPointIdentifier) is ExpectedPlugin
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            f"PythonPluginSystem: Skipping plug-in '{kEntryPointIdentifier}' defined in"
+            f" '{module_path}'. Already registered by '/some/plugin/path'",
+        )
+
+
+@pytest.mark.benchmark
+def test_benchmark_scan_entry_points_with_500_distributions(
+    the_manager_plugin_module_hook, a_site_dir, a_cache_path, capsys
+):
+    distCount = 500
+    pluginCount = 5
+    for idx in range(distCount):
+        if idx % (distCount // pluginCount) == 0:
+            write_entry_point_dist(a_site_dir, f"plugin_{idx}", f"org.openassetio.test.{idx}")
+        else:
+            write_non_plugin_dist(a_site_dir, f"dist_{idx}")
+
+    def scan(cachePath):
+        forget_modules(a_site_dir)
+        importlib.invalidate_caches()
+        plugin_system = PythonPluginSystem(ConsoleLogger())
+        plugin_system.setEntryPointCachePath(cachePath)
+        start = time.perf_counter()
+        plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, the_manager_plugin_module_hook)
+        duration = time.perf_counter() - start
+        assert len(plugin_system.identifiers()) == pluginCount
+        return duration
+
+    uncached = scan("")
+    cold = scan(a_cache_path)
+    warm = min(scan(a_cache_path) for _ in range(5))
+
+    with capsys.disabled():
+        print(f"\nscan_entry_points() with {distCount} distributions ({pluginCount} plugins)")
+        print(f"  uncached: {uncached:.4f}s")
+        print(f"  cold cache: {cold:.4f}s")
+        print(f"  warm cache: {warm:.4f}s (speedup x{uncached / warm:.2f})")
+
+
 class Test_PythonPluginSystem_plugin:
     def test_when_plugin_not_found_then_raises_InputValidationException(self, a_plugin_system):
         with pytest.raises(
@@ -523,6 +715,108 @@ class Test_PythonPluginSystem_plugin:
             a_plugin_system.plugin("nonexistent")
 
 
+class Test_PythonPluginSystem_scan_startup_profile:
+    @pytest.mark.usefixtures("startup_profile_enabled")
+    def test_when_profiling_enabled_then_scan_and_imports_recorded(
+        self,
+        a_plugin_system,
+        the_manager_plugin_module_hook,
+        a_paths_env_var,
+        an_entry_point_group_name,
+        a_disable_entry_point_env_var,
+        a_python_module_plugin_path,
+    ):
+        plugin_path = os.path.join(a_python_module_plugin_path, "modulePlugin.py")
+
+        a_plugin_system.scan(
+            a_python_module_plugin_path,
+            a_paths_env_var,
+            an_entry_point_group_name,
+            a_disable_entry_point_env_var,
+            True,
+            the_manager_plugin_module_hook,
+        )
+
+        assert [(event.name, event.detail, event.depth) for event in StartupProfile.events()] == [
+            ("PythonPluginSystem.import", plugin_path, 1),
+            ("PythonPluginSystem.scan", a_python_module_plugin_path, 0),
+        ]
+
+
+kEntryPointIdentifier = "org.openassetio.test.pluginSystem.cachedEntryPoint"
+
+
+def write_entry_point_dist(site_dir, module_name, identifier):
+    """
+    Write a minimal distribution to a site directory, providing a plugin
+    through an `openassetio.manager_plugin` entry point, whose module
+    records each time it is imported (see entry_point_import_count).
+    """
+    write_non_plugin_dist(
+        site_dir, module_name, f"[{PLUGIN_ENTRY_POINT_GROUP}]\n{module_name} = {module_name}\n"
+    )
+    module_path = site_dir / f"{module_name}.py"
+    module_path.write_text(
+        f"""\
+import os
+
+from openassetio.pluginSystem import PythonPluginSystemPlugin
+
+# Recorded outside the site directory, so its mtime is unaffected.
+with open(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "{module_name}.imports"),
+    "a",
+    encoding="utf-8",
+) as imports:
+    imports.write("x")
+
+
+class EntryPointPlugin(PythonPluginSystemPlugin):
+    @classmethod
+    def identifier(cls):
+        return {identifier!r}
+
+
+openassetioPlugin = EntryPointPlugin
+""",
+        encoding="utf-8",
+    )
+    return module_path
+
+
+def write_non_plugin_dist(site_dir, name, entry_points="[console_scripts]\nsome-tool = x:y\n"):
+    dist_info = site_dir / f"{name}-0.0.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: 0.0.0\n", encoding="utf-8"
+    )
+    (dist_info / "entry_points.txt").write_text(entry_points, encoding="utf-8")
+
+
+def entry_point_import_count(module_path):
+    imports_path = module_path.parent.parent / f"{module_path.stem}.imports"
+    if not imports_path.exists():
+        return 0
+    return len(imports_path.read_text(encoding="utf-8"))
+
+
+def populate_entry_point_cache(cache_path, module_hook_name, site_dir):
+    """
+    Scan entry points to populate the cache, then forget any imported
+    plugin modules, as if in a fresh process.
+    """
+    plugin_system = PythonPluginSystem(ConsoleLogger())
+    plugin_system.setEntryPointCachePath(cache_path)
+    plugin_system.scan_entry_points(PLUGIN_ENTRY_POINT_GROUP, module_hook_name)
+    forget_modules(site_dir)
+
+
+def forget_modules(site_dir):
+    for name, module in list(sys.modules.items()):
+        if str(getattr(module, "__file__", None) or "").startswith(str(site_dir)):
+            del sys.modules[name]
+
+
 @pytest.fixture
 def a_plugin_system(a_logger):
     return PythonPluginSystem(a_logger)
@@ -542,6 +836,23 @@ def a_plugin_system_with_mocked_scanning(mock_logger, monkeypatch):
     return plugin_system
 
 
+@pytest.fixture
+def a_site_dir(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    monkeypatch.syspath_prepend(str(site_dir))
+    # Writing __pycache__ would modify the site directory, invalidating
+    # any entry point cache.
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    yield site_dir
+    forget_modules(site_dir)
+
+
+@pytest.fixture
+def a_cache_path(tmp_path):
+    return str(tmp_path / "entry_points.json")
+
+
 # We use a real logger vs a mock, as it makes debugging test failures
 # easier as it surfaces any actual in-flight errors from the plugin
 # system.
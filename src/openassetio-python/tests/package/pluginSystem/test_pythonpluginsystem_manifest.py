@@ -0,0 +1,246 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+These tests check the registration of plugins declaring a manifest by
+the PythonPluginSystem class, without importing them.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+
+import pytest
+
+from openassetio import errors
+from openassetio.log import ConsoleLogger
+from openassetio.pluginSystem import PythonPluginSystem, PythonPluginSystemPlugin
+
+
+class Test_PythonPluginSystem_scan_paths_with_manifest:
+    def test_when_module_has_manifest_then_registered_without_import(
+        self, a_plugin_system, the_manager_plugin_module_hook, tmp_path
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path, "manifestPlugin", {the_manager_plugin_module_hook: kManifestIdentifier}
+        )
+
+        a_plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        assert a_plugin_system.identifiers() == [kManifestIdentifier]
+        assert import_count(plugin_path) == 0
+
+    def test_when_package_has_manifest_then_registered_without_import(
+        self, a_plugin_system, the_manager_plugin_module_hook, tmp_path
+    ):
+        package_path = tmp_path / "manifestPackage"
+        package_path.mkdir()
+        init_path = write_manifest_plugin(
+            package_path, "__init__", {the_manager_plugin_module_hook: kManifestIdentifier}
+        )
+
+        a_plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        assert a_plugin_system.identifiers() == [kManifestIdentifier]
+        assert import_count(init_path) == 0
+
+    def test_when_plugin_requested_then_module_imported_once(
+        self, a_plugin_system, the_manager_plugin_module_hook, tmp_path
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path, "manifestPlugin", {the_manager_plugin_module_hook: kManifestIdentifier}
+        )
+        a_plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        plugin = a_plugin_system.plugin(kManifestIdentifier)
+        same_plugin = a_plugin_system.plugin(kManifestIdentifier)
+
+        assert issubclass(plugin, PythonPluginSystemPlugin)
+        assert plugin.identifier() == kManifestIdentifier
+        assert plugin.__file__ == str(plugin_path)
+        assert same_plugin is plugin
+        assert import_count(plugin_path) == 1
+
+    def test_when_manifest_does_not_declare_hook_then_skipped_without_import(
+        self, the_manager_plugin_module_hook, tmp_path, mock_logger
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path, "manifestPlugin", {"someOtherHook": kManifestIdentifier}
+        )
+        plugin_system = PythonPluginSystem(mock_logger)
+
+        plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        assert not plugin_system.identifiers()
+        assert import_count(plugin_path) == 0
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kDebug,
+            "PythonPluginSystem: Ignoring as manifest does not declare"
+            f" '{the_manager_plugin_module_hook}' {plugin_path}",
+        )
+
+    def test_when_manifest_identifier_already_registered_then_leftmost_is_used(
+        self, the_manager_plugin_module_hook, tmp_path, mock_logger
+    ):
+        path_a = tmp_path / "a"
+        path_b = tmp_path / "b"
+        path_a.mkdir()
+        path_b.mkdir()
+        plugin_a_path = write_manifest_plugin(
+            path_a, "manifestPlugin", {the_manager_plugin_module_hook: kManifestIdentifier}
+        )
+        plugin_b_path = write_manifest_plugin(
+            path_b, "manifestPlugin", {the_manager_plugin_module_hook: kManifestIdentifier}
+        )
+        plugin_system = PythonPluginSystem(mock_logger)
+
+        plugin_system.scan_paths(
+            os.pathsep.join((str(path_a), str(path_b))), the_manager_plugin_module_hook
+        )
+
+        assert plugin_system.identifiers() == [kManifestIdentifier]
+        assert plugin_system.plugin(kManifestIdentifier).__file__ == str(plugin_a_path)
+        assert import_count(plugin_b_path) == 0
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            f"PythonPluginSystem: Skipping plug-in '{kManifestIdentifier}' declared in"
+            f" '{plugin_b_path}'. Already registered by '{plugin_a_path}'",
+        )
+
+    def test_when_manifest_is_not_a_literal_then_warning_logged_and_module_imported(
+        self, the_manager_plugin_module_hook, tmp_path, mock_logger
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path, "manifestPlugin", f"dict({the_manager_plugin_module_hook}='not literal')"
+        )
+        plugin_system = PythonPluginSystem(mock_logger)
+
+        plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        assert plugin_system.identifiers() == [kManifestIdentifier]
+        assert import_count(plugin_path) == 1
+        mock_logger.mock.log.assert_any_call(
+            mock_logger.Severity.kWarning,
+            "PythonPluginSystem: Ignoring invalid 'openassetioPluginManifest', expected a dict"
+            f" literal of str to str {plugin_path}",
+        )
+
+
+class Test_PythonPluginSystem_plugin_with_manifest:
+    def test_when_module_raises_then_raises_InputValidationException(
+        self, a_plugin_system, the_manager_plugin_module_hook, tmp_path
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path,
+            "manifestPlugin",
+            {the_manager_plugin_module_hook: kManifestIdentifier},
+            extra_source='raise RuntimeError("An exception")',
+        )
+        a_plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match=f"PythonPluginSystem: Failed to load plug-in '{kManifestIdentifier}'"
+            f" from '{plugin_path}'$",
+        ):
+            a_plugin_system.plugin(kManifestIdentifier)
+
+    def test_when_module_provides_different_identifier_then_raises_InputValidationException(
+        self, a_plugin_system, the_manager_plugin_module_hook, tmp_path
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path,
+            "manifestPlugin",
+            {the_manager_plugin_module_hook: "org.openassetio.test.other"},
+        )
+        a_plugin_system.scan_paths(str(tmp_path), the_manager_plugin_module_hook)
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match="PythonPluginSystem: Failed to load plug-in 'org.openassetio.test.other'"
+            f" from '{plugin_path}'. Module provides '{kManifestIdentifier}'",
+        ):
+            a_plugin_system.plugin("org.openassetio.test.other")
+
+    def test_when_module_missing_hook_then_raises_InputValidationException(
+        self, a_plugin_system, tmp_path
+    ):
+        plugin_path = write_manifest_plugin(
+            tmp_path, "manifestPlugin", {"someOtherHook": kManifestIdentifier}
+        )
+        a_plugin_system.scan_paths(str(tmp_path), "someOtherHook")
+
+        with pytest.raises(
+            errors.InputValidationException,
+            match=f"PythonPluginSystem: Failed to load plug-in '{kManifestIdentifier}'"
+            f" from '{plugin_path}'. No top-level 'someOtherHook' variable",
+        ):
+            a_plugin_system.plugin(kManifestIdentifier)
+
+
+kManifestIdentifier = "org.openassetio.test.pluginSystem.manifest"
+
+
+def write_manifest_plugin(directory, module_name, manifest, extra_source=""):
+    """
+    Write a plugin module providing kManifestIdentifier through the
+    `openassetioPlugin` hook, declaring the given manifest, and that
+    records each time it is imported in a sibling file.
+
+    @param manifest `dict` or `str` Manifest, or source of the
+    manifest's value.
+    """
+    plugin_path = directory / f"{module_name}.py"
+    manifest_source = manifest if isinstance(manifest, str) else repr(manifest)
+    plugin_path.write_text(
+        f"""\
+from openassetio.pluginSystem import PythonPluginSystemPlugin
+
+openassetioPluginManifest = {manifest_source}
+
+with open(__file__ + ".imports", "a", encoding="utf-8") as imports:
+    imports.write("x")
+
+{extra_source}
+
+
+class ManifestPlugin(PythonPluginSystemPlugin):
+    @classmethod
+    def identifier(cls):
+        return {kManifestIdentifier!r}
+
+
+openassetioPlugin = ManifestPlugin
+""",
+        encoding="utf-8",
+    )
+    return plugin_path
+
+
+def import_count(plugin_path):
+    imports_path = f"{plugin_path}.imports"
+    if not os.path.exists(imports_path):
+        return 0
+    with open(imports_path, encoding="utf-8") as imports:
+        return len(imports.read())
+
+
+@pytest.fixture
+def a_plugin_system():
+    # We use a real logger vs a mock, as it makes debugging test
+    # failures easier as it surfaces any actual in-flight errors from
+    # the plugin system.
+    return PythonPluginSystem(ConsoleLogger())
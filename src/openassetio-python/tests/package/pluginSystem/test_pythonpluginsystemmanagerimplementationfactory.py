@@ -22,7 +22,9 @@ ManagerImplementationFactoryInterface implementation.
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=use-implicit-booleaness-not-comparison
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import time
 from unittest import mock
 
 import pytest
@@ -131,6 +133,17 @@ class Test_PythonPluginSystemManagerImplementationFactory_identifiers:
         assert first_identifiers == second_identifiers
         assert first_identifiers == mock_plugin_system.identifiers.return_value
 
+    def test_when_called_concurrently_then_scans_once(self, mock_plugin_system, mock_logger):
+        factory = PythonPluginSystemManagerImplementationFactory(mock_logger)
+        # Widen the window for a race.
+        mock_plugin_system.scan.side_effect = lambda *_: time.sleep(0.1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_identifiers = list(executor.map(lambda _: factory.identifiers(), range(8)))
+
+        mock_plugin_system.scan.assert_called_once()
+        assert all_identifiers == [mock_plugin_system.identifiers.return_value] * 8
+
 
 class Test_PythonPluginSystemManagerImplementationFactory_instantiate:
     def test_lazy_scans_for_plugins_before_instantiating(self, mock_plugin_system, mock_logger):
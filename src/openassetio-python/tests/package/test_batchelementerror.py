@@ -20,6 +20,7 @@ Tests for the BatchElementError type.
 # pylint: disable=too-few-public-methods
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
+import pickle
 import re
 
 import pytest
@@ -109,6 +110,15 @@ class Test_BatchElementError_equality:
         assert a_batch_element_error != b_batch_element_error
 
 
+class Test_BatchElementError_pickle:
+    def test_when_round_tripped_then_equal_to_original(self):
+        a_batch_element_error = BatchElementError(
+            BatchElementError.ErrorCode.kEntityResolutionError, "message"
+        )
+
+        assert pickle.loads(pickle.dumps(a_batch_element_error)) == a_batch_element_error
+
+
 class Test_BatchElementException:
     @pytest.mark.parametrize(
         "exception_code",
@@ -19,9 +19,12 @@ Tests that cover the openassetio.Context class.
 
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
+import pickle
+
 import pytest
 
 from openassetio import Context, managerApi
+from openassetio.errors import InputValidationException
 from openassetio.trait import TraitsData
 
 
@@ -77,6 +80,22 @@ class Test_Context_locale:
         assert actual_data is expected_data
 
 
+class Test_Context_pickle:
+    def test_when_round_tripped_then_locale_equal_to_original(self, a_context):
+        a_context.locale.setTraitProperty("a_trait", "a_property", 1)
+
+        unpickled = pickle.loads(pickle.dumps(a_context))
+
+        assert unpickled.locale == a_context.locale
+        assert unpickled.managerState is None
+
+    def test_when_manager_state_not_picklable_then_raises_TypeError(self, a_context):
+        a_context.managerState = managerApi.ManagerStateBase()
+
+        with pytest.raises(TypeError):
+            pickle.dumps(a_context)
+
+
 class Test_Context_managerState:
     def test_when_set_to_unknown_type_then_raises_TypeError(self, a_context):
         expected_msg = (
@@ -101,6 +120,80 @@ class Test_Context_managerState:
         assert actual_data is expected_data
 
 
+class Test_Context_resolveManagerState:
+    def test_when_no_managerState_then_returns_None(self, a_context):
+        assert a_context.resolveManagerState() is None
+
+    def test_when_not_deferred_then_returns_managerState(self, a_context):
+        expected_data = managerApi.ManagerStateBase()
+        a_context.managerState = expected_data
+
+        assert a_context.resolveManagerState() is expected_data
+
+
+class Test_Context_snapshot:
+    def test_when_created_then_is_snapshot(self, a_context):
+        snapshot = a_context.snapshot()
+
+        assert snapshot.isSnapshot()
+        assert not a_context.isSnapshot()
+        assert snapshot is not a_context
+
+    def test_when_created_then_has_frozen_copy_of_locale(self, a_context):
+        a_context.locale.setTraitProperty("a", "p", 1)
+
+        snapshot = a_context.snapshot()
+
+        assert snapshot.locale == a_context.locale
+        assert snapshot.locale is not a_context.locale
+        assert snapshot.locale.isFrozen()
+        assert not a_context.locale.isFrozen()
+
+    def test_when_created_then_shares_managerState(self, a_context):
+        a_state = managerApi.ManagerStateBase()
+        a_context.managerState = a_state
+
+        assert a_context.snapshot().managerState is a_state
+
+    def test_when_original_modified_then_snapshot_unchanged(self, a_context):
+        a_context.locale.setTraitProperty("a", "p", 1)
+        snapshot = a_context.snapshot()
+
+        a_context.locale.setTraitProperty("a", "p", 2)
+        a_context.locale = TraitsData()
+        a_context.managerState = managerApi.ManagerStateBase()
+
+        assert snapshot.locale.getTraitProperty("a", "p") == 1
+        assert snapshot.managerState is None
+
+    def test_when_locale_is_None_then_snapshot_locale_is_None(self, a_context):
+        a_context.locale = None
+
+        assert a_context.snapshot().locale is None
+
+    def test_when_locale_modified_then_raises(self, a_context):
+        snapshot = a_context.snapshot()
+
+        with pytest.raises(InputValidationException, match="Cannot modify a frozen TraitsData"):
+            snapshot.locale.setTraitProperty("a", "p", 1)
+
+    @pytest.mark.parametrize(
+        "attr,value", [("locale", TraitsData()), ("managerState", managerApi.ManagerStateBase())]
+    )
+    def test_when_attribute_set_then_raises(self, a_context, attr, value):
+        snapshot = a_context.snapshot()
+
+        with pytest.raises(InputValidationException, match="Cannot modify a Context snapshot"):
+            setattr(snapshot, attr, value)
+
+    def test_when_snapshot_of_snapshot_then_equivalent(self, a_context):
+        a_context.locale.setTraitProperty("a", "p", 1)
+        snapshot = a_context.snapshot().snapshot()
+
+        assert snapshot.isSnapshot()
+        assert snapshot.locale == a_context.locale
+
+
 @pytest.fixture
 def a_context():
     return Context()
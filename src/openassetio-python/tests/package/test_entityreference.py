@@ -21,9 +21,16 @@ Tests for the EntityReference type.
 # pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import pickle
+import time
+
 import pytest
 
-from openassetio import EntityReference
+from openassetio import Context, EntityReference
+from openassetio.access import PublishingAccess
+from openassetio.hostApi import Manager
+from openassetio.managerApi import ManagerInterface
+from openassetio.trait import TraitsData
 
 
 class Test_EntityReference_inheritance:
@@ -75,7 +82,71 @@ class Test_EntityReference_hash:
         assert {a_ref, b_ref, c_ref, d_str} == {a_ref, c_ref, d_str}
 
 
+class Test_EntityReference_pickle:
+    def test_when_round_tripped_then_equal_to_original(self):
+        a_ref = EntityReference("Some 🍟 with that?")
+
+        assert pickle.loads(pickle.dumps(a_ref)) == a_ref
+
+
 class Test_EntityReference_string_equivalence:
     def test_when_used_with_format_then_result_contains_toString_value(self):
         a_ref = EntityReference("Some 🍟 with that?")
         assert f"{a_ref}" == a_ref.toString()
+
+
+@pytest.mark.benchmark
+class Test_EntityReference_marshalling:
+    def test_benchmark_round_trip_through_preflight(self, a_host_session, capsys):
+        refCount = 100_000
+        repeats = 10
+        refs = [
+            EntityReference(f"ref://some/long/path/to/an/entity/{idx:0>64}")
+            for idx in range(refCount)
+        ]
+        hints = [TraitsData()] * refCount
+        context = Context()
+        manager = Manager(EchoingManagerInterface(), a_host_session)
+
+        results = manager.preflight(refs, hints, PublishingAccess.kWrite, context)
+        assert results == refs
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            manager.preflight(refs, hints, PublishingAccess.kWrite, context)
+        duration = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(f"\npreflight() round trip of {refCount} refs x {repeats}: {duration:.3f}s")
+
+
+class EchoingManagerInterface(ManagerInterface):
+    """
+    Manager whose preflight gives back the references it is given, such
+    that the time taken is dominated by marshalling the references.
+    """
+
+    def identifier(self):
+        return "org.openassetio.test.echoing"
+
+    def hasCapability(self, capability):
+        return capability in (
+            ManagerInterface.Capability.kEntityReferenceIdentification,
+            ManagerInterface.Capability.kManagementPolicyQueries,
+            ManagerInterface.Capability.kEntityTraitIntrospection,
+            ManagerInterface.Capability.kPublishing,
+        )
+
+    def preflight(
+        self,
+        targetEntityRefs,
+        traitsHints,
+        publishingAccess,
+        context,
+        hostSession,
+        successCallback,
+        errorCallback,
+    ):
+        # pylint: disable=unused-argument
+        for idx, ref in enumerate(targetEntityRefs):
+            successCallback(idx, ref)
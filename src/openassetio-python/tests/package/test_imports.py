@@ -24,9 +24,12 @@ Cases should be added for any of the following:
  - C++ implementations hoisted in an __init__.py file.
 """
 
+import subprocess
+import sys
+
 import pytest
 
-# pylint: disable=invalid-name
+# pylint: disable=invalid-name,redefined-outer-name
 # pylint: disable=unused-import,import-outside-toplevel
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
@@ -61,6 +64,57 @@ class Test_package_imports:
         from openassetio import utils
 
 
+class Test_package_lazy_imports:
+    def test_when_openassetio_imported_then_submodules_not_imported(self):
+        newly_imported = modules_imported_by("import openassetio")
+
+        assert "openassetio.hostApi" not in newly_imported
+        assert "openassetio.pluginSystem" not in newly_imported
+        assert "openassetio.ui" not in newly_imported
+
+    def test_when_openassetio_imported_then_textwrap_not_imported(self):
+        # pybind11 imports textwrap when executing indented Python source.
+        assert "textwrap" not in modules_imported_by("import openassetio")
+
+    def test_when_pluginSystem_imported_then_importlib_metadata_not_imported(self):
+        newly_imported = modules_imported_by("import openassetio.pluginSystem")
+
+        assert "importlib.metadata" not in newly_imported
+
+    def test_when_submodule_accessed_as_attribute_then_submodule_imported(self):
+        import openassetio
+
+        assert openassetio.hostApi.Manager is not None
+        assert openassetio.ui.hostApi.UIDelegate is not None
+
+    def test_when_unknown_attribute_accessed_then_raises_AttributeError(self):
+        import openassetio
+
+        with pytest.raises(AttributeError, match="has no attribute 'notASubmodule'"):
+            _ = openassetio.notASubmodule
+
+    def test_when_dir_then_lazy_submodules_listed(self):
+        import openassetio
+
+        assert {"hostApi", "managerApi", "pluginSystem", "ui"} <= set(dir(openassetio))
+
+
+class Test_import_time:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import openassetio",
+            "from openassetio.hostApi import Manager",
+            "import openassetio.pluginSystem",
+            "import openassetio.ui.pluginSystem",
+        ],
+    )
+    def test_when_imported_then_faster_than_eager_import(self, statement, eager_import_time_us):
+        # Guards against a regression that (re-)introduces an eager
+        # import of everything, e.g. a top-level import of a submodule.
+        assert import_time_us(statement) < eager_import_time_us
+
+
 class Test_hostApi_imports:
     def test_importing_HostInterface_succeeds(self):
         from openassetio.hostApi import HostInterface
@@ -188,3 +242,79 @@ class Test_ui_pluginSystem_imports:
 class Test_ui_access_imports:
     def test_importing_UIAccess_succeeds(self):
         from openassetio.ui.access import UIAccess
+
+
+def modules_imported_by(statement):
+    """
+    Get the names of modules newly imported by the given statement,
+    when executed in a fresh interpreter.
+    """
+    script = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print('\\n'.join(set(sys.modules) - before))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.fixture(scope="module")
+def eager_import_time_us():
+    """
+    Time taken to import every lazily imported submodule, along with
+    importlib.metadata, i.e. the cost of `import openassetio` prior to
+    lazy imports.
+    """
+    return import_time_us(
+        "; ".join(
+            [
+                "import importlib.metadata",
+                *(
+                    f"import openassetio.{name}"
+                    for name in (
+                        "access",
+                        "errors",
+                        "hostApi",
+                        "log",
+                        "managerApi",
+                        "pluginSystem",
+                        "test",
+                        "trait",
+                        "utils",
+                        "ui.access",
+                        "ui.hostApi",
+                        "ui.managerApi",
+                        "ui.pluginSystem",
+                    )
+                ),
+            ]
+        )
+    )
+
+
+def import_time_us(statement, repeats=5):
+    """
+    Fastest of several runs of the total time taken by the imports in
+    `statement`, as reported by `python -X importtime`, in microseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        # Each line is "import time: <self us> | <cumulative us> | <name>",
+        # where <name> is indented according to nesting depth. Sum the
+        # cumulative time of top-level imports that follow interpreter
+        # startup (i.e. `site`).
+        rows = [line.split("|") for line in result.stderr.splitlines()]
+        startup_end = next(idx for idx, row in enumerate(rows) if row[2].strip() == "site") + 1
+        timings.append(
+            sum(int(row[1]) for row in rows[startup_end:] if not row[2].startswith("  "))
+        )
+    return min(timings)
@@ -8,8 +8,12 @@ Tests for the traits data container
 # pylint: disable=invalid-name,missing-class-docstring
 # pylint: disable=redefined-outer-name
 # pylint: disable=missing-function-docstring
+import copy
+import pickle
+
 import pytest
 
+from openassetio.errors import InputValidationException
 from openassetio.trait import TraitsData
 
 
@@ -42,6 +46,18 @@ class Test_TraitsData_Copy_Constructor:
         assert data_a.getTraitProperty("a", "p") == 1
         assert not data_a.hasTrait("b")
 
+    def test_when_original_modified_after_copying_then_copy_unchanged(self):
+        data_a = TraitsData()
+        data_a.setTraitProperty("a", "p", 1)
+        data_b = TraitsData(data_a)
+        data_c = TraitsData(data_b)
+        data_a.addTrait("b")
+        data_a.setTraitProperty("a", "p", 2)
+        data_b.addTraits({"c"})
+        assert data_b.getTraitProperty("a", "p") == 1
+        assert not data_b.hasTrait("b")
+        assert data_c.traitSet() == {"a"}
+
 
 class Test_TraitsData_traitSet:
     def test_when_has_no_traits_returns_empty_list(self):
@@ -183,6 +199,74 @@ class Test_TraitsData_equality:
         assert data_a != data_b
 
 
+class Test_TraitsData_freeze:
+    def test_when_not_frozen_then_isFrozen_false(self, a_traitsdata):
+        assert not a_traitsdata.isFrozen()
+
+    def test_when_frozen_then_isFrozen_true(self, a_traitsdata):
+        a_traitsdata.freeze()
+        assert a_traitsdata.isFrozen()
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            lambda data: data.addTrait("new"),
+            lambda data: data.addTraits({"new"}),
+            lambda data: data.setTraitProperty("new", "p", 1),
+        ],
+    )
+    def test_when_frozen_then_modification_raises(self, a_traitsdata, modify):
+        expected = TraitsData(a_traitsdata)
+        a_traitsdata.freeze()
+
+        with pytest.raises(InputValidationException, match="Cannot modify a frozen TraitsData"):
+            modify(a_traitsdata)
+
+        assert a_traitsdata == expected
+
+    def test_when_frozen_then_copy_is_not_frozen(self, a_traitsdata):
+        a_traitsdata.freeze()
+
+        copied = TraitsData(a_traitsdata)
+        copied.addTrait("new")
+
+        assert not copied.isFrozen()
+        assert not a_traitsdata.hasTrait("new")
+
+
+class Test_TraitsData_pickle:
+    def test_when_round_tripped_then_equal_to_original(self):
+        data = TraitsData({"a_trait", "a_trait_without_properties"})
+        data.setTraitProperty("a_trait", "a_bool", True)
+        data.setTraitProperty("a_trait", "an_int", -(2**62))
+        data.setTraitProperty("a_trait", "a_float", 1.5e-300)
+        data.setTraitProperty("a_trait", "a_str", "Some 🍟 with that?")
+
+        unpickled = pickle.loads(pickle.dumps(data))
+
+        assert unpickled == data
+        assert unpickled is not data
+
+    def test_when_empty_then_round_trips(self):
+        assert pickle.loads(pickle.dumps(TraitsData())) == TraitsData()
+
+    def test_when_copied_then_is_deep_copy(self, a_traitsdata):
+        copied = copy.copy(a_traitsdata)
+        copied.addTrait("a_new_trait")
+
+        assert not a_traitsdata.hasTrait("a_new_trait")
+
+    def test_when_state_has_unsupported_version_then_raises_InputValidationException(self):
+        with pytest.raises(InputValidationException, match="unsupported format version 255"):
+            TraitsData.__new__(TraitsData).__setstate__(b"\xff")
+
+    def test_when_state_truncated_then_raises_InputValidationException(self, a_traitsdata):
+        state = a_traitsdata.__getstate__()
+
+        with pytest.raises(InputValidationException, match="unexpected end of data"):
+            TraitsData.__new__(TraitsData).__setstate__(state[:-1])
+
+
 @pytest.fixture
 def a_traitsdata():
     return TraitsData({"first_trait", "second_trait"})
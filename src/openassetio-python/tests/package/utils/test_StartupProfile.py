@@ -0,0 +1,173 @@
+#
+#   Copyright 2025 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests that cover the startup profiling utility.
+"""
+
+# pylint: disable=missing-function-docstring,missing-class-docstring,
+# pylint: disable=invalid-name,redefined-outer-name,unused-argument
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from openassetio.utils import StartupProfile
+
+kEnvVar = "OPENASSETIO_STARTUP_PROFILE"
+
+
+class Test_StartupProfile_kStartupProfileEnvVarName:
+    def test_value(self):
+        assert StartupProfile.kStartupProfileEnvVarName == kEnvVar
+
+
+class Test_StartupProfile_enabled:
+    @pytest.mark.parametrize("value,expected", [("1", True), ("0", False), ("", False)])
+    def test_when_env_var_set_then_reflects_env_var(
+        self, reset_startup_profile, monkeypatch, value, expected
+    ):
+        monkeypatch.setenv(kEnvVar, value)
+        StartupProfile.setEnabled(None)
+        assert StartupProfile.enabled() is expected
+
+    def test_when_env_var_not_set_then_false(self, reset_startup_profile, monkeypatch):
+        monkeypatch.delenv(kEnvVar, raising=False)
+        StartupProfile.setEnabled(None)
+        assert StartupProfile.enabled() is False
+
+    def test_when_set_then_overrides_env_var(self, reset_startup_profile, monkeypatch):
+        monkeypatch.setenv(kEnvVar, "1")
+        StartupProfile.setEnabled(False)
+        assert StartupProfile.enabled() is False
+
+
+class Test_StartupProfile_Scope:
+    def test_when_disabled_then_no_event_recorded(self, reset_startup_profile):
+        StartupProfile.setEnabled(False)
+
+        with StartupProfile.Scope("a.stage", "a detail"):
+            pass
+
+        assert StartupProfile.events() == []
+
+    def test_when_enabled_then_event_recorded(self, startup_profile_enabled):
+        with StartupProfile.Scope("a.stage", "a detail"):
+            pass
+
+        [event] = StartupProfile.events()
+        assert event.name == "a.stage"
+        assert event.detail == "a detail"
+        assert event.start > 0
+        assert event.duration >= 0
+        assert event.depth == 0
+
+    def test_when_nested_then_depth_recorded_and_inner_completes_first(
+        self, startup_profile_enabled
+    ):
+        with StartupProfile.Scope("outer"):
+            with StartupProfile.Scope("inner"):
+                pass
+
+        inner, outer = StartupProfile.events()
+        assert (inner.name, inner.depth) == ("inner", 1)
+        assert (outer.name, outer.depth) == ("outer", 0)
+        assert outer.start <= inner.start
+        assert outer.duration >= inner.duration
+
+    def test_when_ended_explicitly_then_recorded_once(self, startup_profile_enabled):
+        scope = StartupProfile.Scope("a.stage")
+        scope.end()
+        scope.end()
+        del scope
+
+        assert len(StartupProfile.events()) == 1
+
+    def test_when_exception_raised_then_event_recorded(self, startup_profile_enabled):
+        with pytest.raises(RuntimeError):
+            with StartupProfile.Scope("a.stage"):
+                raise RuntimeError()
+
+        assert [event.name for event in StartupProfile.events()] == ["a.stage"]
+
+    def test_when_recorded_from_different_threads_then_thread_indices_differ(
+        self, startup_profile_enabled
+    ):
+        with StartupProfile.Scope("main"):
+            pass
+        thread = threading.Thread(target=lambda: StartupProfile.Scope("other").end())
+        thread.start()
+        thread.join()
+
+        main, other = StartupProfile.events()
+        assert main.thread != other.thread
+
+
+class Test_StartupProfile_reset:
+    def test_when_reset_then_events_discarded(self, startup_profile_enabled):
+        StartupProfile.Scope("a.stage").end()
+
+        StartupProfile.reset()
+
+        assert StartupProfile.events() == []
+
+
+class Test_StartupProfile_toJson:
+    def test_when_no_events_then_empty_list(self, startup_profile_enabled):
+        assert json.loads(StartupProfile.toJson()) == {"events": []}
+
+    def test_when_events_then_all_fields_serialised(self, startup_profile_enabled):
+        with StartupProfile.Scope("outer", 'a "quoted"\\path\n'):
+            StartupProfile.Scope("inner").end()
+
+        events = StartupProfile.events()
+        report = json.loads(StartupProfile.toJson())
+
+        assert [
+            (entry["name"], entry["detail"], entry["depth"], entry["thread"])
+            for entry in report["events"]
+        ] == [(event.name, event.detail, event.depth, event.thread) for event in events]
+        assert report["events"][1]["detail"] == 'a "quoted"\\path\n'
+        for entry, event in zip(report["events"], events):
+            assert entry["start"] == pytest.approx(event.start, abs=1e-6)
+            assert entry["duration"] == pytest.approx(event.duration, abs=1e-6)
+
+    def test_when_env_var_is_path_then_report_written_on_exit(self, tmp_path):
+        report_path = tmp_path / "profile.json"
+        env = dict(os.environ, **{kEnvVar: str(report_path)})
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-c",
+                "from openassetio.utils import StartupProfile;"
+                "StartupProfile.Scope('a.stage', 'a detail').end()",
+            ],
+            env=env,
+        )
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert [(entry["name"], entry["detail"]) for entry in report["events"]] == [
+            ("a.stage", "a detail")
+        ]
+
+
+@pytest.fixture
+def reset_startup_profile():
+    yield
+    StartupProfile.setEnabled(None)
+    StartupProfile.reset()
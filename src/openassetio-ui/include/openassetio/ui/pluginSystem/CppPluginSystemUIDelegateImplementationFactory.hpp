@@ -3,6 +3,7 @@
 #pragma once
 
 #include <filesystem>
+#include <mutex>
 #include <optional>
 #include <unordered_map>
 #include <utility>
@@ -111,6 +112,14 @@ class OPENASSETIO_UI_EXPORT CppPluginSystemUIDelegateImplementationFactory
   CppPluginSystemUIDelegateImplementationFactory(openassetio::Str paths,
                                                  log::LoggerInterfacePtr logger);
 
+  /**
+   * Get the underlying plugin system, scanning for plugins first if
+   * this has not yet been done.
+   *
+   * Safe to call from multiple threads concurrently.
+   */
+  const openassetio::pluginSystem::CppPluginSystemPtr& scannedPluginSystem();
+
   /// Search paths provided on construction.
   openassetio::Str paths_;
 
@@ -122,6 +131,8 @@ class OPENASSETIO_UI_EXPORT CppPluginSystemUIDelegateImplementationFactory
    * are considered.
    */
   openassetio::pluginSystem::CppPluginSystemPtr pluginSystem_;
+  /// Guard for lazy construction of @ref pluginSystem_.
+  std::mutex pluginSystemMutex_;
 };
 }  // namespace ui::pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
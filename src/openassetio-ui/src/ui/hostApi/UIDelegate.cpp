@@ -10,6 +10,7 @@
 #include <fmt/core.h>
 
 #include <openassetio/export.h>
+#include <openassetio/Context.hpp>
 #include <openassetio/InfoDictionary.hpp>
 #include <openassetio/errors/exceptions.hpp>
 #include <openassetio/log/LoggerInterface.hpp>  // NOLINT(*-include-cleaner): needed for logger()
@@ -28,6 +29,18 @@ namespace ui::hostApi {
 
 using HostSessionPtr = openassetio::managerApi::HostSessionPtr;
 
+namespace {
+/**
+ * Create the manager state of a context, if deferred by
+ * Manager::createChildContext, before it is passed to the UI delegate.
+ */
+void resolveDeferredManagerState(const ContextConstPtr& context) {
+  if (context) {
+    context->resolveManagerState();
+  }
+}
+}  // namespace
+
 UIDelegatePtr UIDelegate::make(managerApi::UIDelegateInterfacePtr uiDelegateInterface,
                                HostSessionPtr hostSession) {
   return std::shared_ptr<UIDelegate>(
@@ -75,6 +88,7 @@ InfoDictionary UIDelegate::info() { return uiDelegateInterface_->info(); }
 trait::TraitsDataPtr UIDelegate::uiPolicy(const trait::TraitSet& uiTraitSet,
                                           const access::UIAccess uiAccess,
                                           const ContextConstPtr& context) {
+  resolveDeferredManagerState(context);
   return uiDelegateInterface_->uiPolicy(uiTraitSet, uiAccess, context, hostSession_);
 }
 
@@ -85,6 +99,7 @@ std::optional<UIDelegateStatePtr> UIDelegate::populateUI(
     throw errors::InputValidationException{"UI delegate request cannot be null."};
   }
 
+  resolveDeferredManagerState(context);
   auto maybeUIDelegateStateInterface = uiDelegateInterface_->populateUI(
       uiTraitsData, uiAccess, managerApi::UIDelegateRequest::make(std::move(uiRequestInterface)),
       context, hostSession_);
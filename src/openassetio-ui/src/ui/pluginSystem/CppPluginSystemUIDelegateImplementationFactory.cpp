@@ -4,6 +4,7 @@
 
 #include <cstdlib>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string_view>
 #include <utility>
@@ -35,14 +36,14 @@ const CppPluginSystem::ValidationCallback kCheckIsUIDelegatePlugin{
 
 CppPluginSystemUIDelegateImplementationFactoryPtr
 CppPluginSystemUIDelegateImplementationFactory::make(Str paths, log::LoggerInterfacePtr logger) {
-  return std::make_shared<CppPluginSystemUIDelegateImplementationFactory>(
-      CppPluginSystemUIDelegateImplementationFactory{std::move(paths), std::move(logger)});
+  return CppPluginSystemUIDelegateImplementationFactoryPtr{
+      new CppPluginSystemUIDelegateImplementationFactory{std::move(paths), std::move(logger)}};
 }
 
 CppPluginSystemUIDelegateImplementationFactoryPtr
 CppPluginSystemUIDelegateImplementationFactory::make(log::LoggerInterfacePtr logger) {
-  return std::make_shared<CppPluginSystemUIDelegateImplementationFactory>(
-      CppPluginSystemUIDelegateImplementationFactory{std::move(logger)});
+  return CppPluginSystemUIDelegateImplementationFactoryPtr{
+      new CppPluginSystemUIDelegateImplementationFactory{std::move(logger)}};
 }
 
 CppPluginSystemUIDelegateImplementationFactory::CppPluginSystemUIDelegateImplementationFactory(
@@ -54,23 +55,12 @@ CppPluginSystemUIDelegateImplementationFactory::CppPluginSystemUIDelegateImpleme
     : CppPluginSystemUIDelegateImplementationFactory{"", std::move(logger)} {}
 
 Identifiers CppPluginSystemUIDelegateImplementationFactory::identifiers() {
-  if (!pluginSystem_) {
-    // Lazy load plugins.
-    pluginSystem_ = CppPluginSystem::make(logger());
-    pluginSystem_->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsUIDelegatePlugin);
-  }
-
-  return pluginSystem_->identifiers();
+  return scannedPluginSystem()->identifiers();
 }
 
 managerApi::UIDelegateInterfacePtr CppPluginSystemUIDelegateImplementationFactory::instantiate(
     const Identifier& identifier) {
-  if (!pluginSystem_) {
-    // Lazy load plugins.
-    pluginSystem_ = CppPluginSystem::make(logger());
-    pluginSystem_->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsUIDelegatePlugin);
-  }
-  const auto& [path, plugin] = pluginSystem_->plugin(identifier);
+  const auto& [path, plugin] = scannedPluginSystem()->plugin(identifier);
 
   // Should definitely be a UI delegate plugin, as validated by
   // `kCheckIsUIDelegatePlugin`. We use the exception-throwing version
@@ -79,6 +69,24 @@ managerApi::UIDelegateInterfacePtr CppPluginSystemUIDelegateImplementationFactor
 
   return uiPlugin.interface();
 }
+
+const openassetio::pluginSystem::CppPluginSystemPtr&
+CppPluginSystemUIDelegateImplementationFactory::scannedPluginSystem() {
+  // The factory may be queried from multiple threads concurrently
+  // (e.g. a factory shared between host threads), so ensure only one
+  // thread performs the lazy scan.
+  // Once scanned, the plugin system is safe to query concurrently
+  // (including deferred plugin loading), so it is safe to use without
+  // holding the lock.
+  const std::lock_guard lock{pluginSystemMutex_};
+  if (!pluginSystem_) {
+    // Lazy load plugins.
+    auto pluginSystem = CppPluginSystem::make(logger());
+    pluginSystem->scan(paths_, kPluginEnvVar, kModuleHookName, kCheckIsUIDelegatePlugin);
+    pluginSystem_ = std::move(pluginSystem);
+  }
+  return pluginSystem_;
+}
 }  // namespace ui::pluginSystem
 }  // namespace OPENASSETIO_CORE_ABI_VERSION
 }  // namespace openassetio